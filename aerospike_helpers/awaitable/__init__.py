@@ -12,4 +12,5 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-##########################################################################
\ No newline at end of file
+##########################################################################
+from aerospike_helpers.awaitable.client import AsyncClient
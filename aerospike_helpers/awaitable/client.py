@@ -0,0 +1,152 @@
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+'''
+Asyncio client for the aerospike.client class.
+
+Commands with a native async implementation in the C client are issued on the
+aerospike event loops (see :meth:`aerospike.init_async`) and resolve an
+:class:`asyncio.Future` directly from the completion callback. The remaining
+commands are run in the asyncio loop's default executor.
+
+Example::
+
+    import asyncio
+    import aerospike
+    from aerospike_helpers.awaitable import AsyncClient
+
+    aerospike.init_async()
+    client = AsyncClient(aerospike.client(config).connect())
+
+    async def main():
+        await client.put(('test', 'demo', 1), {'bin': 1})
+        key, meta, bins = await client.get(('test', 'demo', 1))
+
+    asyncio.get_event_loop().run_until_complete(main())
+'''
+import asyncio
+import functools
+
+from aerospike_helpers.awaitable import io
+
+
+def _kwargs(**kwargs):
+    # Optional arguments which were not supplied are left to the C defaults.
+    return {name: value for name, value in kwargs.items() if value is not None}
+
+
+class AsyncClient(object):
+    '''
+    Wraps a connected :class:`aerospike.Client` and exposes its commands as
+    coroutines.
+
+    Args:
+        client (aerospike.Client): A connected client.
+        executor (concurrent.futures.Executor): Executor used for the commands
+            which do not have a native async implementation. Defaults to the
+            asyncio loop's default executor.
+        completion_queue (bool): Queue the native async completions and
+            deliver them in batches on ``loop``, instead of taking the GIL
+            on the event loop threads for every command. See
+            :meth:`aerospike.Client.enable_completion_queue`. Default False.
+        loop (asyncio.AbstractEventLoop): Loop delivering the queued
+            completions. Defaults to the current event loop.
+    '''
+
+    def __init__(self, client, executor=None, completion_queue=False,
+                 loop=None):
+        self._client = client
+        self._executor = executor
+        if completion_queue:
+            loop = loop or asyncio.get_event_loop()
+            # Woken up once per batch, poll_completions() drains everything
+            # queued by then.
+            client.enable_completion_queue(
+                notify=functools.partial(loop.call_soon_threadsafe,
+                                         client.poll_completions))
+
+    @property
+    def client(self):
+        '''The wrapped :class:`aerospike.Client`.'''
+        return self._client
+
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(method, *args, **kwargs))
+
+    # Single record commands
+
+    async def get(self, key, policy=None):
+        return await io.get(self._client, key, policy)
+
+    async def put(self, key, bins, meta=None, policy=None, serializer=None):
+        return await io.put(self._client, key, bins, meta, policy, serializer)
+
+    async def select(self, key, bins, policy=None):
+        return await self._run(self._client.select, key, bins,
+                               **_kwargs(policy=policy))
+
+    async def exists(self, key, policy=None):
+        return await io.exists(self._client, key, policy)
+
+    async def remove(self, key, meta=None, policy=None):
+        return await io.remove(self._client, key, meta, policy)
+
+    async def operate(self, key, list, meta=None, policy=None):
+        return await io.operate(self._client, key, list, meta, policy)
+
+    async def operate_ordered(self, key, list, meta=None, policy=None):
+        return await self._run(self._client.operate_ordered, key, list,
+                               **_kwargs(meta=meta, policy=policy))
+
+    async def apply(self, key, module, function, args, policy=None):
+        return await io.apply(self._client, key, module, function, args,
+                              policy)
+
+    # Batch commands
+
+    async def get_many(self, keys, policy=None):
+        return await self._run(self._client.get_many, keys,
+                               **_kwargs(policy=policy))
+
+    async def exists_many(self, keys, policy=None):
+        return await self._run(self._client.exists_many, keys,
+                               **_kwargs(policy=policy))
+
+    async def select_many(self, keys, bins, policy=None):
+        return await self._run(self._client.select_many, keys, bins,
+                               **_kwargs(policy=policy))
+
+    async def batch_write(self, batch_records, policy_batch=None):
+        return await self._run(self._client.batch_write, batch_records,
+                               **_kwargs(policy_batch=policy_batch))
+
+    async def batch_operate(self, keys, ops, policy_batch=None,
+                            policy_batch_write=None):
+        return await io.batch_operate(self._client, keys, ops, policy_batch,
+                                      policy_batch_write)
+
+    async def batch_apply(self, keys, module, function, args,
+                          policy_batch=None, policy_batch_apply=None):
+        return await self._run(
+            self._client.batch_apply, keys, module, function, args,
+            **_kwargs(policy_batch=policy_batch,
+                      policy_batch_apply=policy_batch_apply))
+
+    async def batch_remove(self, keys, policy_batch=None,
+                           policy_batch_remove=None):
+        return await io.batch_remove(self._client, keys, policy_batch,
+                                     policy_batch_remove)
@@ -14,110 +14,128 @@
 # limitations under the License.
 ##########################################################################
 '''
-Module with helper functions to do async get/put by
+Module with helper functions to do the native async commands used by
 the :mod:`aerospike.Client.awaitable` methods for the aerospike.client class.
+
+Each command resolves its own :class:`asyncio.Future`, which is bound to the
+completion callback handed to the C client. Concurrent commands on the same
+key therefore never share state.
 '''
 import asyncio
-import aerospike
-from aerospike import exception as e
 
-_get_results = {}
-_get_cqd = 0
-_put_results = {}
-_put_cqd = 0
 
-async def _io_get_put(client, op=0, key=None, record=None, meta=None, policy=None, serialize=None):
-    global _get_cqd, _put_cqd
-    index = None
+def _resolve(fut, result, exc):
+    # Runs on the asyncio loop thread.
+    if fut.done():
+        return
+    if exc is not None:
+        fut.set_exception(exc)
+    else:
+        fut.set_result(result)
+
 
-    if key is not None:
-        if len(key) >= 3:
-            index = key[2]
-        if index is None:
-            if len(key) >= 4:
-                index = key[3]
+def _deliver(loop, fut, result, exc):
+    # Completions delivered by poll_completions() already run on the loop, the
+    # others run on an aerospike event loop thread and are handed over.
+    if asyncio._get_running_loop() is loop:
+        _resolve(fut, result, exc)
+    else:
+        loop.call_soon_threadsafe(_resolve, fut, result, exc)
 
-    if index is not None and isinstance(index, bytearray):
-        index = bytes(index)
 
-    #print(f"io:_io_get_put op:{op} key:{key} index:{index}")
+def _to_exception(err, exc_type):
+    # Build an exception instance the same way the synchronous API does,
+    # by passing the (code, msg, file, line, in_doubt) tuple as arguments.
+    if isinstance(exc_type, type):
+        return exc_type(*err)
+    return exc_type
 
-    def put_async_callback(key_tuple, err, exce):
-        global _put_cqd
 
-        _put_cqd -= 1
+def _record_callback(loop, fut):
+    def callback(key_tuple, record_tuple, err, exc_type):
+        if err[0] != 0:
+            _deliver(loop, fut, None, _to_exception(err, exc_type))
+        else:
+            _deliver(loop, fut, record_tuple, None)
+    return callback
 
-        result = [key_tuple, err, exce]
-        _put_results[index]['result'] = result
 
-        #print(f"io:put_cb {_put_results[index]}")
+def _status_callback(loop, fut):
+    def callback(key_tuple, err, exc_type):
+        if err[0] != 0:
+            _deliver(loop, fut, None, _to_exception(err, exc_type))
+        else:
+            _deliver(loop, fut, err[0], None)
+    return callback
 
-        loop = _put_results[index]['loop']
-        fut = _put_results[index]['fut']
 
-        if result[1][0] != 0:
-            #print(f"io:put_cb except:{result[2]}")
-            loop.call_soon_threadsafe(fut.set_exception, result[2])
+def _batch_callback(loop, fut):
+    def callback(batch_records, err, exc_type):
+        if err[0] != 0:
+            _deliver(loop, fut, None, _to_exception(err, exc_type))
         else:
-            loop.call_soon_threadsafe(fut.set_result, result[1][0])
+            _deliver(loop, fut, batch_records, None)
+    return callback
+
 
-    def get_async_callback(key_tuple, record_tuple, err, exce):
-        global _get_cqd
+async def get(client, key=None, policy=None):
+    loop = asyncio.get_event_loop()
+    fut = loop.create_future()
+    client.get_async(_record_callback(loop, fut), key, policy)
+    return await fut
 
-        _get_cqd -= 1
 
-        result = [key_tuple, record_tuple, err, exce]
-        _get_results[index]['result'] = result
+async def put(client, key=None, record=None, meta=None, policy=None, serialize=None):
+    loop = asyncio.get_event_loop()
+    fut = loop.create_future()
+    client.put_async(_status_callback(loop, fut), key, record, meta, policy,
+                     serialize)
+    return await fut
 
-        #print(f"io:get_cb {_get_results[index]}")
 
-        loop = _get_results[index]['loop']
-        fut = _get_results[index]['fut']
+async def exists(client, key=None, policy=None):
+    loop = asyncio.get_event_loop()
+    fut = loop.create_future()
+    client.exists_async(_record_callback(loop, fut), key, policy)
+    return await fut
 
-        if result[2][0] != 0:
-            #print(f"io:get_cb except:{result[3]}")
-            loop.call_soon_threadsafe(fut.set_exception, result[3])
-        else:
-            loop.call_soon_threadsafe(fut.set_result, result[1])
 
+async def remove(client, key=None, meta=None, policy=None):
     loop = asyncio.get_event_loop()
-    future = loop.create_future()
-    
-    context = {'loop': None, 'fut': None, 'result': None}
-
-    if index is not None:
-        if op == 0:
-            _put_results[index] = context
-            _put_results[index]['loop'] = loop
-            _put_results[index]['fut'] = future
-            _put_cqd += 1
-        elif op == 1:
-            _get_results[index] = context
-            _get_results[index]['loop'] = loop
-            _get_results[index]['fut'] = future
-            _get_cqd += 1
-
-    try:
-        if op == 0:
-            client.put_async(put_async_callback, key, record, meta, policy, serialize)
-        if op == 1:
-            client.get_async(get_async_callback, key, policy)
-    except Exception as e:
-        #print(f"io:post_get key:{key} except:{e} cqd:{[_get_cqd if op else _put_cqd]}")
-        raise e
-
-    await future
-    
-    if index is not None:
-        if op == 0:
-            del _put_results[index]
-        if op == 1:
-            del _get_results[index]
-    
-    return future.result()
+    fut = loop.create_future()
+    client.remove_async(_status_callback(loop, fut), key, meta, policy)
+    return await fut
 
-async def get(client, key=None, policy=None):
-    return await _io_get_put(client, 1, key, None, None, policy)
 
-async def put(client, key=None, record=None, meta=None, policy=None, serialize=None):
-    return await _io_get_put(client, 0, key, record, meta, policy, serialize)
+async def operate(client, key=None, list=None, meta=None, policy=None):
+    loop = asyncio.get_event_loop()
+    fut = loop.create_future()
+    client.operate_async(_record_callback(loop, fut), key, list, meta, policy)
+    return await fut
+
+
+async def apply(client, key=None, module=None, function=None, args=None,
+                policy=None):
+    loop = asyncio.get_event_loop()
+    fut = loop.create_future()
+    client.apply_async(_record_callback(loop, fut), key, module, function,
+                       args, policy)
+    return await fut
+
+
+async def batch_operate(client, keys=None, ops=None, policy_batch=None,
+                        policy_batch_write=None):
+    loop = asyncio.get_event_loop()
+    fut = loop.create_future()
+    client.batch_operate_async(_batch_callback(loop, fut), keys, ops,
+                               policy_batch, policy_batch_write)
+    return await fut
+
+
+async def batch_remove(client, keys=None, policy_batch=None,
+                       policy_batch_remove=None):
+    loop = asyncio.get_event_loop()
+    fut = loop.create_future()
+    client.batch_remove_async(_batch_callback(loop, fut), keys, policy_batch,
+                              policy_batch_remove)
+    return await fut
@@ -16,6 +16,15 @@
 
 import typing as ty
 
+import aerospike
+
+# C base holding the key, record, result and in_doubt slots. Batch results are
+# allocated from it directly, without calling __init__.
+# The documentation build mocks the aerospike module.
+_BatchRecordBase = getattr(aerospike, "_BatchRecordBase", object)
+if not isinstance(_BatchRecordBase, type):
+    _BatchRecordBase = object
+
 TypeOps = ty.List[ty.Dict]
 TypeBatchPolicyWrite = ty.Union[ty.Dict, None]
 TypeBatchPolicyRemove = ty.Union[ty.Dict, None]
@@ -31,7 +40,7 @@ class _Types():
     REMOVE = 3
 
 #### BatchRecord ####
-class BatchRecord:
+class BatchRecord(_BatchRecordBase):
     """ BatchRecord provides the base fields for BatchRecord objects.
 
         BatchRecord should usually be read from as a result and not created by the user. Its subclasses can be used as input to batch_write.
@@ -46,11 +55,10 @@ class BatchRecord:
             This may be the case when a client error occurs (like timeout) after the command was sent \
             to the server.
     """
+    __slots__ = ()
+
     def __init__(self, key: tuple) -> None:
-        self.key = key
-        self.record = None
-        self.result = 0
-        self.in_doubt = False
+        super().__init__(key)
 
 
 class Write(BatchRecord):
@@ -67,6 +75,10 @@ class Write(BatchRecord):
             policy (:ref:`aerospike_batch_write_policies`, optional): An optional dictionary of batch write policy flags.
     """
 
+    __slots__ = ("ops", "policy")
+    _type = _Types.WRITE
+    _has_write = True
+
     def __init__(self, key: tuple, ops: 'TypeOps', policy: 'TypeBatchPolicyWrite' = None) -> None:
         """
             Example::
@@ -91,8 +103,6 @@ class Write(BatchRecord):
         """
         super().__init__(key)
         self.ops = ops
-        self._type = _Types.WRITE
-        self._has_write = True
         self.policy = policy
 
 
@@ -111,6 +121,10 @@ class Read(BatchRecord):
             policy (:ref:`aerospike_batch_read_policies`, optional): An optional dictionary of batch read policy flags.
     """
 
+    __slots__ = ("ops", "read_all_bins", "policy")
+    _type = _Types.READ
+    _has_write = False
+
     def __init__(self, key: tuple, ops: ty.Union[TypeOps, None], read_all_bins: bool = False, policy: 'TypeBatchPolicyRead' = None) -> None:
         """
             Example::
@@ -135,8 +149,6 @@ class Read(BatchRecord):
         super().__init__(key)
         self.ops = ops
         self.read_all_bins = read_all_bins
-        self._type = _Types.READ
-        self._has_write = False
         self.policy = policy
 
 
@@ -157,6 +169,10 @@ class Apply(BatchRecord):
             policy (:ref:`aerospike_batch_apply_policies`, optional): An optional dictionary of batch apply policy flags.
     """
 
+    __slots__ = ("module", "function", "args", "policy")
+    _type = _Types.APPLY
+    _has_write = True
+
     def __init__(self, key: tuple, module: str, function: str, args: 'TypeUDFArgs', policy: 'TypeBatchPolicyApply' = None) -> None:
         """
             Example::
@@ -183,8 +199,6 @@ class Apply(BatchRecord):
                 ba = Apply(key, module, function, args)
         """
         super().__init__(key)
-        self._type = _Types.APPLY
-        self._has_write = True
         self.module = module
         self.function = function
         self.args = args
@@ -205,6 +219,10 @@ class Remove(BatchRecord):
             policy (:ref:`aerospike_batch_remove_policies`, optional): An optional dictionary of batch remove policy flags.
     """
 
+    __slots__ = ("policy",)
+    _type = _Types.REMOVE
+    _has_write = True
+
     def __init__(self, key: tuple, policy: 'TypeBatchPolicyRemove' = None) -> None:
         """
             Example::
@@ -221,8 +239,6 @@ class Remove(BatchRecord):
                 br = Remove(key, ops)
         """
         super().__init__(key)
-        self._type = _Types.REMOVE
-        self._has_write = True
         self.policy = policy
 
 
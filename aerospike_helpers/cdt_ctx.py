@@ -91,6 +91,8 @@ class _cdt_ctx:
     """
     Class used to represent a single ctx_operation.
     """
+    __slots__ = ('id', 'value', 'extra_args')
+
     def __init__(self, *, id=None, value=None, extra_args=None):
         self.id = id
         self.value = value
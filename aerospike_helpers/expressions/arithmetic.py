@@ -45,6 +45,7 @@ class Add(_BaseExpr):
 
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.ADD
 
     def __init__(self, *args: 'TypeNumber'):
@@ -63,6 +64,7 @@ class Add(_BaseExpr):
 
         """
         self._children = args + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Sub(_BaseExpr):
@@ -77,6 +79,7 @@ class Sub(_BaseExpr):
 
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.SUB
 
     def __init__(self, *args: 'TypeNumber'):
@@ -94,6 +97,7 @@ class Sub(_BaseExpr):
             expr = exp.Eq(exp.IntBin("a") - exp.IntBin("b"), 11).compile()
         """
         self._children = args + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Mul(_BaseExpr):
@@ -107,6 +111,7 @@ class Mul(_BaseExpr):
 
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.MUL
 
     def __init__(self, *args: 'TypeNumber'):
@@ -124,6 +129,7 @@ class Mul(_BaseExpr):
             expr = exp.GE(exp.IntBin("a") * exp.IntBin("b"), 11).compile()
         """
         self._children = args + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Div(_BaseExpr):
@@ -139,6 +145,7 @@ class Div(_BaseExpr):
 
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
 
     _op = _ExprOp.DIV
 
@@ -160,6 +167,7 @@ class Div(_BaseExpr):
             expr = exp.GE(exp.FloatBin("a") // exp.FloatBin("b") // exp.FloatBin("c"), 11.0).compile()
         """
         self._children = args + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Pow(_BaseExpr):
@@ -172,6 +180,7 @@ class Pow(_BaseExpr):
 
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.POW
 
     def __init__(self, base: 'TypeFloat', exponent: 'TypeFloat'):
@@ -190,6 +199,7 @@ class Pow(_BaseExpr):
             expr = exp.Eq(exp.FloatBin("a") ** 2.0, 16.0).compile()
         """
         self._children = (base, exponent)
+        self._fixed = None
 
 
 class Log(_BaseExpr):
@@ -199,6 +209,7 @@ class Log(_BaseExpr):
 
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.LOG
 
     def __init__(self, num: 'TypeFloat', base: 'TypeFloat'):
@@ -214,6 +225,7 @@ class Log(_BaseExpr):
             expr = exp.Eq(exp.Log(exp.FloatBin("a"), 2.0), 16.0).compile()
         """
         self._children = (num, base)
+        self._fixed = None
 
 
 class Mod(_BaseExpr):
@@ -226,6 +238,7 @@ class Mod(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.MOD
 
     def __init__(self, numerator: 'TypeInteger', denominator: 'TypeInteger'):
@@ -244,6 +257,7 @@ class Mod(_BaseExpr):
             expr = exp.Eq(exp.IntBin("a") % 10, 0).compile()
         """
         self._children = (numerator, denominator)
+        self._fixed = None
 
 
 class Abs(_BaseExpr):
@@ -256,6 +270,7 @@ class Abs(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.ABS
 
     def __init__(self, value: 'TypeNumber'):
@@ -273,6 +288,7 @@ class Abs(_BaseExpr):
             expr = exp.Eq(abs(exp.IntBin("a")), 1).compile()
         """
         self._children = (value,)
+        self._fixed = None
 
 
 class Floor(_BaseExpr):
@@ -285,6 +301,7 @@ class Floor(_BaseExpr):
 
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.FLOOR
 
     def __init__(self, value: 'TypeFloat'):
@@ -303,6 +320,7 @@ class Floor(_BaseExpr):
             expr = exp.Eq(math.floor(2.25), 2.0).compile()
         """
         self._children = (value,)
+        self._fixed = None
 
 
 class Ceil(_BaseExpr):
@@ -315,6 +333,7 @@ class Ceil(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.CEIL
 
     def __init__(self, value: 'TypeFloat'):
@@ -333,6 +352,7 @@ class Ceil(_BaseExpr):
             expr = exp.Eq(math.ceil(2.25), 3.0).compile()
         """
         self._children = (value,)
+        self._fixed = None
 
 
 class ToInt(_BaseExpr):
@@ -340,6 +360,7 @@ class ToInt(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.TO_INT
 
     def __init__(self, value: 'TypeFloat'):
@@ -354,6 +375,7 @@ class ToInt(_BaseExpr):
             expr = exp.Eq(exp.ToInt(exp.FloatBin("a")), 2).compile()
         """
         self._children = (value,)
+        self._fixed = None
 
 
 class ToFloat(_BaseExpr):
@@ -361,6 +383,7 @@ class ToFloat(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.TO_FLOAT
 
     def __init__(self, value: 'TypeInteger'):
@@ -375,6 +398,7 @@ class ToFloat(_BaseExpr):
             expr = exp.Eq(exp.ToFloat(exp.IntBin("a")), 2).compile()
         """
         self._children = (value,)
+        self._fixed = None
 
 
 class Min(_BaseExpr):
@@ -384,6 +408,7 @@ class Min(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.MIN
 
     def __init__(self, *args: 'TypeNumber'):
@@ -398,6 +423,7 @@ class Min(_BaseExpr):
             expr = exp.GT(exp.Min(exp.IntBin("a"), exp.IntBin("b"), exp.IntBin("c")), 0).compile()
         """
         self._children = args + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Max(_BaseExpr):
@@ -406,6 +432,7 @@ class Max(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.MAX
 
     def __init__(self, *args: 'TypeNumber'):
@@ -420,3 +447,4 @@ class Max(_BaseExpr):
             expr = exp.GT(exp.Max(exp.IntBin("a"), exp.IntBin("b"), exp.IntBin("c")), 100).compile()
         """
         self._children = args + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
@@ -67,6 +67,7 @@ class Unknown(_BaseExpr):
     Note that this special 'unknown' trilean value is the same value returned
     by any failed expression.
     """
+    __slots__ = ()
     _op = _ExprOp.UNKNOWN
 
     def __init__(self):
@@ -96,6 +97,7 @@ class Unknown(_BaseExpr):
 
 
 class _Key(_BaseExpr):
+    __slots__ = ()
     _op = _ExprOp.REC_KEY
 
 
@@ -103,6 +105,7 @@ class KeyInt(_Key):
     """ Create an expression that returns the key as an integer. Returns the unknown-value if
         the key is not an integer.
     """
+    __slots__ = ()
     _rt = ResultType.INTEGER
 
     def __init__(self):
@@ -120,6 +123,7 @@ class KeyStr(_Key):
     """ Create an expression that returns the key as a string. Returns the unknown-value if
         the key is not a string.
     """
+    __slots__ = ()
     _rt = ResultType.STRING
 
     def __init__(self):
@@ -137,6 +141,7 @@ class KeyBlob(_Key):
     """ Create an expression that returns the key as a blob. Returns the unknown-value if
         the key is not a blob.
     """
+    __slots__ = ()
     _rt = ResultType.BLOB
 
     def __init__(self):
@@ -155,6 +160,7 @@ class KeyExists(_BaseExpr):
         data as a boolean expression. This would occur on record write, when write policies set the `key` field to
         :class:`aerospike.POLICY_KEY_SEND`.
     """
+    __slots__ = ()
     _op = _ExprOp.META_KEY_EXISTS
     _rt = ResultType.BOOLEAN
 
@@ -178,6 +184,7 @@ class BoolBin(_BaseExpr):
     """ Create an expression that returns a bin as a boolean. Returns the unknown-value
         if the bin is not a boolean.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.BOOLEAN
 
@@ -193,12 +200,14 @@ class BoolBin(_BaseExpr):
                 expr = exp.BoolBin("a").compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class IntBin(_BaseExpr):
     """ Create an expression that returns a bin as an integer. Returns the unknown-value
         if the bin is not an integer.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.INTEGER
 
@@ -214,12 +223,14 @@ class IntBin(_BaseExpr):
                 expr = exp.Eq(exp.IntBin("a"), 200).compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class StrBin(_BaseExpr):
     """ Create an expression that returns a bin as a string. Returns the unknown-value
         if the bin is not a string.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.STRING
 
@@ -235,12 +246,14 @@ class StrBin(_BaseExpr):
                 expr = exp.Eq(exp.StrBin("a"), "xyz").compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class FloatBin(_BaseExpr):
     """ Create an expression that returns a bin as a float. Returns the unknown-value
         if the bin is not a float.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.FLOAT
 
@@ -256,12 +269,14 @@ class FloatBin(_BaseExpr):
                 expr = exp.GT(exp.FloatBin("a"), 2.71).compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class BlobBin(_BaseExpr):
     """ Create an expression that returns a bin as a blob. Returns the unknown-value
         if the bin is not a blob.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.BLOB
 
@@ -277,12 +292,14 @@ class BlobBin(_BaseExpr):
                 expr = exp.Eq(exp.BlobBin("a"), bytearray([0x65, 0x65])).compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class GeoBin(_BaseExpr):
     """ Create an expression that returns a bin as a geojson. Returns the unknown-value
         if the bin is not a geojson.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.GEOJSON
 
@@ -298,12 +315,14 @@ class GeoBin(_BaseExpr):
                 expr = exp.CmpGeo(GeoBin("a"), exp.GeoBin("b")).compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class ListBin(_BaseExpr):
     """ Create an expression that returns a bin as a list. Returns the unknown-value
         if the bin is not a list.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.LIST
 
@@ -327,12 +346,14 @@ class ListBin(_BaseExpr):
                 expr = exp.GT(list42Count, 0).compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class MapBin(_BaseExpr):
     """ Create an expression that returns a bin as a map. Returns the unknown-value
         if the bin is not a map.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.MAP
 
@@ -350,12 +371,14 @@ class MapBin(_BaseExpr):
                 expr = exp.GT(map_exprs.MapSize(None, exp.MapBin("a")), 7).compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class HLLBin(_BaseExpr):
     """ Create an expression that returns a bin as a HyperLogLog. Returns the unknown-value
         if the bin is not a HyperLogLog.
     """
+    __slots__ = ()
     _op = _ExprOp.BIN
     _rt = ResultType.HLL
 
@@ -373,10 +396,12 @@ class HLLBin(_BaseExpr):
                 expr = exp.GT(count, 1000000).compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class BinExists(_BaseExpr):
     """Create an expression that returns True if bin exists."""
+    __slots__ = ()
     _op = _ExprOp.BIN_EXISTS
     _rt = ResultType.BOOLEAN
 
@@ -392,12 +417,14 @@ class BinExists(_BaseExpr):
                 expr = exp.BinExists("a").compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 class BinType(_BaseExpr):
     """ Create an expression that returns the type of a bin
         as one of the aerospike :ref:`bin types <aerospike_bin_types>`
     """
+    __slots__ = ()
     _op = _ExprOp.BIN_TYPE
     _rt = ResultType.INTEGER
 
@@ -413,6 +440,7 @@ class BinType(_BaseExpr):
                 expr = exp.Eq(exp.BinType("a"), aerospike.AS_BYTES_STRING).compile()
         """
         self._fixed = {_Keys.BIN_KEY: bin}
+        self._children = ()
 
 
 ####################
@@ -425,6 +453,7 @@ class SetName(_BaseExpr):
         This expression usually evaluates quickly because record
         meta data is cached in memory.
     """
+    __slots__ = ()
     _op = _ExprOp.META_SET_NAME
     _rt = ResultType.STRING
 
@@ -444,6 +473,7 @@ class DeviceSize(_BaseExpr):
         memory, then zero is returned. This expression usually evaluates quickly
         because record meta data is cached in memory.
     """
+    __slots__ = ()
     _op = _ExprOp.META_DEVICE_SIZE
     _rt = ResultType.INTEGER
 
@@ -462,6 +492,7 @@ class LastUpdateTime(_BaseExpr):
     """ Create an expression that the returns record last update time expressed as 64 bit
         integer nanoseconds since 1970-01-01 epoch.
     """
+    __slots__ = ()
     _op = _ExprOp.META_LAST_UPDATE_TIME
     _rt = ResultType.INTEGER
 
@@ -480,6 +511,7 @@ class SinceUpdateTime(_BaseExpr):
     """ Create an expression that returns milliseconds since the record was last updated.
         This expression usually evaluates quickly because record meta data is cached in memory.
     """
+    __slots__ = ()
     _op = _ExprOp.META_SINCE_UPDATE_TIME
     _rt = ResultType.INTEGER
 
@@ -498,6 +530,7 @@ class VoidTime(_BaseExpr):
     """ Create an expression that returns record expiration time expressed as 64 bit
         integer nanoseconds since 1970-01-01 epoch.
     """
+    __slots__ = ()
     _op = _ExprOp.META_VOID_TIME
     _rt = ResultType.INTEGER
 
@@ -518,6 +551,7 @@ class TTL(_BaseExpr):
     """ Create an expression that returns record expiration time (time to live) in integer
         seconds.
     """
+    __slots__ = ()
     _op = _ExprOp.META_TTL
     _rt = ResultType.INTEGER
 
@@ -538,6 +572,7 @@ class IsTombstone(_BaseExpr):
         tombstone state. This expression usually evaluates quickly because record
         meta data is cached in memory. NOTE: this is only applicable for XDR filter expressions.
     """
+    __slots__ = ()
     _op = _ExprOp.META_IS_TOMBSTONE
     _rt = ResultType.BOOLEAN
 
@@ -554,6 +589,7 @@ class IsTombstone(_BaseExpr):
 
 class DigestMod(_BaseExpr):
     """Create an expression that returns record digest modulo as integer."""
+    __slots__ = ()
     _op = _ExprOp.META_DIGEST_MOD
     _rt = ResultType.INTEGER
 
@@ -569,6 +605,7 @@ class DigestMod(_BaseExpr):
                 expr = exp.Eq(exp.DigestMod(3), 1).compile()
         """
         self._fixed = {_Keys.VALUE_KEY: mod}
+        self._children = ()
 
 
 ########################
@@ -578,6 +615,7 @@ class DigestMod(_BaseExpr):
 
 class Eq(_BaseExpr):
     """Create an equals, (==) expression."""
+    __slots__ = ()
     _op = _ExprOp.EQ
 
     def __init__(self, expr0: 'TypeComparisonArg', expr1: 'TypeComparisonArg'):
@@ -593,10 +631,12 @@ class Eq(_BaseExpr):
             expr = exp.Eq(exp.IntBin("a"), 11).compile()
         """
         self._children = (expr0, expr1)
+        self._fixed = None
 
 
 class NE(_BaseExpr):
     """Create a not equals (not ==) expressions."""
+    __slots__ = ()
     _op = _ExprOp.NE
 
     def __init__(self, expr0: 'TypeComparisonArg', expr1: 'TypeComparisonArg'):
@@ -612,10 +652,12 @@ class NE(_BaseExpr):
                 expr = exp.NE(exp.IntBin("a"), 13).compile()
         """         
         self._children = (expr0, expr1)
+        self._fixed = None
 
 
 class GT(_BaseExpr):
     """Create a greater than (>) expression."""
+    __slots__ = ()
     _op = _ExprOp.GT
 
     def __init__(self, expr0: 'TypeComparisonArg', expr1: 'TypeComparisonArg'):
@@ -631,10 +673,12 @@ class GT(_BaseExpr):
                 expr = exp.GT(exp.IntBin("a"), 8).compile()
         """
         self._children = (expr0, expr1)
+        self._fixed = None
 
 
 class GE(_BaseExpr):
     """Create a greater than or equal to (>=) expression."""
+    __slots__ = ()
     _op = _ExprOp.GE
 
     def __init__(self, expr0: 'TypeComparisonArg', expr1: 'TypeComparisonArg'):
@@ -650,10 +694,12 @@ class GE(_BaseExpr):
                 expr = exp.GE(exp.IntBin("a"), 88).compile()
         """
         self._children = (expr0, expr1)
+        self._fixed = None
 
 
 class LT(_BaseExpr):
     """Create a less than (<) expression."""
+    __slots__ = ()
     _op = _ExprOp.LT
 
     def __init__(self, expr0: 'TypeComparisonArg', expr1: 'TypeComparisonArg'):
@@ -669,10 +715,12 @@ class LT(_BaseExpr):
                 expr = exp.LT(exp.IntBin("a"), 1000).compile()
         """
         self._children = (expr0, expr1)
+        self._fixed = None
 
 
 class LE(_BaseExpr):
     """Create a less than or equal to (<=) expression."""
+    __slots__ = ()
     _op = _ExprOp.LE
 
     def __init__(self, expr0: 'TypeComparisonArg', expr1: 'TypeComparisonArg'):
@@ -688,10 +736,12 @@ class LE(_BaseExpr):
                 expr = exp.LE(exp.IntBin("a"), 1).compile()
         """
         self._children = (expr0, expr1)
+        self._fixed = None
 
 
 class CmpRegex(_BaseExpr):
     """ Create an expression that performs a regex match on a string bin or value expression."""
+    __slots__ = ()
     _op = _ExprOp.CMP_REGEX
 
     def __init__(self, options: int, regex_str: str, cmp_str: Union[_BaseExpr, str]):
@@ -715,6 +765,7 @@ class CmpRegex(_BaseExpr):
 
 class CmpGeo(_BaseExpr):
     """Create a point within region or region contains point expression."""
+    __slots__ = ()
     _op = _ExprOp.CMP_GEO
 
     def __init__(self, expr0: 'TypeGeo', expr1: 'TypeGeo'):
@@ -730,6 +781,7 @@ class CmpGeo(_BaseExpr):
                 expr = exp.CmpGeo(exp.GeoBin("point"), exp.GeoBin("region")).compile()
         """
         self._children = (expr0, expr1)
+        self._fixed = None
 
 
 #####################
@@ -739,6 +791,7 @@ class CmpGeo(_BaseExpr):
 
 class Not(_BaseExpr):
     """Create a "not" (not) operator expression."""
+    __slots__ = ()
     _op = _ExprOp.NOT
 
     def __init__(self, *exprs: _BaseExpr):
@@ -755,10 +808,12 @@ class Not(_BaseExpr):
                             exp.Eq(exp.IntBin("a"), 10))).compile()
         """
         self._children = exprs
+        self._fixed = None
 
 
 class And(_BaseExpr):
     """Create an "and" operator that applies to a variable amount of expressions."""
+    __slots__ = ()
     _op = _ExprOp.AND
 
     def __init__(self, *exprs: _BaseExpr):
@@ -777,10 +832,12 @@ class And(_BaseExpr):
                     exp.LT(exp.IntBin("b"), 3)).compile()
         """
         self._children = exprs + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Or(_BaseExpr):
     """Create an "or" operator that applies to a variable amount of expressions."""
+    __slots__ = ()
     _op = _ExprOp.OR
 
     def __init__(self, *exprs: _BaseExpr):
@@ -797,10 +854,12 @@ class Or(_BaseExpr):
                     exp.Eq(exp.IntBin("b"), 0)).compile()
         """ 
         self._children = exprs + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Exclusive(_BaseExpr):
     """Create an expression that returns True if only one of the expressions are True."""
+    __slots__ = ()
     _op = _ExprOp.EXCLUSIVE
 
     def __init__(self, *exprs: _BaseExpr):
@@ -817,6 +876,7 @@ class Exclusive(_BaseExpr):
                             exp.Eq(exp.IntBin("b"), 0)).compile()
         """
         self._children = exprs + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 #######################################
@@ -840,6 +900,7 @@ class Cond(_BaseExpr):
 
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.COND
 
     def __init__(self, *exprs: _BaseExpr):
@@ -897,6 +958,7 @@ class Cond(_BaseExpr):
             # (('test', 'demo', 'key', bytearray(b'...')), {'ttl': 2592000, 'gen': 2}, {'results': -1})
             """
         self._children = exprs + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Let(_BaseExpr):
@@ -906,6 +968,7 @@ class Let(_BaseExpr):
         argument. This expression is useful if you need to reuse the result of a
         complicated or expensive expression.
     """
+    __slots__ = ()
     _op = _ExprOp.LET
 
     def __init__(self, *exprs: _BaseExpr):
@@ -923,12 +986,14 @@ class Let(_BaseExpr):
                     exp.LT(exp.Var("x"), 10))).compile()
         """
         self._children = exprs + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class Def(_BaseExpr):
     """ Assign variable to an expression that can be accessed later with :class:`~aerospike_helpers.expressions.base.Var`.
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.DEF
 
     def __init__(self, var_name: str, expr: _BaseExpr):
@@ -954,6 +1019,7 @@ class Var(_BaseExpr):
     """ Retrieve expression value from a variable previously defined with :class:`~aerospike_helpers.expressions.base.Def`.
         Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.VAR
 
     def __init__(self, var_name: str):
@@ -971,3 +1037,4 @@ class Var(_BaseExpr):
                         exp.LT(exp.Var("x"), 10))).compile()
         """
         self._fixed = {_Keys.VALUE_KEY: var_name}
+        self._children = ()
@@ -50,6 +50,7 @@ TypePolicy = Union[Dict[str, Any], None]
 
 class BitResize(_BaseExpr):
     """Create an expression that performs a bit_resize operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_RESIZE
 
     def __init__(self, policy: 'TypePolicy', byte_size: int, flags: int, bin: 'TypeBinName'):
@@ -73,10 +74,12 @@ class BitResize(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: flags} if flags is not None else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitInsert(_BaseExpr):
     """Create an expression that performs a bit_insert operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_INSERT
 
     def __init__(self, policy: 'TypePolicy', byte_offset: int, value: 'TypeBitValue', bin: 'TypeBinName'):
@@ -100,10 +103,12 @@ class BitInsert(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitRemove(_BaseExpr):
     """Create an expression that performs a bit_remove operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_REMOVE
 
     def __init__(self, policy: 'TypePolicy', byte_offset: int, byte_size: int, bin: 'TypeBinName'):
@@ -131,10 +136,12 @@ class BitRemove(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitSet(_BaseExpr):
     """Create an expression that performs a bit_set operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_SET
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, value: 'TypeBitValue', bin: 'TypeBinName'):
@@ -160,10 +167,12 @@ class BitSet(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitOr(_BaseExpr):
     """Create an expression that performs a bit_or operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_OR
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, value: 'TypeBitValue', bin: 'TypeBinName'):
@@ -196,10 +205,12 @@ class BitOr(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitXor(_BaseExpr):
     """Create an expression that performs a bit_xor operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_XOR
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, value: 'TypeBitValue', bin: 'TypeBinName'):
@@ -225,10 +236,12 @@ class BitXor(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitAnd(_BaseExpr):
     """Create an expression that performs a bit_and operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_AND
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, value: 'TypeBitValue', bin: 'TypeBinName'):
@@ -262,10 +275,12 @@ class BitAnd(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitNot(_BaseExpr):
     """Create an expression that performs a bit_not operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_NOT
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, bin: 'TypeBinName'):
@@ -289,10 +304,12 @@ class BitNot(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitLeftShift(_BaseExpr):
     """Create an expression that performs a bit_lshift operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_LSHIFT
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, shift: int, bin: 'TypeBinName'):
@@ -318,10 +335,12 @@ class BitLeftShift(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitRightShift(_BaseExpr):
     """Create an expression that performs a bit_rshift operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_RSHIFT
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, shift: int, bin: 'TypeBinName'):
@@ -353,12 +372,14 @@ class BitRightShift(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitAdd(_BaseExpr):
     """Create an expression that performs a bit_add operation.
        Note: integers are stored big-endian.
     """
+    __slots__ = ()
     _op = aerospike.OP_BIT_ADD
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, value: int, action: int, bin: 'TypeBinName'):
@@ -393,12 +414,14 @@ class BitAdd(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: action} if action is not None else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitSubtract(_BaseExpr):
     """ Create an expression that performs a bit_subtract operation.
         Note: integers are stored big-endian.
     """
+    __slots__ = ()
     _op = aerospike.OP_BIT_SUBTRACT
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, value: int, action: int, bin: 'TypeBinName'):
@@ -426,12 +449,14 @@ class BitSubtract(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: action} if action is not None else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitSetInt(_BaseExpr):
     """ Create an expression that performs a bit_set_int operation.
         Note: integers are stored big-endian.
     """
+    __slots__ = ()
     _op = aerospike.OP_BIT_SET_INT
 
     def __init__(self, policy: 'TypePolicy', bit_offset: int, bit_size: int, value: int, bin: 'TypeBinName'):
@@ -457,6 +482,7 @@ class BitSetInt(_BaseExpr):
             _GenericExpr(_ExprOp._AS_EXP_BIT_FLAGS, 0, {_Keys.VALUE_KEY: policy['bit_write_flags']} if policy is not None and 'bit_write_flags' in policy else {_Keys.VALUE_KEY: 0}),
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 ######################
@@ -466,6 +492,7 @@ class BitSetInt(_BaseExpr):
 
 class BitGet(_BaseExpr):
     """Create an expression that performs a bit_get operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_GET
 
     def __init__(self, bit_offset: int, bit_size: int, bin: 'TypeBinName'):
@@ -487,10 +514,12 @@ class BitGet(_BaseExpr):
             bit_size,
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitCount(_BaseExpr):
     """Create an expression that performs a bit_count operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_COUNT
 
     def __init__(self, bit_offset: int, bit_size: int, bin: 'TypeBinName'):
@@ -516,10 +545,12 @@ class BitCount(_BaseExpr):
             bit_size,
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitLeftScan(_BaseExpr):
     """Create an expression that performs a bit_lscan operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_LSCAN
 
     def __init__(self, bit_offset: int, bit_size: int, value: bool, bin: 'TypeBinName'):
@@ -543,10 +574,12 @@ class BitLeftScan(_BaseExpr):
             value,
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitRightScan(_BaseExpr):
     """Create an expression that performs a bit_rscan operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_RSCAN
 
     def __init__(self, bit_offset: int, bit_size: int, value: bool, bin: 'TypeBinName'):
@@ -574,10 +607,12 @@ class BitRightScan(_BaseExpr):
             value,
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
 
 
 class BitGetInt(_BaseExpr):
     """Create an expression that performs a bit_get_int operation."""
+    __slots__ = ()
     _op = aerospike.OP_BIT_GET_INT
 
     def __init__(self, bit_offset: int, bit_size: int, sign: bool, bin: 'TypeBinName'):
@@ -601,3 +636,4 @@ class BitGetInt(_BaseExpr):
             1 if sign else 0,
             bin if isinstance(bin, _BaseExpr) else BlobBin(bin)
         )
+        self._fixed = None
@@ -39,6 +39,7 @@ class IntAnd(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_AND
 
     def __init__(self, *exprs: 'TypeInteger'):
@@ -53,6 +54,7 @@ class IntAnd(_BaseExpr):
                 expr = exp.Eq(exp.IntAnd(exp.IntBin("a"), 0xff), 0x11).compile()
         """
         self._children = exprs + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class IntOr(_BaseExpr):
@@ -61,6 +63,7 @@ class IntOr(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_OR
 
     def __init__(self, *exprs: 'TypeInteger'):
@@ -75,6 +78,7 @@ class IntOr(_BaseExpr):
                 expr = exp.NE(exp.IntOr(IntBin("a"), 0x10), 0).compile()
         """
         self._children = exprs + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class IntXOr(_BaseExpr):
@@ -83,6 +87,7 @@ class IntXOr(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_XOR
 
     def __init__(self, *exprs: 'TypeInteger'):
@@ -97,6 +102,7 @@ class IntXOr(_BaseExpr):
                 expr = exp.Eq(exp.IntXOr(exp.IntBin("a"), exp.IntBin("b")), 16).compile()
         """
         self._children = exprs + (_GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, 0, {}),)
+        self._fixed = None
 
 
 class IntNot(_BaseExpr):
@@ -104,6 +110,7 @@ class IntNot(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_NOT
 
     def __init__(self, expr: 'TypeInteger'):
@@ -118,6 +125,7 @@ class IntNot(_BaseExpr):
                 expr = exp.Eq(exp.IntNot(exp.IntBin("a")), 7).compile()
         """
         self._children = (expr,)
+        self._fixed = None
 
 
 class IntLeftShift(_BaseExpr):
@@ -125,6 +133,7 @@ class IntLeftShift(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_LSHIFT
 
     def __init__(self, value: 'TypeInteger', shift: 'TypeInteger'):
@@ -140,6 +149,7 @@ class IntLeftShift(_BaseExpr):
                 expr = exp.GT(exp.IntLeftShift(exp.IntBin("a"), 8), 0xff).compile()
         """
         self._children = (value, shift)
+        self._fixed = None
 
 
 class IntRightShift(_BaseExpr):
@@ -147,6 +157,7 @@ class IntRightShift(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_RSHIFT
 
     def __init__(self, value: 'TypeInteger', shift: 'TypeInteger'):
@@ -162,6 +173,7 @@ class IntRightShift(_BaseExpr):
                 expr = exp.GT(exp.IntRightShift(exp.IntBin("a"), 8), 0xff).compile()
         """
         self._children = (value, shift)
+        self._fixed = None
 
 
 class IntArithmeticRightShift(_BaseExpr):
@@ -169,6 +181,7 @@ class IntArithmeticRightShift(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_ARSHIFT
 
     def __init__(self, value: 'TypeInteger', shift: 'TypeInteger'):
@@ -184,6 +197,7 @@ class IntArithmeticRightShift(_BaseExpr):
                 expr = exp.GT(exp.IntArithmeticRightShift(exp.IntBin("a"), 8), 0xff).compile()
         """
         self._children = (value, shift)
+        self._fixed = None
 
 
 class IntCount(_BaseExpr):
@@ -191,6 +205,7 @@ class IntCount(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_COUNT
 
     def __init__(self, value: 'TypeInteger'):
@@ -205,6 +220,7 @@ class IntCount(_BaseExpr):
                 expr = exp.Eq(exp.IntCount(exp.IntBin("a")), 4).compile()
         """
         self._children = (value,)
+        self._fixed = None
 
 
 class IntLeftScan(_BaseExpr):
@@ -216,6 +232,7 @@ class IntLeftScan(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_LSCAN
 
     def __init__(self, value: 'TypeInteger', search: 'TypeBool'):
@@ -231,6 +248,7 @@ class IntLeftScan(_BaseExpr):
                 expr = exp.GT(exp.IntLeftScan(exp.IntBin("a"), True), 4).compile()
         """
         self._children = (value, search)
+        self._fixed = None
 
 
 class IntRightScan(_BaseExpr):
@@ -243,6 +261,7 @@ class IntRightScan(_BaseExpr):
 
        Requires server version 5.6.0+.
     """
+    __slots__ = ()
     _op = _ExprOp.INT_RSCAN
 
     def __init__(self, value: 'TypeInteger', search: 'TypeBool'):
@@ -258,3 +277,4 @@ class IntRightScan(_BaseExpr):
                 expr = exp.GT(exp.IntRightScan(exp.IntBin("a"), True), 4).compile()
         """
         self._children = (value, search)
+        self._fixed = None
@@ -47,6 +47,7 @@ class HLLInit(_BaseExpr):
        an existing HLL bin will set that config and retain its current value for the unset config.
        If the HLL bin does not exist, index_bit_count is required to create it, mh_bit_count is optional.
     """
+    __slots__ = ()
     _op = aerospike.OP_HLL_INIT
 
     def __init__(self, policy: 'TypePolicy', index_bit_count: Union[int, None], mh_bit_count: Union[int, None], bin: 'TypeBinName'):
@@ -69,10 +70,12 @@ class HLLInit(_BaseExpr):
             policy['flags'] if policy is not None and 'flags' in policy else aerospike.HLL_WRITE_DEFAULT,
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin)
         )
+        self._fixed = None
 
 
 class HLLAdd(_BaseExpr):
     """Create an expression that performs an hll_add."""
+    __slots__ = ()
     _op = aerospike.OP_HLL_ADD
 
     def __init__(self, policy: 'TypePolicy', list: 'TypeListValue', index_bit_count: Union[int, None], mh_bit_count: Union[int, None], bin: 'TypeBinName'):
@@ -98,6 +101,7 @@ class HLLAdd(_BaseExpr):
             policy['flags'] if policy is not None and 'flags' in policy else aerospike.HLL_WRITE_DEFAULT,
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin)
         )
+        self._fixed = None
 
 
 ######################
@@ -107,6 +111,7 @@ class HLLAdd(_BaseExpr):
 
 class HLLGetCount(_BaseExpr):
     """Create an expression that performs an as_operations_hll_get_count."""
+    __slots__ = ()
     _op = aerospike.OP_HLL_GET_COUNT
 
     def __init__(self, bin: 'TypeBinName'):
@@ -123,10 +128,12 @@ class HLLGetCount(_BaseExpr):
         self._children = (
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin),
         )
+        self._fixed = None
 
 
 class HLLGetUnion(_BaseExpr):
     """Create an expression that performs an hll_get_union."""
+    __slots__ = ()
     _op = aerospike.OP_HLL_GET_UNION
 
     def __init__(self, values: 'TypeValue', bin: 'TypeBinName'):
@@ -147,10 +154,12 @@ class HLLGetUnion(_BaseExpr):
             values,
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin),
         )
+        self._fixed = None
 
 
 class HLLGetUnionCount(_BaseExpr):
     """Create an expression that performs an as_operations_hll_get_union_count."""
+    __slots__ = ()
     _op = aerospike.OP_HLL_GET_UNION_COUNT
 
     def __init__(self, values: 'TypeValue', bin: 'TypeBinName'):
@@ -171,10 +180,12 @@ class HLLGetUnionCount(_BaseExpr):
             values,
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin),
         )
+        self._fixed = None
 
 
 class HLLGetIntersectCount(_BaseExpr):
     """Create an expression that performs an as_operations_hll_get_inersect_count."""
+    __slots__ = ()
     _op = aerospike.OP_HLL_GET_INTERSECT_COUNT
 
     def __init__(self, values: 'TypeValue', bin: 'TypeBinName'):
@@ -195,10 +206,12 @@ class HLLGetIntersectCount(_BaseExpr):
             values,
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin),
         )
+        self._fixed = None
 
 
 class HLLGetSimilarity(_BaseExpr):
     """Create an expression that performs an as_operations_hll_get_similarity."""
+    __slots__ = ()
     _op = aerospike.OP_HLL_GET_SIMILARITY
 
     def __init__(self, values: 'TypeValue', bin: 'TypeBinName'):
@@ -220,10 +233,12 @@ class HLLGetSimilarity(_BaseExpr):
             values,
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin),
         )
+        self._fixed = None
 
 
 class HLLDescribe(_BaseExpr):
     """Create an expression that performs an as_operations_hll_describe."""
+    __slots__ = ()
     _op = aerospike.OP_HLL_DESCRIBE
 
     def __init__(self, bin: 'TypeBinName'):
@@ -240,12 +255,14 @@ class HLLDescribe(_BaseExpr):
         self._children = (
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin),
         )
+        self._fixed = None
 
 
 class HLLMayContain(_BaseExpr):
     """ Create an expression that checks if the HLL bin contains any keys in
         list.
     """
+    __slots__ = ()
     _op = aerospike.OP_HLL_MAY_CONTAIN
 
     def __init__(self, list: 'TypeListValue', bin: 'TypeBinName', ):
@@ -264,3 +281,4 @@ class HLLMayContain(_BaseExpr):
             list,
             bin if isinstance(bin, _BaseExpr) else HLLBin(bin),
         )
+        self._fixed = None
@@ -47,6 +47,7 @@ TypePolicy = Union[Dict[str, Any], None]
 
 class ListAppend(_BaseExpr):
     """Create an expression that appends value to end of list."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_APPEND
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', value: 'TypeValue', bin: 'TypeBinName'):
@@ -80,6 +81,7 @@ class ListAppend(_BaseExpr):
 
 class ListAppendItems(_BaseExpr):
     """Create an expression that appends a list of items to the end of a list."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_APPEND_ITEMS
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', value: 'TypeValue', bin: 'TypeBinName'):
@@ -115,6 +117,7 @@ class ListAppendItems(_BaseExpr):
 
 class ListInsert(_BaseExpr):
     """Create an expression that inserts value to specified index of list."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_INSERT
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', index: 'TypeIndex', value: 'TypeValue', bin: 'TypeBinName'):
@@ -150,6 +153,7 @@ class ListInsert(_BaseExpr):
 
 class ListInsertItems(_BaseExpr):
     """Create an expression that inserts each input list item starting at specified index of list."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_INSERT_ITEMS
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', index: 'TypeIndex', values: 'TypeListValue', bin: 'TypeBinName'):
@@ -185,6 +189,7 @@ class ListInsertItems(_BaseExpr):
 
 class ListIncrement(_BaseExpr):
     """Create an expression that increments list[index] by value."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_INCREMENT
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', index: 'TypeIndex', value: 'TypeValue', bin: 'TypeBinName'):
@@ -226,6 +231,7 @@ class ListIncrement(_BaseExpr):
 
 class ListSet(_BaseExpr):
     """Create an expression that sets item value at specified index in list."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_SET
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', index: 'TypeIndex', value: 'TypeValue', bin: 'TypeBinName'):
@@ -261,6 +267,7 @@ class ListSet(_BaseExpr):
 
 class ListClear(_BaseExpr):
     """Create an expression that removes all items in a list."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_CLEAR
 
     def __init__(self, ctx: 'TypeCTX', bin: 'TypeBinName'):
@@ -288,6 +295,7 @@ class ListClear(_BaseExpr):
 
 class ListSort(_BaseExpr):
     """Create an expression that sorts a list."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_SORT
 
     def __init__(self, ctx: 'TypeCTX', order: int, bin: 'TypeBinName'):
@@ -314,6 +322,7 @@ class ListSort(_BaseExpr):
 
 class ListRemoveByValue(_BaseExpr):
     """Create an expression that removes list items identified by value."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_VALUE
 
     def __init__(self, ctx: 'TypeCTX', value: 'TypeValue', bin: 'TypeBinName'):
@@ -342,6 +351,7 @@ class ListRemoveByValue(_BaseExpr):
 
 class ListRemoveByValueList(_BaseExpr):
     """Create an expression that removes list items identified by values."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_VALUE_LIST
 
     def __init__(self, ctx: 'TypeCTX', values: 'TypeListValue', bin: 'TypeBinName'):
@@ -372,6 +382,7 @@ class ListRemoveByValueRange(_BaseExpr):
         (begin inclusive, end exclusive). If begin is None, the range is less than end.
         If end is None, the range is greater than or equal to begin.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_VALUE_RANGE
 
     def __init__(self, ctx: 'TypeCTX', begin: 'TypeValue', end: 'TypeValue', bin: 'TypeBinName'):
@@ -401,6 +412,7 @@ class ListRemoveByValueRange(_BaseExpr):
 
 class ListRemoveByValueRelRankToEnd(_BaseExpr):
     """Create an expression that removes list items nearest to value and greater by relative rank."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_REL_RANK_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', value: 'TypeValue', rank: 'TypeRank', bin: 'TypeBinName'):
@@ -435,6 +447,7 @@ class ListRemoveByValueRelRankRange(_BaseExpr):
     """ Create an expression that removes list items nearest to value and greater by relative rank with a
         count limit.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_REL_RANK_RANGE
 
     def __init__(self, ctx: 'TypeCTX', value: 'TypeValue', rank: 'TypeRank', count: 'TypeCount', bin: 'TypeBinName'):
@@ -468,6 +481,7 @@ class ListRemoveByValueRelRankRange(_BaseExpr):
 
 class ListRemoveByIndex(_BaseExpr):
     """Create an expression that removes "count" list items starting at specified index."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_INDEX
 
     def __init__(self, ctx: 'TypeCTX', index: 'TypeIndex', bin: 'TypeBinName'):
@@ -495,6 +509,7 @@ class ListRemoveByIndex(_BaseExpr):
 
 class ListRemoveByIndexRangeToEnd(_BaseExpr):
     """Create an expression that removes list items starting at specified index to the end of list."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_INDEX_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', index: 'TypeIndex', bin: 'TypeBinName'):
@@ -522,6 +537,7 @@ class ListRemoveByIndexRangeToEnd(_BaseExpr):
 
 class ListRemoveByIndexRange(_BaseExpr):
     """Create an expression that removes "count" list items starting at specified index."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_INDEX_RANGE
 
     def __init__(self, ctx: 'TypeCTX', index: 'TypeIndex', count: 'TypeCount', bin: 'TypeBinName'):
@@ -551,6 +567,7 @@ class ListRemoveByIndexRange(_BaseExpr):
 
 class ListRemoveByRank(_BaseExpr):
     """Create an expression that removes list item identified by rank."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_RANK
 
     def __init__(self, ctx: 'TypeCTX', rank: 'TypeRank', bin: 'TypeBinName'):
@@ -578,6 +595,7 @@ class ListRemoveByRank(_BaseExpr):
 
 class ListRemoveByRankRangeToEnd(_BaseExpr):
     """Create an expression that removes list items starting at specified rank to the last ranked item."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_RANK_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', rank: 'TypeRank', bin: 'TypeBinName'):
@@ -607,6 +625,7 @@ class ListRemoveByRankRangeToEnd(_BaseExpr):
 
 class ListRemoveByRankRange(_BaseExpr):
     """Create an expression that removes "count" list items starting at specified rank."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_REMOVE_BY_RANK_RANGE
 
     def __init__(self, ctx: 'TypeCTX', rank: 'TypeRank', count: 'TypeCount', bin: 'TypeBinName'):
@@ -641,6 +660,7 @@ class ListRemoveByRankRange(_BaseExpr):
 
 class ListSize(_BaseExpr):
     """Create an expression that returns list size."""
+    __slots__ = ()
     _op = aerospike.OP_LIST_SIZE
 
     def __init__(self, ctx: 'TypeCTX', bin: 'TypeBinName'):
@@ -668,6 +688,7 @@ class ListGetByValue(_BaseExpr):
     """ Create an expression that selects list items identified by value and returns selected
         data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_VALUE
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value: 'TypeValue', bin: 'TypeBinName'):
@@ -699,6 +720,7 @@ class ListGetByValueRange(_BaseExpr):
     """ Create an expression that selects list items identified by value range and returns selected
         data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_VALUE_RANGE
 
     def __init__(
@@ -742,6 +764,7 @@ class ListGetByValueList(_BaseExpr):
     """ Create an expression that selects list items identified by values and returns selected
         data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_VALUE_LIST
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value: 'TypeListValue', bin: 'TypeBinName'):
@@ -772,6 +795,7 @@ class ListGetByValueList(_BaseExpr):
 
 class ListGetByValueRelRankRangeToEnd(_BaseExpr):
     """Create an expression that selects list items nearest to value and greater by relative rank"""
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_VALUE_RANK_RANGE_REL_TO_END
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value: 'TypeValue', rank: 'TypeRank', bin: 'TypeBinName'):
@@ -808,6 +832,7 @@ class ListGetByValueRelRankRange(_BaseExpr):
     """ Create an expression that selects list items nearest to value and greater by relative rank with a
         count limit and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_VALUE_RANK_RANGE_REL
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value: 'TypeValue', rank: 'TypeRank', count: 'TypeCount', bin: 'TypeBinName'):
@@ -847,6 +872,7 @@ class ListGetByIndex(_BaseExpr):
     """ Create an expression that selects list item identified by index
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_INDEX
 
     def __init__(
@@ -886,6 +912,7 @@ class ListGetByIndexRangeToEnd(_BaseExpr):
     """ Create an expression that selects list items starting at specified index to the end of list
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_INDEX_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, index: 'TypeIndex', bin: 'TypeBinName'):
@@ -917,6 +944,7 @@ class ListGetByIndexRange(_BaseExpr):
     """ Create an expression that selects "count" list items starting at specified index
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_INDEX_RANGE
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, index: 'TypeIndex', count: 'TypeCount', bin: 'TypeBinName'):
@@ -950,6 +978,7 @@ class ListGetByRank(_BaseExpr):
     """ Create an expression that selects list item identified by rank
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_RANK
 
     def __init__(
@@ -989,6 +1018,7 @@ class ListGetByRankRangeToEnd(_BaseExpr):
     """ Create an expression that selects list items starting at specified rank to the last ranked item
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_RANK_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, rank: 'TypeRank', bin: 'TypeBinName'):
@@ -1020,6 +1050,7 @@ class ListGetByRankRange(_BaseExpr):
     """ Create an expression that selects "count" list items starting at specified rank
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_LIST_GET_BY_RANK_RANGE
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, rank: 'TypeRank', count: 'TypeCount', bin: 'TypeBinName'):
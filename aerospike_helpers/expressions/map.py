@@ -49,6 +49,7 @@ TypePolicy = Union[Dict[str, Any], None]
 
 class MapPut(_BaseExpr):
     """Create an expression that writes key/val to map bin."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_PUT
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', key: 'TypeKey', value: 'TypeValue', bin: 'TypeBinName'):
@@ -83,6 +84,7 @@ class MapPut(_BaseExpr):
 
 class MapPutItems(_BaseExpr):
     """Create an expression that writes each map item to map bin."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_PUT_ITEMS
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', map: map, bin: 'TypeBinName'):
@@ -117,6 +119,7 @@ class MapIncrement(_BaseExpr):
     """ Create an expression that increments a map value, by value, for all items identified by key.
         Valid only for numbers.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_INCREMENT
 
     def __init__(self, ctx: 'TypeCTX', policy: 'TypePolicy', key: 'TypeKey', value: 'TypeValue', bin: 'TypeBinName'):
@@ -151,6 +154,7 @@ class MapIncrement(_BaseExpr):
 
 class MapClear(_BaseExpr):
     """Create an expression that removes all items in map."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_CLEAR
 
     def __init__(self, ctx: 'TypeCTX', bin: 'TypeBinName'):
@@ -176,6 +180,7 @@ class MapClear(_BaseExpr):
 
 class MapRemoveByKey(_BaseExpr):
     """Create an expression that removes a map item identified by key."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_KEY
 
     def __init__(self, ctx: 'TypeCTX', key: 'TypeKey', bin: 'TypeBinName'):
@@ -203,6 +208,7 @@ class MapRemoveByKey(_BaseExpr):
 
 class MapRemoveByKeyList(_BaseExpr):
     """Create an expression that removes map items identified by keys."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_KEY_LIST
 
     def __init__(self, ctx: 'TypeCTX', keys: List[TypeKey], bin: 'TypeBinName'):
@@ -233,6 +239,7 @@ class MapRemoveByKeyRange(_BaseExpr):
         (begin inclusive, end exclusive). If begin is None, the range is less than end.
         If end is None, the range is greater than equal to begin.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_KEY_RANGE
 
     def __init__(self, ctx: 'TypeCTX', begin: 'TypeValue', end: 'TypeValue', bin: 'TypeBinName'):
@@ -262,6 +269,7 @@ class MapRemoveByKeyRange(_BaseExpr):
 
 class MapRemoveByKeyRelIndexRangeToEnd(_BaseExpr):
     """Create an expression that removes map items nearest to key and greater by index."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_KEY_REL_INDEX_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', key: 'TypeKey', index: 'TypeIndex', bin: 'TypeBinName'):
@@ -292,6 +300,7 @@ class MapRemoveByKeyRelIndexRangeToEnd(_BaseExpr):
 
 class MapRemoveByKeyRelIndexRange(_BaseExpr):
     """Create an expression that removes map items nearest to key and greater by index with a count limit."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_KEY_REL_INDEX_RANGE
 
     def __init__(self, ctx: 'TypeCTX', key: 'TypeKey', index: 'TypeIndex', count: 'TypeCount', bin: 'TypeBinName'):
@@ -325,6 +334,7 @@ class MapRemoveByKeyRelIndexRange(_BaseExpr):
 
 class MapRemoveByValue(_BaseExpr):
     """Create an expression that removes map items identified by value."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_VALUE
 
     def __init__(self, ctx: 'TypeCTX', value: 'TypeValue', bin: 'TypeBinName'):
@@ -352,6 +362,7 @@ class MapRemoveByValue(_BaseExpr):
 
 class MapRemoveByValueList(_BaseExpr):
     """Create an expression that removes map items identified by values."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_VALUE_LIST
 
     def __init__(self, ctx: 'TypeCTX', values: 'TypeListValue', bin: 'TypeBinName'):
@@ -382,6 +393,7 @@ class MapRemoveByValueRange(_BaseExpr):
         (begin inclusive, end exclusive). If begin is nil, the range is less than end.
         If end is aerospike.CDTInfinite(), the range is greater than equal to begin.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_VALUE_RANGE
 
     def __init__(self, ctx: 'TypeCTX', begin: 'TypeValue', end: 'TypeValue', bin: 'TypeBinName'):
@@ -411,6 +423,7 @@ class MapRemoveByValueRange(_BaseExpr):
 
 class MapRemoveByValueRelRankRangeToEnd(_BaseExpr):
     """Create an expression that removes map items nearest to value and greater by relative rank."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_VALUE_REL_RANK_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', value: 'TypeValue', rank: 'TypeRank', bin: 'TypeBinName'):
@@ -442,6 +455,7 @@ class MapRemoveByValueRelRankRange(_BaseExpr):
     """ Create an expression that removes map items nearest to value and greater by relative rank with a
         count limit.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_VALUE_REL_RANK_RANGE
 
     def __init__(self, ctx: 'TypeCTX', value: 'TypeValue', rank: 'TypeRank', count: 'TypeCount', bin: 'TypeBinName'):
@@ -473,6 +487,7 @@ class MapRemoveByValueRelRankRange(_BaseExpr):
 
 class MapRemoveByIndex(_BaseExpr):
     """Create an expression that removes map item identified by index."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_INDEX
 
     def __init__(self, ctx: 'TypeCTX', index: 'TypeIndex', bin: 'TypeBinName'):
@@ -500,6 +515,7 @@ class MapRemoveByIndex(_BaseExpr):
 
 class MapRemoveByIndexRangeToEnd(_BaseExpr):
     """Create an expression that removes map items starting at specified index to the end of map."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_INDEX_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', index: 'TypeIndex', bin: 'TypeBinName'):
@@ -527,6 +543,7 @@ class MapRemoveByIndexRangeToEnd(_BaseExpr):
 
 class MapRemoveByIndexRange(_BaseExpr):
     """Create an expression that removes count map items starting at specified index."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_INDEX_RANGE
 
     def __init__(self, ctx: 'TypeCTX', index: 'TypeIndex', count: 'TypeCount', bin: 'TypeBinName'):
@@ -556,6 +573,7 @@ class MapRemoveByIndexRange(_BaseExpr):
 
 class MapRemoveByRank(_BaseExpr):
     """Create an expression that removes map item identified by its value's rank."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_RANK
 
     def __init__(self, ctx: 'TypeCTX', rank: 'TypeRank', bin: 'TypeBinName'):
@@ -583,6 +601,7 @@ class MapRemoveByRank(_BaseExpr):
 
 class MapRemoveByRankRangeToEnd(_BaseExpr):
     """Create an expression that removes map items starting at specified rank to the last ranked item."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_RANK_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', rank: 'TypeRank', bin: 'TypeBinName'):
@@ -610,6 +629,7 @@ class MapRemoveByRankRangeToEnd(_BaseExpr):
 
 class MapRemoveByRankRange(_BaseExpr):
     """Create an expression that removes "count" map items starting at specified rank."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_REMOVE_BY_RANK_RANGE
 
     def __init__(self, ctx: 'TypeCTX', rank: 'TypeRank', count: 'TypeCount', bin: 'TypeBinName'):
@@ -644,6 +664,7 @@ class MapRemoveByRankRange(_BaseExpr):
 
 class MapSize(_BaseExpr):
     """Create an expression that returns map size."""
+    __slots__ = ()
     _op = aerospike.OP_MAP_SIZE
 
     def __init__(self, ctx: 'TypeCTX', bin: 'TypeBinName'):
@@ -671,6 +692,7 @@ class MapGetByKey(_BaseExpr):
     """ Create an expression that selects map item identified by key
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_KEY
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value_type: int, key: 'TypeKey', bin: 'TypeBinName'):
@@ -705,6 +727,7 @@ class MapGetByKeyRange(_BaseExpr):
        If end is aerospike.CDTInfinite(), the range is greater than equal to begin.
        Expression returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_KEY_RANGE
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, begin: 'TypeKey', end: 'TypeKey', bin: 'TypeBinName'):
@@ -738,6 +761,7 @@ class MapGetByKeyList(_BaseExpr):
     """ Create an expression that selects map items identified by keys
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_KEY_LIST
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, keys: 'TypeKeyList', bin: 'TypeBinName'):
@@ -769,6 +793,7 @@ class MapGetByKeyRelIndexRangeToEnd(_BaseExpr):
     """Create an expression that selects map items nearest to key and greater by index with a count limit.
        Expression returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_KEY_REL_INDEX_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, key: 'TypeKey', index: 'TypeIndex', bin: 'TypeBinName'):
@@ -802,6 +827,7 @@ class MapGetByKeyRelIndexRange(_BaseExpr):
     """Create an expression that selects map items nearest to key and greater by index with a count limit.
        Expression returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_KEY_REL_INDEX_RANGE
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, key: 'TypeKey', index: 'TypeIndex', count: 'TypeCount', bin: 'TypeBinName'):
@@ -840,6 +866,7 @@ class MapGetByValue(_BaseExpr):
     """Create an expression that selects map items identified by value
        and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_VALUE
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value: 'TypeValue', bin: 'TypeBinName'):
@@ -873,6 +900,7 @@ class MapGetByValueRange(_BaseExpr):
         If end is None, the range is greater than equal to begin.
         Expression returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_VALUE_RANGE
 
     def __init__(
@@ -913,6 +941,7 @@ class MapGetByValueList(_BaseExpr):
     """Create an expression that selects map items identified by values
       and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_VALUE_LIST
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value: 'TypeListValue', bin: 'TypeBinName'):
@@ -944,6 +973,7 @@ class MapGetByValueRelRankRangeToEnd(_BaseExpr):
     """Create an expression that selects map items nearest to value and greater by relative rank,
        Expression returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_VALUE_RANK_RANGE_REL_TO_END
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value: 'TypeValue', rank: 'TypeRank', bin: 'TypeBinName'):
@@ -977,6 +1007,7 @@ class MapGetByValueRelRankRange(_BaseExpr):
     """ Create an expression that selects map items nearest to value and greater by relative rank with a
         count limit. Expression returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_VALUE_RANK_RANGE_REL
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, value: 'TypeValue', rank: 'TypeRank', count: 'TypeCount', bin: 'TypeBinName'):
@@ -1014,6 +1045,7 @@ class MapGetByIndex(_BaseExpr):
     """ Create an expression that selects map item identified by index
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_INDEX
 
     def __init__(
@@ -1053,6 +1085,7 @@ class MapGetByIndexRangeToEnd(_BaseExpr):
     """Create an expression that selects map items starting at specified index to the end of map
        and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_INDEX_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, index: 'TypeIndex', bin: 'TypeBinName'):
@@ -1084,6 +1117,7 @@ class MapGetByIndexRange(_BaseExpr):
     """Create an expression that selects "count" map items starting at specified index
        and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_INDEX_RANGE
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, index: 'TypeIndex', count: 'TypeCount', bin: 'TypeBinName'):
@@ -1117,6 +1151,7 @@ class MapGetByRank(_BaseExpr):
     """ Create an expression that selects map items identified by rank
         and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_RANK
 
     def __init__(
@@ -1156,6 +1191,7 @@ class MapGetByRankRangeToEnd(_BaseExpr):
     """Create an expression that selects map items starting at specified rank to the last ranked item
        and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_RANK_RANGE_TO_END
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, rank: 'TypeRank', bin: 'TypeBinName'):
@@ -1187,6 +1223,7 @@ class MapGetByRankRange(_BaseExpr):
     """Create an expression that selects "count" map items starting at specified rank
        and returns selected data specified by return_type.
     """
+    __slots__ = ()
     _op = aerospike.OP_MAP_GET_BY_RANK_RANGE
 
     def __init__(self, ctx: 'TypeCTX', return_type: int, rank: 'TypeRank', count: 'TypeCount', bin: 'TypeBinName'):
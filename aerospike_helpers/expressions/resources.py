@@ -3,7 +3,6 @@ Resources used by all expressions.
 '''
 
 #from __future__ import annotations
-from itertools import chain
 from typing import List, Optional, Tuple, Union, Dict, Any
 import aerospike
 from aerospike_helpers import cdt_ctx
@@ -121,6 +120,8 @@ class ResultType:
 
 
 class _AtomExpr:
+    __slots__ = ()
+
     def _op(self):
         raise NotImplementedError
 
@@ -139,18 +140,37 @@ TypeChildren = Tuple[TypeChild, ...]
 
 TypeAny = Union[_AtomExpr, Any]
 
+class _SubtreeEnd:
+    # Marks the end of a sub-expression on the compile() stack.
+    __slots__ = ('node', 'start')
+
+    def __init__(self, node: '_BaseExpr', start: int):
+        self.node = node
+        self.start = start
+
+
 class _BaseExpr(_AtomExpr):
+    # _fixed and _children are set by every __init__, _compiled_op and
+    # _compiled on first use. Expressions are not changed once built.
+    __slots__ = ('_fixed', '_children', '_compiled_op', '_compiled')
+
     _op = 0
     # type: int
     _rt = None
     # type: 'TypeResultType'
-    _fixed = None
-    # type: 'TypeFixed'
-    _children = ()
-    # type: 'TypeChildren'
+
+    def __init__(self):
+        self._fixed = None
+        # type: 'TypeFixed'
+        self._children = ()
+        # type: 'TypeChildren'
 
     def _get_op(self) -> TypeCompiledOp:
-        return (self._op, self._rt, self._fixed, len(self._children))
+        op = getattr(self, '_compiled_op', None)
+        if op is None:
+            op = (self._op, self._rt, self._fixed, len(self._children))
+            self._compiled_op = op
+        return op
 
     def _vop(self, v) -> TypeCompiledOp:
         return (
@@ -161,19 +181,42 @@ class _BaseExpr(_AtomExpr):
         )
 
     def compile(self) -> TypeExpression:
+        compiled = getattr(self, '_compiled', None)
+        if compiled is None:
+            compiled = tuple(self._compile())
+            self._compiled = compiled
+
+        return list(compiled)
+
+    def _compile(self) -> TypeExpression:
         expression = [self._get_op()]
         # type: 'TypeExpression'
-        work = chain(self._children)
-
-        while True:
-            try:
-                item = next(work)
-            except StopIteration:
-                break
 
-            if isinstance(item, _BaseExpr):
-                expression.append(item._get_op())
-                work = chain(item._children, work)
+        # Sub-expressions seen in this compile(), by id, with their
+        # (start, end) in expression.
+        spans = {}
+        stack = list(reversed(self._children))
+
+        while stack:
+            item = stack.pop()
+
+            if type(item) is _SubtreeEnd:
+                spans[id(item.node)] = (item.start, len(expression))
+            elif isinstance(item, _BaseExpr):
+                compiled = getattr(item, '_compiled', None)
+                if compiled is not None:
+                    # Compiled on its own before.
+                    expression.extend(compiled)
+                elif not item._children:
+                    expression.append(item._get_op())
+                elif id(item) in spans:
+                    # Shared sub-expression, emitted before.
+                    start, end = spans[id(item)]
+                    expression.extend(expression[start:end])
+                else:
+                    stack.append(_SubtreeEnd(item, len(expression)))
+                    expression.append(item._get_op())
+                    stack.extend(reversed(item._children))
             else:
                 # Should be a str, bin, int, float, etc.
                 expression.append(self._vop(item))
@@ -203,8 +246,7 @@ class _BaseExpr(_AtomExpr):
         return _create_operator_expression(l, r, op_type)
 
     def _overload_op_va_args(self, right: 'TypeAny', op_type: int):
-        expr_end = _BaseExpr()
-        expr_end._op = _ExprOp._AS_EXP_CODE_END_OF_VA_ARGS
+        expr_end = _GenericExpr(_ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, None, None)
 
         if self._op == op_type:
             # Last element of an expression with var args'
@@ -256,14 +298,15 @@ class _BaseExpr(_AtomExpr):
         return self._overload_op(right, _ExprOp.MOD)
 
 def _create_operator_expression(left_children: 'TypeChildren', right_children: 'TypeChildren', op_type: int):
-    new_expr = _BaseExpr()
-    new_expr._op = op_type
+    new_expr = _GenericExpr(op_type, None, None)
     new_expr._children = (*left_children, *right_children)
     return new_expr
 
 class _GenericExpr(_BaseExpr):
-    
+    __slots__ = ('_op', '_rt')
+
     def __init__(self, op: _ExprOp, rt: 'TypeResultType', fixed: 'TypeFixed'):
         self._op = op
         self._rt = rt
         self._fixed = fixed
+        self._children = ()
@@ -146,3 +146,54 @@ def touch(ttl: int=None):
             "TTL should be specified in the meta dictionary for operate", DeprecationWarning)
         op_dict["val"] = ttl
     return op_dict
+
+
+class _FrozenOp(dict):
+    """An operation dictionary which can not be modified after creation."""
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("frozen operation dictionaries can not be modified")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = __ior__ = _readonly
+
+    def __repr__(self):
+        return "frozen(%s)" % dict.__repr__(self)
+
+    def __reduce__(self):
+        return (frozen, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def frozen(op):
+    """Create a read only copy of an operation dictionary.
+
+    The returned operation can be passed anywhere an operation dictionary is
+    accepted, and is meant for constant operation specs that are built once
+    and reused across many calls. Only the top level of the operation is
+    frozen, nested values such as lists or maps are shared with `op`.
+
+    Args:
+        op (dict): An operation dictionary, such as the ones returned by the
+            helpers in this module.
+    Returns:
+        A read only operation dictionary. Frozen operations are returned as
+        is.
+
+    Example::
+
+        import aerospike_helpers.operations.operations as op_helpers
+
+        INCR_COUNT = op_helpers.frozen(op_helpers.increment("count", 1))
+        for key in keys:
+            client.operate(key, [INCR_COUNT])
+    """
+    if isinstance(op, _FrozenOp):
+        return op
+    return _FrozenOp(op)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+'''
+Benchmarks for the conversion layer between Python objects and the C client.
+
+These do not need a server, every value is converted to its C client
+representation and back with the client's test only round trip methods.
+'''
+import json
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+pytest.importorskip("pytest_benchmark")
+
+
+class Opaque(object):
+    '''A value only the serializers can handle.'''
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, Opaque) and other.value == self.value
+
+
+def serialize(value):
+    return json.dumps(value.value)
+
+
+def deserialize(value):
+    return Opaque(json.loads(value))
+
+
+VALUES = {
+    'int': 123456789,
+    'float': 1234.5678,
+    'str': 'a' * 64,
+    'bytes': b'\x00\x01' * 64,
+    'bytearray': bytearray(b'\x00\x01' * 64),
+    'list': list(range(100)),
+    'map': {'key%d' % i: i for i in range(100)},
+    'nested': {
+        'list': [[i, 'str%d' % i, {'i': i}] for i in range(20)],
+        'map': {i: {'a': [i] * 5, 'b': {'c': str(i)}} for i in range(20)},
+    },
+    'key_ordered_dict': aerospike.KeyOrderedDict(
+        ('key%d' % i, i) for i in range(100)),
+    'geo': aerospike.GeoJSON({'type': 'Point', 'coordinates': [-122.0, 37.5]}),
+}
+
+BINS = {
+    'int': 1,
+    'str': 'a' * 32,
+    'bytes': b'\x00' * 32,
+    'list': list(range(10)),
+    'map': {'a': 1, 'b': [1, 2]},
+}
+KEY = ('test', 'demo', 'conversions')
+META = {'ttl': 100, 'gen': 1}
+
+
+@pytest.fixture(scope='module')
+def client():
+    # The client is never connected, conversions need no I/O.
+    client = aerospike.client({
+        'hosts': [('127.0.0.1', 3000)],
+        'serialization': (serialize, deserialize),
+    })
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize('name', sorted(VALUES))
+def test_val(benchmark, client, name):
+    value = VALUES[name]
+    result = benchmark(client._roundtrip_val, value)
+    if isinstance(value, aerospike.GeoJSON):
+        assert result.dumps() == value.dumps()
+    else:
+        assert result == value
+
+
+@pytest.mark.parametrize('name', ['list', 'map', 'nested', 'key_ordered_dict'])
+def test_val_msgpack(benchmark, client, name):
+    value = VALUES[name]
+    assert benchmark(client._roundtrip_val, value, True) == value
+
+
+def test_val_serializer(benchmark, client):
+    value = Opaque({'a': [1, 2, 3]})
+    result = benchmark(client._roundtrip_val, value, False,
+                       aerospike.SERIALIZER_USER)
+    assert result == value
+
+
+def test_record(benchmark, client):
+    key, meta, bins = benchmark(client._roundtrip_record, KEY, BINS, META)
+    assert key[:3] == KEY
+    assert meta['ttl'] == META['ttl']
+    assert bins == BINS
+
+
+def test_record_many_bins(benchmark, client):
+    bins = {'bin%d' % i: i for i in range(100)}
+    _, _, result = benchmark(client._roundtrip_record, KEY, bins)
+    assert result == bins
+
+
+def test_record_digest_key(benchmark, client):
+    key = ('test', 'demo', None, aerospike.calc_digest(*KEY))
+    result, _, _ = benchmark(client._roundtrip_record, key, BINS)
+    assert result[3] == key[3]
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+'''
+Benchmarks of operate_prepared() against operate() for list and map
+operations with a ctx.
+
+These need a server, set AEROSPIKE_HOST and AEROSPIKE_PORT to use one other
+than 127.0.0.1:3000. Each operation list is benchmarked in its own group, so
+that the operate and prepared timings are reported side by side.
+'''
+import os
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+pytest.importorskip("pytest_benchmark")
+
+from aerospike import exception as e
+from aerospike_helpers import cdt_ctx
+from aerospike_helpers.operations import list_operations as lops
+from aerospike_helpers.operations import map_operations as mops
+from aerospike_helpers.operations import operations
+
+KEY = ('test', 'demo', 'operate_prepared')
+LIST_CTX = [cdt_ctx.cdt_ctx_map_key('list'), cdt_ctx.cdt_ctx_list_index(0)]
+MAP_CTX = [cdt_ctx.cdt_ctx_map_key('map'), cdt_ctx.cdt_ctx_map_key('inner')]
+RECORD = {
+    'doc': {'list': [[0]], 'map': {'inner': {'count': 0}}},
+    'visits': 0,
+}
+
+
+def list_append(value):
+    return [lops.list_append('doc', value, ctx=LIST_CTX),
+            lops.list_size('doc', ctx=LIST_CTX)]
+
+
+def map_put(value):
+    return [mops.map_put('doc', 'last', value, ctx=MAP_CTX),
+            mops.map_increment('doc', 'count', value, ctx=MAP_CTX),
+            mops.map_get_by_key('doc', 'count', aerospike.MAP_RETURN_VALUE,
+                                ctx=MAP_CTX)]
+
+
+def mixed(value):
+    return [operations.increment('visits', value),
+            lops.list_set('doc', 0, value, ctx=LIST_CTX),
+            mops.map_put('doc', 'last', value, ctx=MAP_CTX),
+            lops.list_get_by_index('doc', 0, aerospike.LIST_RETURN_VALUE,
+                                   ctx=LIST_CTX),
+            mops.map_get_by_key('doc', 'last', aerospike.MAP_RETURN_VALUE,
+                                ctx=MAP_CTX),
+            operations.read('visits')]
+
+
+OPS = {'list_append': list_append, 'map_put': map_put, 'mixed': mixed}
+
+
+@pytest.fixture(scope='module')
+def client():
+    config = {'hosts': [(os.environ.get('AEROSPIKE_HOST', '127.0.0.1'),
+                         int(os.environ.get('AEROSPIKE_PORT', 3000)))]}
+    try:
+        client = aerospike.client(config).connect()
+    except e.AerospikeError:
+        pytest.skip('No server to benchmark against')
+    yield client
+    client.close()
+
+
+@pytest.fixture(autouse=True)
+def record(client):
+    client.put(KEY, RECORD)
+    yield
+    client.remove(KEY)
+
+
+@pytest.mark.parametrize('name', sorted(OPS))
+def test_operate(benchmark, client, name):
+    benchmark.group = name
+    build = OPS[name]
+    # The ops dicts are built for every value, as a caller of operate() does.
+    benchmark(lambda: client.operate(KEY, build(1)))
+
+
+@pytest.mark.parametrize('name', sorted(OPS))
+def test_operate_prepared(benchmark, client, name):
+    benchmark.group = name
+    prepared = client.prepare_operate(OPS[name](1))
+    values = [1] * prepared.values_size
+    benchmark(client.operate_prepared, KEY, prepared, values)
@@ -263,6 +263,12 @@ setup(
                 'src/main/client/get.c',
                 'src/main/client/get_async.c',
                 'src/main/client/put_async.c',
+                'src/main/client/exists_async.c',
+                'src/main/client/remove_async.c',
+                'src/main/client/operate_async.c',
+                'src/main/client/apply_async.c',
+                'src/main/client/batch_async.c',
+                'src/main/client/completions.c',
                 'src/main/client/get_many.c',
                 'src/main/client/batch_get_ops.c',
                 'src/main/client/select_many.c',
@@ -270,10 +276,15 @@ setup(
                 'src/main/client/info_random_node.c',
                 'src/main/client/info_node.c',
                 'src/main/client/info.c',
+                'src/main/client/info_all_parsed.c',
                 'src/main/client/put.c',
                 'src/main/client/operate_list.c',
                 'src/main/client/operate_map.c',
                 'src/main/client/operate.c',
+                'src/main/client/operate_prepared.c',
+                'src/main/client/compile_policy.c',
+                'src/main/client/compile_expression.c',
+                'src/main/client/roundtrip.c',
                 'src/main/client/query.c',
                 'src/main/client/remove.c',
                 'src/main/client/scan.c',
@@ -293,12 +304,14 @@ setup(
                 'src/main/query/get_parts.c',
                 'src/main/query/foreach.c',
                 'src/main/query/results.c',
+                'src/main/query/iter_results.c',
                 'src/main/query/select.c',
                 'src/main/query/where.c',
                 'src/main/query/execute_background.c',
                 'src/main/scan/type.c',
                 'src/main/scan/foreach.c',
                 'src/main/scan/results.c',
+                'src/main/scan/iter_results.c',
                 'src/main/scan/select.c',
                 'src/main/scan/execute_background.c',
                 'src/main/scan/apply.c',
@@ -312,6 +325,14 @@ setup(
                 'src/main/geospatial/dumps.c',
                 'src/main/policy.c',
                 'src/main/conversions.c',
+                'src/main/completion_queue.c',
+                'src/main/results_queue.c',
+                'src/main/batch_chunks.c',
+                'src/main/exp_cache.c',
+                'src/main/record_cache.c',
+                'src/main/record_cache_shm.c',
+                'src/main/single_flight.c',
+                'src/main/pool.c',
                 'src/main/convert_expressions.c',
                 'src/main/policy_config.c',
                 'src/main/calc_digest.c',
@@ -321,6 +342,13 @@ setup(
                 'src/main/nullobject/type.c',
                 'src/main/cdt_types/type.c',
                 'src/main/key_ordered_dict/type.c',
+                'src/main/record/type.c',
+                'src/main/results_iterator/type.c',
+                'src/main/batch_record/type.c',
+                'src/main/prepared_ops/type.c',
+                'src/main/prepared_ops/compile.c',
+                'src/main/policy_object/type.c',
+                'src/main/compiled_expression/type.c',
                 'src/main/client/set_xdr_filter.c',
                 'src/main/client/get_expression_base64.c',
                 'src/main/client/get_nodes.c',
@@ -328,6 +356,7 @@ setup(
                 'src/main/client/get_key_partition_id.c',
                 'src/main/client/batch_write.c',
                 'src/main/client/batch_operate.c',
+                'src/main/client/batch_write_columns.c',
                 'src/main/client/batch_remove.c',
                 'src/main/client/batch_apply.c'
             ],
@@ -0,0 +1,73 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include "types.h"
+
+/*
+ *******************************************************************************************************
+ * Splitting of batch commands with more keys than the max_keys_per_batch
+ * batch policy.
+ *
+ * The sub-batches are run by worker threads. Each worker takes the GIL to
+ * convert its keys and results and releases it while the C client runs the
+ * sub-batch, so up to BATCH_CHUNKS_MAX_WORKERS sub-batches are in flight at
+ * the same time. Within a sub-batch, the C client groups the keys by node.
+ *******************************************************************************************************
+ */
+
+// Maximum number of sub-batches run at the same time.
+#define BATCH_CHUNKS_MAX_WORKERS 8
+
+/**
+ * Runs a batch command on a slice of the keys. Returns a new reference to a
+ * list of results or to a BatchRecords object, or NULL with an exception set.
+ */
+typedef PyObject *(*batch_chunk_fn)(AerospikeClient *self, PyObject *py_keys,
+									void *udata);
+
+/**
+ * Returns a new reference to the result standing for a slice of the keys
+ * which failed with py_exception, or which was not started, if started is
+ * false, after another slice failed with py_exception. Returns NULL with an
+ * exception set on error.
+ */
+typedef PyObject *(*batch_chunk_fail_fn)(AerospikeClient *self,
+										 PyObject *py_keys,
+										 PyObject *py_exception, bool started,
+										 void *udata);
+
+/**
+ * Returns true when py_keys is a list or tuple with more than max_keys keys.
+ * A max_keys of 0 means no limit.
+ */
+bool batch_chunks_needed(PyObject *py_keys, uint32_t max_keys);
+
+/**
+ * Runs fn on the slices of at most max_keys keys of py_keys and merges the
+ * results in the order of the keys. When a sub-batch raises, no further
+ * sub-batches are started. The exception of the first failed one is raised,
+ * or, if fail_fn is not NULL, the slices which failed or were not started
+ * are merged as returned by fail_fn. Must be called with the GIL held.
+ */
+PyObject *batch_chunks_invoke(AerospikeClient *self, PyObject *py_keys,
+							  uint32_t max_keys, batch_chunk_fn fn,
+							  batch_chunk_fail_fn fail_fn, void *udata);
@@ -0,0 +1,51 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeBatchRecord_Ready(void);
+
+/**
+ * Creates a batch record of type py_type for a result. Subclasses of the C
+ * type are allocated without calling __init__, other types are called with
+ * the key.
+ */
+PyObject *AerospikeBatchRecord_New(PyObject *py_type, PyObject *py_key);
+
+/**
+ * Sets the result, in_doubt and, on success, record fields of a batch
+ * record. The slots of the C type are set directly, other objects through
+ * setattr.
+ */
+as_status AerospikeBatchRecord_Set_Result(AerospikeClient *client,
+										  as_error *err,
+										  PyObject *py_batch_record,
+										  as_status result, bool in_doubt,
+										  const as_record *rec,
+										  const as_key *key);
@@ -89,6 +89,16 @@ PyObject *AerospikeClient_Apply_Invoke(AerospikeClient *self, PyObject *py_key,
 									   PyObject *py_function,
 									   PyObject *py_arglist,
 									   PyObject *py_policy);
+
+/**
+ * Async Apply a UDF on a record in the database.
+ *
+ *		client.apply_async(callback, (x,y,z), module, function, args...)
+ *
+ */
+PyObject *AerospikeClient_Apply_Async(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds);
+
 /**
  * Check existence of a record in the database.
  *
@@ -101,6 +111,15 @@ PyObject *AerospikeClient_Exists(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Exists_Invoke(AerospikeClient *self, PyObject *py_key,
 										PyObject *py_policy);
 
+/**
+ * Async Check existence of a record in the database.
+ *
+ *		client.exists_async(callback, (x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Exists_Async(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds);
+
 /**
  * Read a record from the database.
  *
@@ -166,6 +185,15 @@ PyObject *AerospikeClient_Remove(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Remove_Invoke(AerospikeClient *self, PyObject *py_key,
 										PyObject *py_meta, PyObject *py_policy);
 
+/**
+ * Async Remove a record from the database.
+ *
+ *		client.remove_async(callback, (x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Remove_Async(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds);
+
 /**
  * Remove bin from the database.
  *
@@ -214,6 +242,16 @@ PyObject *AerospikeClient_Touch(AerospikeClient *self, PyObject *args,
  */
 PyObject *AerospikeClient_Operate(AerospikeClient *self, PyObject *args,
 								  PyObject *kwds);
+
+/**
+ * Async Performs operate operations
+ *
+ *		client.operate_async(callback, (x,y,z), [ops])
+ *
+ */
+PyObject *AerospikeClient_Operate_Async(AerospikeClient *self, PyObject *args,
+										PyObject *kwds);
+
 /**
  * Performs operate ordered operations
  *
@@ -223,6 +261,33 @@ PyObject *AerospikeClient_Operate(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_OperateOrdered(AerospikeClient *self, PyObject *args,
 										 PyObject *kwds);
 
+/**
+ * Converts a list of operations and an operate policy once.
+ *
+ *		client.prepare_operate([ops], policy)
+ *
+ */
+PyObject *AerospikeClient_Prepare_Operate(AerospikeClient *self,
+										  PyObject *args, PyObject *kwds);
+
+/**
+ * Performs operations converted by prepare_operate() on a record.
+ *
+ *		client.operate_prepared(key, prepared, values, meta)
+ *
+ */
+PyObject *AerospikeClient_Operate_Prepared(AerospikeClient *self,
+										   PyObject *args, PyObject *kwds);
+
+/**
+ * Convert a policy dict once, for use in place of the dict.
+ *
+ *		client.compile_policy(kind, policy)
+ *
+ */
+PyObject *AerospikeClient_Compile_Policy(AerospikeClient *self,
+										 PyObject *args, PyObject *kwds);
+
 /*******************************************************************************
  * LIST FUNCTIONS(CDT)
  ******************************************************************************/
@@ -707,6 +772,27 @@ PyObject *AerospikeClient_BatchWrite(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Batch_Operate(AerospikeClient *self, PyObject *args,
 										PyObject *kwds);
 
+/**
+ * Perform the same read/write operations on multiple keys, with a row of
+ * op values per key.
+ * Requires server version 6.0+
+ *
+ *		client.batch_write_columns([keys], [ops], [values], policy_batch, policy_batch_write)
+ *
+ */
+PyObject *AerospikeClient_Batch_Write_Columns(AerospikeClient *self,
+											  PyObject *args, PyObject *kwds);
+
+/**
+ * Async Perform read/write operations on multiple keys.
+ * Requires server version 6.0+
+ *
+ *		client.batch_operate_async(callback, [keys], [ops], policy_batch, policy_batch_write)
+ *
+ */
+PyObject *AerospikeClient_Batch_Operate_Async(AerospikeClient *self,
+											  PyObject *args, PyObject *kwds);
+
 /**
  * Remove multiple records by key.
  * Requires server version 6.0+
@@ -717,6 +803,16 @@ PyObject *AerospikeClient_Batch_Operate(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Batch_Remove(AerospikeClient *self, PyObject *args,
 									   PyObject *kwds);
 
+/**
+ * Async Remove multiple records by key.
+ * Requires server version 6.0+
+ *
+ *		client.batch_remove_async(callback, [keys], policy_batch, policy_batch_remove)
+ *
+ */
+PyObject *AerospikeClient_Batch_Remove_Async(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds);
+
 /**
  * Apply a user defined function (UDF) to multiple keys.
  * Requires server version 6.0+
@@ -763,6 +859,35 @@ PyObject *AerospikeClient_SetXDRFilter(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_GetExpressionBase64(AerospikeClient *self,
 											  PyObject *args, PyObject *kwds);
 
+/**
+ * Pack a compiled aerospike expression once, for use in its place.
+ *
+ *		client.compile_expression(compiled_expression)
+ *
+ */
+PyObject *AerospikeClient_Compile_Expression(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds);
+
+/**
+ * Convert a value to an as_val and back, without any I/O.
+ * Test only, used by the conversion benchmarks.
+ *
+ *		client._roundtrip_val([1, 'a', {'b': 2}], msgpack=True)
+ *
+ */
+PyObject *AerospikeClient_Roundtrip_Val(AerospikeClient *self, PyObject *args,
+										PyObject *kwds);
+
+/**
+ * Convert a key and bins to an as_key and as_record and back, without any I/O.
+ * Test only, used by the conversion benchmarks.
+ *
+ *		client._roundtrip_record(('test', 'demo', 1), {'a': 1}, {'ttl': 100})
+ *
+ */
+PyObject *AerospikeClient_Roundtrip_Record(AerospikeClient *self,
+										   PyObject *args, PyObject *kwds);
+
 /**
  * Send an info request to the entire cluster
  * client.info_all("statistics", {}")
@@ -770,6 +895,13 @@ PyObject *AerospikeClient_GetExpressionBase64(AerospikeClient *self,
 PyObject *AerospikeClient_InfoAll(AerospikeClient *self, PyObject *args,
 								  PyObject *kwds);
 
+/**
+ * Send several info commands to the entire cluster, and parse the responses
+ * client.info_all_parsed(["statistics", "namespace/test"])
+*/
+PyObject *AerospikeClient_InfoAllParsed(AerospikeClient *self, PyObject *args,
+										PyObject *kwds);
+
 /**
 * Perform info operation on the database.
 *
@@ -826,6 +958,29 @@ void close_aerospike_object(aerospike *as, as_error *err, char *alias_to_search,
 int check_type(AerospikeClient *self, PyObject *py_value, int op,
 			   as_error *err);
 
+/*******************************************************************************
+ * ASYNC COMPLETION QUEUE
+ ******************************************************************************/
+
+/**
+ * Queue async completions instead of invoking callbacks from the event loops.
+ *
+ *		client.enable_completion_queue(capacity, notify)
+ *
+ */
+PyObject *AerospikeClient_Enable_Completion_Queue(AerospikeClient *self,
+												  PyObject *args,
+												  PyObject *kwds);
+
+/**
+ * Invoke the callbacks of queued async completions.
+ *
+ *		client.poll_completions(max)
+ *
+ */
+PyObject *AerospikeClient_Poll_Completions(AerospikeClient *self,
+										   PyObject *args, PyObject *kwds);
+
 /*******************************************************************************
  * TRUNCATE OPERATIONS
  ******************************************************************************/
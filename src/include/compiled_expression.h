@@ -0,0 +1,55 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_exp.h>
+
+/*
+ *******************************************************************************************************
+ * A packed expression, accepted wherever a compiled expression list is.
+ *
+ * Made by client.compile_expression(), or from the bytes or base64 of a
+ * packed expression, which is also how it is pickled.
+ *******************************************************************************************************
+ */
+typedef struct {
+	PyObject_HEAD
+	as_exp *exp;
+} AerospikeCompiledExpression;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeCompiledExpression_Ready(void);
+
+/**
+ * Returns a new CompiledExpression which owns exp, or NULL with an exception
+ * set. exp is destroyed on failure.
+ */
+PyObject *AerospikeCompiledExpression_New(as_exp *exp);
+
+bool AerospikeCompiledExpression_Check(PyObject *py_obj);
+
+/**
+ * Returns a copy of the packed expression of py_expression, a
+ * CompiledExpression. The caller must free it with as_exp_destroy().
+ */
+as_exp *AerospikeCompiledExpression_Copy(PyObject *py_expression);
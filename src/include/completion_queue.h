@@ -0,0 +1,98 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+/*
+ *******************************************************************************************************
+ * Bounded queue of finished async commands.
+ *
+ * Event loop threads push completions without touching the GIL, and Python
+ * delivers them in batches with client.poll_completions().
+ *******************************************************************************************************
+ */
+
+// Delivers a completion to Python. Called with the GIL held.
+typedef void (*completion_deliver_fn)(as_error *err, void *result,
+									  void *udata);
+
+typedef struct {
+	completion_deliver_fn deliver;
+	// NULL when the command succeeded.
+	as_error *error;
+	void *result;
+	void *udata;
+} completion_entry;
+
+typedef struct completion_queue_s {
+	pthread_mutex_t lock;
+	completion_entry *entries;
+	uint32_t capacity;
+	uint32_t head;
+	uint32_t size;
+	// Called once when the queue stops being empty, until it is drained.
+	PyObject *notify;
+	bool notify_pending;
+} completion_queue;
+
+completion_queue *completion_queue_create(uint32_t capacity,
+										  PyObject *py_notify);
+
+/**
+ * Delivers the pending completions and frees the queue. Needs the GIL.
+ */
+void completion_queue_destroy(completion_queue *queue);
+
+/**
+ * Queues a completion from an event loop thread, without the GIL.
+ * Returns false when the queue is full, the caller then delivers the
+ * completion directly.
+ */
+bool completion_queue_push(completion_queue *queue,
+						   completion_deliver_fn deliver, as_error *err,
+						   void *result, void *udata);
+
+/**
+ * Delivers up to max (0 for all) queued completions. Needs the GIL.
+ */
+uint32_t completion_queue_drain(completion_queue *queue, uint32_t max);
+
+/**
+ * Copies a record handed to an async listener. The C client destroys the
+ * original when the listener returns.
+ */
+as_record *completion_record_copy(const as_record *rec);
+
+/**
+ * Copies a key into dst, keeping the digest of src. Does not need the GIL.
+ */
+void completion_key_copy(as_key *dst, const as_key *src);
+
+/**
+ * Releases the reference to the client held by an async command, once its
+ * callback ran. The last reference is released from the main thread, so that
+ * the client is not closed from an event loop thread. Needs the GIL.
+ */
+void completion_client_release(PyObject *py_client);
@@ -20,4 +20,21 @@
 
 PyObject *AerospikeException_New(void);
 PyObject *raise_exception(as_error *err);
+
+/**
+ * Returns a new exception instance for err, with the attributes which are
+ * not NULL set when the exception class declares them. Falls back to a new
+ * reference to the class if the instance cannot be built.
+ */
+PyObject *create_pyexception(as_error *err, PyObject *py_key, PyObject *py_bin,
+							 PyObject *py_module, PyObject *py_func,
+							 PyObject *py_name);
+
+/**
+ * Sets the Python error indicator to the instance built by
+ * create_pyexception().
+ */
+void raise_exception_base(as_error *err, PyObject *py_key, PyObject *py_bin,
+						  PyObject *py_module, PyObject *py_func,
+						  PyObject *py_name);
 void remove_exception(as_error *err);
@@ -0,0 +1,66 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_exp.h>
+
+#include "types.h"
+
+/*
+ *******************************************************************************************************
+ * Cache of packed expressions, enabled by the expression_cache_size client
+ * config.
+ *
+ * Entries are keyed by the identity of the compiled expression list and hold
+ * a reference to it, so that its id is not reused while it is cached. An
+ * entry also holds a snapshot of the list, with its lists, tuples, dicts and
+ * bytearrays copied all the way down and the id, value and extra_args of its
+ * cdt ctx objects, and is only used while the list still matches it. Immutable
+ * values are compared by identity. Lists holding any other object, such as a
+ * subclass of a container, are not cached.
+ * The least recently used entry is evicted when the cache is full.
+ *
+ * The cache is a dict, only used with the GIL held. Its order is the order of
+ * use, a hit moves the entry to the end.
+ *******************************************************************************************************
+ */
+
+/**
+ * Creates the cache of the client, for up to size expressions. A size of 0
+ * leaves the cache disabled.
+ */
+int exp_cache_init(AerospikeClient *self, uint32_t size);
+
+/**
+ * Sets *exp_list to a copy of the packed expression of py_exp_list and
+ * returns true if it is cached. The caller must free the copy.
+ */
+bool exp_cache_get(AerospikeClient *self, PyObject *py_exp_list,
+				   as_exp **exp_list);
+
+/**
+ * Caches exp_list, converted from py_exp_list, evicting the least recently
+ * used expression if the cache is full.
+ */
+void exp_cache_put(AerospikeClient *self, PyObject *py_exp_list,
+				   as_exp *exp_list);
+
+void exp_cache_destroy(AerospikeClient *self);
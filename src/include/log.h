@@ -59,4 +59,19 @@ PyObject *Aerospike_Set_Log_Level(PyObject *parent, PyObject *args,
 PyObject *Aerospike_Set_Log_Handler(PyObject *parent, PyObject *args,
 									PyObject *kwds);
 
+/**
+ * Buffer log records in a ring buffer of buffer_size records, instead of
+ * calling the log handler, 0 disables it
+ *          aerospike.set_log_buffer(4096)
+ */
+PyObject *Aerospike_Set_Log_Buffer(PyObject *parent, PyObject *args,
+								   PyObject *kwds);
+
+/**
+ * Remove the buffered log records
+ *          records, dropped = aerospike.drain_logs()
+ */
+PyObject *Aerospike_Drain_Logs(PyObject *parent, PyObject *args,
+							   PyObject *kwds);
+
 void Aerospike_Enable_Default_Logging();
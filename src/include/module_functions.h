@@ -47,3 +47,11 @@ PyObject *Aerospike_Is_AsyncSupported(PyObject *self);
  ******************************************************************************/
 
 PyObject *AerospikeInitAsync(PyObject *self, PyObject *args, PyObject *kwds);
+
+/**
+ * Per event loop async command statistics
+ *
+ *		aerospike.async_stats()
+ *
+ */
+PyObject *Aerospike_Async_Stats(PyObject *self);
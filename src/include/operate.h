@@ -26,3 +26,5 @@
 as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
 				 as_vector *unicodeStrVector, as_static_pool *static_pool,
 				 as_operations *ops, long *op, long *ret_type);
+
+bool opRequiresValue(int op);
@@ -272,6 +272,15 @@ as_status declare_policy_constants(PyObject *aerospike);
 
 void set_scan_options(as_error *err, as_scan *scan_p, PyObject *py_options);
 
+as_status get_compact_records(as_error *err, PyObject *py_options,
+							  bool *compact_records);
+
+as_status get_chunk_options(as_error *err, PyObject *py_options,
+							uint32_t *chunk_size, uint32_t *queue_size);
+
+as_status get_max_keys_per_batch(as_error *err, PyObject *py_policy,
+								 uint32_t *max_keys);
+
 as_status set_query_options(as_error *err, PyObject *query_options,
 							as_query *query);
 
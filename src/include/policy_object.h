@@ -0,0 +1,121 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stddef.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+#include <aerospike/as_policy.h>
+
+#include "types.h"
+
+/*
+ * Enum to declare the kinds of policies client.compile_policy() converts
+ */
+typedef enum Aerospike_policy_kind_e {
+
+	POLICY_KIND_READ,
+	POLICY_KIND_WRITE,
+	POLICY_KIND_APPLY,
+	POLICY_KIND_REMOVE,
+	POLICY_KIND_OPERATE,
+	POLICY_KIND_QUERY,
+	POLICY_KIND_SCAN,
+	POLICY_KIND_BATCH,
+	POLICY_KIND_BATCH_WRITE,
+	POLICY_KIND_BATCH_READ,
+	POLICY_KIND_BATCH_APPLY,
+	POLICY_KIND_BATCH_REMOVE,
+	POLICY_KIND_INFO,
+	POLICY_KIND_ADMIN
+
+} aerospike_policy_kind;
+
+/*
+ *******************************************************************************************************
+ * A policy dict converted once by client.compile_policy().
+ *
+ * The policy starts from the defaults of the compiling client, and is copied
+ * by the pyobject_to_policy_* functions instead of reading a dict.
+ *******************************************************************************************************
+ */
+typedef struct {
+	PyObject_HEAD
+	aerospike_policy_kind kind;
+	union {
+		as_policy_read read;
+		as_policy_write write;
+		as_policy_apply apply;
+		as_policy_remove remove;
+		as_policy_operate operate;
+		as_policy_query query;
+		as_policy_scan scan;
+		as_policy_batch batch;
+		as_policy_batch_write batch_write;
+		as_policy_batch_read batch_read;
+		as_policy_batch_apply batch_apply;
+		as_policy_batch_remove batch_remove;
+		as_policy_info info;
+		as_policy_admin admin;
+	} policy;
+	// Filter expression of the policy, NULL if it has none.
+	as_exp *exp;
+	// False for batch record policies compiled from None, which are left
+	// to the batch policy like a None policy.
+	bool has_policy;
+	// max_keys_per_batch of batch policies, 0 if not set.
+	uint32_t max_keys_per_batch;
+} AerospikePolicy;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikePolicy_Ready(void);
+
+/**
+ * Converts py_policy, a policy dict or None, to a policy of the kind named
+ * by py_kind.
+ */
+AerospikePolicy *AerospikePolicy_New(AerospikeClient *client, as_error *err,
+									 PyObject *py_kind, PyObject *py_policy);
+
+bool AerospikePolicy_Check(PyObject *py_obj);
+
+/**
+ * Copies the policy of py_policy, an aerospike.Policy, into policy, which
+ * has room for size bytes, and sets *policy_p to policy. Fails if py_policy
+ * is not of the given kind.
+ *
+ * filter_exp points to the filter_exp field of policy, or is NULL for
+ * policies without one. The filter expression is copied into a new as_exp,
+ * returned in *exp_list_p, which the caller must free. When exp_list_p is
+ * NULL the policy is used without its filter expression.
+ */
+as_status AerospikePolicy_Copy(as_error *err, PyObject *py_policy,
+							   aerospike_policy_kind kind, void *policy,
+							   void **policy_p, size_t size,
+							   as_exp **filter_exp, as_exp **exp_list_p);
+
+/**
+ * Sets *max_keys to the max_keys_per_batch of py_policy, an aerospike.Policy.
+ */
+void AerospikePolicy_Max_Keys_Per_Batch(PyObject *py_policy,
+										uint32_t *max_keys);
@@ -1,35 +1,75 @@
 /*
  *******************************************************************************************************
- * Static pool maintained to avoid runtime mallocs.
- * It comprises of following pools:
- * 1. Pool for Arraylist
- * 2. Pool for Hashmap
- * 3. Pool for Strings
- * 4. Pool for Integers
- * 5. Pool for Bytes
+ * Value pool used while converting Python objects, to avoid a malloc per
+ * as_bytes.
+ *
+ * The pool is a list of fixed size blocks, so the as_bytes it hands out never
+ * move. Blocks are only allocated once a value is requested and are cached
+ * per thread once released, so declaring a pool is cheap and there is no
+ * upper bound on the number of values.
+ *
+ * A pool must be released with POOL_RELEASE once nothing refers to its
+ * values anymore. POOL_DESTROY only destroys the values, for the callers
+ * which do not hand them over to the C client.
  *******************************************************************************************************
  */
-#define AS_MAX_STORE_SIZE 4096
+#pragma once
+
+#include <stdint.h>
+
+#include <aerospike/as_bytes.h>
+
+#define AS_POOL_BLOCK_SIZE 64
+
+typedef struct bytes_pool_block {
+	struct bytes_pool_block *next;
+	as_bytes bytes_pool[AS_POOL_BLOCK_SIZE];
+} as_static_pool_block;
 
 typedef struct bytes_static_pool {
-	as_bytes bytes_pool[AS_MAX_STORE_SIZE];
+	as_static_pool_block *head;
+	as_static_pool_block *tail;
 	uint32_t current_bytes_id;
 } as_static_pool;
 
+/**
+ * Allocates an empty pool on the heap, for pools owned by an object.
+ * Release it, then free it with cf_free().
+ */
+as_static_pool *as_static_pool_new(void);
+
+/**
+ * Returns the next as_bytes of the pool, growing it when needed.
+ */
+as_bytes *as_static_pool_get_bytes(as_static_pool *static_pool);
+
+/**
+ * Hands the blocks of the pool back to the per thread cache.
+ */
+void as_static_pool_release(as_static_pool *static_pool);
+
 #define BYTES_CNT(static_pool)                                                 \
 	(((as_static_pool *)static_pool)->current_bytes_id)
 
-#define BYTES_POOL(static_pool) ((as_static_pool *)static_pool)->bytes_pool
-
 #define GET_BYTES_POOL(map_bytes, static_pool, err)                            \
-	if (AS_MAX_STORE_SIZE > BYTES_CNT(static_pool)) {                          \
-		map_bytes = &(BYTES_POOL(static_pool)[BYTES_CNT(static_pool)++]);      \
-	}                                                                          \
-	else {                                                                     \
+	map_bytes = as_static_pool_get_bytes((as_static_pool *)static_pool);       \
+	if (!map_bytes) {                                                          \
 		as_error_update(err, AEROSPIKE_ERR, "Cannot allocate as_bytes");       \
 	}
 
 #define POOL_DESTROY(static_pool)                                              \
-	for (uint32_t iter = 0; iter < BYTES_CNT(static_pool); iter++) {           \
-		as_bytes_destroy(&BYTES_POOL(static_pool)[iter]);                      \
+	{                                                                          \
+		uint32_t iter = 0;                                                     \
+		for (as_static_pool_block *block =                                     \
+				 ((as_static_pool *)static_pool)->head;                        \
+			 block; block = block->next) {                                     \
+			for (uint32_t i = 0;                                               \
+				 i < AS_POOL_BLOCK_SIZE && iter < BYTES_CNT(static_pool);      \
+				 i++, iter++) {                                                \
+				as_bytes_destroy(&block->bytes_pool[i]);                       \
+			}                                                                  \
+		}                                                                      \
 	}
+
+#define POOL_RELEASE(static_pool)                                              \
+	as_static_pool_release((as_static_pool *)static_pool)
@@ -0,0 +1,126 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_bin.h>
+#include <aerospike/as_cdt_ctx.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+#include <aerospike/as_list_operations.h>
+#include <aerospike/as_map_operations.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_policy.h>
+#include <aerospike/as_vector.h>
+
+#include "types.h"
+
+/*
+ *******************************************************************************************************
+ * Operation lists converted once and applied to many records.
+ *
+ * Plain read, write, increment, append and prepend ops with a str bin name
+ * keep their op code and bin name, and are added to an as_operations
+ * straight from their value.
+ *
+ * List, map, bit, HLL and expression ops without a val are packed once and
+ * the packed op is shared by every as_operations they are added to. The list
+ * append, append_items, insert, insert_items, increment and set ops and the
+ * map put, increment and decrement ops keep their converted ctx, policy and
+ * index, and only convert their value. Every other op is converted by
+ * add_op() from a copy of its op dict.
+ *
+ * Each op with a val takes its value from a row of values, in the order of
+ * the ops, or from the op dict when no row is given.
+ *******************************************************************************************************
+ */
+
+typedef struct {
+	// Copy of the op dict.
+	PyObject *py_op;
+	// val of the op dict, NULL if the op takes no value.
+	PyObject *py_value;
+	// AS_OPERATOR_* or OP_LIST_* / OP_MAP_* of the ops converted without
+	// add_op(), -1 otherwise.
+	long operation;
+	char bin[AS_BIN_NAME_MAX_SIZE];
+	// Index of the op value in a row of values, -1 if the op takes no value.
+	Py_ssize_t column;
+	// The op packed once, NULL if it is not.
+	as_operations *packed;
+	// Converted once for the list and map ops with a val.
+	as_cdt_ctx ctx;
+	bool ctx_in_use;
+	as_list_policy list_policy;
+	bool list_policy_in_use;
+	as_map_policy map_policy;
+	int64_t index;
+	// key of the op dict, for map ops.
+	PyObject *py_key;
+	// Values converted once, NULL if none were.
+	as_static_pool *static_pool;
+} compiled_op;
+
+typedef struct {
+	PyObject_HEAD
+	AerospikeClient *client;
+	compiled_op *ops;
+	Py_ssize_t ops_size;
+	// Number of values in a row of values.
+	Py_ssize_t values_size;
+	as_policy_operate policy;
+	// NULL when the client's default operate policy is used.
+	as_policy_operate *policy_p;
+	as_exp *exp_list_p;
+} AerospikePreparedOps;
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+/**
+ * Compiles the op dicts of py_ops into compiled, which has room for one entry
+ * per op and must be zeroed. The entries hold references, release them with
+ * compiled_ops_release(), also when this fails.
+ */
+as_status compiled_ops_init(AerospikeClient *self, as_error *err,
+							PyObject *py_ops, compiled_op *compiled,
+							Py_ssize_t *values_size);
+
+void compiled_ops_release(compiled_op *compiled, Py_ssize_t size);
+
+/**
+ * Adds an op to ops. py_values is a list or tuple of values_size values, or
+ * NULL to use the values of the op dicts.
+ */
+as_status compiled_op_add(AerospikeClient *self, as_error *err,
+						  compiled_op *cop, PyObject *py_values,
+						  as_vector *unicodeStrVector,
+						  as_static_pool *static_pool, as_operations *ops);
+
+PyTypeObject *AerospikePreparedOps_Ready(void);
+
+/**
+ * Compiles py_ops and py_policy for operate_prepared().
+ */
+AerospikePreparedOps *AerospikePreparedOps_New(AerospikeClient *client,
+											   as_error *err, PyObject *py_ops,
+											   PyObject *py_policy);
+
+bool AerospikePreparedOps_Check(PyObject *py_obj);
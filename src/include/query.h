@@ -104,6 +104,16 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 PyObject *AerospikeQuery_Results(AerospikeQuery *self, PyObject *args,
 								 PyObject *kwds);
 
+/**
+ * Execute the query and return an iterator over a bounded buffer of results.
+ *
+ *		for result in query.iter_results(buffer=100):
+ *			print result
+ *
+ */
+PyObject *AerospikeQuery_Iter_Results(AerospikeQuery *self, PyObject *args,
+									  PyObject *kwds);
+
 /**
  * Execute a UDF in the background. Returns the query id to allow status of the query to be monitored.
  * */
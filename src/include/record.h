@@ -0,0 +1,40 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeRecord_Ready(void);
+
+PyObject *AerospikeRecord_Get_Type(void);
+
+/**
+ * Converts a result of a query or scan to a Python object. Records become
+ * compact aerospike.Record objects, other values go through
+ * val_to_pyobject().
+ */
+as_status val_to_compact_pyobject(AerospikeClient *self, as_error *err,
+								  const as_val *val, PyObject **obj);
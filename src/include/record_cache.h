@@ -0,0 +1,127 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_exp.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+#include "types.h"
+#include "record_cache_shm.h"
+
+typedef enum {
+	RECORD_CACHE_POLICY_LRU,
+	RECORD_CACHE_POLICY_LFU
+} record_cache_policy;
+
+typedef struct record_cache_s {
+	// Cache key (namespace and digest) to entry, in order of insertion or use.
+	PyObject *entries;
+	// Namespace to the set of cached set names, NULL to cache every set.
+	PyObject *sets;
+	uint32_t max_entries;
+	uint64_t max_bytes;
+	uint64_t bytes;
+	uint32_t max_ttl_ms;
+	record_cache_policy policy;
+	// Bumped by every invalidation.
+	uint64_t write_seq;
+	// Records shared with the other processes on the host, NULL if disabled.
+	record_cache_shm *shm;
+} record_cache;
+
+/*
+ *******************************************************************************************************
+ * Read through record cache, enabled by the cache client config.
+ *
+ * get() and select() are served from the cache when it holds the record, and
+ * records read by get(), select() and read only operate() calls are cached
+ * until their ttl, capped by the cache max_ttl, runs out. Writes through the
+ * client invalidate the records they touch.
+ *
+ * A read only caches its record if no invalidation happened while it was in
+ * flight, so a write racing with the read can not leave a stale record in the
+ * cache.
+ *
+ * With a shm config, whole records are also shared with the other processes
+ * on the host, through record_cache_shm.h, and local misses are looked up
+ * there before going to the server.
+ *
+ * The cache is only used with the GIL held.
+ *******************************************************************************************************
+ */
+
+/**
+ * Creates the record cache of the client from the cache config dict.
+ * Returns -1 if the config is invalid.
+ */
+int record_cache_init(AerospikeClient *self, PyObject *py_config);
+
+/**
+ * Returns the invalidation sequences of the client and of the shared memory,
+ * to pass to record_cache_put() for a read started now.
+ */
+uint64_t record_cache_seq(AerospikeClient *self);
+
+/**
+ * Sets *py_rec to a new (key, meta, bins) record tuple and returns true if
+ * the cache holds the record of key. py_bin_names is a list or tuple of the
+ * bins to return, NULL for all the bins. Reads using a filter expression are
+ * not served from the cache.
+ */
+bool record_cache_get(AerospikeClient *self, as_key *key,
+					  PyObject *py_bin_names, const as_exp *filter_exp,
+					  PyObject **py_rec);
+
+/**
+ * Caches the bins of py_rec, the record tuple converted from rec. py_bin_names
+ * is the list or tuple of bins that were read, NULL for all the bins.
+ */
+void record_cache_put(AerospikeClient *self, as_key *key,
+					  const as_record *rec, PyObject *py_rec,
+					  PyObject *py_bin_names, const as_exp *filter_exp,
+					  uint64_t seq);
+
+/**
+ * Removes the record of key from the cache, after a write to it.
+ */
+void record_cache_invalidate(AerospikeClient *self, as_key *key);
+
+/**
+ * Removes the records of the keys of batch from the cache, after a batch write
+ * to them.
+ */
+void record_cache_invalidate_batch(AerospikeClient *self, as_batch *batch);
+
+/**
+ * Removes the records of the keys of records from the cache, after a batch
+ * write to them.
+ */
+void record_cache_invalidate_records(AerospikeClient *self,
+									 as_batch_records *records);
+
+/**
+ * Removes every record from the cache.
+ */
+void record_cache_clear(AerospikeClient *self);
+
+void record_cache_destroy(AerospikeClient *self);
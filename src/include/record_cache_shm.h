@@ -0,0 +1,116 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_key.h>
+#include <aerospike/as_map.h>
+#include <aerospike/as_record.h>
+
+#include "types.h"
+
+typedef struct record_cache_shm_s record_cache_shm;
+
+// A record read from the shared memory cache.
+typedef struct record_cache_shm_record_s {
+	// Bin name to value, owned by the caller.
+	as_map *bins;
+	uint32_t gen;
+	// The ttl as read, AS_RECORD_NO_EXPIRE_TTL for records that never expire.
+	uint32_t ttl;
+	// When the record expires and when the entry expires, 0 for never.
+	uint64_t record_expires_ms;
+	uint64_t expires_ms;
+	// Size of the packed bins.
+	uint32_t size;
+} record_cache_shm_record;
+
+/*
+ *******************************************************************************************************
+ * Shared memory tier of the record cache, enabled by the shm section of the
+ * cache client config.
+ *
+ * Every process on a host which uses the same shm_key shares a fixed number
+ * of slots, indexed by record digest. Each slot holds one whole record, packed
+ * with msgpack, and is guarded by a version which is odd while a process
+ * writes to it, so readers never block and never see a partly written record.
+ *
+ * Writes through any of the processes invalidate the slot of the record, and
+ * bump a shared sequence so that reads which were in flight at the time do not
+ * cache what they read, and so that the processes check their own copies of
+ * records against the slots before using them again.
+ *
+ * The segment is only shared by processes of the same user, and records with
+ * pickled bytes are never shared.
+ *******************************************************************************************************
+ */
+
+/**
+ * Attaches to the shared memory segment described by the shm config dict,
+ * creating it if no process did yet, or replacing it if reset is True or its
+ * creator died before setting it up. Returns -1 if the config is invalid,
+ * does not match the layout of the existing segment, or if the segment is
+ * not private to the user.
+ */
+int record_cache_shm_attach(PyObject *py_config, record_cache_shm **shm);
+
+/**
+ * Returns the shared invalidation sequence, to pass to record_cache_shm_put()
+ * for a read started now.
+ */
+uint32_t record_cache_shm_seq(record_cache_shm *shm);
+
+/**
+ * Fills record and returns true if the shared memory holds the record of key.
+ * Does not need the GIL.
+ */
+bool record_cache_shm_get(record_cache_shm *shm, as_key *key,
+						  record_cache_shm_record *record);
+
+/**
+ * Returns true if the shared memory still holds generation gen of the record
+ * of key.
+ */
+bool record_cache_shm_contains(record_cache_shm *shm, as_key *key,
+							   uint32_t gen);
+
+/**
+ * Stores all the bins of rec, unless the record is too large for a slot or
+ * the shared sequence moved past seq.
+ */
+void record_cache_shm_put(record_cache_shm *shm, as_key *key,
+						  const as_record *rec, uint64_t record_expires_ms,
+						  uint64_t expires_ms, uint32_t seq);
+
+/**
+ * Removes the record of key from the shared memory, after a write to it.
+ */
+void record_cache_shm_invalidate(record_cache_shm *shm, as_key *key);
+
+/**
+ * Removes every record from the shared memory.
+ */
+void record_cache_shm_clear(record_cache_shm *shm);
+
+/**
+ * Unmaps the shared memory. The segment itself is left for the other
+ * processes.
+ */
+void record_cache_shm_detach(record_cache_shm *shm);
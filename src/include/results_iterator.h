@@ -0,0 +1,47 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+
+#include "types.h"
+#include "results_queue.h"
+
+/*******************************************************************************
+ * FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeResultsIterator_Ready(void);
+
+/**
+ * Starts running the command on a worker thread and returns an iterator over
+ * its results. At most buffer results are held in memory, the C client
+ * callbacks wait for the consumer when the buffer is full.
+ *
+ * py_source is the Query or Scan object owning the command. The command is
+ * destroyed by the iterator, also when the iterator cannot be created.
+ */
+PyObject *AerospikeResultsIterator_New(AerospikeClient *client,
+									   PyObject *py_source, as_error *err,
+									   uint32_t buffer, bool compact_records,
+									   results_queue_run_fn run,
+									   results_queue_destroy_fn destroy,
+									   void *command);
@@ -0,0 +1,117 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/aerospike.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "types.h"
+
+/*
+ *******************************************************************************************************
+ * Bounded queue of query and scan results.
+ *
+ * A worker thread runs the command and the C client threads push copies of
+ * the results without touching the GIL. When the queue is full they wait for
+ * the consumer, which keeps the memory used by large result sets bounded.
+ *******************************************************************************************************
+ */
+
+// Default number of results held by a queue.
+#define RESULTS_QUEUE_DEFAULT_CAPACITY 1024
+
+typedef bool (*results_queue_callback)(const as_val *val, void *udata);
+
+// Runs a query or scan on the worker thread, without the GIL.
+typedef void (*results_queue_run_fn)(aerospike *as, as_error *err,
+									 void *command,
+									 results_queue_callback callback,
+									 void *udata);
+
+// Frees the command once the worker thread has finished.
+typedef void (*results_queue_destroy_fn)(void *command);
+
+typedef struct results_queue_s {
+	aerospike *as;
+	results_queue_run_fn run;
+	// NULL when the command is owned by the caller.
+	results_queue_destroy_fn destroy;
+	void *command;
+	pthread_t thread;
+
+	// Guards everything below.
+	pthread_mutex_t lock;
+	pthread_cond_t not_empty;
+	pthread_cond_t not_full;
+	// Ring buffer of copies of the results.
+	as_val **entries;
+	uint32_t capacity;
+	uint32_t head;
+	uint32_t size;
+	// Set by the worker thread once the command returned.
+	bool done;
+	// Set when the consumer stops before the end of the results.
+	bool cancelled;
+	as_error error;
+} results_queue;
+
+/**
+ * Starts running the command on a worker thread. The command is destroyed
+ * with the queue, or right away when the thread cannot be started.
+ */
+results_queue *results_queue_start(aerospike *as, as_error *err,
+								   uint32_t capacity, results_queue_run_fn run,
+								   results_queue_destroy_fn destroy,
+								   void *command);
+
+/**
+ * Moves up to max results into vals, waiting until at least one result is
+ * queued. Returns 0 once the command has finished and the queue is drained.
+ * Call it without the GIL.
+ */
+uint32_t results_queue_pop(results_queue *queue, as_val **vals, uint32_t max);
+
+/**
+ * Cancels the command if it is still running, without waiting for it. A
+ * results_queue_pop() in progress returns once the worker thread has
+ * stopped. The queue must still be destroyed.
+ */
+void results_queue_cancel(results_queue *queue);
+
+/**
+ * Cancels the command if it is still running, waits for the worker thread
+ * and frees the queue. The error of the command, if it was not cancelled, is
+ * copied into err. Call it without the GIL.
+ */
+void results_queue_destroy(results_queue *queue, as_error *err);
+
+/**
+ * Calls py_callback with lists of up to chunk_size results until the queue is
+ * drained or the callback returns False, then destroys the queue. Records are
+ * passed as (partition id, record) tuples when partition_ids is set. Needs
+ * the GIL.
+ */
+as_status results_queue_deliver(results_queue *queue, AerospikeClient *client,
+								as_error *err, PyObject *py_callback,
+								uint32_t chunk_size, bool compact_records,
+								bool partition_ids);
@@ -82,6 +82,16 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
 								PyObject *kwds);
 
+/**
+ * Execute the scan and return an iterator over a bounded buffer of results.
+ *
+ *    for result in scan.iter_results(buffer=100):
+ *      print result
+ *
+ */
+PyObject *AerospikeScan_Iter_Results(AerospikeScan *self, PyObject *args,
+									 PyObject *kwds);
+
 /**
  * Execute the scan in the background.
  *
@@ -0,0 +1,101 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+#include "types.h"
+
+typedef struct single_flight_s single_flight;
+
+/*
+ *******************************************************************************************************
+ * Coalescing of concurrent identical reads, enabled by the single_flight
+ * client config.
+ *
+ * The first read of a record, for given bins and policy object, leads a
+ * flight and sends the command. Identical reads made while it is in flight
+ * join it instead of sending their own: sync reads wait for its result with
+ * the GIL released, and async reads have their callbacks invoked with it.
+ *
+ * Flights are only joined, finished and released with the GIL held.
+ *******************************************************************************************************
+ */
+
+/**
+ * Enables coalescing for the client if py_enabled is True.
+ */
+void single_flight_init(AerospikeClient *self, PyObject *py_enabled);
+
+/**
+ * Joins the flight reading key, for the bins in py_bins (NULL for all the
+ * bins) with py_policy, or starts one. Sets *leader to true if the caller
+ * started the flight and must send the command, then call
+ * single_flight_finish(). Returns NULL if coalescing is disabled or the read
+ * can not be coalesced. The returned flight must be released with
+ * single_flight_release().
+ */
+single_flight *single_flight_join(AerospikeClient *self, as_key *key,
+								  PyObject *py_bins, PyObject *py_policy,
+								  bool async, bool *leader);
+
+/**
+ * Waits for the leader to finish the flight, with the GIL released, then sets
+ * *py_rec to a new record tuple of its result for key, or copies its error to
+ * err.
+ */
+as_status single_flight_await(single_flight *flight, as_error *err,
+							  as_key *key, PyObject **py_rec);
+
+/**
+ * Sets *py_rec to a new record tuple of the result of the finished flight,
+ * with py_key as its key, or copies the error of the flight to err.
+ */
+as_status single_flight_result(single_flight *flight, as_error *err,
+							   PyObject *py_key, PyObject **py_rec);
+
+/**
+ * Queues the callback of an async read which joined the flight. The callback
+ * is invoked as for get_async(), with py_key as the key and py_rec_key as the
+ * key of the record.
+ */
+int single_flight_add_callback(single_flight *flight, PyObject *py_callback,
+							   PyObject *py_key, PyObject *py_rec_key);
+
+/**
+ * Returns a new list of the (callback, key, record key) tuples queued on the
+ * flight.
+ */
+PyObject *single_flight_callbacks(single_flight *flight);
+
+/**
+ * Publishes the result of the flight, rec as read on success, None if py_rec
+ * is None, or err, and wakes up the reads waiting for it. Each reader gets
+ * its own conversion of rec. Later identical reads start a new flight.
+ */
+void single_flight_finish(AerospikeClient *self, single_flight *flight,
+						  const as_record *rec, PyObject *py_rec,
+						  as_error *err);
+
+void single_flight_release(single_flight *flight);
+
+void single_flight_destroy(AerospikeClient *self);
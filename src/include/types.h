@@ -25,7 +25,9 @@
 #include <aerospike/as_scan.h>
 #include <aerospike/as_bin.h>
 #include <aerospike/as_operations.h>
+#include <aerospike/as_record.h>
 #include "pool.h"
+#include "completion_queue.h"
 
 // Bin names can be of type Unicode in Python
 // DB supports 32767 maximum number of bins
@@ -73,6 +75,16 @@ typedef struct {
 	bool has_connected;
 	bool use_shared_connection;
 	uint8_t send_bool_as;
+	bool return_none_on_miss;
+	completion_queue *completion_queue;
+	// Packed expressions, NULL when the expression cache is disabled.
+	PyObject *exp_cache;
+	uint32_t exp_cache_size;
+	// Read through record cache, NULL when the cache is disabled.
+	struct record_cache_s *record_cache;
+	// Key to capsule of the reads in flight, NULL when reads are not
+	// coalesced.
+	PyObject *single_flights;
 } AerospikeClient;
 
 typedef struct {
@@ -96,4 +108,27 @@ typedef struct {
 
 typedef struct {
 	PyDictObject dict;
-} AerospikeKeyOrderedDict;
\ No newline at end of file
+} AerospikeKeyOrderedDict;
+
+typedef struct {
+	PyObject_HEAD
+	AerospikeClient *client;
+	// Copy of the record, released once the bins have been converted.
+	as_record *rec;
+	as_key key;
+	uint32_t ttl;
+	uint16_t gen;
+	// Built on first access.
+	PyObject *py_key;
+	PyObject *py_bins;
+} AerospikeRecord;
+
+typedef struct {
+	PyObject_HEAD
+	PyObject *key;
+	PyObject *record;
+	PyObject *result;
+	PyObject *in_doubt;
+	// Attributes set on the record other than the slots.
+	PyObject *dict;
+} AerospikeBatchRecord;
\ No newline at end of file
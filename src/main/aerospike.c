@@ -24,6 +24,12 @@
 #include "geo.h"
 #include "scan.h"
 #include "key_ordered_dict.h"
+#include "record.h"
+#include "results_iterator.h"
+#include "batch_record.h"
+#include "prepared_ops.h"
+#include "policy_object.h"
+#include "compiled_expression.h"
 #include "predicates.h"
 #include "exceptions.h"
 #include "policy.h"
@@ -34,6 +40,7 @@
 #include "nullobject.h"
 #include "cdt_types.h"
 #include <aerospike/as_log_macros.h>
+#include <aerospike/as_event.h>
 
 PyObject *py_global_hosts;
 int counter = 0xA8000000;
@@ -52,8 +59,31 @@ config = {\n\
 client = aerospike.client(config)");
 
 PyDoc_STRVAR(init_async_doc,
-			 "init_async() -> initialize aerospike async eventloop library\n\
-aerospike.init_async()");
+			 "init_async([loops[, max_commands_in_process[, max_commands_in_queue]]]) -> initialize aerospike async eventloop library\n\
+aerospike.init_async(loops=4)\n\
+\n\
+Creates loops event loop threads; async commands are spread across them. \
+max_commands_in_process limits the commands in flight on each loop, with the \
+rest queued up to max_commands_in_queue (0 means no limit).");
+
+PyDoc_STRVAR(async_stats_doc,
+			 "async_stats() -> list of per event loop statistics\n\
+\n\
+Returns one dict per async event loop with the number of commands in process \
+and the number of commands waiting in its queue.");
+
+PyDoc_STRVAR(set_log_buffer_doc,
+			 "set_log_buffer(buffer_size) -> buffer C client log records\n\
+\n\
+Stores log records in a ring buffer of buffer_size records, without taking the GIL, \
+instead of calling the log handler. Records are dropped when the buffer is full. \
+0 restores the log handler.");
+
+PyDoc_STRVAR(drain_logs_doc,
+			 "drain_logs([max_records]) -> (list of buffered log records, number of dropped records)\n\
+\n\
+Removes up to max_records (default all) records from the log buffer, as \
+(level, func, path, line, msg) tuples, with the number of records dropped since the last drain.");
 
 static PyMethodDef Aerospike_Methods[] = {
 
@@ -67,12 +97,18 @@ static PyMethodDef Aerospike_Methods[] = {
 
 	{"init_async", (PyCFunction)AerospikeInitAsync,
 	 METH_VARARGS | METH_KEYWORDS, init_async_doc},
+	{"async_stats", (PyCFunction)Aerospike_Async_Stats, METH_NOARGS,
+	 async_stats_doc},
 	{"client", (PyCFunction)AerospikeClient_New, METH_VARARGS | METH_KEYWORDS,
 	 client_doc},
 	{"set_log_level", (PyCFunction)Aerospike_Set_Log_Level,
 	 METH_VARARGS | METH_KEYWORDS, "Sets the log level"},
 	{"set_log_handler", (PyCFunction)Aerospike_Set_Log_Handler,
 	 METH_VARARGS | METH_KEYWORDS, "Enables the log handler"},
+	{"set_log_buffer", (PyCFunction)Aerospike_Set_Log_Buffer,
+	 METH_VARARGS | METH_KEYWORDS, set_log_buffer_doc},
+	{"drain_logs", (PyCFunction)Aerospike_Drain_Logs,
+	 METH_VARARGS | METH_KEYWORDS, drain_logs_doc},
 	{"geodata", (PyCFunction)Aerospike_Set_Geo_Data,
 	 METH_VARARGS | METH_KEYWORDS,
 	 "Creates a GeoJSON object from geospatial data."},
@@ -121,6 +157,12 @@ struct Aerospike_State {
 	PyTypeObject *query;
 	PyTypeObject *scan;
 	PyTypeObject *kdict;
+	PyTypeObject *record;
+	PyTypeObject *results_iterator;
+	PyTypeObject *batch_record;
+	PyTypeObject *prepared_ops;
+	PyTypeObject *policy;
+	PyTypeObject *compiled_expression;
 	PyObject *predicates;
 	PyTypeObject *geospatial;
 	PyTypeObject *null_object;
@@ -142,6 +184,12 @@ static int Aerospike_Clear(PyObject *aerospike)
 	Py_CLEAR(Aerospike_State(aerospike)->query);
 	Py_CLEAR(Aerospike_State(aerospike)->scan);
 	Py_CLEAR(Aerospike_State(aerospike)->kdict);
+	Py_CLEAR(Aerospike_State(aerospike)->record);
+	Py_CLEAR(Aerospike_State(aerospike)->results_iterator);
+	Py_CLEAR(Aerospike_State(aerospike)->batch_record);
+	Py_CLEAR(Aerospike_State(aerospike)->prepared_ops);
+	Py_CLEAR(Aerospike_State(aerospike)->policy);
+	Py_CLEAR(Aerospike_State(aerospike)->compiled_expression);
 	Py_CLEAR(Aerospike_State(aerospike)->predicates);
 	Py_CLEAR(Aerospike_State(aerospike)->geospatial);
 	Py_CLEAR(Aerospike_State(aerospike)->null_object);
@@ -196,6 +244,38 @@ MOD_INIT(aerospike)
 	PyModule_AddObject(aerospike, "KeyOrderedDict", (PyObject *)kdict);
 	Aerospike_State(aerospike)->kdict = kdict;
 
+	PyTypeObject *record = AerospikeRecord_Ready();
+	Py_INCREF(record);
+	PyModule_AddObject(aerospike, "Record", (PyObject *)record);
+	Aerospike_State(aerospike)->record = record;
+
+	PyTypeObject *results_iterator = AerospikeResultsIterator_Ready();
+	Py_INCREF(results_iterator);
+	PyModule_AddObject(aerospike, "ResultsIterator",
+					   (PyObject *)results_iterator);
+	Aerospike_State(aerospike)->results_iterator = results_iterator;
+
+	PyTypeObject *batch_record = AerospikeBatchRecord_Ready();
+	Py_INCREF(batch_record);
+	PyModule_AddObject(aerospike, "_BatchRecordBase", (PyObject *)batch_record);
+	Aerospike_State(aerospike)->batch_record = batch_record;
+
+	PyTypeObject *prepared_ops = AerospikePreparedOps_Ready();
+	Py_INCREF(prepared_ops);
+	PyModule_AddObject(aerospike, "PreparedOps", (PyObject *)prepared_ops);
+	Aerospike_State(aerospike)->prepared_ops = prepared_ops;
+
+	PyTypeObject *policy = AerospikePolicy_Ready();
+	Py_INCREF(policy);
+	PyModule_AddObject(aerospike, "Policy", (PyObject *)policy);
+	Aerospike_State(aerospike)->policy = policy;
+
+	PyTypeObject *compiled_expression = AerospikeCompiledExpression_Ready();
+	Py_INCREF(compiled_expression);
+	PyModule_AddObject(aerospike, "CompiledExpression",
+					   (PyObject *)compiled_expression);
+	Aerospike_State(aerospike)->compiled_expression = compiled_expression;
+
 	/*
 	 * Add constants to module.
 	 */
@@ -242,23 +322,95 @@ MOD_INIT(aerospike)
 
 PyObject *AerospikeInitAsync(PyObject *self, PyObject *args, PyObject *kwds)
 {
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Arguments
+	long loops = 1;
+	long max_commands_in_process = 0;
+	long max_commands_in_queue = 0;
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"loops", "max_commands_in_process",
+							 "max_commands_in_queue", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|lll:init_async", kwlist,
+									&loops, &max_commands_in_process,
+									&max_commands_in_queue) == false) {
+		return NULL;
+	}
+
 #if AS_EVENT_LIB_DEFINED
 	as_log_info("AerospikeInitAsync");
+
+	if (loops < 1) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"loops must be a positive integer");
+		goto CLEANUP;
+	}
+
+	if (max_commands_in_process < 0 || max_commands_in_queue < 0) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"max_commands_in_process and max_commands_in_queue "
+						"must not be negative");
+		goto CLEANUP;
+	}
+
+	// Commands issued without an explicit event loop are spread round-robin
+	// across all the loops by the C client.
+	as_policy_event policy;
+	as_policy_event_init(&policy);
+	policy.max_commands_in_process = (int)max_commands_in_process;
+	policy.max_commands_in_queue = (uint32_t)max_commands_in_queue;
+
+	async_support = false;
+	Py_BEGIN_ALLOW_THREADS
 	as_event_destroy_loops();
-	as_event_create_loops(1);
-	async_support = true;
+	as_create_event_loops(&err, &policy, (uint32_t)loops, NULL);
+	Py_END_ALLOW_THREADS
+
+	if (err.code == AEROSPIKE_OK) {
+		async_support = true;
+	}
 #else
-	as_error err;
-	as_error_init(&err);
 	as_error_update(
 		&err, AEROSPIKE_ERR,
 		"Support for async is disabled, build software with async option");
-	PyObject *py_err = NULL, *exception_type = NULL;
-	error_to_pyobject(&err, &py_err);
-	exception_type = raise_exception(&err);
-	PyErr_SetObject(exception_type, py_err);
-	Py_DECREF(py_err);
-	return NULL;
+	goto CLEANUP;
 #endif
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL, *exception_type = NULL;
+		error_to_pyobject(&err, &py_err);
+		exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
 	return PyLong_FromLong(0);
 }
+
+PyObject *Aerospike_Async_Stats(PyObject *self)
+{
+	PyObject *py_stats = PyList_New(0);
+
+#if AS_EVENT_LIB_DEFINED
+	if (!async_support) {
+		return py_stats;
+	}
+
+	for (uint32_t i = 0; i < as_event_loop_size; i++) {
+		as_event_loop *event_loop = as_event_loop_get_by_index(i);
+		PyObject *py_loop = Py_BuildValue(
+			"{s:I,s:i,s:I}", "loop", i, "in_process",
+			as_event_loop_get_process_size(event_loop), "in_queue",
+			(uint32_t)as_event_loop_get_queue_size(event_loop));
+		PyList_Append(py_stats, py_loop);
+		Py_DECREF(py_loop);
+	}
+#endif
+
+	return py_stats;
+}
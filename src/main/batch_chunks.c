@@ -0,0 +1,283 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <citrusleaf/alloc.h>
+
+#include "batch_chunks.h"
+#include "conversions.h"
+
+typedef struct {
+	PyObject *type;
+	PyObject *value;
+	PyObject *traceback;
+} batch_chunk_error;
+
+typedef struct {
+	AerospikeClient *client;
+	PyObject *py_keys;
+	Py_ssize_t max_keys;
+	batch_chunk_fn fn;
+	batch_chunk_fail_fn fail_fn;
+	void *udata;
+
+	// Only read and written with the GIL held.
+	Py_ssize_t chunks_size;
+	Py_ssize_t next_chunk;
+	bool failed;
+
+	PyObject **results;
+	batch_chunk_error *errors;
+} batch_chunks;
+
+static void *batch_chunks_worker(void *udata)
+{
+	batch_chunks *chunks = (batch_chunks *)udata;
+
+	PyGILState_STATE gstate = PyGILState_Ensure();
+
+	while (!chunks->failed && chunks->next_chunk < chunks->chunks_size) {
+		Py_ssize_t i = chunks->next_chunk++;
+		Py_ssize_t start = i * chunks->max_keys;
+
+		PyObject *py_result = NULL;
+		PyObject *py_chunk = PySequence_GetSlice(chunks->py_keys, start,
+												 start + chunks->max_keys);
+		if (py_chunk) {
+			// fn releases the GIL while the C client runs the sub-batch.
+			py_result = chunks->fn(chunks->client, py_chunk, chunks->udata);
+			Py_DECREF(py_chunk);
+		}
+
+		if (!py_result) {
+			batch_chunk_error *error = &chunks->errors[i];
+			if (!PyErr_Occurred()) {
+				PyErr_SetString(PyExc_SystemError,
+								"batch command failed without an exception");
+			}
+			PyErr_Fetch(&error->type, &error->value, &error->traceback);
+			chunks->failed = true;
+		}
+		chunks->results[i] = py_result;
+	}
+
+	PyGILState_Release(gstate);
+	return NULL;
+}
+
+static int batch_chunks_merge(PyObject *py_merged, PyObject *py_result)
+{
+	if (PyList_Check(py_merged)) {
+		Py_ssize_t size = PyList_GET_SIZE(py_merged);
+		return PyList_SetSlice(py_merged, size, size, py_result);
+	}
+
+	// A BatchRecords object takes the records of the sub-batch, and the
+	// result of the first sub-batch which failed.
+	int rv = -1;
+	PyObject *py_records =
+		PyObject_GetAttrString(py_merged, FIELD_NAME_BATCH_RECORDS);
+	PyObject *py_chunk_records =
+		PyObject_GetAttrString(py_result, FIELD_NAME_BATCH_RECORDS);
+	PyObject *py_status =
+		PyObject_GetAttrString(py_merged, FIELD_NAME_BATCH_RESULT);
+
+	if (!py_records || !py_chunk_records || !py_status ||
+		!PyList_Check(py_records)) {
+		PyErr_SetString(PyExc_TypeError, "Unable to merge BatchRecords");
+		goto CLEANUP;
+	}
+
+	Py_ssize_t size = PyList_GET_SIZE(py_records);
+	if (PyList_SetSlice(py_records, size, size, py_chunk_records) == -1) {
+		goto CLEANUP;
+	}
+
+	rv = 0;
+	if (PyObject_Not(py_status) == 1) {
+		PyObject *py_chunk_status =
+			PyObject_GetAttrString(py_result, FIELD_NAME_BATCH_RESULT);
+		if (!py_chunk_status) {
+			rv = -1;
+			goto CLEANUP;
+		}
+		rv = PyObject_SetAttrString(py_merged, FIELD_NAME_BATCH_RESULT,
+									py_chunk_status);
+		Py_DECREF(py_chunk_status);
+	}
+
+CLEANUP:
+	Py_XDECREF(py_records);
+	Py_XDECREF(py_chunk_records);
+	Py_XDECREF(py_status);
+	return rv;
+}
+
+bool batch_chunks_needed(PyObject *py_keys, uint32_t max_keys)
+{
+	if (!max_keys || !py_keys) {
+		return false;
+	}
+
+	if (PyList_Check(py_keys)) {
+		return PyList_GET_SIZE(py_keys) > (Py_ssize_t)max_keys;
+	}
+
+	if (PyTuple_Check(py_keys)) {
+		return PyTuple_GET_SIZE(py_keys) > (Py_ssize_t)max_keys;
+	}
+
+	return false;
+}
+
+// Replaces the result of chunk i, which failed or was not started, with the
+// one returned by fail_fn. Chunks are started in order, so the first failed
+// chunk comes before the ones which were not started.
+static PyObject *batch_chunks_fail(batch_chunks *chunks, Py_ssize_t i,
+								   PyObject **py_first_exception)
+{
+	batch_chunk_error *error = &chunks->errors[i];
+	PyObject *py_exception = *py_first_exception;
+	bool started = error->type != NULL;
+
+	if (started) {
+		PyErr_NormalizeException(&error->type, &error->value,
+								 &error->traceback);
+		py_exception = error->value;
+		if (!*py_first_exception) {
+			Py_XINCREF(py_exception);
+			*py_first_exception = py_exception;
+		}
+	}
+
+	Py_ssize_t start = i * chunks->max_keys;
+	PyObject *py_result = NULL;
+	PyObject *py_chunk =
+		PySequence_GetSlice(chunks->py_keys, start, start + chunks->max_keys);
+	if (py_chunk) {
+		py_result = chunks->fail_fn(chunks->client, py_chunk, py_exception,
+									started, chunks->udata);
+		Py_DECREF(py_chunk);
+	}
+
+	Py_CLEAR(error->type);
+	Py_CLEAR(error->value);
+	Py_CLEAR(error->traceback);
+	return py_result;
+}
+
+PyObject *batch_chunks_invoke(AerospikeClient *self, PyObject *py_keys,
+							  uint32_t max_keys, batch_chunk_fn fn,
+							  batch_chunk_fail_fn fail_fn, void *udata)
+{
+	batch_chunks chunks;
+	chunks.client = self;
+	chunks.py_keys = py_keys;
+	chunks.max_keys = max_keys;
+	chunks.fn = fn;
+	chunks.fail_fn = fail_fn;
+	chunks.udata = udata;
+	chunks.chunks_size = (PySequence_Size(py_keys) + max_keys - 1) / max_keys;
+	chunks.next_chunk = 0;
+	chunks.failed = false;
+	chunks.results = cf_calloc(chunks.chunks_size, sizeof(PyObject *));
+	chunks.errors = cf_calloc(chunks.chunks_size, sizeof(batch_chunk_error));
+
+	pthread_t workers[BATCH_CHUNKS_MAX_WORKERS];
+	int workers_size = 0;
+	int max_workers = chunks.chunks_size < BATCH_CHUNKS_MAX_WORKERS
+						  ? (int)chunks.chunks_size
+						  : BATCH_CHUNKS_MAX_WORKERS;
+
+	// The workers wait for the GIL until it is released below.
+	for (int i = 0; i < max_workers; i++) {
+		if (pthread_create(&workers[workers_size], NULL, batch_chunks_worker,
+						   &chunks) == 0) {
+			workers_size++;
+		}
+	}
+
+	if (workers_size) {
+		Py_BEGIN_ALLOW_THREADS
+		for (int i = 0; i < workers_size; i++) {
+			pthread_join(workers[i], NULL);
+		}
+		Py_END_ALLOW_THREADS
+	}
+	else {
+		// Run the sub-batches one after the other on this thread.
+		batch_chunks_worker(&chunks);
+	}
+
+	PyObject *py_merged = NULL;
+	PyObject *py_first_exception = NULL;
+	bool raised = false;
+
+	for (Py_ssize_t i = 0; i < chunks.chunks_size; i++) {
+		batch_chunk_error *error = &chunks.errors[i];
+		PyObject *py_result = chunks.results[i];
+
+		if (fail_fn && !py_result && !raised) {
+			py_result = batch_chunks_fail(&chunks, i, &py_first_exception);
+			if (!py_result) {
+				raised = true;
+			}
+		}
+
+		if (error->type) {
+			if (!raised) {
+				PyErr_Restore(error->type, error->value, error->traceback);
+				raised = true;
+			}
+			else {
+				Py_XDECREF(error->type);
+				Py_XDECREF(error->value);
+				Py_XDECREF(error->traceback);
+			}
+			continue;
+		}
+
+		if (!py_result) {
+			// Not started after a failure.
+			continue;
+		}
+
+		if ((fail_fn || !chunks.failed) && !raised) {
+			if (!py_merged) {
+				py_merged = py_result;
+				continue;
+			}
+			if (batch_chunks_merge(py_merged, py_result) == -1) {
+				raised = true;
+			}
+		}
+		Py_DECREF(py_result);
+	}
+
+	if (raised) {
+		Py_CLEAR(py_merged);
+	}
+	Py_XDECREF(py_first_exception);
+
+	cf_free(chunks.results);
+	cf_free(chunks.errors);
+
+	return py_merged;
+}
@@ -0,0 +1,298 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <structmember.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+
+#include "batch_record.h"
+#include "conversions.h"
+
+static PyTypeObject AerospikeBatchRecord_Type;
+
+/*******************************************************************************
+ * HELPERS
+ ******************************************************************************/
+
+static void batch_record_set(PyObject **field, PyObject *value)
+{
+	PyObject *old = *field;
+	*field = value;
+	Py_XDECREF(old);
+}
+
+PyObject *AerospikeBatchRecord_New(PyObject *py_type, PyObject *py_key)
+{
+	if (!PyType_Check(py_type) ||
+		!PyType_IsSubtype((PyTypeObject *)py_type, &AerospikeBatchRecord_Type)) {
+		return PyObject_CallFunctionObjArgs(py_type, py_key, NULL);
+	}
+
+	PyTypeObject *type = (PyTypeObject *)py_type;
+	AerospikeBatchRecord *self =
+		(AerospikeBatchRecord *)type->tp_alloc(type, 0);
+	if (!self) {
+		return NULL;
+	}
+
+	Py_INCREF(py_key);
+	self->key = py_key;
+	Py_INCREF(Py_None);
+	self->record = Py_None;
+	self->result = PyLong_FromLong(0);
+	Py_INCREF(Py_False);
+	self->in_doubt = Py_False;
+
+	return (PyObject *)self;
+}
+
+as_status AerospikeBatchRecord_Set_Result(AerospikeClient *client,
+										  as_error *err,
+										  PyObject *py_batch_record,
+										  as_status result, bool in_doubt,
+										  const as_record *rec,
+										  const as_key *key)
+{
+	PyObject *py_rec = NULL;
+
+	if (result == AEROSPIKE_OK &&
+		record_to_pyobject(client, err, rec, key, &py_rec) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	PyObject *py_result = PyLong_FromLong((long)result);
+	PyObject *py_in_doubt = PyBool_FromLong((long)in_doubt);
+
+	if (PyObject_TypeCheck(py_batch_record, &AerospikeBatchRecord_Type)) {
+		AerospikeBatchRecord *self = (AerospikeBatchRecord *)py_batch_record;
+		batch_record_set(&self->result, py_result);
+		batch_record_set(&self->in_doubt, py_in_doubt);
+		if (py_rec) {
+			batch_record_set(&self->record, py_rec);
+		}
+		return AEROSPIKE_OK;
+	}
+
+	PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT, py_result);
+	PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_INDOUBT,
+						   py_in_doubt);
+	Py_DECREF(py_result);
+	Py_DECREF(py_in_doubt);
+
+	if (py_rec) {
+		PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD,
+							   py_rec);
+		Py_DECREF(py_rec);
+	}
+
+	return AEROSPIKE_OK;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE MEMBERS
+ ******************************************************************************/
+
+static PyMemberDef AerospikeBatchRecord_Type_Members[] = {
+	{"key", T_OBJECT, offsetof(AerospikeBatchRecord, key), 0,
+	 "The aerospike key to operate on."},
+	{"record", T_OBJECT, offsetof(AerospikeBatchRecord, record), 0,
+	 "The record corresponding to the requested key."},
+	{"result", T_OBJECT, offsetof(AerospikeBatchRecord, result), 0,
+	 "The status code of the operation."},
+	{"in_doubt", T_OBJECT, offsetof(AerospikeBatchRecord, in_doubt), 0,
+	 "Whether the write may have completed even though an error was "
+	 "returned."},
+	{NULL}};
+
+static PyGetSetDef AerospikeBatchRecord_Type_GetSet[] = {
+	{"__dict__", PyObject_GenericGetDict, PyObject_GenericSetDict},
+	{NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+// Adds the slots declared by the classes of self to py_slots.
+static int batch_record_get_slots(PyObject *self, PyObject *py_slots)
+{
+	PyObject *py_mro = Py_TYPE(self)->tp_mro;
+
+	for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(py_mro); i++) {
+		PyTypeObject *type = (PyTypeObject *)PyTuple_GET_ITEM(py_mro, i);
+		PyObject *py_names = PyDict_GetItemString(type->tp_dict, "__slots__");
+		if (!py_names) {
+			continue;
+		}
+
+		PyObject *py_seq = PyUnicode_Check(py_names)
+							   ? PyTuple_Pack(1, py_names)
+							   : PySequence_Fast(py_names, "__slots__");
+		if (!py_seq) {
+			return -1;
+		}
+
+		for (Py_ssize_t j = 0; j < PySequence_Fast_GET_SIZE(py_seq); j++) {
+			PyObject *py_name = PySequence_Fast_GET_ITEM(py_seq, j);
+			if (!PyUnicode_Check(py_name) ||
+				!PyUnicode_CompareWithASCIIString(py_name, "__dict__") ||
+				!PyUnicode_CompareWithASCIIString(py_name, "__weakref__")) {
+				continue;
+			}
+
+			// Slots which were never set are left out.
+			PyObject *py_value = PyObject_GetAttr(self, py_name);
+			if (!py_value) {
+				if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+					Py_DECREF(py_seq);
+					return -1;
+				}
+				PyErr_Clear();
+				continue;
+			}
+
+			int rc = PyDict_SetItem(py_slots, py_name, py_value);
+			Py_DECREF(py_value);
+			if (rc == -1) {
+				Py_DECREF(py_seq);
+				return -1;
+			}
+		}
+		Py_DECREF(py_seq);
+	}
+
+	return 0;
+}
+
+static PyObject *AerospikeBatchRecord_Type_Reduce(AerospikeBatchRecord *self,
+												  PyObject *Py_UNUSED(args))
+{
+	PyObject *py_slots = Py_BuildValue(
+		"{s:O,s:O,s:O,s:O}", "key", self->key ? self->key : Py_None,
+		"record", self->record ? self->record : Py_None, "result",
+		self->result ? self->result : Py_None, "in_doubt",
+		self->in_doubt ? self->in_doubt : Py_None);
+	if (!py_slots || batch_record_get_slots((PyObject *)self, py_slots) == -1) {
+		Py_XDECREF(py_slots);
+		return NULL;
+	}
+
+	PyObject *py_copyreg = PyImport_ImportModule("copyreg");
+	PyObject *py_newobj =
+		py_copyreg ? PyObject_GetAttrString(py_copyreg, "__newobj__") : NULL;
+	Py_XDECREF(py_copyreg);
+	if (!py_newobj) {
+		Py_DECREF(py_slots);
+		return NULL;
+	}
+
+	// The (dict, slots) state is restored by pickle and copy with setattr for
+	// the slots.
+	PyObject *py_dict =
+		self->dict && PyDict_Size(self->dict) ? self->dict : Py_None;
+	return Py_BuildValue("(N(O)(ON))", py_newobj, Py_TYPE(self), py_dict,
+						 py_slots);
+}
+
+static PyMethodDef AerospikeBatchRecord_Type_Methods[] = {
+	{"__reduce__", (PyCFunction)AerospikeBatchRecord_Type_Reduce, METH_NOARGS,
+	 "Pickles the record with its slots and attributes."},
+	{NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static int AerospikeBatchRecord_Type_Init(AerospikeBatchRecord *self,
+										  PyObject *args, PyObject *kwds)
+{
+	PyObject *py_key = NULL;
+
+	static char *kwlist[] = {"key", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:BatchRecord", kwlist,
+									&py_key) == false) {
+		return -1;
+	}
+
+	Py_INCREF(py_key);
+	batch_record_set(&self->key, py_key);
+	Py_INCREF(Py_None);
+	batch_record_set(&self->record, Py_None);
+	batch_record_set(&self->result, PyLong_FromLong(0));
+	Py_INCREF(Py_False);
+	batch_record_set(&self->in_doubt, Py_False);
+
+	return 0;
+}
+
+static int AerospikeBatchRecord_Type_Traverse(AerospikeBatchRecord *self,
+											  visitproc visit, void *arg)
+{
+	Py_VISIT(self->key);
+	Py_VISIT(self->record);
+	Py_VISIT(self->result);
+	Py_VISIT(self->in_doubt);
+	Py_VISIT(self->dict);
+	return 0;
+}
+
+static int AerospikeBatchRecord_Type_Clear(AerospikeBatchRecord *self)
+{
+	Py_CLEAR(self->key);
+	Py_CLEAR(self->record);
+	Py_CLEAR(self->result);
+	Py_CLEAR(self->in_doubt);
+	Py_CLEAR(self->dict);
+	return 0;
+}
+
+static void AerospikeBatchRecord_Type_Dealloc(AerospikeBatchRecord *self)
+{
+	PyObject_GC_UnTrack(self);
+	AerospikeBatchRecord_Type_Clear(self);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeBatchRecord_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike._BatchRecordBase",
+	.tp_basicsize = sizeof(AerospikeBatchRecord),
+	.tp_dealloc = (destructor)AerospikeBatchRecord_Type_Dealloc,
+	.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+	.tp_doc = "Base of the aerospike_helpers.batch.records classes. Results of\n"
+			  "batch commands are filled in directly from C.\n",
+	.tp_traverse = (traverseproc)AerospikeBatchRecord_Type_Traverse,
+	.tp_clear = (inquiry)AerospikeBatchRecord_Type_Clear,
+	.tp_members = AerospikeBatchRecord_Type_Members,
+	.tp_getset = AerospikeBatchRecord_Type_GetSet,
+	.tp_methods = AerospikeBatchRecord_Type_Methods,
+	.tp_dictoffset = offsetof(AerospikeBatchRecord, dict),
+	.tp_init = (initproc)AerospikeBatchRecord_Type_Init,
+	.tp_new = PyType_GenericNew};
+
+PyTypeObject *AerospikeBatchRecord_Ready()
+{
+	return PyType_Ready(&AerospikeBatchRecord_Type) == 0
+			   ? &AerospikeBatchRecord_Type
+			   : NULL;
+}
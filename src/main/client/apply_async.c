@@ -0,0 +1,301 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "completion_queue.h"
+
+#include "serializer.h"
+#include "record_cache.h"
+
+// Struct for Python User-Data for the Callback
+typedef struct {
+	as_key key;
+	as_error error;
+	PyObject *callback;
+	AerospikeClient *client;
+} LocalData;
+
+static void apply_async_invoke(as_error *cmd_error, as_val *val, void *udata,
+							   as_event_loop *event_loop)
+{
+	PyObject *py_key = NULL;
+	PyObject *py_result = NULL;
+	PyObject *py_err = NULL;
+	PyObject *py_exception = NULL;
+	PyObject *py_arglist = NULL;
+	PyObject *py_return = NULL;
+	as_error temp_error;
+
+	LocalData *data = (LocalData *)udata;
+	as_error *error = cmd_error ? cmd_error : &data->error;
+
+	PyGILState_STATE gstate = PyGILState_Ensure();
+
+	key_to_pyobject(&temp_error, &data->key, &py_key);
+
+	if (error->code == AEROSPIKE_OK) {
+		if (val_to_pyobject(data->client, &temp_error, val, &py_result) !=
+			AEROSPIKE_OK) {
+			as_error_copy(&data->error, &temp_error);
+			error = &data->error;
+		}
+	}
+
+	error_to_pyobject(error, &py_err);
+
+	if (error->code != AEROSPIKE_OK) {
+		py_exception =
+			create_pyexception(error, py_key, Py_None, NULL, NULL, NULL);
+	}
+	else {
+		Py_INCREF(Py_None);
+		py_exception = Py_None;
+	}
+
+	if (!py_result) {
+		Py_INCREF(Py_None);
+		py_result = Py_None;
+	}
+
+	py_arglist = PyTuple_New(4);
+	PyTuple_SetItem(py_arglist, 0, py_key);		  //0-key tuple
+	PyTuple_SetItem(py_arglist, 1, py_result);	  //1-udf result
+	PyTuple_SetItem(py_arglist, 2, py_err);		  //2-error tuple
+	PyTuple_SetItem(py_arglist, 3, py_exception); //3-exception
+
+	py_return = PyObject_Call(data->callback, py_arglist, NULL);
+	Py_DECREF(py_arglist);
+
+	if (!py_return) {
+		// The callback raised, nothing else can be done from the event loop.
+		PyErr_WriteUnraisable(data->callback);
+	}
+	else {
+		Py_DECREF(py_return);
+	}
+
+	if (val) {
+		as_val_destroy(val);
+	}
+
+	as_key_destroy(&data->key);
+	Py_DECREF(data->callback);
+	completion_client_release((PyObject *)data->client);
+	cf_free(data);
+
+	PyGILState_Release(gstate);
+}
+
+static void apply_async_deliver(as_error *err, void *result, void *udata)
+{
+	apply_async_invoke(err, (as_val *)result, udata, NULL);
+}
+
+static void apply_async_callback(as_error *cmd_error, as_val *val, void *udata,
+								 as_event_loop *event_loop)
+{
+	LocalData *data = (LocalData *)udata;
+	completion_queue *queue = data->client->completion_queue;
+
+	// The listener owns val, the queue takes it over.
+	if (queue && completion_queue_push(queue, apply_async_deliver, cmd_error,
+									   val, udata)) {
+		return;
+	}
+
+	apply_async_invoke(cmd_error, val, udata, event_loop);
+}
+
+/**
+ *******************************************************************************************************
+ * Applies asynchronously a registered udf module on a particular record.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with (key, result, error, exception).
+ * In case of error before the command is issued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Apply_Async(AerospikeClient *self, PyObject *args,
+									  PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_module = NULL;
+	PyObject *py_function = NULL;
+	PyObject *py_arglist = NULL;
+	PyObject *py_policy = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_apply apply_policy;
+	as_policy_apply *apply_policy_p = NULL;
+	as_list *arglist = NULL;
+	const char *module = NULL;
+	const char *function = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	LocalData *uData = NULL;
+
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"apply_callback", "key",	 "module", "function",
+							 "args",		   "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOOOO|O:apply_async", kwlist,
+									&py_callback, &py_key, &py_module,
+									&py_function, &py_arglist,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	if (!async_support) {
+		as_error_update(
+			&err, AEROSPIKE_ERR,
+			"Support for async is disabled, build software with async option");
+		goto CLEANUP;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!PyCallable_Check(py_callback)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"apply_callback must be callable");
+		goto CLEANUP;
+	}
+
+	if (!PyList_Check(py_arglist)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"expected UDF method arguments in a 'list'");
+		goto CLEANUP;
+	}
+
+	if (!PyUnicode_Check(py_module)) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"udf module argument must be a string");
+		goto CLEANUP;
+	}
+	module = PyUnicode_AsUTF8(py_module);
+
+	if (!PyUnicode_Check(py_function)) {
+		as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+						"function name must be a string");
+		goto CLEANUP;
+	}
+	function = PyUnicode_AsUTF8(py_function);
+
+	self->is_client_put_serializer = false;
+	if (pyobject_to_list(self, &err, py_arglist, &arglist, &static_pool,
+						 SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_policy_apply(self, &err, py_policy, &apply_policy,
+								 &apply_policy_p,
+								 &self->as->config.policies.apply, &exp_list,
+								 &exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	uData = cf_malloc(sizeof(LocalData));
+	uData->callback = py_callback;
+	uData->client = self;
+	as_error_init(&uData->error);
+
+	if (pyobject_to_key(&err, py_key, &uData->key) != AEROSPIKE_OK) {
+		cf_free(uData);
+		uData = NULL;
+		goto CLEANUP;
+	}
+
+	Py_INCREF(py_callback);
+	Py_INCREF(self);
+
+	record_cache_invalidate(self, &uData->key);
+
+	// Invoke operation
+	Py_BEGIN_ALLOW_THREADS
+	aerospike_key_apply_async(self->as, &err, apply_policy_p, &uData->key,
+							  module, function, arglist, apply_async_callback,
+							  uData, NULL, NULL);
+	Py_END_ALLOW_THREADS
+
+	if (err.code != AEROSPIKE_OK) {
+		// The listener is not invoked when the command could not be queued.
+		Py_DECREF(py_callback);
+		Py_DECREF(self);
+	}
+	else {
+		uData = NULL;
+	}
+
+CLEANUP:
+
+	if (arglist) {
+		as_list_destroy(arglist);
+	}
+
+	POOL_RELEASE(&static_pool);
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (uData) {
+		as_key_destroy(&uData->key);
+		cf_free(uData);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, py_key, NULL, py_module, py_function, NULL);
+		return NULL;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
@@ -30,12 +30,13 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "batch_record.h"
+#include "record_cache.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
 	PyObject *py_results;
-	PyObject *batch_records_module;
-	PyObject *func_name;
+	PyObject *py_record_type;
 	AerospikeClient *client;
 } LocalData;
 
@@ -66,8 +67,7 @@ static bool batch_apply_cb(const as_batch_result *results, uint32_t n,
             break;
 		}
 
-		py_batch_record = PyObject_CallMethodObjArgs(
-			data->batch_records_module, data->func_name, py_key, NULL);
+		py_batch_record = AerospikeBatchRecord_New(data->py_record_type, py_key);
 		if (py_batch_record == NULL) {
             as_log_error("unable to instance BatchRecord at results index: %d", i);
 			success = false;
@@ -231,16 +231,24 @@ static PyObject *AerospikeClient_Batch_Apply_Invoke(
 		Py_DECREF(res_list);
 		goto CLEANUP;
 	}
+	// Results are allocated from the C type, without calling __init__.
+	PyObject *py_record_type = PyObject_GetAttrString(br_module, "BatchRecord");
 	Py_DECREF(br_module);
 	Py_DECREF(obj_name);
 	Py_DECREF(res_list);
+	if (!py_record_type) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to load BatchRecord");
+		Py_CLEAR(br_instance);
+		goto CLEANUP;
+	}
 
 	// Create and initialize callback user-data
 	LocalData data;
 	data.client = self;
-	data.func_name = PyUnicode_FromString("BatchRecord");
+	data.py_record_type = py_record_type;
 	data.py_results = PyObject_GetAttrString(br_instance, "batch_records");
-	data.batch_records_module = br_module;
 
     as_error batch_apply_err;
     as_error_init(&batch_apply_err);
@@ -253,8 +261,10 @@ static PyObject *AerospikeClient_Batch_Apply_Invoke(
 
 	Py_END_ALLOW_THREADS
 
+	record_cache_invalidate_batch(self, &batch);
+
 	Py_DECREF(data.py_results);
-	Py_DECREF(data.func_name);
+	Py_DECREF(data.py_record_type);
 
 	PyObject *py_bw_res = PyLong_FromLong((long)batch_apply_err.code);
 	PyObject_SetAttrString(br_instance, FIELD_NAME_BATCH_RESULT, py_bw_res);
@@ -267,6 +277,8 @@ CLEANUP:
 		as_list_destroy(arglist);
 	}
 
+	POOL_RELEASE(&static_pool);
+
 	if (batch_exp_list_p) {
 		as_exp_destroy(batch_exp_list_p);
 	}
@@ -0,0 +1,565 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "batch_record.h"
+#include "completion_queue.h"
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_log_macros.h>
+
+#include "operate.h"
+#include "record_cache.h"
+
+// Struct for Python User-Data for the Callback
+// Batch commands are re-serialized on retry, so everything the command
+// references has to live until the listener runs.
+typedef struct {
+	PyObject *callback;
+	AerospikeClient *client;
+	as_batch batch;
+	as_operations ops;
+	bool ops_initialised;
+	as_static_pool *static_pool;
+	as_vector *unicodeStrVector;
+	as_policy_batch policy_batch;
+	as_exp *batch_exp_list_p;
+	as_policy_batch_write policy_batch_write;
+	as_policy_batch_remove policy_batch_remove;
+	as_exp *batch_sub_exp_list_p;
+} LocalData;
+
+static LocalData *batch_async_data_create(AerospikeClient *self,
+										  PyObject *py_callback)
+{
+	LocalData *data = cf_malloc(sizeof(LocalData));
+	memset(data, 0, sizeof(LocalData));
+	data->callback = py_callback;
+	data->client = self;
+	data->static_pool = as_static_pool_new();
+	data->unicodeStrVector = as_vector_create(sizeof(char *), 128);
+	as_batch_init(&data->batch, 0);
+	return data;
+}
+
+static void batch_async_data_destroy(LocalData *data)
+{
+	for (unsigned int i = 0; i < data->unicodeStrVector->size; i++) {
+		free(as_vector_get_ptr(data->unicodeStrVector, i));
+	}
+	as_vector_destroy(data->unicodeStrVector);
+
+	if (data->ops_initialised) {
+		as_operations_destroy(&data->ops);
+	}
+
+	POOL_RELEASE(data->static_pool);
+	cf_free(data->static_pool);
+
+	if (data->batch_exp_list_p) {
+		as_exp_destroy(data->batch_exp_list_p);
+	}
+
+	if (data->batch_sub_exp_list_p) {
+		as_exp_destroy(data->batch_sub_exp_list_p);
+	}
+
+	as_batch_destroy(&data->batch);
+	cf_free(data);
+}
+
+/**
+ * Converts the keys of py_keys into data->batch.
+ */
+static as_status batch_async_set_keys(as_error *err, LocalData *data,
+									  PyObject *py_keys)
+{
+	Py_ssize_t keys_size = PyList_Size(py_keys);
+
+	as_batch_destroy(&data->batch);
+	as_batch_init(&data->batch, (uint32_t)keys_size);
+
+	for (Py_ssize_t i = 0; i < keys_size; i++) {
+		PyObject *py_key = PyList_GetItem(py_keys, i);
+		as_key *key = as_batch_keyat(&data->batch, (uint32_t)i);
+
+		if (!PyTuple_Check(py_key)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "key should be an aerospike key tuple");
+		}
+
+		if (pyobject_to_key(err, py_key, key) != AEROSPIKE_OK) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "failed to convert key at index: %d",
+								   (int)i);
+		}
+	}
+
+	return err->code;
+}
+
+/**
+ * Builds an aerospike_helpers.batch.records.BatchRecords from the C client results.
+ */
+static as_status batch_records_to_pyobject(AerospikeClient *self,
+										   as_error *err,
+										   as_batch_records *records,
+										   as_status batch_status,
+										   PyObject **py_batch_records)
+{
+	PyObject *br_module = NULL;
+	PyObject *py_results = NULL;
+	PyObject *py_instance = NULL;
+	PyObject *py_record_type = NULL;
+
+	br_module = PyImport_ImportModule("aerospike_helpers.batch.records");
+	if (!br_module) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to load batch_records module");
+	}
+
+	py_results = PyList_New(0);
+	py_instance = PyObject_CallMethod(br_module, "BatchRecords", "O",
+									  py_results);
+	if (!py_instance) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to instance BatchRecords");
+		goto CLEANUP;
+	}
+
+	py_record_type = PyObject_GetAttrString(br_module, "BatchRecord");
+	if (!py_record_type) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to load BatchRecord");
+		goto CLEANUP;
+	}
+
+	uint32_t size = records ? records->list.size : 0;
+	for (uint32_t i = 0; i < size; i++) {
+		as_batch_base_record *rec = as_vector_get(&records->list, i);
+		PyObject *py_key = NULL;
+		PyObject *py_batch_record = NULL;
+
+		if (key_to_pyobject(err, &rec->key, &py_key) != AEROSPIKE_OK) {
+			as_log_error("unable to convert key at results index: %d", i);
+			goto CLEANUP;
+		}
+
+		py_batch_record = AerospikeBatchRecord_New(py_record_type, py_key);
+		Py_DECREF(py_key);
+		if (!py_batch_record) {
+			PyErr_Clear();
+			as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							"Unable to instance BatchRecord at index: %d", i);
+			goto CLEANUP;
+		}
+
+		AerospikeBatchRecord_Set_Result(self, err, py_batch_record,
+										rec->result, rec->in_doubt,
+										&rec->record, &rec->key);
+
+		PyList_Append(py_results, py_batch_record);
+		Py_DECREF(py_batch_record);
+
+		if (err->code != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	PyObject *py_batch_status = PyLong_FromLong((long)batch_status);
+	PyObject_SetAttrString(py_instance, FIELD_NAME_BATCH_RESULT,
+						   py_batch_status);
+	Py_DECREF(py_batch_status);
+
+CLEANUP:
+	Py_XDECREF(py_record_type);
+	Py_DECREF(br_module);
+	Py_DECREF(py_results);
+
+	if (err->code != AEROSPIKE_OK) {
+		Py_XDECREF(py_instance);
+		return err->code;
+	}
+
+	*py_batch_records = py_instance;
+	return err->code;
+}
+
+static void batch_async_invoke(as_error *cmd_error, as_batch_records *records,
+							   void *udata, as_event_loop *event_loop)
+{
+	PyObject *py_batch_records = NULL;
+	PyObject *py_err = NULL;
+	PyObject *py_exception = NULL;
+	PyObject *py_arglist = NULL;
+	PyObject *py_return = NULL;
+	as_error error;
+
+	LocalData *data = (LocalData *)udata;
+
+	as_error_init(&error);
+
+	PyGILState_STATE gstate = PyGILState_Ensure();
+
+	// Per record failures are reported through each BatchRecord, like the
+	// synchronous batch commands do. Only a failure to deliver any results
+	// is raised.
+	as_status batch_status = cmd_error ? cmd_error->code : AEROSPIKE_OK;
+	if (records) {
+		batch_records_to_pyobject(data->client, &error, records, batch_status,
+								  &py_batch_records);
+	}
+	else if (cmd_error) {
+		as_error_copy(&error, cmd_error);
+	}
+
+	error_to_pyobject(&error, &py_err);
+
+	if (error.code != AEROSPIKE_OK) {
+		py_exception = create_pyexception(&error, NULL, NULL, NULL, NULL, NULL);
+	}
+	else {
+		Py_INCREF(Py_None);
+		py_exception = Py_None;
+	}
+
+	if (!py_batch_records) {
+		Py_INCREF(Py_None);
+		py_batch_records = Py_None;
+	}
+
+	py_arglist = PyTuple_New(3);
+	PyTuple_SetItem(py_arglist, 0, py_batch_records); //0-BatchRecords
+	PyTuple_SetItem(py_arglist, 1, py_err);			  //1-error tuple
+	PyTuple_SetItem(py_arglist, 2, py_exception);	  //2-exception
+
+	py_return = PyObject_Call(data->callback, py_arglist, NULL);
+	Py_DECREF(py_arglist);
+
+	if (!py_return) {
+		// The callback raised, nothing else can be done from the event loop.
+		PyErr_WriteUnraisable(data->callback);
+	}
+	else {
+		Py_DECREF(py_return);
+	}
+
+	if (records) {
+		as_batch_records_destroy(records);
+	}
+
+	Py_DECREF(data->callback);
+	completion_client_release((PyObject *)data->client);
+	batch_async_data_destroy(data);
+
+	PyGILState_Release(gstate);
+}
+
+static void batch_async_deliver(as_error *err, void *result, void *udata)
+{
+	batch_async_invoke(err, (as_batch_records *)result, udata, NULL);
+}
+
+static void batch_async_callback(as_error *cmd_error, as_batch_records *records,
+								 void *udata, as_event_loop *event_loop)
+{
+	LocalData *data = (LocalData *)udata;
+	completion_queue *queue = data->client->completion_queue;
+
+	// The listener owns records, the queue takes them over.
+	if (queue && completion_queue_push(queue, batch_async_deliver, cmd_error,
+									   records, udata)) {
+		return;
+	}
+
+	batch_async_invoke(cmd_error, records, udata, event_loop);
+}
+
+#define BATCH_ASYNC_PRECHECKS(__callback_name)                                 \
+	if (!async_support) {                                                      \
+		as_error_update(&err, AEROSPIKE_ERR,                                   \
+						"Support for async is disabled, build software with "  \
+						"async option");                                       \
+		goto CLEANUP;                                                          \
+	}                                                                          \
+	if (!self || !self->as) {                                                  \
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,                             \
+						"Invalid aerospike object");                           \
+		goto CLEANUP;                                                          \
+	}                                                                          \
+	if (!self->is_conn_16) {                                                   \
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,                           \
+						"No connection to aerospike cluster");                 \
+		goto CLEANUP;                                                          \
+	}                                                                          \
+	if (!PyCallable_Check(py_callback)) {                                      \
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,                             \
+						__callback_name " must be callable");                  \
+		goto CLEANUP;                                                          \
+	}                                                                          \
+	if (!PyList_Check(py_keys)) {                                              \
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,                             \
+						"keys should be a list of aerospike key tuples");      \
+		goto CLEANUP;                                                          \
+	}
+
+#define BATCH_ASYNC_RAISE_ON_ERROR()                                           \
+	if (err.code != AEROSPIKE_OK) {                                            \
+		PyObject *py_err = NULL;                                               \
+		error_to_pyobject(&err, &py_err);                                      \
+		PyObject *exception_type = raise_exception(&err);                      \
+		PyErr_SetObject(exception_type, py_err);                               \
+		Py_DECREF(py_err);                                                     \
+		return NULL;                                                           \
+	}
+
+/**
+ *******************************************************************************************************
+ * Performs asynchronously the same operations on multiple records.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with (BatchRecords, error, exception).
+ * In case of error before the command is issued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_Operate_Async(AerospikeClient *self,
+											  PyObject *args, PyObject *kwds)
+{
+	PyObject *py_callback = NULL;
+	PyObject *py_keys = NULL;
+	PyObject *py_ops = NULL;
+	PyObject *py_policy_batch = NULL;
+	PyObject *py_policy_batch_write = NULL;
+
+	as_error err;
+	as_policy_batch *policy_batch_p = NULL;
+	as_policy_batch_write *policy_batch_write_p = NULL;
+	as_exp batch_exp_list;
+	as_exp batch_write_exp_list;
+	long operation;
+	long return_type = -1;
+
+	LocalData *data = NULL;
+
+	as_error_init(&err);
+
+	static char *kwlist[] = {"batch_callback", "keys", "ops", "policy_batch",
+							 "policy_batch_write", NULL};
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:batch_operate_async",
+									kwlist, &py_callback, &py_keys, &py_ops,
+									&py_policy_batch,
+									&py_policy_batch_write) == false) {
+		return NULL;
+	}
+
+	BATCH_ASYNC_PRECHECKS("batch_callback")
+
+	if (!PyList_Check(py_ops) || !PyList_Size(py_ops)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"ops should be a list of op dictionaries");
+		goto CLEANUP;
+	}
+
+	data = batch_async_data_create(self, py_callback);
+
+	Py_ssize_t ops_size = PyList_Size(py_ops);
+	as_operations_init(&data->ops, (uint16_t)ops_size);
+	data->ops_initialised = true;
+
+	for (Py_ssize_t i = 0; i < ops_size; i++) {
+		PyObject *py_val = PyList_GetItem(py_ops, i);
+
+		if (!PyDict_Check(py_val)) {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"op should be an aerospike operation dictionary");
+			goto CLEANUP;
+		}
+
+		if (add_op(self, &err, py_val, data->unicodeStrVector,
+				   data->static_pool, &data->ops, &operation,
+				   &return_type) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (batch_async_set_keys(&err, data, py_keys) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy_batch) {
+		if (pyobject_to_policy_batch(
+				self, &err, py_policy_batch, &data->policy_batch,
+				&policy_batch_p, &self->as->config.policies.batch,
+				&batch_exp_list, &data->batch_exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (py_policy_batch_write) {
+		if (pyobject_to_batch_write_policy(
+				self, &err, py_policy_batch_write, &data->policy_batch_write,
+				&policy_batch_write_p, &batch_write_exp_list,
+				&data->batch_sub_exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	Py_INCREF(py_callback);
+	Py_INCREF(self);
+
+	record_cache_invalidate_batch(self, &data->batch);
+
+	Py_BEGIN_ALLOW_THREADS
+	aerospike_batch_operate_async(self->as, &err, policy_batch_p,
+								  policy_batch_write_p, &data->batch,
+								  &data->ops, batch_async_callback, data,
+								  NULL);
+	Py_END_ALLOW_THREADS
+
+	if (err.code != AEROSPIKE_OK) {
+		// The listener is not invoked when the command could not be queued.
+		Py_DECREF(py_callback);
+		Py_DECREF(self);
+	}
+	else {
+		data = NULL;
+	}
+
+CLEANUP:
+	if (data) {
+		batch_async_data_destroy(data);
+	}
+
+	BATCH_ASYNC_RAISE_ON_ERROR()
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+/**
+ *******************************************************************************************************
+ * Removes asynchronously multiple records.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with (BatchRecords, error, exception).
+ * In case of error before the command is issued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_Remove_Async(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds)
+{
+	PyObject *py_callback = NULL;
+	PyObject *py_keys = NULL;
+	PyObject *py_policy_batch = NULL;
+	PyObject *py_policy_batch_remove = NULL;
+
+	as_error err;
+	as_policy_batch *policy_batch_p = NULL;
+	as_policy_batch_remove *policy_batch_remove_p = NULL;
+	as_exp batch_exp_list;
+	as_exp batch_remove_exp_list;
+
+	LocalData *data = NULL;
+
+	as_error_init(&err);
+
+	static char *kwlist[] = {"batch_callback", "keys", "policy_batch",
+							 "policy_batch_remove", NULL};
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:batch_remove_async",
+									kwlist, &py_callback, &py_keys,
+									&py_policy_batch,
+									&py_policy_batch_remove) == false) {
+		return NULL;
+	}
+
+	BATCH_ASYNC_PRECHECKS("batch_callback")
+
+	data = batch_async_data_create(self, py_callback);
+
+	if (batch_async_set_keys(&err, data, py_keys) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy_batch) {
+		if (pyobject_to_policy_batch(
+				self, &err, py_policy_batch, &data->policy_batch,
+				&policy_batch_p, &self->as->config.policies.batch,
+				&batch_exp_list, &data->batch_exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (py_policy_batch_remove) {
+		if (pyobject_to_batch_remove_policy(
+				self, &err, py_policy_batch_remove, &data->policy_batch_remove,
+				&policy_batch_remove_p, &batch_remove_exp_list,
+				&data->batch_sub_exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	Py_INCREF(py_callback);
+	Py_INCREF(self);
+
+	record_cache_invalidate_batch(self, &data->batch);
+
+	Py_BEGIN_ALLOW_THREADS
+	aerospike_batch_remove_async(self->as, &err, policy_batch_p,
+								 policy_batch_remove_p, &data->batch,
+								 batch_async_callback, data, NULL);
+	Py_END_ALLOW_THREADS
+
+	if (err.code != AEROSPIKE_OK) {
+		// The listener is not invoked when the command could not be queued.
+		Py_DECREF(py_callback);
+		Py_DECREF(self);
+	}
+	else {
+		data = NULL;
+	}
+
+CLEANUP:
+	if (data) {
+		batch_async_data_destroy(data);
+	}
+
+	BATCH_ASYNC_RAISE_ON_ERROR()
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
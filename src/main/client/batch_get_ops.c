@@ -29,6 +29,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "batch_chunks.h"
 
 #include <aerospike/as_double.h>
 #include <aerospike/as_integer.h>
@@ -131,6 +132,9 @@ AerospikeClient_Batch_GetOps_Invoke(AerospikeClient *self, as_error *err,
 
 	as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
 	as_operations ops;
 	Py_ssize_t ops_size = PyList_Size(py_ops);
 	as_operations_inita(&ops, ops_size);
@@ -144,9 +148,6 @@ AerospikeClient_Batch_GetOps_Invoke(AerospikeClient *self, as_error *err,
 		}
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	if (py_meta) {
 		if (check_for_meta(py_meta, &ops, err) != AEROSPIKE_OK) {
 			goto CLEANUP;
@@ -216,12 +217,37 @@ CLEANUP:
 	as_vector_destroy(unicodeStrVector);
 
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 
 	as_batch_destroy(&batch);
 
 	return py_results;
 }
 
+typedef struct {
+	PyObject *py_ops;
+	PyObject *py_meta;
+	PyObject *py_policy;
+} BatchGetOpsArgs;
+
+static PyObject *batch_get_ops_chunk(AerospikeClient *self, PyObject *py_keys,
+									 void *udata)
+{
+	BatchGetOpsArgs *getops_args = (BatchGetOpsArgs *)udata;
+	as_error err;
+	as_error_init(&err);
+
+	PyObject *py_results = AerospikeClient_Batch_GetOps_Invoke(
+		self, &err, py_keys, getops_args->py_ops, getops_args->py_meta,
+		getops_args->py_policy);
+
+	if (py_results == NULL) {
+		raise_exception_base(&err, py_keys, Py_None, NULL, NULL, NULL);
+	}
+
+	return py_results;
+}
+
 /**
  *******************************************************************************************************
  * Multiple operations on a single record
@@ -261,6 +287,22 @@ PyObject *AerospikeClient_Batch_GetOps(AerospikeClient *self, PyObject *args,
 						"batch_getops keys/ops should be of type list");
 	}
 
+	uint32_t max_keys = 0;
+	if (err.code == AEROSPIKE_OK) {
+		if (get_max_keys_per_batch(&err, py_policy, &max_keys) !=
+			AEROSPIKE_OK) {
+			raise_exception_base(&err, py_keys, Py_None, NULL, NULL, NULL);
+			return NULL;
+		}
+
+		if (batch_chunks_needed(py_keys, max_keys)) {
+			BatchGetOpsArgs getops_args = {py_ops, py_meta, py_policy};
+			return batch_chunks_invoke(self, py_keys, max_keys,
+									   batch_get_ops_chunk, NULL,
+									   &getops_args);
+		}
+	}
+
 	py_results = AerospikeClient_Batch_GetOps_Invoke(
 		self, &err, py_keys, py_ops, py_meta, py_policy);
 
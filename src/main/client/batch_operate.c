@@ -31,12 +31,14 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "batch_record.h"
+#include "batch_chunks.h"
+#include "record_cache.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
 	PyObject *py_results;
-	PyObject *batch_records_module;
-	PyObject *func_name;
+	PyObject *py_record_type;
 	AerospikeClient *client;
 } LocalData;
 
@@ -67,8 +69,7 @@ static bool batch_operate_cb(const as_batch_result *results, uint32_t n,
             break;
 		}
 
-		py_batch_record = PyObject_CallMethodObjArgs(
-			data->batch_records_module, data->func_name, py_key, NULL);
+		py_batch_record = AerospikeBatchRecord_New(data->py_record_type, py_key);
 		if (py_batch_record == NULL) {
             as_log_error("unable to instance BatchRecord at results index: %d", i);
 			success = false;
@@ -247,16 +248,24 @@ static PyObject *AerospikeClient_Batch_Operate_Invoke(
 		Py_DECREF(res_list);
 		goto CLEANUP;
 	}
+	// Results are allocated from the C type, without calling __init__.
+	PyObject *py_record_type = PyObject_GetAttrString(br_module, "BatchRecord");
 	Py_DECREF(br_module);
 	Py_DECREF(obj_name);
 	Py_DECREF(res_list);
+	if (!py_record_type) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to load BatchRecord");
+		Py_CLEAR(br_instance);
+		goto CLEANUP;
+	}
 
 	// Create and initialize callback user-data
 	LocalData data;
 	data.client = self;
-	data.func_name = PyUnicode_FromString("BatchRecord");
+	data.py_record_type = py_record_type;
 	data.py_results = PyObject_GetAttrString(br_instance, "batch_records");
-	data.batch_records_module = br_module;
 
     as_error batch_apply_err;
     as_error_init(&batch_apply_err);
@@ -269,8 +278,10 @@ static PyObject *AerospikeClient_Batch_Operate_Invoke(
 
 	Py_END_ALLOW_THREADS
 
+	record_cache_invalidate_batch(self, &batch);
+
 	Py_DECREF(data.py_results);
-	Py_DECREF(data.func_name);
+	Py_DECREF(data.py_record_type);
 
 PyObject *py_bw_res = PyLong_FromLong((long)batch_apply_err.code);
 	PyObject_SetAttrString(br_instance, FIELD_NAME_BATCH_RESULT, py_bw_res);
@@ -293,6 +304,7 @@ CLEANUP:
 
 	as_vector_destroy(unicodeStrVector);
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 	as_batch_destroy(&batch);
 
 	if (tmp_keys_p) {
@@ -312,6 +324,98 @@ CLEANUP:
 	return br_instance;
 }
 
+typedef struct {
+	PyObject *py_ops;
+	PyObject *py_policy_batch;
+	PyObject *py_policy_batch_write;
+} BatchOperateArgs;
+
+static PyObject *batch_operate_chunk(AerospikeClient *self, PyObject *py_keys,
+									 void *udata)
+{
+	BatchOperateArgs *operate_args = (BatchOperateArgs *)udata;
+	as_error err;
+	as_error_init(&err);
+
+	return AerospikeClient_Batch_Operate_Invoke(
+		self, &err, py_keys, operate_args->py_ops,
+		operate_args->py_policy_batch, operate_args->py_policy_batch_write);
+}
+
+// Stands for the keys of a sub-batch which raised py_exception, or was not
+// started after another one did, with records failed with the error of the
+// exception. Only the records of a sub-batch which raised can be in doubt.
+static PyObject *batch_operate_failed_chunk(AerospikeClient *self,
+											PyObject *py_keys,
+											PyObject *py_exception,
+											bool started, void *udata)
+{
+	as_status code = AEROSPIKE_ERR_CLIENT;
+	bool in_doubt = false;
+
+	if (py_exception) {
+		PyObject *py_code = PyObject_GetAttrString(py_exception, "code");
+		if (py_code && PyLong_Check(py_code)) {
+			code = (as_status)PyLong_AsLong(py_code);
+		}
+		Py_XDECREF(py_code);
+
+		PyObject *py_in_doubt =
+			PyObject_GetAttrString(py_exception, "in_doubt");
+		in_doubt = started && py_in_doubt && PyObject_IsTrue(py_in_doubt) == 1;
+		Py_XDECREF(py_in_doubt);
+		PyErr_Clear();
+	}
+
+	PyObject *br_module =
+		PyImport_ImportModule("aerospike_helpers.batch.records");
+	if (!br_module) {
+		return NULL;
+	}
+
+	PyObject *py_record_type = PyObject_GetAttrString(br_module, "BatchRecord");
+	PyObject *br_instance =
+		PyObject_CallMethod(br_module, "BatchRecords", "(N)", PyList_New(0));
+	Py_DECREF(br_module);
+
+	PyObject *py_results =
+		br_instance ? PyObject_GetAttrString(br_instance, "batch_records")
+					: NULL;
+	PyObject *py_code = PyLong_FromLong((long)code);
+	as_error err;
+	as_error_init(&err);
+
+	bool ok = py_record_type && py_results && py_code &&
+			  PyObject_SetAttrString(br_instance, FIELD_NAME_BATCH_RESULT,
+									 py_code) == 0;
+
+	for (Py_ssize_t i = 0; ok && i < PySequence_Size(py_keys); i++) {
+		PyObject *py_key = PySequence_GetItem(py_keys, i);
+		PyObject *py_batch_record =
+			py_key ? AerospikeBatchRecord_New(py_record_type, py_key) : NULL;
+		ok = py_batch_record &&
+			 AerospikeBatchRecord_Set_Result(self, &err, py_batch_record, code,
+											 in_doubt, NULL,
+											 NULL) == AEROSPIKE_OK &&
+			 PyList_Append(py_results, py_batch_record) == 0;
+		Py_XDECREF(py_batch_record);
+		Py_XDECREF(py_key);
+	}
+
+	Py_XDECREF(py_record_type);
+	Py_XDECREF(py_results);
+	Py_XDECREF(py_code);
+
+	if (!ok) {
+		Py_CLEAR(br_instance);
+		if (!PyErr_Occurred()) {
+			PyErr_SetString(PyExc_SystemError,
+							"Unable to build the records of a failed batch");
+		}
+	}
+	return br_instance;
+}
+
 /**
  *******************************************************************************************************
  * Same operations on a multiple records
@@ -360,6 +464,20 @@ PyObject *AerospikeClient_Batch_Operate(AerospikeClient *self, PyObject *args,
 		goto ERROR;
 	}
 
+	uint32_t max_keys = 0;
+	if (get_max_keys_per_batch(&err, py_policy_batch, &max_keys) !=
+		AEROSPIKE_OK) {
+		goto ERROR;
+	}
+
+	if (batch_chunks_needed(py_keys, max_keys)) {
+		BatchOperateArgs operate_args = {py_ops, py_policy_batch,
+										 py_policy_batch_write};
+		return batch_chunks_invoke(self, py_keys, max_keys,
+								   batch_operate_chunk,
+								   batch_operate_failed_chunk, &operate_args);
+	}
+
 	py_results = AerospikeClient_Batch_Operate_Invoke(
 		self, &err, py_keys, py_ops, py_policy_batch, py_policy_batch_write);
 
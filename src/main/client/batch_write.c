@@ -30,9 +30,11 @@
 #include "serializer.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "batch_record.h"
 #include "cdt_operation_utils.h"
 #include "geo.h"
 #include "cdt_types.h"
+#include "record_cache.h"
 
 #define GET_BATCH_POLICY_FROM_PYOBJECT(__policy, __policy_type,                \
 									   __conversion_func, __batch_type)        \
@@ -434,6 +436,8 @@ static PyObject *AerospikeClient_BatchWriteInvoke(AerospikeClient *self,
 
 	Py_END_ALLOW_THREADS
 
+	record_cache_invalidate_records(self, &batch_records);
+
 	PyObject *py_bw_res = PyLong_FromLong((long)err->code);
 	if (PyObject_HasAttrString(py_obj, FIELD_NAME_BATCH_RESULT)) {
 		PyObject_DelAttrString(py_obj, FIELD_NAME_BATCH_RESULT);
@@ -450,43 +454,11 @@ static PyObject *AerospikeClient_BatchWriteInvoke(AerospikeClient *self,
 
 		as_batch_base_record *batch_record = as_vector_get(res_list, i);
 
-		as_status *result_code = &(batch_record->result);
-		as_key *requested_key = &(batch_record->key);
-		as_record *result_rec = &(batch_record->record);
-		bool in_doubt = batch_record->in_doubt;
-
-		PyObject *py_res = PyLong_FromLong((long)*result_code);
-		if (PyObject_HasAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT)) {
-			PyObject_DelAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT);
-		}
-		PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT,
-							   py_res);
-		Py_DECREF(py_res);
-
-		PyObject *py_in_doubt = PyBool_FromLong((long)in_doubt);
-		PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_INDOUBT,
-							py_in_doubt);
-		Py_DECREF(py_in_doubt);
-
-		if (*result_code == AEROSPIKE_OK) {
-			PyObject *rec = NULL;
-
-			if (PyObject_HasAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD)) {
-				PyObject_DelAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD);
-			}
-
-			if (result_rec) {
-				record_to_pyobject(self, err, result_rec, requested_key, &rec);
-				PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD,
-									   rec);
-				Py_DECREF(rec);
-			}
-			else {
-				Py_INCREF(Py_None);
-				PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD,
-									   Py_None);
-			}
-		}
+		AerospikeBatchRecord_Set_Result(self, err, py_batch_record,
+										batch_record->result,
+										batch_record->in_doubt,
+										&batch_record->record,
+										&batch_record->key);
 	}
 
 	goto CLEANUP3;
@@ -512,6 +484,8 @@ CLEANUP4:
 		as_batch_records_destroy(&batch_records);
 	}
 
+	POOL_RELEASE(&static_pool);
+
 	for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
 		free(as_vector_get_ptr(unicodeStrVector, i));
 	}
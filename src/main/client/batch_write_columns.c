@@ -0,0 +1,350 @@
+/*******************************************************************************
+ * Copyright 2013-2022 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_operations.h>
+#include <citrusleaf/alloc.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "batch_record.h"
+#include "prepared_ops.h"
+#include "record_cache.h"
+
+/**
+ *******************************************************************************************************
+ * This function invokes csdk's API's.
+ *
+ * @param self                      AerospikeClient object
+ * @param err                       The as_error to be populated by the function
+ *                                  with the encountered error if any.
+ * @param py_keys                   The list containing keys.
+ * @param py_ops                    The list containing the template op dictionaries.
+ * @param py_values                 The list containing a row of op values per key.
+ * @param py_policy_batch      		Python dict used to populate policy_batch.
+ * @param py_policy_batch_write     Python dict used to populate policy_batch_write.
+ *******************************************************************************************************
+ */
+static PyObject *AerospikeClient_Batch_Write_Columns_Invoke(
+	AerospikeClient *self, as_error *err, PyObject *py_keys, PyObject *py_ops,
+	PyObject *py_values, PyObject *py_policy_batch,
+	PyObject *py_policy_batch_write)
+{
+	as_policy_batch policy_batch;
+	as_policy_batch *policy_batch_p = NULL;
+
+	as_policy_batch_write policy_batch_write;
+	as_policy_batch_write *policy_batch_write_p = NULL;
+
+	// For expressions conversion.
+	as_exp batch_exp_list;
+	as_exp *batch_exp_list_p = NULL;
+
+	as_exp batch_write_exp_list;
+	as_exp *batch_write_exp_list_p = NULL;
+
+	as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	as_batch_records batch_records;
+	as_batch_records *batch_records_p = NULL;
+
+	Py_ssize_t ops_size = PyList_Size(py_ops);
+	Py_ssize_t keys_size = PyList_Size(py_keys);
+	Py_ssize_t columns_size = 0;
+	compiled_op *compiled = NULL;
+
+	PyObject *br_module = NULL;
+	PyObject *py_record_type = NULL;
+	PyObject *py_results = NULL;
+	PyObject *br_instance = NULL;
+
+	if (!self || !self->as) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (PyList_Size(py_values) != keys_size) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM,
+						"values should have one row per key");
+		goto CLEANUP;
+	}
+
+	compiled = cf_calloc(ops_size, sizeof(compiled_op));
+	if (compiled_ops_init(self, err, py_ops, compiled, &columns_size) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy_batch) {
+		if (pyobject_to_policy_batch(
+				self, err, py_policy_batch, &policy_batch, &policy_batch_p,
+				&self->as->config.policies.batch, &batch_exp_list,
+				&batch_exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (py_policy_batch_write) {
+		if (pyobject_to_batch_write_policy(
+				self, err, py_policy_batch_write, &policy_batch_write,
+				&policy_batch_write_p, &batch_write_exp_list,
+				&batch_write_exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	as_batch_records_init(&batch_records, keys_size);
+	batch_records_p = &batch_records;
+
+	for (Py_ssize_t i = 0; i < keys_size; i++) {
+		PyObject *py_key = PyList_GetItem(py_keys, i);
+		PyObject *py_row = PyList_GetItem(py_values, i);
+
+		if (!PyTuple_Check(py_key)) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM,
+							"key should be an aerospike key tuple");
+			goto CLEANUP;
+		}
+
+		if ((!PyList_Check(py_row) && !PyTuple_Check(py_row)) ||
+			PySequence_Fast_GET_SIZE(py_row) != columns_size) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM,
+							"values at index %zd should be a list or tuple of "
+							"%zd op values",
+							i, columns_size);
+			goto CLEANUP;
+		}
+
+		as_batch_write_record *wr = as_batch_write_reserve(&batch_records);
+		wr->policy = policy_batch_write_p;
+		wr->ops = as_operations_new(ops_size);
+
+		if (pyobject_to_key(err, py_key, &wr->key) != AEROSPIKE_OK) {
+			as_error_update(err, AEROSPIKE_ERR_PARAM,
+							"failed to convert key at index: %zd", i);
+			goto CLEANUP;
+		}
+
+		for (Py_ssize_t j = 0; j < ops_size; j++) {
+			if (compiled_op_add(self, err, &compiled[j], py_row,
+								unicodeStrVector, &static_pool,
+								wr->ops) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+		}
+	}
+
+	// import batch_records helper
+	PyObject *sys_modules = PyImport_GetModuleDict();
+
+	if (PyMapping_HasKeyString(sys_modules, "aerospike_helpers.batch.records")) {
+		br_module = PyMapping_GetItemString(sys_modules,
+											"aerospike_helpers.batch.records");
+	}
+	else {
+		br_module = PyImport_ImportModule("aerospike_helpers.batch.records");
+	}
+
+	if (!br_module) {
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to load batch_records module");
+		goto CLEANUP;
+	}
+
+	py_record_type = PyObject_GetAttrString(br_module, "BatchRecord");
+	if (!py_record_type) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to load BatchRecord");
+		goto CLEANUP;
+	}
+
+	as_error batch_write_err;
+	as_error_init(&batch_write_err);
+
+	Py_BEGIN_ALLOW_THREADS
+
+	aerospike_batch_write(self->as, &batch_write_err, policy_batch_p,
+						  &batch_records);
+
+	Py_END_ALLOW_THREADS
+
+	record_cache_invalidate_records(self, &batch_records);
+
+	py_results = PyList_New(keys_size);
+	for (Py_ssize_t i = 0; i < keys_size; i++) {
+		as_batch_base_record *batch_record =
+			as_vector_get(&batch_records.list, i);
+
+		// Results are allocated from the C type, without calling __init__.
+		PyObject *py_batch_record = AerospikeBatchRecord_New(
+			py_record_type, PyList_GetItem(py_keys, i));
+		if (!py_batch_record) {
+			PyErr_Clear();
+			as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							"Unable to instance BatchRecord at index: %zd", i);
+			goto CLEANUP;
+		}
+		PyList_SET_ITEM(py_results, i, py_batch_record);
+
+		if (AerospikeBatchRecord_Set_Result(
+				self, err, py_batch_record, batch_record->result,
+				batch_record->in_doubt, &batch_record->record,
+				&batch_record->key) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	br_instance =
+		PyObject_CallMethod(br_module, "BatchRecords", "O", py_results);
+	if (!br_instance) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to instance BatchRecords");
+		goto CLEANUP;
+	}
+
+	PyObject *py_bw_res = PyLong_FromLong((long)batch_write_err.code);
+	PyObject_SetAttrString(br_instance, FIELD_NAME_BATCH_RESULT, py_bw_res);
+	Py_DECREF(py_bw_res);
+
+CLEANUP:
+	Py_XDECREF(py_results);
+	Py_XDECREF(py_record_type);
+	Py_XDECREF(br_module);
+
+	if (batch_records_p) {
+		// The ops are owned here, the batch records only point to them.
+		for (uint32_t i = 0; i < batch_records.list.size; i++) {
+			as_batch_write_record *wr = as_vector_get(&batch_records.list, i);
+			if (wr->ops) {
+				as_operations_destroy(wr->ops);
+			}
+		}
+		as_batch_records_destroy(&batch_records);
+	}
+
+	if (compiled) {
+		compiled_ops_release(compiled, ops_size);
+		cf_free(compiled);
+	}
+
+	for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+		free(as_vector_get_ptr(unicodeStrVector, i));
+	}
+
+	if (batch_exp_list_p) {
+		as_exp_destroy(batch_exp_list_p);
+	}
+
+	if (batch_write_exp_list_p) {
+		as_exp_destroy(batch_write_exp_list_p);
+	}
+
+	as_vector_destroy(unicodeStrVector);
+	POOL_RELEASE(&static_pool);
+
+	if (err->code != AEROSPIKE_OK) {
+		Py_XDECREF(br_instance);
+		raise_exception_base(err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return br_instance;
+}
+
+/**
+ *******************************************************************************************************
+ * Same operations on multiple records, with different values per record.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns aerospike_helpers.batch.records.BatchRecords object on success.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Batch_Write_Columns(AerospikeClient *self,
+											  PyObject *args, PyObject *kwds)
+{
+	as_error err;
+	PyObject *py_policy_batch = NULL;
+	PyObject *py_policy_batch_write = NULL;
+	PyObject *py_keys = NULL;
+	PyObject *py_ops = NULL;
+	PyObject *py_values = NULL;
+
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"keys", "ops", "values", "policy_batch",
+							 "policy_batch_write", NULL};
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:batch_write_columns",
+									kwlist, &py_keys, &py_ops, &py_values,
+									&py_policy_batch,
+									&py_policy_batch_write) == false) {
+		return NULL;
+	}
+
+	// required arg so don't need to check for NULL
+	if (!PyList_Check(py_ops) || !PyList_Size(py_ops)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"ops should be a list of op dictionaries");
+		goto ERROR;
+	}
+
+	if (!PyList_Check(py_keys)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"keys should be a list of aerospike key tuples");
+		goto ERROR;
+	}
+
+	if (!PyList_Check(py_values)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"values should be a list of op value rows");
+		goto ERROR;
+	}
+
+	return AerospikeClient_Batch_Write_Columns_Invoke(
+		self, &err, py_keys, py_ops, py_values, py_policy_batch,
+		py_policy_batch_write);
+
+ERROR:
+	raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+	return NULL;
+}
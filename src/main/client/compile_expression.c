@@ -0,0 +1,81 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "compiled_expression.h"
+
+/**
+ *******************************************************************************************************
+ * Packs a compiled expression once, for use in place of the expression list.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.CompiledExpression object.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Compile_Expression(AerospikeClient *self,
+											 PyObject *args, PyObject *kwds)
+{
+	PyObject *py_expression = NULL;
+	as_exp *exp_list_p = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"expression", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:compile_expression", kwlist,
+									&py_expression) == false) {
+		return NULL;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (AerospikeCompiledExpression_Check(py_expression)) {
+		Py_INCREF(py_expression);
+		return py_expression;
+	}
+
+	convert_exp_list(self, py_expression, &exp_list_p, &err);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		if (exp_list_p) {
+			as_exp_destroy(exp_list_p);
+		}
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return AerospikeCompiledExpression_New(exp_list_p);
+}
@@ -0,0 +1,72 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+
+#include "client.h"
+#include "exceptions.h"
+#include "policy_object.h"
+
+/**
+ *******************************************************************************************************
+ * Converts a policy dict once, for use in place of the dict.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.Policy object.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Compile_Policy(AerospikeClient *self,
+										 PyObject *args, PyObject *kwds)
+{
+	PyObject *py_kind = NULL;
+	PyObject *py_policy = NULL;
+	AerospikePolicy *py_compiled = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"kind", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:compile_policy", kwlist,
+									&py_kind, &py_policy) == false) {
+		return NULL;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	py_compiled = AerospikePolicy_New(self, &err, py_kind, py_policy);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return (PyObject *)py_compiled;
+}
@@ -0,0 +1,158 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "completion_queue.h"
+
+#define DEFAULT_COMPLETION_QUEUE_CAPACITY 65536
+
+/**
+ *******************************************************************************************************
+ * Switches the async commands of the client to completion queue mode.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns None.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Enable_Completion_Queue(AerospikeClient *self,
+												  PyObject *args,
+												  PyObject *kwds)
+{
+	// Python Function Arguments
+	long capacity = DEFAULT_COMPLETION_QUEUE_CAPACITY;
+	PyObject *py_notify = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"capacity", "notify", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds,
+									"|lO:enable_completion_queue", kwlist,
+									&capacity, &py_notify) == false) {
+		return NULL;
+	}
+
+	if (!self) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (capacity < 1 || capacity > UINT32_MAX) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"capacity must be a positive integer");
+		goto CLEANUP;
+	}
+
+	if (py_notify && py_notify != Py_None && !PyCallable_Check(py_notify)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "notify must be callable");
+		goto CLEANUP;
+	}
+
+	// Listeners read the queue pointer without a lock, so it is only ever
+	// set once for the lifetime of the client.
+	if (self->completion_queue) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"Completion queue is already enabled");
+		goto CLEANUP;
+	}
+
+	self->completion_queue =
+		completion_queue_create((uint32_t)capacity, py_notify);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+/**
+ *******************************************************************************************************
+ * Invokes the callbacks of the async commands queued since the last poll.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns the number of callbacks invoked.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Poll_Completions(AerospikeClient *self,
+										   PyObject *args, PyObject *kwds)
+{
+	// Python Function Arguments
+	long max = 0;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"max", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|l:poll_completions", kwlist,
+									&max) == false) {
+		return NULL;
+	}
+
+	if (max < 0) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "max must not be negative");
+		goto CLEANUP;
+	}
+
+	if (!self->completion_queue) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"Completion queue is not enabled");
+		goto CLEANUP;
+	}
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		PyObject *py_err = NULL;
+		error_to_pyobject(&err, &py_err);
+		PyObject *exception_type = raise_exception(&err);
+		PyErr_SetObject(exception_type, py_err);
+		Py_DECREF(py_err);
+		return NULL;
+	}
+
+	return PyLong_FromUnsignedLong(
+		completion_queue_drain(self->completion_queue, (uint32_t)max));
+}
@@ -0,0 +1,260 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "completion_queue.h"
+
+// Struct for Python User-Data for the Callback
+typedef struct {
+	as_key key;
+	as_error error;
+	PyObject *callback;
+	AerospikeClient *client;
+} LocalData;
+
+static void exists_async_invoke(as_error *cmd_error, as_record *record,
+								void *udata, as_event_loop *event_loop)
+{
+	PyObject *py_key = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_result = NULL;
+	PyObject *py_err = NULL;
+	PyObject *py_exception = NULL;
+	PyObject *py_arglist = NULL;
+	PyObject *py_return = NULL;
+	as_error temp_error;
+
+	LocalData *data = (LocalData *)udata;
+	as_error *error = cmd_error ? cmd_error : &data->error;
+
+	PyGILState_STATE gstate = PyGILState_Ensure();
+
+	key_to_pyobject(&temp_error, &data->key, &py_key);
+
+	// A missing record is not an error for exists(), mirror the sync API.
+	if (error->code == AEROSPIKE_ERR_RECORD_NOT_FOUND) {
+		as_error_reset(error);
+		Py_INCREF(Py_None);
+		py_meta = Py_None;
+	}
+	else if (error->code == AEROSPIKE_OK) {
+		metadata_to_pyobject(&temp_error, record, &py_meta);
+	}
+
+	error_to_pyobject(error, &py_err);
+
+	if (error->code == AEROSPIKE_OK) {
+		py_result = PyTuple_New(2);
+		Py_INCREF(py_key);
+		PyTuple_SetItem(py_result, 0, py_key);
+		PyTuple_SetItem(py_result, 1, py_meta);
+		Py_INCREF(Py_None);
+		py_exception = Py_None;
+	}
+	else {
+		Py_INCREF(Py_None);
+		py_result = Py_None;
+		py_exception =
+			create_pyexception(error, py_key, Py_None, NULL, NULL, NULL);
+	}
+
+	py_arglist = PyTuple_New(4);
+	PyTuple_SetItem(py_arglist, 0, py_key);		  //0-key tuple
+	PyTuple_SetItem(py_arglist, 1, py_result);	  //1-(key, meta) tuple
+	PyTuple_SetItem(py_arglist, 2, py_err);		  //2-error tuple
+	PyTuple_SetItem(py_arglist, 3, py_exception); //3-exception
+
+	py_return = PyObject_Call(data->callback, py_arglist, NULL);
+	Py_DECREF(py_arglist);
+
+	if (!py_return) {
+		// The callback raised, nothing else can be done from the event loop.
+		PyErr_WriteUnraisable(data->callback);
+	}
+	else {
+		Py_DECREF(py_return);
+	}
+
+	if (record) {
+		as_record_destroy(record);
+	}
+
+	as_key_destroy(&data->key);
+	Py_DECREF(data->callback);
+	completion_client_release((PyObject *)data->client);
+	cf_free(data);
+
+	PyGILState_Release(gstate);
+}
+
+static void exists_async_deliver(as_error *err, void *result, void *udata)
+{
+	exists_async_invoke(err, (as_record *)result, udata, NULL);
+}
+
+static void exists_async_callback(as_error *cmd_error, as_record *record,
+								  void *udata, as_event_loop *event_loop)
+{
+	LocalData *data = (LocalData *)udata;
+	completion_queue *queue = data->client->completion_queue;
+
+	if (queue) {
+		as_record *copy = record ? completion_record_copy(record) : NULL;
+		if (completion_queue_push(queue, exists_async_deliver, cmd_error, copy,
+								  udata)) {
+			return;
+		}
+		if (copy) {
+			as_record_destroy(copy);
+		}
+	}
+
+	exists_async_invoke(cmd_error, record, udata, event_loop);
+}
+
+/**
+ *******************************************************************************************************
+ * Checks asynchronously if a record exists in the Aerospike DB.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with (key, (key, meta), error, exception).
+ * In case of error before the command is issued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Exists_Async(AerospikeClient *self, PyObject *args,
+									   PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_policy = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_read read_policy;
+	as_policy_read *read_policy_p = NULL;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	LocalData *uData = NULL;
+
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"exists_callback", "key", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:exists_async", kwlist,
+									&py_callback, &py_key,
+									&py_policy) == false) {
+		return NULL;
+	}
+
+	if (!async_support) {
+		as_error_update(
+			&err, AEROSPIKE_ERR,
+			"Support for async is disabled, build software with async option");
+		goto CLEANUP;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!PyCallable_Check(py_callback)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"exists_callback must be callable");
+		goto CLEANUP;
+	}
+
+	uData = cf_malloc(sizeof(LocalData));
+	uData->callback = py_callback;
+	uData->client = self;
+	as_error_init(&uData->error);
+
+	if (pyobject_to_key(&err, py_key, &uData->key) != AEROSPIKE_OK) {
+		cf_free(uData);
+		uData = NULL;
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_policy_read(self, &err, py_policy, &read_policy,
+								&read_policy_p, &self->as->config.policies.read,
+								&exp_list, &exp_list_p) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	Py_INCREF(py_callback);
+	Py_INCREF(self);
+
+	// Invoke operation
+	Py_BEGIN_ALLOW_THREADS
+	aerospike_key_exists_async(self->as, &err, read_policy_p, &uData->key,
+							   exists_async_callback, uData, NULL, NULL);
+	Py_END_ALLOW_THREADS
+
+	if (err.code != AEROSPIKE_OK) {
+		// The listener is not invoked when the command could not be queued.
+		Py_DECREF(py_callback);
+		Py_DECREF(self);
+	}
+	else {
+		uData = NULL;
+	}
+
+CLEANUP:
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (uData) {
+		as_key_destroy(&uData->key);
+		cf_free(uData);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, py_key, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
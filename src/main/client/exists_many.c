@@ -28,6 +28,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "batch_chunks.h"
 
 typedef struct _exists_many_cb_data {
 	PyObject *py_recs;
@@ -299,23 +300,20 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_keys);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_keys, Py_None, NULL, NULL, NULL);
 		return NULL;
 	}
 
 	return py_recs;
 }
 
+static PyObject *exists_many_chunk(AerospikeClient *self, PyObject *py_keys,
+								   void *udata)
+{
+	return AerospikeClient_Exists_Many_Invoke(self, py_keys,
+											  (PyObject *)udata);
+}
+
 /**
  *******************************************************************************************************
  * Read the meta-data of records from the database in batch.
@@ -337,6 +335,10 @@ PyObject *AerospikeClient_Exists_Many(AerospikeClient *self, PyObject *args,
 	PyObject *py_keys = NULL;
 	PyObject *py_policy = NULL;
 
+	as_error err;
+	as_error_init(&err);
+	uint32_t max_keys = 0;
+
 	// Python Function Keyword Arguments
 	static char *kwlist[] = {"keys", "policy", NULL};
 
@@ -346,6 +348,16 @@ PyObject *AerospikeClient_Exists_Many(AerospikeClient *self, PyObject *args,
 		return NULL;
 	}
 
+	if (get_max_keys_per_batch(&err, py_policy, &max_keys) != AEROSPIKE_OK) {
+		raise_exception_base(&err, py_keys, Py_None, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	if (batch_chunks_needed(py_keys, max_keys)) {
+		return batch_chunks_invoke(self, py_keys, max_keys, exists_many_chunk,
+								   NULL, py_policy);
+	}
+
 	// Invoke Operation
 	return AerospikeClient_Exists_Many_Invoke(self, py_keys, py_policy);
 }
@@ -26,6 +26,8 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "record_cache.h"
+#include "single_flight.h"
 
 /**
  *******************************************************************************************************
@@ -52,6 +54,11 @@ PyObject *AerospikeClient_Get_Invoke(AerospikeClient *self, PyObject *py_key,
 	as_policy_read *read_policy_p = NULL;
 	as_key key;
 	as_record *rec = NULL;
+	const as_exp *filter_exp = NULL;
+	uint64_t cache_seq = 0;
+	bool cached = false;
+	single_flight *flight = NULL;
+	bool flight_leader = false;
 
 	// For converting expressions.
 	as_exp exp_list;
@@ -91,19 +98,45 @@ PyObject *AerospikeClient_Get_Invoke(AerospikeClient *self, PyObject *py_key,
 		goto CLEANUP;
 	}
 
-	// Invoke operation
-	Py_BEGIN_ALLOW_THREADS
-	aerospike_key_get(self->as, &err, read_policy_p, &key, &rec);
-	Py_END_ALLOW_THREADS
-	if (err.code == AEROSPIKE_OK) {
-		record_initialised = true;
+	if (read_policy_p) {
+		filter_exp = read_policy_p->base.filter_exp;
+	}
+
+	cached = record_cache_get(self, &key, NULL, filter_exp, &py_rec);
+	if (!cached) {
+		flight = single_flight_join(self, &key, NULL, py_policy, false,
+									&flight_leader);
+	}
 
-		if (record_to_pyobject(self, &err, rec, &key, &py_rec) !=
-			AEROSPIKE_OK) {
-			goto CLEANUP;
+	if (flight && !flight_leader) {
+		// An identical read is in flight, share its result.
+		single_flight_await(flight, &err, &key, &py_rec);
+	}
+	else if (!cached) {
+		cache_seq = record_cache_seq(self);
+
+		// Invoke operation
+		Py_BEGIN_ALLOW_THREADS
+		aerospike_key_get(self->as, &err, read_policy_p, &key, &rec);
+		Py_END_ALLOW_THREADS
+	}
+	if (err.code == AEROSPIKE_OK) {
+		// rec is NULL when the record was served from the cache or by another
+		// read.
+		if (rec) {
+			record_initialised = true;
+
+			if (record_to_pyobject(self, &err, rec, &key, &py_rec) !=
+				AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+			record_cache_put(self, &key, rec, py_rec, NULL, filter_exp,
+							 cache_seq);
 		}
-		if (!read_policy_p ||
-			(read_policy_p && read_policy_p->key == AS_POLICY_KEY_DIGEST)) {
+
+		if (py_rec != Py_None &&
+			(!read_policy_p ||
+			 (read_policy_p && read_policy_p->key == AS_POLICY_KEY_DIGEST))) {
 			// This is a special case.
 			// C-client returns NULL key, so to the user
 			// response will be (<ns>, <set>, None, <digest>)
@@ -114,12 +147,26 @@ PyObject *AerospikeClient_Get_Invoke(AerospikeClient *self, PyObject *py_key,
 			PyTuple_SetItem(p_key, 2, Py_None);
 		}
 	}
+	else if (err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND &&
+			 self->return_none_on_miss) {
+		// A miss is a normal outcome for this client, skip the exception.
+		as_error_reset(&err);
+		Py_INCREF(Py_None);
+		py_rec = Py_None;
+	}
 	else {
 		as_error_update(&err, err.code, NULL);
 	}
 
 CLEANUP:
 
+	if (flight) {
+		if (flight_leader) {
+			single_flight_finish(self, flight, rec, py_rec, &err);
+		}
+		single_flight_release(flight);
+	}
+
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);
 		;
@@ -136,17 +183,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, Py_None, NULL, NULL, NULL);
 		return NULL;
 	}
 
@@ -26,6 +26,8 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "completion_queue.h"
+#include "single_flight.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
@@ -35,12 +37,68 @@ typedef struct {
 	AerospikeClient *client;
 	as_policy_read read_policy;
 	as_policy_read *read_policy_p;
+	// The flight led by this read, NULL if reads are not coalesced.
+	single_flight *flight;
 } LocalData;
 
 LocalData *async_cb_create(void) { return cf_malloc(sizeof(LocalData)); }
 
 void async_cb_destroy(LocalData *uData) { cf_free(uData); }
 
+/**
+ * Invokes the callbacks of the async reads which joined the flight led by
+ * data, with the result of the flight.
+ */
+static void read_async_notify_followers(LocalData *data,
+										const as_record *record,
+										PyObject *py_rec, as_error *error)
+{
+	single_flight *flight = data->flight;
+	single_flight_finish(data->client, flight, record, py_rec, error);
+
+	PyObject *py_callbacks = single_flight_callbacks(flight);
+	Py_ssize_t size = py_callbacks ? PyList_GET_SIZE(py_callbacks) : 0;
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_entry = PyList_GET_ITEM(py_callbacks, i);
+		PyObject *py_key = PyTuple_GET_ITEM(py_entry, 1);
+		PyObject *py_follower_rec = NULL;
+		PyObject *py_err = NULL;
+		PyObject *py_exception = NULL;
+
+		as_error follower_error;
+		as_error_init(&follower_error);
+		single_flight_result(flight, &follower_error,
+							 PyTuple_GET_ITEM(py_entry, 2), &py_follower_rec);
+		error_to_pyobject(&follower_error, &py_err);
+
+		if (follower_error.code != AEROSPIKE_OK) {
+			py_exception = create_pyexception(&follower_error, py_key, Py_None,
+											  NULL, NULL, NULL);
+		}
+
+		PyObject *py_return = PyObject_CallFunctionObjArgs(
+			PyTuple_GET_ITEM(py_entry, 0), py_key,
+			py_follower_rec ? py_follower_rec : Py_None, py_err,
+			py_exception ? py_exception : Py_None, NULL);
+		if (!py_return) {
+			// As for the leader, an exception raised by a callback is dropped.
+			PyErr_Clear();
+		}
+
+		Py_XDECREF(py_return);
+		Py_XDECREF(py_follower_rec);
+		Py_XDECREF(py_err);
+		Py_XDECREF(py_exception);
+	}
+
+	Py_XDECREF(py_callbacks);
+	PyErr_Clear();
+
+	single_flight_release(flight);
+	data->flight = NULL;
+}
+
 void read_async_callback_helper(as_error *cmd_error, as_record *record,
 								void *udata, as_event_loop *event_loop, int cb)
 {
@@ -94,16 +152,17 @@ void read_async_callback_helper(as_error *cmd_error, as_record *record,
 		}
 	}
 
+	if (data->flight) {
+		read_async_notify_followers(data, record, py_rec, error);
+	}
+
 	if (error->code != AEROSPIKE_OK) {
-		py_exception = raise_exception(error);
-		if (PyObject_HasAttrString(py_exception, "key")) {
-			PyObject_SetAttrString(py_exception, "key", py_key);
-		}
-		if (PyObject_HasAttrString(py_exception, "bin")) {
-			PyObject_SetAttrString(py_exception, "bin", Py_None);
+		if (cb) {
+			py_exception =
+				create_pyexception(error, py_key, Py_None, NULL, NULL, NULL);
 		}
-		if (!cb) {
-			PyErr_SetObject(py_exception, py_err);
+		else {
+			raise_exception_base(error, py_key, Py_None, NULL, NULL, NULL);
 			Py_DECREF(py_err);
 		}
 	}
@@ -153,6 +212,9 @@ void read_async_callback_helper(as_error *cmd_error, as_record *record,
 
 	if (udata) {
 		as_key_destroy(&data->key);
+		// Release the references taken when the command was issued.
+		Py_XDECREF(data->callback);
+		completion_client_release((PyObject *)data->client);
 		//todo: dont free cb data in case of retry logic
 		async_cb_destroy(udata);
 	}
@@ -164,12 +226,67 @@ void read_async_callback_helper(as_error *cmd_error, as_record *record,
 	return;
 }
 
+static void read_async_deliver(as_error *error, void *result, void *udata)
+{
+	read_async_callback_helper(error, (as_record *)result, udata, NULL, 1);
+}
+
 void read_async_callback(as_error *error, as_record *record, void *udata,
 						 as_event_loop *event_loop)
 {
+	LocalData *data = (LocalData *)udata;
+	completion_queue *queue = data->client->completion_queue;
+
+	// In completion queue mode the result is handed over without taking the
+	// GIL, poll_completions() invokes the callback later.
+	if (queue) {
+		as_record *copy = record ? completion_record_copy(record) : NULL;
+		if (completion_queue_push(queue, read_async_deliver, error, copy,
+								  udata)) {
+			return;
+		}
+		if (copy) {
+			as_record_destroy(copy);
+		}
+	}
+
 	read_async_callback_helper(error, record, udata, event_loop, 1);
 }
 
+/**
+ * Queues the callback of data on the flight it joined, and releases the
+ * flight.
+ */
+static as_status read_async_follow(LocalData *data)
+{
+	PyObject *py_key = NULL;
+	PyObject *py_rec_key = NULL;
+
+	// The record key of a get has no user key with the default key policy.
+	if (key_to_pyobject(&data->error, &data->key, &py_key) == AEROSPIKE_OK &&
+		key_to_pyobject(&data->error, &data->key, &py_rec_key) ==
+			AEROSPIKE_OK) {
+		if (!data->read_policy_p ||
+			data->read_policy_p->key == AS_POLICY_KEY_DIGEST) {
+			Py_INCREF(Py_None);
+			PyTuple_SetItem(py_rec_key, 2, Py_None);
+		}
+
+		if (single_flight_add_callback(data->flight, data->callback, py_key,
+									   py_rec_key) == -1) {
+			PyErr_Clear();
+			as_error_update(&data->error, AEROSPIKE_ERR_CLIENT,
+							"Unable to join the read in flight");
+		}
+	}
+
+	Py_XDECREF(py_key);
+	Py_XDECREF(py_rec_key);
+	single_flight_release(data->flight);
+	data->flight = NULL;
+	return data->error.code;
+}
+
 /**
  *******************************************************************************************************
  * Gets a record from the Aerospike DB.
@@ -218,8 +335,14 @@ PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
 	// Create and initialize callback user-data
 	LocalData *uData = async_cb_create();
 	uData->callback = py_callback;
+	// Callbacks are often per-command closures, keep them alive until the
+	// command completes on the event loop.
+	Py_INCREF(py_callback);
 	uData->client = self;
+	// The completion queue of the client is used until the callback runs.
+	Py_INCREF(self);
 	uData->read_policy_p = NULL;
+	uData->flight = NULL;
 	memset(&uData->key, 0, sizeof(uData->key));
 	as_error_init(&uData->error);
 
@@ -228,6 +351,7 @@ PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
 	as_exp *exp_list_p = NULL;
 
 	as_status status = AEROSPIKE_OK;
+	bool flight_leader = false;
 
 	if (!self || !self->as) {
 		as_error_update(&uData->error, AEROSPIKE_ERR_PARAM,
@@ -256,6 +380,26 @@ PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
 		goto CLEANUP;
 	}
 
+	uData->flight = single_flight_join(self, &uData->key, NULL, py_policy, true,
+									   &flight_leader);
+	if (uData->flight && !flight_leader) {
+		// An identical read is in flight, its callback invokes this one too.
+		if (read_async_follow(uData) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+
+		if (exp_list_p) {
+			as_exp_destroy(exp_list_p);
+		}
+		as_key_destroy(&uData->key);
+		Py_DECREF(uData->callback);
+		Py_DECREF(uData->client);
+		async_cb_destroy(uData);
+
+		Py_INCREF(Py_None);
+		return Py_None;
+	}
+
 	// Invoke operation
 	Py_BEGIN_ALLOW_THREADS
 	status = aerospike_key_get_async(uData->client->as, &uData->error,
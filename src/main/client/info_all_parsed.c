@@ -0,0 +1,395 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/aerospike_info.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_node.h>
+#include <aerospike/as_string_builder.h>
+#include <citrusleaf/alloc.h>
+
+#include "client.h"
+#include "policy.h"
+#include "conversions.h"
+#include "exceptions.h"
+
+typedef enum {
+	INFO_FORMAT_RAW,
+	// name=value;name=value
+	INFO_FORMAT_STATS,
+	// name=value:name=value;name=value:name=value
+	INFO_FORMAT_RECORDS
+} info_format;
+
+typedef struct info_parsed_udata_t {
+	PyObject *py_nodes;
+	as_error error;
+} info_parsed_udata;
+
+static bool has_prefix(const char *command, const char *prefix)
+{
+	return strncmp(command, prefix, strlen(prefix)) == 0;
+}
+
+/**
+ * Picks the parser for an info command, from the command name.
+ */
+static info_format get_info_format(const char *command)
+{
+	if (!strcmp(command, "statistics") || has_prefix(command, "namespace/") ||
+		has_prefix(command, "get-config")) {
+		return INFO_FORMAT_STATS;
+	}
+
+	if (!strcmp(command, "sets") || has_prefix(command, "sets/") ||
+		has_prefix(command, "sindex-list")) {
+		return INFO_FORMAT_RECORDS;
+	}
+
+	if (!strcmp(command, "sindex") || has_prefix(command, "sindex/")) {
+		// sindex/<ns>/<index> returns the statistics of a single index.
+		const char *ns = strchr(command, '/');
+		if (ns && strchr(ns + 1, '/')) {
+			return INFO_FORMAT_STATS;
+		}
+		return INFO_FORMAT_RECORDS;
+	}
+
+	return INFO_FORMAT_RAW;
+}
+
+/**
+ * Converts an info value to an int or a float when all of it is a number,
+ * otherwise to a str. Returns a new reference, or NULL with a Python error set.
+ */
+static PyObject *info_value_to_pyobject(const char *value)
+{
+	const char *digits = value[0] == '-' ? value + 1 : value;
+	size_t digits_len = strlen(digits);
+
+	if (digits_len && strspn(digits, "0123456789") == digits_len) {
+		return PyLong_FromString(value, NULL, 10);
+	}
+
+	if (digits_len && digits[0] >= '0' && digits[0] <= '9' &&
+		strspn(digits, "0123456789.eE+-") == digits_len) {
+		char *end = NULL;
+		double d = strtod(value, &end);
+		if (*end == '\0') {
+			return PyFloat_FromDouble(d);
+		}
+	}
+
+	return PyUnicode_FromString(value);
+}
+
+/**
+ * Parses name=value pairs split by separator into py_dict.
+ * Pairs without a '=' are skipped. Modifies str.
+ */
+static int info_pairs_to_pydict(char *str, char separator, PyObject *py_dict)
+{
+	char *pair = str;
+
+	while (pair) {
+		char *next = strchr(pair, separator);
+		if (next) {
+			*next++ = '\0';
+		}
+
+		char *value = strchr(pair, '=');
+		if (value && value != pair) {
+			*value++ = '\0';
+
+			PyObject *py_value = info_value_to_pyobject(value);
+			if (!py_value) {
+				return -1;
+			}
+
+			int rc = PyDict_SetItemString(py_dict, pair, py_value);
+			Py_DECREF(py_value);
+			if (rc == -1) {
+				return -1;
+			}
+		}
+
+		pair = next;
+	}
+
+	return 0;
+}
+
+/**
+ * Parses the body of an info response in the given format.
+ * Returns a new reference, or NULL with a Python error set. Modifies body.
+ */
+static PyObject *info_body_to_pyobject(char *body, info_format format)
+{
+	// Error responses are kept as is, for every format.
+	if (format == INFO_FORMAT_RAW || has_prefix(body, "ERROR")) {
+		return PyUnicode_FromString(body);
+	}
+
+	if (format == INFO_FORMAT_STATS) {
+		PyObject *py_stats = PyDict_New();
+		if (py_stats && info_pairs_to_pydict(body, ';', py_stats) == -1) {
+			Py_CLEAR(py_stats);
+		}
+		return py_stats;
+	}
+
+	PyObject *py_records = PyList_New(0);
+	char *record = body;
+
+	while (py_records && record) {
+		char *next = strchr(record, ';');
+		if (next) {
+			*next++ = '\0';
+		}
+
+		if (*record) {
+			PyObject *py_record = PyDict_New();
+			if (!py_record ||
+				info_pairs_to_pydict(record, ':', py_record) == -1 ||
+				PyList_Append(py_records, py_record) == -1) {
+				Py_XDECREF(py_record);
+				Py_CLEAR(py_records);
+				break;
+			}
+			Py_DECREF(py_record);
+		}
+
+		record = next;
+	}
+
+	return py_records;
+}
+
+/**
+ * Parses a multi command info response, one command\tbody line per command,
+ * into a dict of command to parsed body.
+ * Returns a new reference, or NULL with a Python error set.
+ */
+static PyObject *info_response_to_pydict(const char *response)
+{
+	PyObject *py_response = PyDict_New();
+	if (!py_response || !response) {
+		return py_response;
+	}
+
+	char *buffer = cf_strdup(response);
+	char *line = buffer;
+
+	while (line) {
+		char *next = strchr(line, '\n');
+		if (next) {
+			*next++ = '\0';
+		}
+
+		char *body = strchr(line, '\t');
+		if (body) {
+			*body++ = '\0';
+
+			PyObject *py_body =
+				info_body_to_pyobject(body, get_info_format(line));
+			if (!py_body ||
+				PyDict_SetItemString(py_response, line, py_body) == -1) {
+				Py_XDECREF(py_body);
+				Py_CLEAR(py_response);
+				break;
+			}
+			Py_DECREF(py_body);
+		}
+
+		line = next;
+	}
+
+	cf_free(buffer);
+	return py_response;
+}
+
+/**
+ *******************************************************************************************************
+ * Callback for aerospike_info_foreach(). Used by info_all_parsed.
+ *
+ * @param err                   The as_error to be populated by the function
+ *                              with the encountered error if any.
+ * @param node                  The current as_node object for which the
+ *                              callback is fired by c client.
+ * @param req                   The info request string.
+ * @param res                   The info response string for current node.
+ * @param udata                 The info_parsed_udata holding the dict of
+ *                              parsed responses, keyed by node name.
+ *
+ * Returns true if callback is successful, Otherwise false.
+ *******************************************************************************************************
+ */
+static bool AerospikeClient_InfoAllParsed_each(as_error *err,
+											   const as_node *node,
+											   const char *req, char *res,
+											   void *udata)
+{
+	info_parsed_udata *udata_ptr = (info_parsed_udata *)udata;
+	bool ok = true;
+
+	if (err && err->code != AEROSPIKE_OK) {
+		return false;
+	}
+
+	// Need to make sure we have the GIL since we're back in python land now
+	PyGILState_STATE gil_state = PyGILState_Ensure();
+
+	/* Since this is called from aerospike_info_foreach, we do not own res, so there is no need to free it */
+	PyObject *py_response = info_response_to_pydict(res);
+	if (!py_response || PyDict_SetItemString(udata_ptr->py_nodes, node->name,
+											 py_response) == -1) {
+		PyErr_Clear();
+		as_error_update(&udata_ptr->error, AEROSPIKE_ERR_CLIENT,
+						"Unable to parse info response from node %s",
+						node->name);
+		ok = false;
+	}
+	Py_XDECREF(py_response);
+
+	PyGILState_Release(gil_state);
+	return ok;
+}
+
+/**
+ * Joins the info commands into a single request, one command per line.
+ */
+static as_status info_commands_to_request(as_error *err, PyObject *py_commands,
+										  as_string_builder *request)
+{
+	if ((!PyList_Check(py_commands) && !PyTuple_Check(py_commands)) ||
+		!PySequence_Fast_GET_SIZE(py_commands)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "Commands must be a non empty list of strings");
+	}
+
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(py_commands);
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_command = PySequence_Fast_GET_ITEM(py_commands, i);
+		const char *command = NULL;
+
+		if (PyUnicode_Check(py_command)) {
+			command = PyUnicode_AsUTF8(py_command);
+		}
+
+		if (!command || !*command || strpbrk(command, "\t\n")) {
+			PyErr_Clear();
+			return as_error_update(
+				err, AEROSPIKE_ERR_PARAM,
+				"Command at index %zd must be a non empty single line string",
+				i);
+		}
+
+		as_string_builder_append(request, command);
+		as_string_builder_append_char(request, '\n');
+	}
+
+	return err->code;
+}
+
+/**
+ *******************************************************************************************************
+ * Sends several info commands to all the nodes in a cluster, in one request
+ * per node, and parses the responses.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a dict of node name to a dict of command to parsed response.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_InfoAllParsed(AerospikeClient *self, PyObject *args,
+										PyObject *kwds)
+{
+	PyObject *py_commands = NULL;
+	PyObject *py_policy = NULL;
+
+	info_parsed_udata udata;
+	udata.py_nodes = NULL;
+	as_error_init(&udata.error);
+
+	as_policy_info info_policy;
+	as_policy_info *info_policy_p = NULL;
+
+	as_string_builder request;
+	as_string_builder_inita(&request, 1024, true);
+
+	as_error err;
+	as_error_init(&err);
+
+	static char *kwlist[] = {"commands", "policy", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:info_all_parsed", kwlist,
+									&py_commands, &py_policy) == false) {
+		return NULL;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	// Convert python policy object to as_policy_info
+	if (pyobject_to_policy_info(&err, py_policy, &info_policy, &info_policy_p,
+								&self->as->config.policies.info) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (info_commands_to_request(&err, py_commands, &request) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	udata.py_nodes = PyDict_New();
+
+	Py_BEGIN_ALLOW_THREADS
+	aerospike_info_foreach(
+		self->as, &err, info_policy_p, request.data,
+		(aerospike_info_foreach_callback)AerospikeClient_InfoAllParsed_each,
+		&udata);
+	Py_END_ALLOW_THREADS
+
+	if (udata.error.code != AEROSPIKE_OK) {
+		as_error_copy(&err, &udata.error);
+	}
+
+CLEANUP:
+	as_string_builder_destroy(&request);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(udata.py_nodes);
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return udata.py_nodes;
+}
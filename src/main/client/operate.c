@@ -36,6 +36,7 @@
 #include "bit_operations.h"
 #include "hll_operations.h"
 #include "expression_operations.h"
+#include "record_cache.h"
 
 #include <aerospike/as_double.h>
 #include <aerospike/as_integer.h>
@@ -76,17 +77,7 @@ static inline bool isExprOp(int op);
 
 #define EXCEPTION_ON_ERROR()                                                   \
 	if (err.code != AEROSPIKE_OK) {                                            \
-		PyObject *py_err = NULL;                                               \
-		error_to_pyobject(&err, &py_err);                                      \
-		PyObject *exception_type = raise_exception(&err);                      \
-		if (PyObject_HasAttrString(exception_type, "key")) {                   \
-			PyObject_SetAttrString(exception_type, "key", py_key);             \
-		}                                                                      \
-		if (PyObject_HasAttrString(exception_type, "bin")) {                   \
-			PyObject_SetAttrString(exception_type, "bin", py_bin);             \
-		}                                                                      \
-		PyErr_SetObject(exception_type, py_err);                               \
-		Py_DECREF(py_err);                                                     \
+		raise_exception_base(&err, py_key, py_bin, NULL, NULL, NULL);          \
 		return NULL;                                                           \
 	}
 
@@ -817,6 +808,37 @@ as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
 	return err->code;
 }
 
+/**
+ * Returns a new tuple of the bins read by ops, or NULL if ops may write to the
+ * record or read anything but whole bins.
+ */
+static PyObject *operate_read_bin_names(as_operations *ops, PyObject *py_meta)
+{
+	if (py_meta || !ops->binops.size) {
+		return NULL;
+	}
+
+	for (uint16_t i = 0; i < ops->binops.size; i++) {
+		if (ops->binops.entries[i].op != AS_OPERATOR_READ) {
+			return NULL;
+		}
+	}
+
+	PyObject *py_bin_names = PyTuple_New(ops->binops.size);
+	for (uint16_t i = 0; py_bin_names && i < ops->binops.size; i++) {
+		PyObject *py_name =
+			PyUnicode_FromString(ops->binops.entries[i].bin.name);
+		if (!py_name) {
+			Py_CLEAR(py_bin_names);
+			PyErr_Clear();
+			break;
+		}
+		PyTuple_SET_ITEM(py_bin_names, i, py_name);
+	}
+
+	return py_bin_names;
+}
+
 /**
  *******************************************************************************************************
  * This function invokes csdk's API's.
@@ -828,22 +850,27 @@ as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
  * @param py_list               The list containing op, bin and value.
  * @param py_meta               The metadata for the operation.
  * @param py_policy      		Python dict used to populate the operate_policy or map_policy.
+ * @param none_on_miss          Return None instead of raising RecordNotFound,
+ *                              set from return_none_on_miss by operate().
  *******************************************************************************************************
  */
-static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
-												as_error *err, as_key *key,
-												PyObject *py_list,
-												PyObject *py_meta,
-												PyObject *py_policy)
+static PyObject *
+AerospikeClient_Operate_Invoke(AerospikeClient *self, as_error *err,
+							   as_key *key, PyObject *py_list,
+							   PyObject *py_meta, PyObject *py_policy,
+							   bool none_on_miss)
 {
 	int i = 0;
 	long operation;
 	long return_type = -1;
 	bool operation_succeeded = false;
 	PyObject *py_rec = NULL;
+	PyObject *py_read_bins = NULL;
 	as_record *rec = NULL;
 	as_policy_operate operate_policy;
 	as_policy_operate *operate_policy_p = NULL;
+	const as_exp *filter_exp = NULL;
+	uint64_t cache_seq = 0;
 
 	// For expressions conversion.
 	as_exp exp_list;
@@ -851,6 +878,9 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
 
 	as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
 	as_operations ops;
 	Py_ssize_t size = PyList_Size(py_list);
 	as_operations_inita(&ops, size);
@@ -864,8 +894,6 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
 		}
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
 	CHECK_CONNECTED(err);
 
 	if (py_meta) {
@@ -889,10 +917,28 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
 		goto CLEANUP;
 	}
 
+	if (operate_policy_p) {
+		filter_exp = operate_policy_p->base.filter_exp;
+	}
+	cache_seq = record_cache_seq(self);
+
 	Py_BEGIN_ALLOW_THREADS
 	aerospike_key_operate(self->as, err, operate_policy_p, key, &ops, &rec);
 	Py_END_ALLOW_THREADS
 
+	py_read_bins = operate_read_bin_names(&ops, py_meta);
+	if (!py_read_bins) {
+		// The operations may have written to the record, even on an error.
+		record_cache_invalidate(self, key);
+	}
+
+	if (err->code == AEROSPIKE_ERR_RECORD_NOT_FOUND && none_on_miss) {
+		// A miss is a normal outcome for this client, skip the exception.
+		as_error_reset(err);
+		Py_INCREF(Py_None);
+		py_rec = Py_None;
+		goto CLEANUP;
+	}
 	if (err->code != AEROSPIKE_OK) {
 		as_error_update(err, err->code, NULL);
 		goto CLEANUP;
@@ -901,7 +947,12 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
 	operation_succeeded = true;
 
 	if (rec) {
-		record_to_pyobject(self, err, rec, key, &py_rec);
+		if (record_to_pyobject(self, err, rec, key, &py_rec) ==
+				AEROSPIKE_OK &&
+			py_read_bins) {
+			record_cache_put(self, key, rec, py_rec, py_read_bins, filter_exp,
+							 cache_seq);
+		}
 	}
 
 CLEANUP:
@@ -914,6 +965,7 @@ CLEANUP:
 	}
 
 	as_vector_destroy(unicodeStrVector);
+	Py_XDECREF(py_read_bins);
 
 	if (rec && operation_succeeded) {
 		as_record_destroy(rec);
@@ -923,6 +975,7 @@ CLEANUP:
 	}
 
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 
 	if (err->code != AEROSPIKE_OK) {
 		PyObject *py_err = NULL;
@@ -977,7 +1030,8 @@ PyObject *AerospikeClient_Operate(AerospikeClient *self, PyObject *args,
 
 	if (py_list && PyList_Check(py_list)) {
 		py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-												   py_meta, py_policy);
+												   py_meta, py_policy,
+												   self->return_none_on_miss);
 	}
 	else {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM,
@@ -1079,6 +1133,17 @@ AerospikeClient_OperateOrdered_Invoke(AerospikeClient *self, as_error *err,
 	aerospike_key_operate(self->as, err, operate_policy_p, key, &ops, &rec);
 	Py_END_ALLOW_THREADS
 
+	// The operations may have written to the record, even on an error.
+	record_cache_invalidate(self, key);
+
+	if (err->code == AEROSPIKE_ERR_RECORD_NOT_FOUND &&
+		self->return_none_on_miss) {
+		// A miss is a normal outcome for this client, skip the exception.
+		as_error_reset(err);
+		Py_INCREF(Py_None);
+		py_rec = Py_None;
+		goto CLEANUP;
+	}
 	if (err->code != AEROSPIKE_OK) {
 		as_error_update(err, err->code, NULL);
 		goto CLEANUP;
@@ -1141,6 +1206,7 @@ CLEANUP:
 	}
 
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 
 	if (err->code != AEROSPIKE_OK) {
 		PyObject *py_err = NULL;
@@ -1217,14 +1283,7 @@ PyObject *AerospikeClient_OperateOrdered(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, NULL, NULL, NULL, NULL);
 		return NULL;
 	}
 	return py_result;
@@ -1267,7 +1326,7 @@ PyObject *AerospikeClient_Append(AerospikeClient *self, PyObject *args,
 	PyObject *py_list = NULL;
 	py_list = create_pylist(py_list, AS_OPERATOR_APPEND, py_bin, py_append_str);
 	py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-											   py_meta, py_policy);
+											   py_meta, py_policy, false);
 
 	DECREF_LIST_AND_RESULT();
 
@@ -1315,7 +1374,7 @@ PyObject *AerospikeClient_Prepend(AerospikeClient *self, PyObject *args,
 	py_list =
 		create_pylist(py_list, AS_OPERATOR_PREPEND, py_bin, py_prepend_str);
 	py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-											   py_meta, py_policy);
+											   py_meta, py_policy, false);
 
 	DECREF_LIST_AND_RESULT();
 
@@ -1362,7 +1421,7 @@ PyObject *AerospikeClient_Increment(AerospikeClient *self, PyObject *args,
 	PyObject *py_list = NULL;
 	py_list = create_pylist(py_list, AS_OPERATOR_INCR, py_bin, py_offset_value);
 	py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-											   py_meta, py_policy);
+											   py_meta, py_policy, false);
 
 	DECREF_LIST_AND_RESULT();
 
@@ -1409,7 +1468,7 @@ PyObject *AerospikeClient_Touch(AerospikeClient *self, PyObject *args,
 	PyObject *py_list = NULL;
 	py_list = create_pylist(py_list, AS_OPERATOR_TOUCH, NULL, py_touchvalue);
 	py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-											   py_meta, py_policy);
+											   py_meta, py_policy, false);
 
 	DECREF_LIST_AND_RESULT();
 
@@ -0,0 +1,318 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "completion_queue.h"
+
+#include "operate.h"
+#include "serializer.h"
+#include "record_cache.h"
+
+// Struct for Python User-Data for the Callback
+typedef struct {
+	as_key key;
+	as_error error;
+	PyObject *callback;
+	AerospikeClient *client;
+} LocalData;
+
+static void operate_async_invoke(as_error *cmd_error, as_record *record,
+								 void *udata, as_event_loop *event_loop)
+{
+	PyObject *py_key = NULL;
+	PyObject *py_rec = NULL;
+	PyObject *py_err = NULL;
+	PyObject *py_exception = NULL;
+	PyObject *py_arglist = NULL;
+	PyObject *py_return = NULL;
+	as_error temp_error;
+
+	LocalData *data = (LocalData *)udata;
+	as_error *error = cmd_error ? cmd_error : &data->error;
+
+	PyGILState_STATE gstate = PyGILState_Ensure();
+
+	key_to_pyobject(&temp_error, &data->key, &py_key);
+
+	if (error->code == AEROSPIKE_OK && record) {
+		if (record_to_pyobject(data->client, &temp_error, record, &data->key,
+							   &py_rec) != AEROSPIKE_OK) {
+			as_error_copy(&data->error, &temp_error);
+			error = &data->error;
+		}
+	}
+
+	error_to_pyobject(error, &py_err);
+
+	if (error->code != AEROSPIKE_OK) {
+		py_exception =
+			create_pyexception(error, py_key, Py_None, NULL, NULL, NULL);
+	}
+	else {
+		Py_INCREF(Py_None);
+		py_exception = Py_None;
+	}
+
+	if (!py_rec) {
+		Py_INCREF(Py_None);
+		py_rec = Py_None;
+	}
+
+	py_arglist = PyTuple_New(4);
+	PyTuple_SetItem(py_arglist, 0, py_key);		  //0-key tuple
+	PyTuple_SetItem(py_arglist, 1, py_rec);		  //1-record tuple
+	PyTuple_SetItem(py_arglist, 2, py_err);		  //2-error tuple
+	PyTuple_SetItem(py_arglist, 3, py_exception); //3-exception
+
+	py_return = PyObject_Call(data->callback, py_arglist, NULL);
+	Py_DECREF(py_arglist);
+
+	if (!py_return) {
+		// The callback raised, nothing else can be done from the event loop.
+		PyErr_WriteUnraisable(data->callback);
+	}
+	else {
+		Py_DECREF(py_return);
+	}
+
+	if (record) {
+		as_record_destroy(record);
+	}
+
+	as_key_destroy(&data->key);
+	Py_DECREF(data->callback);
+	completion_client_release((PyObject *)data->client);
+	cf_free(data);
+
+	PyGILState_Release(gstate);
+}
+
+static void operate_async_deliver(as_error *err, void *result, void *udata)
+{
+	operate_async_invoke(err, (as_record *)result, udata, NULL);
+}
+
+static void operate_async_callback(as_error *cmd_error, as_record *record,
+								   void *udata, as_event_loop *event_loop)
+{
+	LocalData *data = (LocalData *)udata;
+	completion_queue *queue = data->client->completion_queue;
+
+	if (queue) {
+		as_record *copy = record ? completion_record_copy(record) : NULL;
+		if (completion_queue_push(queue, operate_async_deliver, cmd_error,
+								  copy, udata)) {
+			return;
+		}
+		if (copy) {
+			as_record_destroy(copy);
+		}
+	}
+
+	operate_async_invoke(cmd_error, record, udata, event_loop);
+}
+
+/**
+ *******************************************************************************************************
+ * Performs asynchronously multiple operations on a single record.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with (key, record, error, exception).
+ * In case of error before the command is issued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Operate_Async(AerospikeClient *self, PyObject *args,
+										PyObject *kwds)
+{
+	// Python Function Arguments
+	PyObject *py_callback = NULL;
+	PyObject *py_key = NULL;
+	PyObject *py_list = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_policy = NULL;
+
+	// Aerospike Client Arguments
+	as_error err;
+	as_policy_operate operate_policy;
+	as_policy_operate *operate_policy_p = NULL;
+	as_operations ops;
+	bool ops_initialised = false;
+	long operation;
+	long return_type = -1;
+
+	// For converting expressions.
+	as_exp exp_list;
+	as_exp *exp_list_p = NULL;
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
+
+	LocalData *uData = NULL;
+
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"operate_callback", "key", "list", "meta",
+							 "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:operate_async", kwlist,
+									&py_callback, &py_key, &py_list, &py_meta,
+									&py_policy) == false) {
+		as_vector_destroy(unicodeStrVector);
+		return NULL;
+	}
+
+	if (!async_support) {
+		as_error_update(
+			&err, AEROSPIKE_ERR,
+			"Support for async is disabled, build software with async option");
+		goto CLEANUP;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!PyCallable_Check(py_callback)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"operate_callback must be callable");
+		goto CLEANUP;
+	}
+
+	if (!py_list || !PyList_Check(py_list)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"Operations should be of type list");
+		goto CLEANUP;
+	}
+
+	Py_ssize_t size = PyList_Size(py_list);
+	as_operations_inita(&ops, size);
+	ops_initialised = true;
+
+	if (py_policy) {
+		if (pyobject_to_policy_operate(
+				self, &err, py_policy, &operate_policy, &operate_policy_p,
+				&self->as->config.policies.operate, &exp_list,
+				&exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (py_meta) {
+		if (check_for_meta(py_meta, &ops, &err) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_val = PyList_GetItem(py_list, i);
+
+		if (PyDict_Check(py_val)) {
+			if (add_op(self, &err, py_val, unicodeStrVector, &static_pool, &ops,
+					   &operation, &return_type) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+		}
+	}
+
+	uData = cf_malloc(sizeof(LocalData));
+	uData->callback = py_callback;
+	uData->client = self;
+	as_error_init(&uData->error);
+
+	if (pyobject_to_key(&err, py_key, &uData->key) != AEROSPIKE_OK) {
+		cf_free(uData);
+		uData = NULL;
+		goto CLEANUP;
+	}
+
+	Py_INCREF(py_callback);
+	Py_INCREF(self);
+
+	record_cache_invalidate(self, &uData->key);
+
+	// Invoke operation. The command is serialized before this returns, so
+	// the operations and their values can be released afterwards.
+	Py_BEGIN_ALLOW_THREADS
+	aerospike_key_operate_async(self->as, &err, operate_policy_p, &uData->key,
+								&ops, operate_async_callback, uData, NULL,
+								NULL);
+	Py_END_ALLOW_THREADS
+
+	if (err.code != AEROSPIKE_OK) {
+		// The listener is not invoked when the command could not be queued.
+		Py_DECREF(py_callback);
+		Py_DECREF(self);
+	}
+	else {
+		uData = NULL;
+	}
+
+CLEANUP:
+
+	for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+		free(as_vector_get_ptr(unicodeStrVector, i));
+	}
+	as_vector_destroy(unicodeStrVector);
+
+	if (ops_initialised) {
+		as_operations_destroy(&ops);
+	}
+
+	POOL_RELEASE(&static_pool);
+
+	if (exp_list_p) {
+		as_exp_destroy(exp_list_p);
+	}
+
+	if (uData) {
+		as_key_destroy(&uData->key);
+		cf_free(uData);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, py_key, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
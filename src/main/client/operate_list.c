@@ -30,6 +30,7 @@
 #include "policy.h"
 #include "serializer.h"
 #include "geo.h"
+#include "record_cache.h"
 
 #include <aerospike/as_double.h>
 #include <aerospike/as_integer.h>
@@ -94,24 +95,15 @@
 	Py_BEGIN_ALLOW_THREADS                                                     \
 	aerospike_key_operate(self->as, &err, operate_policy_p, &key, &ops,        \
 						  __rec);                                              \
-	Py_END_ALLOW_THREADS
+	Py_END_ALLOW_THREADS                                                       \
+	record_cache_invalidate(self, &key);
 
 #define EXCEPTION_ON_ERROR()                                                   \
 	if (key_created) {                                                         \
 		as_key_destroy(&key);                                                  \
 	}                                                                          \
 	if (err.code != AEROSPIKE_OK) {                                            \
-		PyObject *py_err = NULL;                                               \
-		error_to_pyobject(&err, &py_err);                                      \
-		PyObject *exception_type = raise_exception(&err);                      \
-		if (PyObject_HasAttrString(exception_type, "key")) {                   \
-			PyObject_SetAttrString(exception_type, "key", py_key);             \
-		}                                                                      \
-		if (PyObject_HasAttrString(exception_type, "bin")) {                   \
-			PyObject_SetAttrString(exception_type, "bin", py_bin);             \
-		}                                                                      \
-		PyErr_SetObject(exception_type, py_err);                               \
-		Py_DECREF(py_err);                                                     \
+		raise_exception_base(&err, py_key, py_bin, NULL, NULL, NULL);          \
 		return NULL;                                                           \
 	}
 
@@ -167,11 +159,11 @@ PyObject *AerospikeClient_ListAppend(AerospikeClient *self, PyObject *args,
 		return NULL;
 	}
 
-	CHECK_CONNECTED_AND_CDT_SUPPORT();
-
 	as_static_pool static_pool;
 	memset(&static_pool, 0, sizeof(static_pool));
 
+	CHECK_CONNECTED_AND_CDT_SUPPORT();
+
 	POLICY_KEY_META_BIN();
 
 	as_val *put_val = NULL;
@@ -185,6 +177,7 @@ PyObject *AerospikeClient_ListAppend(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 	EXCEPTION_ON_ERROR();
 
 	return PyLong_FromLong(0);
@@ -220,11 +213,11 @@ PyObject *AerospikeClient_ListExtend(AerospikeClient *self, PyObject *args,
 		return NULL;
 	}
 
-	CHECK_CONNECTED_AND_CDT_SUPPORT();
-
 	as_static_pool static_pool;
 	memset(&static_pool, 0, sizeof(static_pool));
 
+	CHECK_CONNECTED_AND_CDT_SUPPORT();
+
 	if (!PyList_Check(py_append_val)) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM,
 						"Items should be of type list");
@@ -245,6 +238,7 @@ PyObject *AerospikeClient_ListExtend(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 	EXCEPTION_ON_ERROR();
 
 	return PyLong_FromLong(0);
@@ -281,11 +275,11 @@ PyObject *AerospikeClient_ListInsert(AerospikeClient *self, PyObject *args,
 		return NULL;
 	}
 
-	CHECK_CONNECTED_AND_CDT_SUPPORT();
-
 	as_static_pool static_pool;
 	memset(&static_pool, 0, sizeof(static_pool));
 
+	CHECK_CONNECTED_AND_CDT_SUPPORT();
+
 	POLICY_KEY_META_BIN();
 
 	as_val *put_val = NULL;
@@ -301,6 +295,7 @@ PyObject *AerospikeClient_ListInsert(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 	EXCEPTION_ON_ERROR();
 
 	return PyLong_FromLong(0);
@@ -337,11 +332,11 @@ PyObject *AerospikeClient_ListInsertItems(AerospikeClient *self, PyObject *args,
 		return NULL;
 	}
 
-	CHECK_CONNECTED_AND_CDT_SUPPORT();
-
 	as_static_pool static_pool;
 	memset(&static_pool, 0, sizeof(static_pool));
 
+	CHECK_CONNECTED_AND_CDT_SUPPORT();
+
 	if (!PyList_Check(py_insert_val)) {
 		as_error_update(&err, AEROSPIKE_ERR_PARAM,
 						"Items should be of type list");
@@ -363,6 +358,7 @@ PyObject *AerospikeClient_ListInsertItems(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 	EXCEPTION_ON_ERROR();
 
 	return PyLong_FromLong(0);
@@ -721,11 +717,11 @@ PyObject *AerospikeClient_ListSet(AerospikeClient *self, PyObject *args,
 		return NULL;
 	}
 
-	CHECK_CONNECTED_AND_CDT_SUPPORT();
-
 	as_static_pool static_pool;
 	memset(&static_pool, 0, sizeof(static_pool));
 
+	CHECK_CONNECTED_AND_CDT_SUPPORT();
+
 	POLICY_KEY_META_BIN();
 
 	as_val *put_val = NULL;
@@ -740,6 +736,7 @@ PyObject *AerospikeClient_ListSet(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
 	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
 	EXCEPTION_ON_ERROR();
 
 	return PyLong_FromLong(0);
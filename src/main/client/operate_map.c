@@ -30,6 +30,7 @@
 #include "exceptions.h"
 #include "policy.h"
 #include "serializer.h"
+#include "record_cache.h"
 
 #define BASE_VARIABLES                                                         \
 	as_error err;                                                              \
@@ -101,6 +102,7 @@
 	Py_BEGIN_ALLOW_THREADS                                                     \
 	aerospike_key_operate(self->as, &err, operate_policy_p, &key, &ops, &rec); \
 	Py_END_ALLOW_THREADS                                                       \
+	record_cache_invalidate(self, &key);                                       \
 	if (err.code != AEROSPIKE_OK) {                                            \
 		goto CLEANUP;                                                          \
 	}
@@ -123,12 +125,14 @@
 						"Unexpected empty return");                            \
 	}
 
-#define CLEANUP_AND_EXCEPTION_ON_ERROR(__err)                                  \
+#define CLEANUP_OPERATION()                                                    \
 	as_operations_destroy(&ops);                                               \
 	as_record_destroy(rec);                                                    \
 	if (key_created) {                                                         \
 		as_key_destroy(&key);                                                  \
-	}                                                                          \
+	}
+
+#define EXCEPTION_ON_ERROR(__err)                                              \
 	if (__err.code != AEROSPIKE_OK) {                                          \
 		PyObject *py_err = NULL;                                               \
 		error_to_pyobject(&__err, &py_err);                                    \
@@ -138,6 +142,10 @@
 		return NULL;                                                           \
 	}
 
+#define CLEANUP_AND_EXCEPTION_ON_ERROR(__err)                                  \
+	CLEANUP_OPERATION()                                                        \
+	EXCEPTION_ON_ERROR(__err)
+
 /* Forward declaration for function which inverts an operation */
 static as_status invertIfSpecified(as_error *err, PyObject *py_inverted,
 								   uint64_t *returnType);
@@ -169,6 +177,7 @@ PyObject *AerospikeClient_MapSetPolicy(AerospikeClient *self, PyObject *args,
 	Py_BEGIN_ALLOW_THREADS
 	aerospike_key_operate(self->as, &err, NULL, &key, &ops, &rec);
 	Py_END_ALLOW_THREADS
+	record_cache_invalidate(self, &key);
 
 CLEANUP:
 	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
@@ -231,7 +240,9 @@ PyObject *AerospikeClient_MapPut(AerospikeClient *self, PyObject *args,
 	DO_OPERATION();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&static_pool);
+	EXCEPTION_ON_ERROR(err);
 
 	if (error_occured) {
 		return NULL;
@@ -283,7 +294,9 @@ PyObject *AerospikeClient_MapPutItems(AerospikeClient *self, PyObject *args,
 	DO_OPERATION();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&static_pool);
+	EXCEPTION_ON_ERROR(err);
 	if (error_occured) {
 		return NULL;
 	}
@@ -341,7 +354,9 @@ PyObject *AerospikeClient_MapIncrement(AerospikeClient *self, PyObject *args,
 	DO_OPERATION();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	if (error_occured) {
 		return NULL;
@@ -398,7 +413,9 @@ PyObject *AerospikeClient_MapDecrement(AerospikeClient *self, PyObject *args,
 	DO_OPERATION();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	if (error_occured) {
 		return NULL;
@@ -530,7 +547,9 @@ PyObject *AerospikeClient_MapRemoveByKey(AerospikeClient *self, PyObject *args,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -590,7 +609,9 @@ PyObject *AerospikeClient_MapRemoveByKeyList(AerospikeClient *self,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -653,7 +674,9 @@ PyObject *AerospikeClient_MapRemoveByKeyRange(AerospikeClient *self,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -706,7 +729,9 @@ PyObject *AerospikeClient_MapRemoveByValue(AerospikeClient *self,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -767,7 +792,9 @@ PyObject *AerospikeClient_MapRemoveByValueList(AerospikeClient *self,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -830,7 +857,9 @@ PyObject *AerospikeClient_MapRemoveByValueRange(AerospikeClient *self,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -1062,7 +1091,9 @@ PyObject *AerospikeClient_MapGetByKey(AerospikeClient *self, PyObject *args,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -1116,7 +1147,9 @@ PyObject *AerospikeClient_MapGetByValue(AerospikeClient *self, PyObject *args,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -1178,7 +1211,9 @@ PyObject *AerospikeClient_MapGetByKeyRange(AerospikeClient *self,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -1240,7 +1275,9 @@ PyObject *AerospikeClient_MapGetByValueRange(AerospikeClient *self,
 	SETUP_RETURN_VAL();
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 
 	return py_result;
 }
@@ -1321,7 +1358,9 @@ PyObject *AerospikeClient_MapGetByValueList(AerospikeClient *self,
 	SETUP_RETURN_VAL()
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 	return py_result;
 }
 
@@ -1401,7 +1440,9 @@ PyObject *AerospikeClient_MapGetByKeyList(AerospikeClient *self, PyObject *args,
 	SETUP_RETURN_VAL()
 
 CLEANUP:
-	CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+	CLEANUP_OPERATION();
+	POOL_RELEASE(&pool);
+	EXCEPTION_ON_ERROR(err);
 	return py_result;
 }
 
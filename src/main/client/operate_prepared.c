@@ -0,0 +1,249 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_operations.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "prepared_ops.h"
+#include "record_cache.h"
+
+/**
+ *******************************************************************************************************
+ * Converts a list of operations and an operate policy once, for use with
+ * operate_prepared().
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.PreparedOps object.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Prepare_Operate(AerospikeClient *self,
+										  PyObject *args, PyObject *kwds)
+{
+	PyObject *py_ops = NULL;
+	PyObject *py_policy = NULL;
+	AerospikePreparedOps *py_prepared = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"ops", "policy", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:prepare_operate", kwlist,
+									&py_ops, &py_policy) == false) {
+		return NULL;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!PyList_Check(py_ops) || !PyList_Size(py_ops)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"ops should be a list of op dictionaries");
+		goto CLEANUP;
+	}
+
+	py_prepared = AerospikePreparedOps_New(self, &err, py_ops, py_policy);
+
+CLEANUP:
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return (PyObject *)py_prepared;
+}
+
+/**
+ *******************************************************************************************************
+ * Applies operations converted by prepare_operate() to a record.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns the record like operate().
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Operate_Prepared(AerospikeClient *self,
+										   PyObject *args, PyObject *kwds)
+{
+	PyObject *py_key = NULL;
+	PyObject *py_prepared = NULL;
+	PyObject *py_values = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_rec = NULL;
+
+	as_error err;
+	as_error_init(&err);
+
+	as_key key;
+	bool key_initialised = false;
+	as_record *rec = NULL;
+
+	as_vector *unicodeStrVector = NULL;
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	as_operations ops;
+	bool ops_initialised = false;
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "prepared", "values", "meta", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:operate_prepared",
+									kwlist, &py_key, &py_prepared, &py_values,
+									&py_meta) == false) {
+		return NULL;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (!AerospikePreparedOps_Check(py_prepared)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"prepared should be returned by prepare_operate()");
+		goto CLEANUP;
+	}
+
+	AerospikePreparedOps *prepared = (AerospikePreparedOps *)py_prepared;
+	if (prepared->client != self) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"prepared was returned by another client");
+		goto CLEANUP;
+	}
+
+	if (py_values == Py_None) {
+		py_values = NULL;
+	}
+
+	if (py_values &&
+		((!PyList_Check(py_values) && !PyTuple_Check(py_values)) ||
+		 PySequence_Fast_GET_SIZE(py_values) != prepared->values_size)) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"values should be a list or tuple of %zd op values",
+						prepared->values_size);
+		goto CLEANUP;
+	}
+
+	if (pyobject_to_key(&err, py_key, &key) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	key_initialised = true;
+
+	as_operations_inita(&ops, prepared->ops_size);
+	ops_initialised = true;
+
+	if (py_meta) {
+		if (check_for_meta(py_meta, &ops, &err) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	unicodeStrVector = as_vector_create(sizeof(char *), 128);
+	for (Py_ssize_t i = 0; i < prepared->ops_size; i++) {
+		if (compiled_op_add(self, &err, &prepared->ops[i], py_values,
+							unicodeStrVector, &static_pool,
+							&ops) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	Py_BEGIN_ALLOW_THREADS
+	aerospike_key_operate(self->as, &err, prepared->policy_p, &key, &ops,
+						  &rec);
+	Py_END_ALLOW_THREADS
+	record_cache_invalidate(self, &key);
+
+	if (err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND &&
+		self->return_none_on_miss) {
+		// A miss is a normal outcome for this client, skip the exception.
+		as_error_reset(&err);
+		Py_INCREF(Py_None);
+		py_rec = Py_None;
+		goto CLEANUP;
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (rec) {
+		record_to_pyobject(self, &err, rec, &key, &py_rec);
+	}
+	else {
+		py_rec = PyLong_FromLong(0);
+	}
+
+CLEANUP:
+	if (unicodeStrVector) {
+		for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+			free(as_vector_get_ptr(unicodeStrVector, i));
+		}
+		as_vector_destroy(unicodeStrVector);
+	}
+
+	if (rec) {
+		as_record_destroy(rec);
+	}
+
+	if (ops_initialised) {
+		as_operations_destroy(&ops);
+	}
+	POOL_RELEASE(&static_pool);
+
+	if (key_initialised) {
+		as_key_destroy(&key);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_rec);
+		raise_exception_base(&err, py_key, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return py_rec;
+}
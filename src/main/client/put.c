@@ -26,6 +26,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "record_cache.h"
 
 /**
  *******************************************************************************************************
@@ -111,6 +112,7 @@ PyObject *AerospikeClient_Put_Invoke(AerospikeClient *self, PyObject *py_key,
 	Py_BEGIN_ALLOW_THREADS
 	aerospike_key_put(self->as, &err, write_policy_p, &key, &rec);
 	Py_END_ALLOW_THREADS
+	record_cache_invalidate(self, &key);
 	if (err.code != AEROSPIKE_OK) {
 		as_error_update(&err, err.code, NULL);
 	}
@@ -131,19 +133,11 @@ CLEANUP:
 		as_record_destroy(&rec);
 	}
 
+	POOL_RELEASE(&static_pool);
+
 	// If an error occurred, tell Python.
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", py_bins);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, py_bins, NULL, NULL, NULL);
 		return NULL;
 	}
 
@@ -26,6 +26,8 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "completion_queue.h"
+#include "record_cache.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
@@ -69,15 +71,12 @@ void write_async_callback_helper(as_error *cmd_error, void *udata,
 	key_to_pyobject(&temp_error, &data->key, &py_key);
 
 	if (error->code != AEROSPIKE_OK) {
-		py_exception = raise_exception(error);
-		if (PyObject_HasAttrString(py_exception, "key")) {
-			PyObject_SetAttrString(py_exception, "key", py_key);
+		if (cb) {
+			py_exception =
+				create_pyexception(error, py_key, Py_None, NULL, NULL, NULL);
 		}
-		if (PyObject_HasAttrString(py_exception, "bin")) {
-			PyObject_SetAttrString(py_exception, "bin", Py_None);
-		}
-		if (!cb) {
-			PyErr_SetObject(py_exception, py_err);
+		else {
+			raise_exception_base(error, py_key, Py_None, NULL, NULL, NULL);
 			Py_DECREF(py_err);
 		}
 	}
@@ -115,6 +114,9 @@ void write_async_callback_helper(as_error *cmd_error, void *udata,
 
 	if (udata) {
 		as_key_destroy(&data->key);
+		// Release the references taken when the command was issued.
+		Py_XDECREF(data->callback);
+		completion_client_release((PyObject *)data->client);
 		//todo: dont free cb data in case of retry logic
 		put_async_cb_destroy(udata);
 	}
@@ -126,9 +128,24 @@ void write_async_callback_helper(as_error *cmd_error, void *udata,
 	return;
 }
 
+static void write_async_deliver(as_error *error, void *result, void *udata)
+{
+	write_async_callback_helper(error, udata, NULL, 1);
+}
+
 void write_async_callback(as_error *error, void *udata,
 						  as_event_loop *event_loop)
 {
+	LocalData *data = (LocalData *)udata;
+	completion_queue *queue = data->client->completion_queue;
+
+	// In completion queue mode the result is handed over without taking the
+	// GIL, poll_completions() invokes the callback later.
+	if (queue &&
+		completion_queue_push(queue, write_async_deliver, error, NULL, udata)) {
+		return;
+	}
+
 	write_async_callback_helper(error, udata, event_loop, 1);
 }
 
@@ -203,7 +220,12 @@ PyObject *AerospikeClient_Put_Async(AerospikeClient *self, PyObject *args,
 	// Create and initialize callback user-data
 	LocalData *uData = put_async_cb_create();
 	uData->callback = py_callback;
+	// Callbacks are often per-command closures, keep them alive until the
+	// command completes on the event loop.
+	Py_INCREF(py_callback);
 	uData->client = self;
+	// The completion queue of the client is used until the callback runs.
+	Py_INCREF(self);
 	memset(&uData->key, 0, sizeof(uData->key));
 
 	as_error_init(&uData->error);
@@ -253,6 +275,10 @@ PyObject *AerospikeClient_Put_Async(AerospikeClient *self, PyObject *args,
 		goto CLEANUP;
 	}
 
+	// The callback can run before this thread holds the GIL again, so drop the
+	// cached record before the write is sent.
+	record_cache_invalidate(self, &uData->key);
+
 	// Invoke operation
 	Py_BEGIN_ALLOW_THREADS
 	status = aerospike_key_put_async(self->as, &uData->error, write_policy_p,
@@ -275,6 +301,8 @@ CLEANUP:
 		as_record_destroy(&rec);
 	}
 
+	POOL_RELEASE(&static_pool);
+
 	// If an error occurred, tell Python.
 	if (uData->error.code != AEROSPIKE_OK) {
 		write_async_callback_helper(&uData->error, uData, NULL, 0);
@@ -26,6 +26,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "record_cache.h"
 
 /**
  *******************************************************************************************************
@@ -120,6 +121,7 @@ PyObject *AerospikeClient_Remove_Invoke(AerospikeClient *self, PyObject *py_key,
 	Py_BEGIN_ALLOW_THREADS
 	aerospike_key_remove(self->as, &err, remove_policy_p, &key);
 	Py_END_ALLOW_THREADS
+	record_cache_invalidate(self, &key);
 	if (err.code != AEROSPIKE_OK) {
 		as_error_update(&err, err.code, NULL);
 	}
@@ -136,17 +138,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, Py_None, NULL, NULL, NULL);
 		return NULL;
 	}
 
@@ -0,0 +1,244 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_buffer.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_msgpack_serializer.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_serializer.h>
+#include <aerospike/as_val.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+/**
+ * Reads the optional serializer argument of the round trip methods, the same
+ * way put() does.
+ */
+static void roundtrip_serializer_option(AerospikeClient *self,
+										PyObject *py_serializer_option,
+										long *serializer_option)
+{
+	if (py_serializer_option && (PyInt_Check(py_serializer_option) ||
+								 PyLong_Check(py_serializer_option))) {
+		self->is_client_put_serializer = true;
+		*serializer_option = PyLong_AsLong(py_serializer_option);
+	}
+	else {
+		self->is_client_put_serializer = false;
+	}
+}
+
+/**
+ *******************************************************************************************************
+ * Converts a Python value to an as_val and back, without any I/O.
+ * Only meant for tests and benchmarks of the conversion layer.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns the converted value.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Roundtrip_Val(AerospikeClient *self, PyObject *args,
+										PyObject *kwds)
+{
+	PyObject *py_value = NULL;
+	PyObject *py_msgpack = NULL;
+	PyObject *py_serializer_option = NULL;
+	PyObject *py_result = NULL;
+	long serializer_option = SERIALIZER_PYTHON;
+
+	as_val *val = NULL;
+	as_val *unpacked = NULL;
+
+	as_serializer serializer;
+	bool serializer_initialised = false;
+	as_buffer buffer;
+	as_buffer_init(&buffer);
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"value", "msgpack", "serializer", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:_roundtrip_val", kwlist,
+									&py_value, &py_msgpack,
+									&py_serializer_option) == false) {
+		return NULL;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	roundtrip_serializer_option(self, py_serializer_option,
+								&serializer_option);
+
+	if (pyobject_to_val(self, &err, py_value, &val, &static_pool,
+						serializer_option) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_msgpack && PyObject_IsTrue(py_msgpack)) {
+		// Pack and unpack the value, as CDT values are sent on the wire.
+		as_msgpack_init(&serializer);
+		serializer_initialised = true;
+
+		if (as_serializer_serialize(&serializer, val, &buffer) != 0) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+							"Unable to pack value with msgpack");
+			goto CLEANUP;
+		}
+
+		if (as_serializer_deserialize(&serializer, &buffer, &unpacked) != 0 ||
+			!unpacked) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+							"Unable to unpack value with msgpack");
+			goto CLEANUP;
+		}
+
+		val_to_pyobject(self, &err, unpacked, &py_result);
+	}
+	else {
+		val_to_pyobject(self, &err, val, &py_result);
+	}
+
+CLEANUP:
+	if (unpacked) {
+		as_val_destroy(unpacked);
+	}
+
+	if (val) {
+		as_val_destroy(val);
+	}
+
+	if (serializer_initialised) {
+		as_serializer_destroy(&serializer);
+	}
+	as_buffer_destroy(&buffer);
+
+	POOL_RELEASE(&static_pool);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_result);
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return py_result;
+}
+
+/**
+ *******************************************************************************************************
+ * Converts a Python key, bins and metadata to an as_key and as_record and
+ * back to a record tuple, without any I/O.
+ * Only meant for tests and benchmarks of the conversion layer.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns a (key, meta, bins) record tuple.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Roundtrip_Record(AerospikeClient *self,
+										   PyObject *args, PyObject *kwds)
+{
+	PyObject *py_key = NULL;
+	PyObject *py_bins = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_serializer_option = NULL;
+	PyObject *py_result = NULL;
+	long serializer_option = SERIALIZER_PYTHON;
+
+	as_key key;
+	bool key_initialised = false;
+	as_record rec;
+	as_record_init(&rec, 0);
+
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
+	as_error err;
+	as_error_init(&err);
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"key", "bins", "meta", "serializer", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:_roundtrip_record",
+									kwlist, &py_key, &py_bins, &py_meta,
+									&py_serializer_option) == false) {
+		return NULL;
+	}
+
+	if (!self || !self->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	roundtrip_serializer_option(self, py_serializer_option,
+								&serializer_option);
+
+	if (pyobject_to_key(&err, py_key, &key) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+	key_initialised = true;
+
+	if (pyobject_to_record(self, &err, py_bins, py_meta, &rec,
+						   serializer_option, &static_pool) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	record_to_pyobject(self, &err, &rec, &key, &py_result);
+
+CLEANUP:
+	POOL_DESTROY(&static_pool);
+
+	if (key_initialised) {
+		as_key_destroy(&key);
+	}
+	as_record_destroy(&rec);
+
+	POOL_RELEASE(&static_pool);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_result);
+		raise_exception_base(&err, py_key, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return py_result;
+}
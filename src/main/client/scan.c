@@ -248,6 +248,8 @@ CLEANUP:
 		as_scan_destroy(&scan);
 	}
 
+	POOL_RELEASE(&static_pool);
+
 	if (err.code != AEROSPIKE_OK) {
 		PyObject *py_err = NULL;
 		error_to_pyobject(&err, &py_err);
@@ -177,6 +177,9 @@ PyObject *AerospikeClient_Index_Cdt_Create(AerospikeClient *self,
 		return NULL;
 	}
 
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+
 	if (!getTypeFromPyObject(py_indextype, (int*)&index_type, &err)) {
 		goto CLEANUP;
 	}
@@ -185,9 +188,6 @@ PyObject *AerospikeClient_Index_Cdt_Create(AerospikeClient *self,
 		goto CLEANUP;
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-
 	if (get_cdt_ctx(self, &err, &ctx, py_ctx, &ctx_in_use, &static_pool,
 					SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 		goto CLEANUP;
@@ -203,19 +203,14 @@ PyObject *AerospikeClient_Index_Cdt_Create(AerospikeClient *self,
 										&ctx);
 
 	as_cdt_ctx_destroy(&ctx);
+	POOL_RELEASE(&static_pool);
 
 	return py_obj;
 
 CLEANUP:
+	POOL_RELEASE(&static_pool);
 	if (py_obj == NULL) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "name")) {
-			PyObject_SetAttrString(exception_type, "name", py_name);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, py_name);
 		return NULL;
 	}
 
@@ -316,14 +311,7 @@ CLEANUP:
 		Py_DECREF(py_ustr_name);
 	}
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "name")) {
-			PyObject_SetAttrString(exception_type, "name", py_name);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, py_name);
 		return NULL;
 	}
 
@@ -26,6 +26,8 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "record_cache.h"
+#include "single_flight.h"
 
 /**
  *******************************************************************************************************
@@ -52,6 +54,10 @@ PyObject *AerospikeClient_Select_Invoke(AerospikeClient *self, PyObject *py_key,
 	as_policy_read *read_policy_p = NULL;
 	as_key key;
 	as_record *rec = NULL;
+	const as_exp *filter_exp = NULL;
+	uint64_t cache_seq = 0;
+	single_flight *flight = NULL;
+	bool flight_leader = false;
 	// It's only safe to free the record if this succeeded.
 	bool select_succeeded = false;
 	char **bins = NULL;
@@ -151,6 +157,23 @@ PyObject *AerospikeClient_Select_Invoke(AerospikeClient *self, PyObject *py_key,
 		goto CLEANUP;
 	}
 
+	if (read_policy_p) {
+		filter_exp = read_policy_p->base.filter_exp;
+	}
+
+	if (record_cache_get(self, &key, py_bins, filter_exp, &py_rec)) {
+		goto CLEANUP;
+	}
+
+	flight = single_flight_join(self, &key, py_bins, py_policy, false,
+								&flight_leader);
+	if (flight && !flight_leader) {
+		// An identical read is in flight, share its result.
+		single_flight_await(flight, &err, &key, &py_rec);
+		goto CLEANUP;
+	}
+	cache_seq = record_cache_seq(self);
+
 	// Invoke operation
 	Py_BEGIN_ALLOW_THREADS
 	aerospike_key_select(self->as, &err, read_policy_p, &key,
@@ -159,13 +182,31 @@ PyObject *AerospikeClient_Select_Invoke(AerospikeClient *self, PyObject *py_key,
 
 	if (err.code == AEROSPIKE_OK) {
 		select_succeeded = true;
-		record_to_pyobject(self, &err, rec, &key, &py_rec);
+		if (record_to_pyobject(self, &err, rec, &key, &py_rec) ==
+			AEROSPIKE_OK) {
+			record_cache_put(self, &key, rec, py_rec, py_bins, filter_exp,
+							 cache_seq);
+		}
+	}
+	else if (err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND &&
+			 self->return_none_on_miss) {
+		// A miss is a normal outcome for this client, skip the exception.
+		as_error_reset(&err);
+		Py_INCREF(Py_None);
+		py_rec = Py_None;
 	}
 	else {
 		as_error_update(&err, err.code, NULL);
 	}
 
 CLEANUP:
+	if (flight) {
+		if (flight_leader) {
+			single_flight_finish(self, flight, rec, py_rec, &err);
+		}
+		single_flight_release(flight);
+	}
+
 	if (exp_list_p) {
 		as_exp_destroy(exp_list_p);
 		;
@@ -185,17 +226,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_key);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_key, Py_None, NULL, NULL, NULL);
 		return NULL;
 	}
 
@@ -28,6 +28,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "batch_chunks.h"
 
 /**
  *************************************************************************
@@ -163,6 +164,19 @@ CLEANUP:
 	return py_recs;
 }
 
+typedef struct {
+	PyObject *py_bins;
+	PyObject *py_policy;
+} SelectManyArgs;
+
+static PyObject *select_many_chunk(AerospikeClient *self, PyObject *py_keys,
+								   void *udata)
+{
+	SelectManyArgs *select_args = (SelectManyArgs *)udata;
+	return AerospikeClient_Select_Many_Invoke(
+		self, py_keys, select_args->py_bins, select_args->py_policy);
+}
+
 /**
  *********************************************************************
  * This function will invoke aerospike_batch_get_bins to get filtered
@@ -281,17 +295,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "key")) {
-			PyObject_SetAttrString(exception_type, "key", py_keys);
-		}
-		if (PyObject_HasAttrString(exception_type, "bin")) {
-			PyObject_SetAttrString(exception_type, "bin", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, py_keys, Py_None, NULL, NULL, NULL);
 		return NULL;
 	}
 	return py_recs;
@@ -305,6 +309,10 @@ PyObject *AerospikeClient_Select_Many(AerospikeClient *self, PyObject *args,
 	PyObject *py_bins = NULL;
 	PyObject *py_policy = NULL;
 
+	as_error err;
+	as_error_init(&err);
+	uint32_t max_keys = 0;
+
 	// Python Function Keyword Arguments
 	static char *kwlist[] = {"keys", "bins", "policy", NULL};
 
@@ -314,6 +322,17 @@ PyObject *AerospikeClient_Select_Many(AerospikeClient *self, PyObject *args,
 		return NULL;
 	}
 
+	if (get_max_keys_per_batch(&err, py_policy, &max_keys) != AEROSPIKE_OK) {
+		raise_exception_base(&err, py_keys, Py_None, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	if (batch_chunks_needed(py_keys, max_keys)) {
+		SelectManyArgs select_args = {py_bins, py_policy};
+		return batch_chunks_invoke(self, py_keys, max_keys, select_many_chunk,
+								   NULL, &select_args);
+	}
+
 	// Invoke Operation
 	return AerospikeClient_Select_Many_Invoke(self, py_keys, py_bins,
 											  py_policy);
@@ -23,6 +23,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "record_cache.h"
 
 static PyObject *AerospikeClient_TruncateInvoke(AerospikeClient *self,
 												char *namespace, char *set,
@@ -44,6 +45,8 @@ static PyObject *AerospikeClient_TruncateInvoke(AerospikeClient *self,
 
 	status =
 		aerospike_truncate(self->as, err, info_policy_p, namespace, set, nanos);
+	// The cache holds no record times, so drop every record.
+	record_cache_clear(self);
 	if (status != AEROSPIKE_OK) {
 		// The truncate operation failed. Update the err->code and return
 		as_error_update(err, AEROSPIKE_ERR_CLIENT, "Truncate operation failed");
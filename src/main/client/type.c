@@ -17,6 +17,7 @@
 #include <Python.h>
 #include <structmember.h>
 #include <stdbool.h>
+#include <stdint.h>
 #include <unistd.h>
 
 #include <aerospike/aerospike.h>
@@ -31,6 +32,9 @@
 #include "exceptions.h"
 #include "tls_config.h"
 #include "policy_config.h"
+#include "exp_cache.h"
+#include "record_cache.h"
+#include "single_flight.h"
 
 static int set_rack_aware_config(as_config *conf, PyObject *config_dict);
 static int set_use_services_alternate(as_config *conf, PyObject *config_dict);
@@ -48,7 +52,8 @@ enum {
 	INIT_DESERIALIZE_ERR,
 	INIT_COMPRESSION_ERR,
 	INIT_POLICY_PARAM_ERR,
-	INIT_INVALID_AUTHMODE_ERR
+	INIT_INVALID_AUTHMODE_ERR,
+	INIT_RECORD_CACHE_ERR
 };
 
 /*******************************************************************************
@@ -65,6 +70,12 @@ PyDoc_STRVAR(exists_doc, "exists(key[, policy]) -> (key, meta)\n\
 Check if a record with a given key exists in the cluster and return the record \
 as a tuple() consisting of key and meta. If the record does not exist the meta data will be None.");
 
+PyDoc_STRVAR(exists_async_doc,
+			 "exists_async(exists_callback, key[, policy])\n\
+\n\
+Check asynchronously if a record with a given key exists in the cluster. \
+The callback is invoked with (key, (key, meta), error, exception). If the record does not exist the meta data will be None.");
+
 PyDoc_STRVAR(get_doc, "get(key[, policy]) -> (key, meta, bins)\n\
 \n\
 Read a record with a given key, and return the record as a tuple() consisting of key, meta and bins.");
@@ -93,10 +104,22 @@ PyDoc_STRVAR(remove_doc, "remove(key[, policy])\n\
 \n\
 Remove a record matching the key from the cluster.");
 
+PyDoc_STRVAR(remove_async_doc,
+			 "remove_async(remove_callback, key[, meta[, policy]])\n\
+\n\
+Remove asynchronously a record matching the key from the cluster. \
+The callback is invoked with (key, error, exception).");
+
 PyDoc_STRVAR(apply_doc, "apply(key, module, function, args[, policy])\n\
 \n\
 Apply a registered (see udf_put()) record UDF to a particular record.");
 
+PyDoc_STRVAR(apply_async_doc,
+			 "apply_async(apply_callback, key, module, function, args[, policy])\n\
+\n\
+Apply asynchronously a registered (see udf_put()) record UDF to a particular record. \
+The callback is invoked with (key, result, error, exception).");
+
 PyDoc_STRVAR(remove_bin_doc, "remove_bin(key, list[, meta[, policy]])\n\
 \n\
 Remove a list of bins from a record with a given key. \
@@ -127,6 +150,12 @@ Starting with 3.6.0 non-existent bins will not be present in the returned Record
 The returned record tuple will only contain one entry per bin, \
 even if multiple operations were performed on the bin.");
 
+PyDoc_STRVAR(operate_async_doc,
+			 "operate_async(operate_callback, key, list[, meta[, policy]])\n\
+\n\
+Perform asynchronously multiple bin operations on a record with a given key. \
+The callback is invoked with (key, (key, meta, bins), error, exception).");
+
 PyDoc_STRVAR(
 	operate_ordered_doc,
 	"operate_ordered(key, list[, meta[, policy]]) -> (key, meta, bins)\n\
@@ -134,6 +163,23 @@ PyDoc_STRVAR(
 Perform multiple bin operations on a record with the results being returned as a list of (bin-name, result) tuples. \
 The order of the elements in the list will correspond to the order of the operations from the input parameters.");
 
+PyDoc_STRVAR(prepare_operate_doc,
+			 "prepare_operate(list[, policy]) -> PreparedOps\n\
+\n\
+Convert a list of operations and an operate policy once, for use with operate_prepared().");
+
+PyDoc_STRVAR(
+	operate_prepared_doc,
+	"operate_prepared(key, prepared[, values[, meta]]) -> (key, meta, bins)\n\
+\n\
+Perform operations returned by prepare_operate() on a record with a given key. \
+Each operation with a val takes its value from values, in order, or keeps the prepared value when values is None.");
+
+PyDoc_STRVAR(compile_policy_doc,
+			 "compile_policy(kind[, policy]) -> Policy\n\
+\n\
+Convert a policy dict of the given kind once, for use in place of the dict.");
+
 PyDoc_STRVAR(list_append_doc, "list_append(key, bin, val[, meta[, policy]])\n\
 \n\
 Append a single element to a list value in bin.");
@@ -413,11 +459,34 @@ PyDoc_STRVAR(get_expression_base64_doc,
 \n\
 Get the base64 representation of a compiled aerospike expression.");
 
+PyDoc_STRVAR(compile_expression_doc,
+			 "compile_expression(compiled_expression: list) -> CompiledExpression\n\
+\n\
+Pack a compiled aerospike expression once, for use in its place without converting it again.");
+
+PyDoc_STRVAR(roundtrip_val_doc,
+			 "_roundtrip_val(value[, msgpack[, serializer]]) -> value\n\
+\n\
+Convert value to its C client representation and back, optionally through msgpack, without any I/O.\n\
+Only meant for tests and benchmarks of the conversion layer.");
+
+PyDoc_STRVAR(roundtrip_record_doc,
+			 "_roundtrip_record(key, bins[, meta[, serializer]]) -> (key, meta, bins)\n\
+\n\
+Convert a key, bins and metadata to a C client key and record and back, without any I/O.\n\
+Only meant for tests and benchmarks of the conversion layer.");
+
 PyDoc_STRVAR(info_all_doc, "info_all(command[, policy]]) -> {}\n\
 \n\
 Send an info *command* to all nodes in the cluster to which the client is connected.\n\
 If any of the individual requests fail, this will raise an exception.");
 
+PyDoc_STRVAR(info_all_parsed_doc,
+			 "info_all_parsed(commands[, policy]) -> {}\n\
+\n\
+Send several info *commands* to all nodes in the cluster, in one request per node, and parse the responses.\n\
+If any of the individual requests fail, this will raise an exception.");
+
 PyDoc_STRVAR(info_single_node_doc,
 			 "info_single_node(command, host[, policy]) -> str\n\
 \n\
@@ -547,6 +616,22 @@ PyDoc_STRVAR(
 Perform read/write operations on multiple keys. \
 Requires server version 6.0+");
 
+PyDoc_STRVAR(
+	batch_write_columns_doc,
+	"batch_write_columns([keys], [ops], [values], policy_batch, policy_batch_write) -> BatchRecords\n\
+\n\
+Perform the same read/write operations on multiple keys, with different values per key. \
+The ops are converted once, each op with a val takes its value from the key's row of values, in order. \
+Requires server version 6.0+");
+
+PyDoc_STRVAR(
+	batch_operate_async_doc,
+	"batch_operate_async(batch_callback, [keys], [ops], policy_batch, policy_batch_write)\n\
+\n\
+Perform asynchronously read/write operations on multiple keys. \
+The callback is invoked with (BatchRecords, error, exception). \
+Requires server version 6.0+");
+
 PyDoc_STRVAR(
 	batch_remove_doc,
 	"batch_remove([keys], policy_batch, policy_batch_remove) -> BatchRecords\n\
@@ -554,6 +639,26 @@ PyDoc_STRVAR(
 Remove multiple records by key. \
 Requires server version 6.0+");
 
+PyDoc_STRVAR(
+	enable_completion_queue_doc,
+	"enable_completion_queue([capacity[, notify]])\n\
+\n\
+Queue the results of async commands instead of invoking their callbacks from the event loop threads. \
+The callbacks are invoked by poll_completions(). notify is called once when the queue stops being empty. \
+When the queue is full, callbacks are invoked directly.");
+
+PyDoc_STRVAR(poll_completions_doc, "poll_completions([max]) -> int\n\
+\n\
+Invoke the callbacks of up to max (all when 0) queued async commands and return how many were invoked.");
+
+PyDoc_STRVAR(
+	batch_remove_async_doc,
+	"batch_remove_async(batch_callback, [keys], policy_batch, policy_batch_remove)\n\
+\n\
+Remove asynchronously multiple records by key. \
+The callback is invoked with (BatchRecords, error, exception). \
+Requires server version 6.0+");
+
 PyDoc_STRVAR(
 	batch_apply_doc,
 	"batch_apply([keys], module, function, [args], policy_batch, policy_batch_apply) -> BatchRecords\n\
@@ -649,6 +754,8 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 
 	{"exists", (PyCFunction)AerospikeClient_Exists,
 	 METH_VARARGS | METH_KEYWORDS, exists_doc},
+	{"exists_async", (PyCFunction)AerospikeClient_Exists_Async,
+	 METH_VARARGS | METH_KEYWORDS, exists_async_doc},
 	{"get", (PyCFunction)AerospikeClient_Get, METH_VARARGS | METH_KEYWORDS,
 	 get_doc},
 	{"get_async", (PyCFunction)AerospikeClient_Get_Async,
@@ -663,8 +770,12 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	 METH_VARARGS | METH_KEYWORDS, get_key_partition_id_doc},
 	{"remove", (PyCFunction)AerospikeClient_Remove,
 	 METH_VARARGS | METH_KEYWORDS, remove_doc},
+	{"remove_async", (PyCFunction)AerospikeClient_Remove_Async,
+	 METH_VARARGS | METH_KEYWORDS, remove_async_doc},
 	{"apply", (PyCFunction)AerospikeClient_Apply, METH_VARARGS | METH_KEYWORDS,
 	 apply_doc},
+	{"apply_async", (PyCFunction)AerospikeClient_Apply_Async,
+	 METH_VARARGS | METH_KEYWORDS, apply_async_doc},
 	{"remove_bin", (PyCFunction)AerospikeClient_RemoveBin,
 	 METH_VARARGS | METH_KEYWORDS, remove_bin_doc},
 	{"append", (PyCFunction)AerospikeClient_Append,
@@ -677,8 +788,16 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	 METH_VARARGS | METH_KEYWORDS, increment_doc},
 	{"operate", (PyCFunction)AerospikeClient_Operate,
 	 METH_VARARGS | METH_KEYWORDS, operate_doc},
+	{"operate_async", (PyCFunction)AerospikeClient_Operate_Async,
+	 METH_VARARGS | METH_KEYWORDS, operate_async_doc},
 	{"operate_ordered", (PyCFunction)AerospikeClient_OperateOrdered,
 	 METH_VARARGS | METH_KEYWORDS, operate_ordered_doc},
+	{"prepare_operate", (PyCFunction)AerospikeClient_Prepare_Operate,
+	 METH_VARARGS | METH_KEYWORDS, prepare_operate_doc},
+	{"operate_prepared", (PyCFunction)AerospikeClient_Operate_Prepared,
+	 METH_VARARGS | METH_KEYWORDS, operate_prepared_doc},
+	{"compile_policy", (PyCFunction)AerospikeClient_Compile_Policy,
+	 METH_VARARGS | METH_KEYWORDS, compile_policy_doc},
 
 	// LIST OPERATIONS
 
@@ -800,8 +919,16 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	 METH_VARARGS | METH_KEYWORDS, set_xdr_filter_doc},
 	{"get_expression_base64", (PyCFunction)AerospikeClient_GetExpressionBase64,
 	 METH_VARARGS | METH_KEYWORDS, get_expression_base64_doc},
+	{"compile_expression", (PyCFunction)AerospikeClient_Compile_Expression,
+	 METH_VARARGS | METH_KEYWORDS, compile_expression_doc},
+	{"_roundtrip_val", (PyCFunction)AerospikeClient_Roundtrip_Val,
+	 METH_VARARGS | METH_KEYWORDS, roundtrip_val_doc},
+	{"_roundtrip_record", (PyCFunction)AerospikeClient_Roundtrip_Record,
+	 METH_VARARGS | METH_KEYWORDS, roundtrip_record_doc},
 	{"info_all", (PyCFunction)AerospikeClient_InfoAll,
 	 METH_VARARGS | METH_KEYWORDS, info_all_doc},
+	{"info_all_parsed", (PyCFunction)AerospikeClient_InfoAllParsed,
+	 METH_VARARGS | METH_KEYWORDS, info_all_parsed_doc},
 	{"info_single_node", (PyCFunction)AerospikeClient_InfoSingleNode,
 	 METH_VARARGS | METH_KEYWORDS, info_single_node_doc},
 	{"info_random_node", (PyCFunction)AerospikeClient_InfoRandomNode,
@@ -862,11 +989,24 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 	 METH_VARARGS | METH_KEYWORDS, batch_write_doc},
 	{"batch_operate", (PyCFunction)AerospikeClient_Batch_Operate,
 	 METH_VARARGS | METH_KEYWORDS, batch_operate_doc},
+	{"batch_write_columns", (PyCFunction)AerospikeClient_Batch_Write_Columns,
+	 METH_VARARGS | METH_KEYWORDS, batch_write_columns_doc},
+	{"batch_operate_async", (PyCFunction)AerospikeClient_Batch_Operate_Async,
+	 METH_VARARGS | METH_KEYWORDS, batch_operate_async_doc},
 	{"batch_remove", (PyCFunction)AerospikeClient_Batch_Remove,
 	 METH_VARARGS | METH_KEYWORDS, batch_remove_doc},
+	{"batch_remove_async", (PyCFunction)AerospikeClient_Batch_Remove_Async,
+	 METH_VARARGS | METH_KEYWORDS, batch_remove_async_doc},
 	{"batch_apply", (PyCFunction)AerospikeClient_Batch_Apply,
 	 METH_VARARGS | METH_KEYWORDS, batch_apply_doc},
 
+	// ASYNC COMPLETION QUEUE
+	{"enable_completion_queue",
+	 (PyCFunction)AerospikeClient_Enable_Completion_Queue,
+	 METH_VARARGS | METH_KEYWORDS, enable_completion_queue_doc},
+	{"poll_completions", (PyCFunction)AerospikeClient_Poll_Completions,
+	 METH_VARARGS | METH_KEYWORDS, poll_completions_doc},
+
 	// TRUNCATE OPERATIONS
 	{"truncate", (PyCFunction)AerospikeClient_Truncate,
 	 METH_VARARGS | METH_KEYWORDS, truncate_doc},
@@ -900,6 +1040,12 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
 	self->use_shared_connection = false;
 	self->as = NULL;
 	self->send_bool_as = SEND_BOOL_AS_PY_BYTES;
+	self->return_none_on_miss = false;
+	self->completion_queue = NULL;
+	self->exp_cache = NULL;
+	self->exp_cache_size = 0;
+	self->record_cache = NULL;
+	self->single_flights = NULL;
 
 	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:client", kwlist,
 									&py_config) == false) {
@@ -1368,6 +1514,29 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
 		}
 	}
 
+	PyObject *py_return_none_on_miss =
+		PyDict_GetItemString(py_config, "return_none_on_miss");
+	if (py_return_none_on_miss && PyBool_Check(py_return_none_on_miss)) {
+		self->return_none_on_miss = (Py_True == py_return_none_on_miss);
+	}
+
+	PyObject *py_exp_cache_size =
+		PyDict_GetItemString(py_config, "expression_cache_size");
+	if (py_exp_cache_size && PyInt_Check(py_exp_cache_size)) {
+		long exp_cache_size = PyInt_AsLong(py_exp_cache_size);
+		if (exp_cache_size > 0 && exp_cache_size <= UINT32_MAX) {
+			exp_cache_init(self, (uint32_t)exp_cache_size);
+		}
+	}
+
+	if (record_cache_init(self, PyDict_GetItemString(py_config, "cache")) ==
+		-1) {
+		error_code = INIT_RECORD_CACHE_ERR;
+		goto CONSTRUCTOR_ERROR;
+	}
+
+	single_flight_init(self, PyDict_GetItemString(py_config, "single_flight"));
+
 	if (set_rack_aware_config(&config, py_config) != INIT_SUCCESS) {
 		error_code = INIT_POLICY_PARAM_ERR;
 		goto CONSTRUCTOR_ERROR;
@@ -1462,6 +1631,11 @@ CONSTRUCTOR_ERROR:
 						"Specify valid auth_mode");
 		break;
 	}
+	case INIT_RECORD_CACHE_ERR: {
+		as_error_update(&constructor_err, AEROSPIKE_ERR_PARAM,
+						"Invalid cache config");
+		break;
+	}
 	default:
 		// If a generic error was caught during init, use this message
 		as_error_update(&constructor_err, AEROSPIKE_ERR_PARAM,
@@ -1539,6 +1713,15 @@ static void AerospikeClient_Type_Dealloc(PyObject *self)
 	AerospikeGlobalHosts *global_host = NULL;
 	AerospikeClient *client = (AerospikeClient *)self;
 
+	if (client->completion_queue) {
+		completion_queue_destroy(client->completion_queue);
+		client->completion_queue = NULL;
+	}
+
+	exp_cache_destroy(client);
+	record_cache_destroy(client);
+	single_flight_destroy(client);
+
 	// If the client has never connected
 	// It is safe to destroy the aerospike structure
 	if (client->as) {
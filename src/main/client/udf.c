@@ -262,17 +262,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", Py_None);
-		}
-		if (PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, Py_None, Py_None, NULL);
 		return NULL;
 	}
 
@@ -365,17 +355,7 @@ CLEANUP:
 		Py_DECREF(py_ustr);
 	}
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", py_filename);
-		}
-		if (PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, py_filename, Py_None, NULL);
 		return NULL;
 	}
 
@@ -463,17 +443,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", Py_None);
-		}
-		if (PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, Py_None, Py_None, NULL);
 		return NULL;
 	}
 
@@ -579,17 +549,7 @@ CLEANUP:
 		as_udf_file_destroy(&file);
 	}
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", py_module);
-		}
-		if (PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, py_module, Py_None, NULL);
 		return NULL;
 	}
 
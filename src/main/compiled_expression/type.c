@@ -0,0 +1,224 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+#include <citrusleaf/alloc.h>
+
+#include "compiled_expression.h"
+#include "exceptions.h"
+#include "macros.h"
+
+static PyTypeObject AerospikeCompiledExpression_Type;
+
+static as_exp *packed_exp_new(const char *packed, Py_ssize_t packed_sz)
+{
+	as_exp *exp = cf_malloc(sizeof(as_exp) + packed_sz);
+	exp->packed_sz = (uint32_t)packed_sz;
+	memcpy(exp->packed, packed, packed_sz);
+	return exp;
+}
+
+static PyObject *raise_param_error(const char *message)
+{
+	as_error err;
+	as_error_init(&err);
+	as_error_update(&err, AEROSPIKE_ERR_PARAM, "%s", message);
+	raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+	return NULL;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject *AerospikeCompiledExpression_From_Bytes(PyObject *cls,
+														PyObject *py_bytes)
+{
+	if (!PyBytes_Check(py_bytes) || !PyBytes_GET_SIZE(py_bytes)) {
+		return raise_param_error("packed expression must be non empty bytes");
+	}
+
+	return AerospikeCompiledExpression_New(packed_exp_new(
+		PyBytes_AS_STRING(py_bytes), PyBytes_GET_SIZE(py_bytes)));
+}
+
+static PyObject *AerospikeCompiledExpression_From_Base64(PyObject *cls,
+														 PyObject *py_base64)
+{
+	if (!PyString_Check(py_base64)) {
+		return raise_param_error("base64 expression must be a str");
+	}
+
+	as_exp *exp = as_exp_from_base64(PyString_AsString(py_base64));
+	if (!exp) {
+		return raise_param_error("invalid base64 expression");
+	}
+
+	return AerospikeCompiledExpression_New(exp);
+}
+
+static PyObject *
+AerospikeCompiledExpression_To_Bytes(AerospikeCompiledExpression *self,
+									 PyObject *unused)
+{
+	return PyBytes_FromStringAndSize((const char *)self->exp->packed,
+									 self->exp->packed_sz);
+}
+
+static PyObject *
+AerospikeCompiledExpression_To_Base64(AerospikeCompiledExpression *self,
+									  PyObject *unused)
+{
+	char *base64 = as_exp_compile_b64(self->exp);
+	PyObject *py_base64 = PyUnicode_FromString(base64);
+	as_exp_destroy_b64(base64);
+	return py_base64;
+}
+
+// Pickled as CompiledExpression.from_bytes(packed).
+static PyObject *
+AerospikeCompiledExpression_Reduce(AerospikeCompiledExpression *self,
+								   PyObject *unused)
+{
+	PyObject *py_from_bytes =
+		PyObject_GetAttrString((PyObject *)Py_TYPE(self), "from_bytes");
+	if (!py_from_bytes) {
+		return NULL;
+	}
+
+	PyObject *py_bytes = AerospikeCompiledExpression_To_Bytes(self, NULL);
+	if (!py_bytes) {
+		Py_DECREF(py_from_bytes);
+		return NULL;
+	}
+
+	return Py_BuildValue("(N(N))", py_from_bytes, py_bytes);
+}
+
+PyDoc_STRVAR(from_bytes_doc, "from_bytes(packed) -> CompiledExpression\n\
+\n\
+Returns the expression of packed, as returned by to_bytes().");
+
+PyDoc_STRVAR(from_base64_doc, "from_base64(base64) -> CompiledExpression\n\
+\n\
+Returns the expression of a base64 str, as returned by to_base64() or get_expression_base64().");
+
+PyDoc_STRVAR(to_bytes_doc, "to_bytes() -> bytes\n\
+\n\
+Returns the packed expression.");
+
+PyDoc_STRVAR(to_base64_doc, "to_base64() -> str\n\
+\n\
+Returns the base64 representation of the packed expression.");
+
+static PyMethodDef AerospikeCompiledExpression_Type_Methods[] = {
+	{"from_bytes", (PyCFunction)AerospikeCompiledExpression_From_Bytes,
+	 METH_O | METH_CLASS, from_bytes_doc},
+	{"from_base64", (PyCFunction)AerospikeCompiledExpression_From_Base64,
+	 METH_O | METH_CLASS, from_base64_doc},
+	{"to_bytes", (PyCFunction)AerospikeCompiledExpression_To_Bytes,
+	 METH_NOARGS, to_bytes_doc},
+	{"to_base64", (PyCFunction)AerospikeCompiledExpression_To_Base64,
+	 METH_NOARGS, to_base64_doc},
+	{"__reduce__", (PyCFunction)AerospikeCompiledExpression_Reduce,
+	 METH_NOARGS, NULL},
+	{NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject *
+AerospikeCompiledExpression_Type_RichCompare(PyObject *py_left,
+											 PyObject *py_right, int op)
+{
+	if ((op != Py_EQ && op != Py_NE) ||
+		!AerospikeCompiledExpression_Check(py_right)) {
+		Py_RETURN_NOTIMPLEMENTED;
+	}
+
+	as_exp *left = ((AerospikeCompiledExpression *)py_left)->exp;
+	as_exp *right = ((AerospikeCompiledExpression *)py_right)->exp;
+	bool equal = left->packed_sz == right->packed_sz &&
+				 !memcmp(left->packed, right->packed, left->packed_sz);
+
+	if (equal == (op == Py_EQ)) {
+		Py_RETURN_TRUE;
+	}
+	Py_RETURN_FALSE;
+}
+
+static void
+AerospikeCompiledExpression_Type_Dealloc(AerospikeCompiledExpression *self)
+{
+	if (self->exp) {
+		as_exp_destroy(self->exp);
+	}
+
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeCompiledExpression_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.CompiledExpression",
+	.tp_basicsize = sizeof(AerospikeCompiledExpression),
+	.tp_dealloc = (destructor)AerospikeCompiledExpression_Type_Dealloc,
+	.tp_hash = PyObject_HashNotImplemented,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "Packed expression, accepted in place of a compiled expression\n"
+			  "list without being converted again.\n",
+	.tp_richcompare = AerospikeCompiledExpression_Type_RichCompare,
+	.tp_methods = AerospikeCompiledExpression_Type_Methods};
+
+PyTypeObject *AerospikeCompiledExpression_Ready()
+{
+	return PyType_Ready(&AerospikeCompiledExpression_Type) == 0
+			   ? &AerospikeCompiledExpression_Type
+			   : NULL;
+}
+
+bool AerospikeCompiledExpression_Check(PyObject *py_obj)
+{
+	return PyObject_TypeCheck(py_obj, &AerospikeCompiledExpression_Type);
+}
+
+PyObject *AerospikeCompiledExpression_New(as_exp *exp)
+{
+	AerospikeCompiledExpression *self = PyObject_New(
+		AerospikeCompiledExpression, &AerospikeCompiledExpression_Type);
+	if (!self) {
+		as_exp_destroy(exp);
+		return NULL;
+	}
+
+	self->exp = exp;
+	return (PyObject *)self;
+}
+
+as_exp *AerospikeCompiledExpression_Copy(PyObject *py_expression)
+{
+	as_exp *exp = ((AerospikeCompiledExpression *)py_expression)->exp;
+	return packed_exp_new((const char *)exp->packed, exp->packed_sz);
+}
@@ -0,0 +1,248 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_boolean.h>
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_val.h>
+
+#include "completion_queue.h"
+
+completion_queue *completion_queue_create(uint32_t capacity,
+										  PyObject *py_notify)
+{
+	completion_queue *queue = cf_malloc(sizeof(completion_queue));
+	pthread_mutex_init(&queue->lock, NULL);
+	queue->entries = cf_malloc(sizeof(completion_entry) * capacity);
+	queue->capacity = capacity;
+	queue->head = 0;
+	queue->size = 0;
+	queue->notify_pending = false;
+
+	if (py_notify == Py_None) {
+		py_notify = NULL;
+	}
+	Py_XINCREF(py_notify);
+	queue->notify = py_notify;
+
+	return queue;
+}
+
+void completion_queue_destroy(completion_queue *queue)
+{
+	// Pending callbacks still own Python references, deliver them instead of
+	// leaking them.
+	completion_queue_drain(queue, 0);
+
+	Py_XDECREF(queue->notify);
+	pthread_mutex_destroy(&queue->lock);
+	cf_free(queue->entries);
+	cf_free(queue);
+}
+
+bool completion_queue_push(completion_queue *queue,
+						   completion_deliver_fn deliver, as_error *err,
+						   void *result, void *udata)
+{
+	as_error *error = NULL;
+	bool notify = false;
+
+	if (err && err->code != AEROSPIKE_OK) {
+		error = cf_malloc(sizeof(as_error));
+		as_error_copy(error, err);
+	}
+
+	pthread_mutex_lock(&queue->lock);
+
+	if (queue->size == queue->capacity) {
+		pthread_mutex_unlock(&queue->lock);
+		if (error) {
+			cf_free(error);
+		}
+		return false;
+	}
+
+	completion_entry *entry =
+		&queue->entries[(queue->head + queue->size) % queue->capacity];
+	entry->deliver = deliver;
+	entry->error = error;
+	entry->result = result;
+	entry->udata = udata;
+	queue->size++;
+
+	if (queue->notify && !queue->notify_pending) {
+		queue->notify_pending = true;
+		notify = true;
+	}
+
+	pthread_mutex_unlock(&queue->lock);
+
+	if (notify) {
+		PyGILState_STATE gstate = PyGILState_Ensure();
+		PyObject *py_return = PyObject_CallObject(queue->notify, NULL);
+		if (!py_return) {
+			PyErr_WriteUnraisable(queue->notify);
+		}
+		else {
+			Py_DECREF(py_return);
+		}
+		PyGILState_Release(gstate);
+	}
+
+	return true;
+}
+
+uint32_t completion_queue_drain(completion_queue *queue, uint32_t max)
+{
+	uint32_t delivered = 0;
+	completion_entry entry;
+
+	while (max == 0 || delivered < max) {
+		pthread_mutex_lock(&queue->lock);
+
+		if (queue->size == 0) {
+			// Ask for a new notification with the next completion.
+			queue->notify_pending = false;
+			pthread_mutex_unlock(&queue->lock);
+			break;
+		}
+
+		entry = queue->entries[queue->head];
+		queue->head = (queue->head + 1) % queue->capacity;
+		queue->size--;
+
+		pthread_mutex_unlock(&queue->lock);
+
+		entry.deliver(entry.error, entry.result, entry.udata);
+		delivered++;
+
+		if (entry.error) {
+			cf_free(entry.error);
+		}
+	}
+
+	return delivered;
+}
+
+as_record *completion_record_copy(const as_record *rec)
+{
+	as_record *copy = as_record_new(rec->bins.size);
+	copy->gen = rec->gen;
+	copy->ttl = rec->ttl;
+
+	for (uint16_t i = 0; i < rec->bins.size; i++) {
+		as_bin *bin = &rec->bins.entries[i];
+		as_val *val = (as_val *)bin->valuep;
+
+		if (!val) {
+			as_record_set_nil(copy, bin->name);
+			continue;
+		}
+
+		// Values allocated on their own outlive the record once reserved,
+		// values stored inline in the bin have to be copied.
+		if ((void *)val != (void *)&bin->value) {
+			as_record_set(copy, bin->name, (as_bin_value *)as_val_reserve(val));
+			continue;
+		}
+
+		switch (as_val_type(val)) {
+		case AS_INTEGER:
+			as_record_set_int64(copy, bin->name, bin->value.integer.value);
+			break;
+		case AS_DOUBLE:
+			as_record_set_double(copy, bin->name, bin->value.dbl.value);
+			break;
+		case AS_STRING:
+			as_record_set_strp(copy, bin->name,
+							   cf_strdup(bin->value.string.value), true);
+			break;
+		case AS_GEOJSON:
+			as_record_set_geojson_strp(
+				copy, bin->name, cf_strdup(bin->value.geojson.value), true);
+			break;
+		case AS_BYTES: {
+			as_bytes *bytes = &bin->value.bytes;
+			uint8_t *value = cf_malloc(bytes->size);
+			memcpy(value, bytes->value, bytes->size);
+			as_record_set_raw_typep(copy, bin->name, value, bytes->size,
+									bytes->type, true);
+			break;
+		}
+		case AS_BOOLEAN:
+			as_record_set(copy, bin->name,
+						  (as_bin_value *)as_boolean_new(
+							  as_boolean_get((as_boolean *)val)));
+			break;
+		default:
+			as_record_set_nil(copy, bin->name);
+			break;
+		}
+	}
+
+	return copy;
+}
+
+void completion_key_copy(as_key *dst, const as_key *src)
+{
+	as_val *val = (as_val *)src->valuep;
+
+	switch (val ? as_val_type(val) : AS_UNDEF) {
+	case AS_INTEGER:
+		as_key_init_int64(dst, src->ns, src->set,
+						  as_integer_get((as_integer *)val));
+		break;
+	case AS_STRING:
+		as_key_init_strp(dst, src->ns, src->set,
+						 cf_strdup(as_string_get((as_string *)val)), true);
+		break;
+	case AS_BYTES: {
+		as_bytes *bytes = (as_bytes *)val;
+		uint8_t *value = cf_malloc(bytes->size);
+		memcpy(value, bytes->value, bytes->size);
+		as_key_init_rawp(dst, src->ns, src->set, value, bytes->size, true);
+		break;
+	}
+	default:
+		as_key_init_digest(dst, src->ns, src->set, src->digest.value);
+		break;
+	}
+
+	// Keep the digest sent by the server instead of hashing the key again.
+	memcpy(dst->digest.value, src->digest.value, AS_DIGEST_VALUE_SIZE);
+	dst->digest.init = src->digest.init;
+}
+
+static int completion_client_decref(void *py_client)
+{
+	Py_DECREF((PyObject *)py_client);
+	return 0;
+}
+
+void completion_client_release(PyObject *py_client)
+{
+	if (Py_REFCNT(py_client) > 1 ||
+		Py_AddPendingCall(completion_client_decref, py_client) == -1) {
+		Py_DECREF(py_client);
+	}
+}
@@ -38,6 +38,7 @@
 #include <aerospike/as_record_iterator.h>
 #include <aerospike/as_msgpack_ext.h>
 
+#include "batch_record.h"
 #include "conversions.h"
 #include "geo.h"
 #include "policy.h"
@@ -2757,25 +2758,7 @@ as_status as_batch_result_to_BatchRecord(AerospikeClient *self, as_error *err,
 										 as_batch_result *bres,
 										 PyObject *py_batch_record)
 {
-	as_status *result_code = &(bres->result);
-	as_record *result_rec = &(bres->record);
-	bool in_doubt = bres->in_doubt;
-
-	PyObject *py_res = PyLong_FromLong((long)*result_code);
-	PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT, py_res);
-	Py_DECREF(py_res);
-
-	PyObject *py_in_doubt = PyBool_FromLong((long)in_doubt);
-	PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_INDOUBT,
-						   py_in_doubt);
-	Py_DECREF(py_in_doubt);
-
-	if (*result_code == AEROSPIKE_OK) {
-		PyObject *rec = NULL;
-		record_to_pyobject(self, err, result_rec, bres->key, &rec);
-		PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD, rec);
-		Py_DECREF(rec);
-	}
-
-	return err->code;
+	return AerospikeBatchRecord_Set_Result(self, err, py_batch_record,
+										   bres->result, bres->in_doubt,
+										   &bres->record, bres->key);
 }
@@ -32,6 +32,8 @@
 #include "cdt_operation_utils.h"
 #include "geo.h"
 #include "cdt_types.h"
+#include "exp_cache.h"
+#include "compiled_expression.h"
 
 // EXPR OPS
 enum expr_ops {
@@ -1497,6 +1499,12 @@ as_status convert_exp_list(AerospikeClient *self, PyObject *py_exp_list,
 {
 	int bottom = 0;
 
+	// Packed by client.compile_expression(), only copied here.
+	if (py_exp_list && AerospikeCompiledExpression_Check(py_exp_list)) {
+		*exp_list = AerospikeCompiledExpression_Copy(py_exp_list);
+		return err->code;
+	}
+
 	if (py_exp_list == NULL || !PyList_Check(py_exp_list)) {
 		as_error_update(err, AEROSPIKE_ERR_PARAM,
 						"Expressions must be a non empty list of 4 element "
@@ -1512,6 +1520,10 @@ as_status convert_exp_list(AerospikeClient *self, PyObject *py_exp_list,
 		return err->code;
 	}
 
+	if (exp_cache_get(self, py_exp_list, exp_list)) {
+		return err->code;
+	}
+
 	int processed_exp_count = 0;
 	int size_to_alloc = 0;
 	bool ctx_in_use = false;
@@ -1669,6 +1681,7 @@ as_status convert_exp_list(AerospikeClient *self, PyObject *py_exp_list,
 	}
 
 	*exp_list = as_exp_compile(c_expr_entries, bottom);
+	exp_cache_put(self, py_exp_list, *exp_list);
 CLEANUP:
 	for (int i = 0; i < processed_exp_count; ++i) {
 		intermediate_expr *temp_expr = (intermediate_expr *)as_vector_get(
@@ -1716,6 +1729,7 @@ CLEANUP:
 	}
 
 	POOL_DESTROY(&static_pool);
+	POOL_RELEASE(&static_pool);
 	as_vector_destroy(unicodeStrVector);
 	return err->code;
 }
\ No newline at end of file
@@ -28,6 +28,85 @@
 
 static PyObject *module;
 
+// Status codes go from the client errors (negative) up to
+// AEROSPIKE_ERR_LUA_FILE_NOT_FOUND, index the classes by code - min.
+#define EXCEPTION_CODE_MIN -32
+#define EXCEPTION_CODE_MAX AEROSPIKE_ERR_LUA_FILE_NOT_FOUND
+#define EXCEPTION_TABLE_SIZE (EXCEPTION_CODE_MAX - EXCEPTION_CODE_MIN + 1)
+
+// Borrowed references, the module owns the classes.
+static PyObject *exception_table[EXCEPTION_TABLE_SIZE];
+static PyObject *aerospike_error;
+
+// Order of the fields in the tuple built by error_to_pyobject().
+static const char *error_fields[] = {"code", "msg", "file", "line",
+									 "in_doubt"};
+
+/**
+ * __init__ of AerospikeError, stores the error tuple on the instance.
+ * args is (self, code, msg, file, line, in_doubt), trailing items optional.
+ */
+static PyObject *AerospikeError_Init(PyObject *unused, PyObject *args)
+{
+	Py_ssize_t size = PyTuple_Size(args);
+	if (size < 1) {
+		PyErr_SetString(PyExc_TypeError,
+						"__init__ needs the exception instance");
+		return NULL;
+	}
+
+	PyObject *py_self = PyTuple_GetItem(args, 0);
+	PyObject *py_args = PyTuple_GetSlice(args, 1, size);
+	int rc = PyObject_SetAttrString(py_self, "args", py_args);
+	Py_DECREF(py_args);
+	if (rc == -1) {
+		return NULL;
+	}
+
+	size_t field_count = sizeof(error_fields) / sizeof(error_fields[0]);
+	for (Py_ssize_t i = 1; i < size && (size_t)i <= field_count; i++) {
+		if (PyObject_SetAttrString(py_self, error_fields[i - 1],
+								   PyTuple_GetItem(args, i)) == -1) {
+			return NULL;
+		}
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+static PyMethodDef AerospikeError_Init_Def = {
+	"__init__", (PyCFunction)AerospikeError_Init, METH_VARARGS, NULL};
+
+/**
+ * Maps every status code to the first exception class declaring it, in the
+ * order of the module dict, which is what the lookup used to return.
+ */
+static void build_exception_table(void)
+{
+	PyObject *py_key = NULL, *py_value = NULL;
+	Py_ssize_t pos = 0;
+	PyObject *py_module_dict = PyModule_GetDict(module);
+
+	memset(exception_table, 0, sizeof(exception_table));
+
+	while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
+		if (!PyExceptionClass_Check(py_value) ||
+			!PyObject_HasAttrString(py_value, "code")) {
+			continue;
+		}
+		PyObject *py_code = PyObject_GetAttrString(py_value, "code");
+		if (py_code != Py_None) {
+			long code = PyInt_AsLong(py_code);
+			if (code >= EXCEPTION_CODE_MIN && code <= EXCEPTION_CODE_MAX &&
+				!exception_table[code - EXCEPTION_CODE_MIN]) {
+				exception_table[code - EXCEPTION_CODE_MIN] = py_value;
+			}
+		}
+		Py_DECREF(py_code);
+	}
+}
+
 PyObject *AerospikeException_New(void)
 {
 	MOD_DEF(module, "aerospike.exception", "Exception objects", -1, NULL, NULL);
@@ -157,6 +236,14 @@ PyObject *AerospikeException_New(void)
 	PyDict_SetItemString(py_dict, "file", Py_None);
 	PyDict_SetItemString(py_dict, "msg", Py_None);
 	PyDict_SetItemString(py_dict, "line", Py_None);
+	PyDict_SetItemString(py_dict, "in_doubt", Py_None);
+
+	// The details of an error live on the instance, not on the class.
+	PyObject *py_init = PyCFunction_New(&AerospikeError_Init_Def, NULL);
+	PyObject *py_init_method = PyInstanceMethod_New(py_init);
+	PyDict_SetItemString(py_dict, "__init__", py_init_method);
+	Py_DECREF(py_init_method);
+	Py_DECREF(py_init);
 
 	exceptions_array.AerospikeError =
 		PyErr_NewException("exception.AerospikeError", NULL, py_dict);
@@ -532,6 +619,9 @@ PyObject *AerospikeException_New(void)
 	PyObject_SetAttrString(exceptions_array.QueryTimeout, "code", py_code);
 	Py_DECREF(py_code);
 
+	aerospike_error = exceptions_array.AerospikeError;
+	build_exception_table();
+
 	return module;
 }
 
@@ -541,6 +631,9 @@ void remove_exception(as_error *err)
 	Py_ssize_t pos = 0;
 	PyObject *py_module_dict = PyModule_GetDict(module);
 
+	memset(exception_table, 0, sizeof(exception_table));
+	aerospike_error = NULL;
+
 	while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
 		Py_DECREF(py_value);
 	}
@@ -548,58 +641,75 @@ void remove_exception(as_error *err)
 
 PyObject *raise_exception(as_error *err)
 {
-	PyObject *py_key = NULL, *py_value = NULL;
-	Py_ssize_t pos = 0;
-	PyObject *py_module_dict = PyModule_GetDict(module);
-	bool found = false;
+	PyObject *py_exception = NULL;
 
-	while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
-		if (PyObject_HasAttrString(py_value, "code")) {
-			PyObject *py_code = PyObject_GetAttrString(py_value, "code");
-			if (py_code == Py_None) {
-				continue;
-			}
-			if (err->code == PyInt_AsLong(py_code)) {
-				found = true;
-				PyObject *py_attr = NULL;
-				py_attr = PyString_FromString(err->message);
-				PyObject_SetAttrString(py_value, "msg", py_attr);
-				Py_DECREF(py_attr);
-
-				// as_error.file is a char* so this may be null
-				if (err->file) {
-					py_attr = PyString_FromString(err->file);
-					PyObject_SetAttrString(py_value, "file", py_attr);
-					Py_DECREF(py_attr);
-				}
-				else {
-					PyObject_SetAttrString(py_value, "file", Py_None);
-				}
-				// If the line is 0, set it as None
-				if (err->line > 0) {
-					py_attr = PyInt_FromLong(err->line);
-					PyObject_SetAttrString(py_value, "line", py_attr);
-					Py_DECREF(py_attr);
-				}
-				else {
-					PyObject_SetAttrString(py_value, "line", Py_None);
-				}
-
-				PyObject_SetAttrString(py_value, "in_doubt",
-									   PyBool_FromLong(err->in_doubt));
-
-				break;
-			}
-			Py_DECREF(py_code);
-		}
+	if (err->code >= EXCEPTION_CODE_MIN && err->code <= EXCEPTION_CODE_MAX) {
+		py_exception = exception_table[err->code - EXCEPTION_CODE_MIN];
 	}
+
 	// We haven't found the right exception, just use AerospikeError
-	if (!found) {
-		PyObject *base_exception =
-			PyDict_GetItemString(py_module_dict, "AerospikeError");
-		if (base_exception) {
-			py_value = base_exception;
-		}
+	if (!py_exception) {
+		py_exception = aerospike_error;
+	}
+	return py_exception;
+}
+
+static void set_exception_attr(PyObject *py_exception, const char *name,
+							   PyObject *py_attr)
+{
+	// Only the classes declaring the attribute get it, e.g. key for
+	// RecordError.
+	if (py_attr && PyObject_HasAttrString(py_exception, name)) {
+		PyObject_SetAttrString(py_exception, name, py_attr);
+	}
+}
+
+static PyObject *new_exception_instance(as_error *err, PyObject *py_key,
+										PyObject *py_bin, PyObject *py_module,
+										PyObject *py_func, PyObject *py_name)
+{
+	PyObject *py_err = NULL;
+	error_to_pyobject(err, &py_err);
+
+	PyObject *py_exception =
+		PyObject_Call(raise_exception(err), py_err, NULL);
+	Py_DECREF(py_err);
+	if (!py_exception) {
+		return NULL;
+	}
+
+	set_exception_attr(py_exception, "key", py_key);
+	set_exception_attr(py_exception, "bin", py_bin);
+	set_exception_attr(py_exception, "module", py_module);
+	set_exception_attr(py_exception, "func", py_func);
+	set_exception_attr(py_exception, "name", py_name);
+
+	return py_exception;
+}
+
+PyObject *create_pyexception(as_error *err, PyObject *py_key, PyObject *py_bin,
+							 PyObject *py_module, PyObject *py_func,
+							 PyObject *py_name)
+{
+	PyObject *py_exception = new_exception_instance(err, py_key, py_bin,
+													py_module, py_func, py_name);
+	if (!py_exception) {
+		// Callers hand the result to callbacks, never leave them with NULL.
+		PyErr_Clear();
+		py_exception = raise_exception(err);
+		Py_INCREF(py_exception);
+	}
+	return py_exception;
+}
+
+void raise_exception_base(as_error *err, PyObject *py_key, PyObject *py_bin,
+						  PyObject *py_module, PyObject *py_func,
+						  PyObject *py_name)
+{
+	PyObject *py_exception = new_exception_instance(err, py_key, py_bin,
+													py_module, py_func, py_name);
+	if (py_exception) {
+		PyErr_SetObject((PyObject *)Py_TYPE(py_exception), py_exception);
+		Py_DECREF(py_exception);
 	}
-	return py_value;
 }
@@ -0,0 +1,366 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <aerospike/as_exp.h>
+#include <citrusleaf/alloc.h>
+
+#include "cdt_types.h"
+#include "exp_cache.h"
+#include "macros.h"
+
+// Items of a cache entry tuple.
+#define EXP_CACHE_LIST 0
+#define EXP_CACHE_SNAPSHOT 1
+#define EXP_CACHE_PACKED 2
+
+// Fields of a cdt ctx, as read by get_cdt_ctx().
+static const char *exp_cache_ctx_fields[] = {"id", "value", "extra_args"};
+#define EXP_CACHE_CTX_FIELDS 3
+
+// Snapshot of a cdt ctx, its type followed by its fields.
+static PyStructSequence_Field exp_cache_ctx_type_fields[] = {
+	{"type", NULL}, {"id", NULL}, {"value", NULL}, {"extra_args", NULL}, {NULL}};
+
+static PyStructSequence_Desc exp_cache_ctx_type_desc = {
+	"aerospike._ExpCacheCtx", NULL, exp_cache_ctx_type_fields,
+	EXP_CACHE_CTX_FIELDS + 1};
+
+static PyTypeObject *exp_cache_ctx_type = NULL;
+
+int exp_cache_init(AerospikeClient *self, uint32_t size)
+{
+	self->exp_cache_size = size;
+	self->exp_cache = NULL;
+
+	if (!size) {
+		return 0;
+	}
+
+	if (!exp_cache_ctx_type) {
+		exp_cache_ctx_type = PyStructSequence_NewType(&exp_cache_ctx_type_desc);
+		if (!exp_cache_ctx_type) {
+			return -1;
+		}
+	}
+
+	self->exp_cache = PyDict_New();
+	return self->exp_cache ? 0 : -1;
+}
+
+// True if py_obj can't be changed in place, so a snapshot can share it.
+static bool exp_cache_is_immutable(PyObject *py_obj)
+{
+	return py_obj == Py_None || PyBool_Check(py_obj) ||
+		   PyLong_CheckExact(py_obj) || PyFloat_CheckExact(py_obj) ||
+		   PyUnicode_CheckExact(py_obj) || PyBytes_CheckExact(py_obj) ||
+		   !strcmp(py_obj->ob_type->tp_name, "aerospike.null") ||
+		   AS_Matches_Classname(py_obj, AS_CDT_WILDCARD_NAME) ||
+		   AS_Matches_Classname(py_obj, AS_CDT_INFINITE_NAME);
+}
+
+static PyObject *exp_cache_snapshot(PyObject *py_obj);
+
+// Returns a snapshot of the fields of a cdt ctx, or NULL, without an error
+// set, if py_obj doesn't have them.
+static PyObject *exp_cache_snapshot_ctx(PyObject *py_obj)
+{
+	PyObject *py_snapshot = PyStructSequence_New(exp_cache_ctx_type);
+	if (!py_snapshot) {
+		return NULL;
+	}
+
+	Py_INCREF(Py_TYPE(py_obj));
+	PyStructSequence_SET_ITEM(py_snapshot, 0, (PyObject *)Py_TYPE(py_obj));
+
+	for (int i = 0; i < EXP_CACHE_CTX_FIELDS; i++) {
+		PyObject *py_field =
+			PyObject_GetAttrString(py_obj, exp_cache_ctx_fields[i]);
+		PyObject *py_field_snapshot =
+			py_field ? exp_cache_snapshot(py_field) : NULL;
+
+		Py_XDECREF(py_field);
+		if (!py_field_snapshot) {
+			// Initialise the remaining items before freeing it.
+			for (int j = i + 1; j <= EXP_CACHE_CTX_FIELDS; j++) {
+				Py_INCREF(Py_None);
+				PyStructSequence_SET_ITEM(py_snapshot, j, Py_None);
+			}
+			Py_DECREF(py_snapshot);
+			return NULL;
+		}
+		PyStructSequence_SET_ITEM(py_snapshot, i + 1, py_field_snapshot);
+	}
+
+	return py_snapshot;
+}
+
+// Returns a copy of py_obj where lists, tuples, dicts and bytearrays are
+// copied all the way down, cdt ctx objects are replaced by a snapshot of their
+// fields and immutable values are shared. Returns NULL, maybe without an error
+// set, if py_obj holds any other value, such as a subclass of a container.
+static PyObject *exp_cache_snapshot(PyObject *py_obj)
+{
+	PyObject *py_copy = NULL;
+	bool is_container = PyList_CheckExact(py_obj) ||
+						PyTuple_CheckExact(py_obj) || PyDict_CheckExact(py_obj);
+
+	if (exp_cache_is_immutable(py_obj)) {
+		Py_INCREF(py_obj);
+		return py_obj;
+	}
+
+	if (PyByteArray_CheckExact(py_obj)) {
+		return PyByteArray_FromObject(py_obj);
+	}
+
+	if (!is_container && (PyList_Check(py_obj) || PyTuple_Check(py_obj) ||
+						  PyDict_Check(py_obj) || PyByteArray_Check(py_obj))) {
+		return NULL;
+	}
+
+	if (Py_EnterRecursiveCall(" in expression cache")) {
+		return NULL;
+	}
+
+	if (!is_container) {
+		py_copy = exp_cache_snapshot_ctx(py_obj);
+	}
+	else if (PyDict_CheckExact(py_obj)) {
+		Py_ssize_t pos = 0;
+		PyObject *py_key = NULL;
+		PyObject *py_value = NULL;
+
+		py_copy = PyDict_New();
+		while (py_copy && PyDict_Next(py_obj, &pos, &py_key, &py_value)) {
+			PyObject *py_value_copy = exp_cache_snapshot(py_value);
+			if (!py_value_copy ||
+				PyDict_SetItem(py_copy, py_key, py_value_copy) == -1) {
+				Py_XDECREF(py_value_copy);
+				Py_CLEAR(py_copy);
+				break;
+			}
+			Py_DECREF(py_value_copy);
+		}
+	}
+	else {
+		bool is_list = PyList_CheckExact(py_obj);
+		Py_ssize_t size = Py_SIZE(py_obj);
+
+		py_copy = is_list ? PyList_New(size) : PyTuple_New(size);
+		for (Py_ssize_t i = 0; py_copy && i < size; i++) {
+			PyObject *py_item = exp_cache_snapshot(
+				is_list ? PyList_GET_ITEM(py_obj, i)
+						: PyTuple_GET_ITEM(py_obj, i));
+			if (!py_item) {
+				Py_CLEAR(py_copy);
+			}
+			else if (is_list) {
+				PyList_SET_ITEM(py_copy, i, py_item);
+			}
+			else {
+				PyTuple_SET_ITEM(py_copy, i, py_item);
+			}
+		}
+	}
+
+	Py_LeaveRecursiveCall();
+	return py_copy;
+}
+
+// True if py_obj still matches py_snapshot, taken by exp_cache_snapshot().
+static bool exp_cache_snapshot_matches(PyObject *py_obj, PyObject *py_snapshot)
+{
+	if (Py_TYPE(py_snapshot) == exp_cache_ctx_type) {
+		if ((PyObject *)Py_TYPE(py_obj) !=
+			PyStructSequence_GET_ITEM(py_snapshot, 0)) {
+			return false;
+		}
+		for (int i = 0; i < EXP_CACHE_CTX_FIELDS; i++) {
+			PyObject *py_field =
+				PyObject_GetAttrString(py_obj, exp_cache_ctx_fields[i]);
+			bool matches =
+				py_field && exp_cache_snapshot_matches(
+								py_field,
+								PyStructSequence_GET_ITEM(py_snapshot, i + 1));
+
+			Py_XDECREF(py_field);
+			if (!matches) {
+				return false;
+			}
+		}
+		return true;
+	}
+
+	if (Py_TYPE(py_obj) != Py_TYPE(py_snapshot)) {
+		return false;
+	}
+
+	if (PyByteArray_CheckExact(py_snapshot)) {
+		Py_ssize_t size = PyByteArray_GET_SIZE(py_snapshot);
+		return PyByteArray_GET_SIZE(py_obj) == size &&
+			   !memcmp(PyByteArray_AS_STRING(py_obj),
+					   PyByteArray_AS_STRING(py_snapshot), size);
+	}
+
+	if (PyDict_CheckExact(py_snapshot)) {
+		Py_ssize_t pos = 0;
+		Py_ssize_t snapshot_pos = 0;
+		PyObject *py_key = NULL;
+		PyObject *py_value = NULL;
+		PyObject *py_snapshot_key = NULL;
+		PyObject *py_snapshot_value = NULL;
+
+		if (PyDict_Size(py_obj) != PyDict_Size(py_snapshot)) {
+			return false;
+		}
+		// The order is compared too, as it is the order of packed maps.
+		while (PyDict_Next(py_obj, &pos, &py_key, &py_value) &&
+			   PyDict_Next(py_snapshot, &snapshot_pos, &py_snapshot_key,
+						   &py_snapshot_value)) {
+			if (py_key != py_snapshot_key ||
+				!exp_cache_snapshot_matches(py_value, py_snapshot_value)) {
+				return false;
+			}
+		}
+		return true;
+	}
+
+	if (PyList_CheckExact(py_snapshot) || PyTuple_CheckExact(py_snapshot)) {
+		bool is_list = PyList_CheckExact(py_snapshot);
+		Py_ssize_t size = Py_SIZE(py_snapshot);
+
+		if (Py_SIZE(py_obj) != size) {
+			return false;
+		}
+		for (Py_ssize_t i = 0; i < size; i++) {
+			if (!exp_cache_snapshot_matches(
+					is_list ? PyList_GET_ITEM(py_obj, i)
+							: PyTuple_GET_ITEM(py_obj, i),
+					is_list ? PyList_GET_ITEM(py_snapshot, i)
+							: PyTuple_GET_ITEM(py_snapshot, i))) {
+				return false;
+			}
+		}
+		return true;
+	}
+
+	// Immutable values are shared by the snapshot.
+	return py_obj == py_snapshot;
+}
+
+// True if py_exp_list is the list of the entry and was not changed since.
+static bool exp_cache_entry_matches(PyObject *py_entry, PyObject *py_exp_list)
+{
+	return PyTuple_GET_ITEM(py_entry, EXP_CACHE_LIST) == py_exp_list &&
+		   exp_cache_snapshot_matches(
+			   py_exp_list, PyTuple_GET_ITEM(py_entry, EXP_CACHE_SNAPSHOT));
+}
+
+bool exp_cache_get(AerospikeClient *self, PyObject *py_exp_list,
+				   as_exp **exp_list)
+{
+	if (!self || !self->exp_cache) {
+		return false;
+	}
+
+	PyObject *py_id = PyLong_FromVoidPtr(py_exp_list);
+	if (!py_id) {
+		PyErr_Clear();
+		return false;
+	}
+
+	bool found = false;
+	PyObject *py_entry = PyDict_GetItem(self->exp_cache, py_id);
+
+	if (py_entry && exp_cache_entry_matches(py_entry, py_exp_list)) {
+		PyObject *py_packed = PyTuple_GET_ITEM(py_entry, EXP_CACHE_PACKED);
+		Py_ssize_t packed_sz = PyBytes_GET_SIZE(py_packed);
+
+		as_exp *exp = cf_malloc(sizeof(as_exp) + packed_sz);
+		exp->packed_sz = (uint32_t)packed_sz;
+		memcpy(exp->packed, PyBytes_AS_STRING(py_packed), packed_sz);
+		*exp_list = exp;
+		found = true;
+
+		// Move the entry to the end, as the most recently used.
+		Py_INCREF(py_entry);
+		PyDict_DelItem(self->exp_cache, py_id);
+		PyDict_SetItem(self->exp_cache, py_id, py_entry);
+		Py_DECREF(py_entry);
+	}
+	else if (py_entry) {
+		// The list was changed since it was cached.
+		PyDict_DelItem(self->exp_cache, py_id);
+	}
+
+	Py_DECREF(py_id);
+	PyErr_Clear();
+	return found;
+}
+
+void exp_cache_put(AerospikeClient *self, PyObject *py_exp_list,
+				   as_exp *exp_list)
+{
+	PyObject *py_id = NULL;
+	PyObject *py_snapshot = NULL;
+	PyObject *py_packed = NULL;
+	PyObject *py_entry = NULL;
+
+	if (!self || !self->exp_cache || !exp_list) {
+		return;
+	}
+
+	// Evict the least recently used entry, the first in the dict.
+	if (PyDict_Size(self->exp_cache) >= (Py_ssize_t)self->exp_cache_size) {
+		Py_ssize_t pos = 0;
+		PyObject *py_oldest = NULL;
+		if (PyDict_Next(self->exp_cache, &pos, &py_oldest, NULL)) {
+			Py_INCREF(py_oldest);
+			PyDict_DelItem(self->exp_cache, py_oldest);
+			Py_DECREF(py_oldest);
+		}
+	}
+
+	py_id = PyLong_FromVoidPtr(py_exp_list);
+	py_snapshot = exp_cache_snapshot(py_exp_list);
+	py_packed = PyBytes_FromStringAndSize((const char *)exp_list->packed,
+										  exp_list->packed_sz);
+	if (!py_id || !py_snapshot || !py_packed) {
+		goto CLEANUP;
+	}
+
+	py_entry = PyTuple_Pack(3, py_exp_list, py_snapshot, py_packed);
+	if (py_entry) {
+		PyDict_SetItem(self->exp_cache, py_id, py_entry);
+	}
+
+CLEANUP:
+	Py_XDECREF(py_entry);
+	Py_XDECREF(py_packed);
+	Py_XDECREF(py_snapshot);
+	Py_XDECREF(py_id);
+	PyErr_Clear();
+}
+
+void exp_cache_destroy(AerospikeClient *self)
+{
+	Py_CLEAR(self->exp_cache);
+}
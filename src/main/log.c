@@ -15,10 +15,12 @@
  ******************************************************************************/
 
 #include <Python.h>
+#include <sched.h>
 #include <stdbool.h>
 
 #include <aerospike/as_error.h>
 #include <aerospike/as_log.h>
+#include <citrusleaf/alloc.h>
 
 #include "client.h"
 #include "conversions.h"
@@ -27,6 +29,47 @@
 
 static AerospikeLogCallback user_callback;
 
+// The callback installed by set_log_handler(), restored when the log buffer is disabled.
+static as_log_callback handler_cb = NULL;
+
+#define LOG_RECORD_MSG_SIZE 1024
+
+// Largest log buffer, in records.
+#define LOG_BUFFER_MAX_SIZE (1 << 16)
+
+/*
+ * A slot of the log ring buffer. sequence tells whether the slot is free for
+ * the writer at position sequence, or holds the record at position
+ * sequence - 1 for the reader.
+ */
+typedef struct log_record_s {
+	size_t sequence;
+	as_log_level level;
+	uint32_t line;
+	// The C client passes __func__ and __FILE__, which have static storage.
+	const char *func;
+	const char *file;
+	char msg[LOG_RECORD_MSG_SIZE];
+} log_record;
+
+/*
+ * Bounded multi producer ring buffer of log records. Log lines are written
+ * by C client threads without taking the GIL or any lock, and read by
+ * drain_logs() under the GIL.
+ */
+typedef struct log_ring_s {
+	log_record *records;
+	size_t mask;
+	size_t enqueue_pos;
+	size_t dequeue_pos;
+	size_t dropped;
+} log_ring;
+
+static log_ring *ring = NULL;
+
+// C client threads inside ring_log_cb(), which may be using the ring.
+static size_t ring_writers = 0;
+
 /*
  * Declare's log level constants.
  */
@@ -175,6 +218,235 @@ static bool log_cb(as_log_level level, const char *func, const char *file,
 	return true;
 }
 
+static void ring_log_write(log_ring *r, as_log_level level, const char *func,
+						   const char *file, uint32_t line, const char *fmt,
+						   va_list ap)
+{
+	log_record *record = NULL;
+	size_t pos = __atomic_load_n(&r->enqueue_pos, __ATOMIC_RELAXED);
+
+	while (true) {
+		record = &r->records[pos & r->mask];
+		size_t sequence = __atomic_load_n(&record->sequence, __ATOMIC_ACQUIRE);
+		intptr_t diff = (intptr_t)sequence - (intptr_t)pos;
+
+		if (diff == 0) {
+			if (__atomic_compare_exchange_n(&r->enqueue_pos, &pos, pos + 1,
+											true, __ATOMIC_RELAXED,
+											__ATOMIC_RELAXED)) {
+				break;
+			}
+		}
+		else if (diff < 0) {
+			// Full, drop the record rather than wait for a drain.
+			__atomic_fetch_add(&r->dropped, 1, __ATOMIC_RELAXED);
+			return;
+		}
+		else {
+			pos = __atomic_load_n(&r->enqueue_pos, __ATOMIC_RELAXED);
+		}
+	}
+
+	vsnprintf(record->msg, LOG_RECORD_MSG_SIZE, fmt, ap);
+
+	record->level = level;
+	record->func = func;
+	record->file = file;
+	record->line = line;
+
+	__atomic_store_n(&record->sequence, pos + 1, __ATOMIC_RELEASE);
+}
+
+static bool ring_log_cb(as_log_level level, const char *func,
+						const char *file, uint32_t line, const char *fmt, ...)
+{
+	// Counted before the ring is loaded, so that a replaced ring is only
+	// freed once no thread can be using it.
+	__atomic_fetch_add(&ring_writers, 1, __ATOMIC_SEQ_CST);
+
+	log_ring *r = __atomic_load_n(&ring, __ATOMIC_SEQ_CST);
+	if (r) {
+		va_list ap;
+		va_start(ap, fmt);
+		ring_log_write(r, level, func, file, line, fmt, ap);
+		va_end(ap);
+	}
+
+	__atomic_fetch_sub(&ring_writers, 1, __ATOMIC_RELEASE);
+	return true;
+}
+
+// Rounds size up to a power of two, so positions wrap with a mask.
+static size_t log_ring_capacity(size_t size)
+{
+	size_t capacity = 1;
+	while (capacity < size) {
+		capacity <<= 1;
+	}
+	return capacity;
+}
+
+static log_ring *log_ring_new(size_t capacity)
+{
+	log_ring *r = cf_malloc(sizeof(log_ring));
+	if (!r) {
+		return NULL;
+	}
+	r->records = cf_malloc(capacity * sizeof(log_record));
+	if (!r->records) {
+		cf_free(r);
+		return NULL;
+	}
+	r->mask = capacity - 1;
+	r->enqueue_pos = 0;
+	r->dequeue_pos = 0;
+	r->dropped = 0;
+
+	for (size_t i = 0; i < capacity; i++) {
+		r->records[i].sequence = i;
+	}
+
+	return r;
+}
+
+static void log_ring_free(log_ring *r)
+{
+	cf_free(r->records);
+	cf_free(r);
+}
+
+PyObject *Aerospike_Set_Log_Buffer(PyObject *parent, PyObject *args,
+								   PyObject *kwds)
+{
+	as_error err;
+	as_error_init(&err);
+
+	PyObject *py_buffer_size = NULL;
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"buffer_size", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "O:set_log_buffer", kwlist,
+									&py_buffer_size) == false) {
+		return NULL;
+	}
+
+	long buffer_size = -1;
+	if (PyLong_Check(py_buffer_size) && !PyBool_Check(py_buffer_size)) {
+		buffer_size = PyLong_AsLong(py_buffer_size);
+		if (buffer_size == -1 && PyErr_Occurred()) {
+			PyErr_Clear();
+		}
+	}
+
+	if (buffer_size < 0 || buffer_size > LOG_BUFFER_MAX_SIZE) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"buffer_size should be an int from 0 to 65536");
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	as_log_callback restore_cb =
+		handler_cb ? handler_cb : (as_log_callback)console_log_cb;
+
+	if (buffer_size == 0) {
+		// Records already in the buffer can still be drained.
+		as_log_set_callback(restore_cb);
+		return PyLong_FromLong(0);
+	}
+
+	log_ring *old = __atomic_load_n(&ring, __ATOMIC_ACQUIRE);
+	size_t capacity = log_ring_capacity((size_t)buffer_size);
+
+	// A buffer of the same capacity is kept, with its records.
+	if (!old || old->mask + 1 != capacity) {
+		log_ring *r = log_ring_new(capacity);
+		if (!r) {
+			as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+							"Unable to allocate the log buffer");
+			raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+			return NULL;
+		}
+
+		/*
+		 * Log to the handler while the ring is replaced, so that only the
+		 * threads already in ring_log_cb() are waited for. Those which load
+		 * the ring from now on see NULL. Drains hold the GIL, as this does.
+		 */
+		as_log_set_callback(restore_cb);
+		__atomic_store_n(&ring, NULL, __ATOMIC_SEQ_CST);
+		while (__atomic_load_n(&ring_writers, __ATOMIC_SEQ_CST)) {
+			sched_yield();
+		}
+		if (old) {
+			log_ring_free(old);
+		}
+		__atomic_store_n(&ring, r, __ATOMIC_RELEASE);
+	}
+
+	as_log_set_callback((as_log_callback)ring_log_cb);
+
+	return PyLong_FromLong(0);
+}
+
+PyObject *Aerospike_Drain_Logs(PyObject *parent, PyObject *args,
+							   PyObject *kwds)
+{
+	long max_records = 0;
+
+	// Python Function Keyword Arguments
+	static char *kwlist[] = {"max_records", NULL};
+
+	// Python Function Argument Parsing
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|l:drain_logs", kwlist,
+									&max_records) == false) {
+		return NULL;
+	}
+
+	PyObject *py_records = PyList_New(0);
+	if (!py_records) {
+		return NULL;
+	}
+
+	log_ring *r = __atomic_load_n(&ring, __ATOMIC_ACQUIRE);
+	size_t dropped = 0;
+
+	// Readers are serialized by the GIL, so there is a single reader.
+	while (r && (max_records <= 0 || PyList_GET_SIZE(py_records) < max_records)) {
+		size_t pos = r->dequeue_pos;
+		log_record *record = &r->records[pos & r->mask];
+		size_t sequence = __atomic_load_n(&record->sequence, __ATOMIC_ACQUIRE);
+
+		if (sequence != pos + 1) {
+			// Empty, or the next record is still being written.
+			break;
+		}
+
+		PyObject *py_record = Py_BuildValue(
+			"(lssIN)", (long)record->level, record->func ? record->func : "",
+			record->file ? record->file : "", record->line,
+			PyUnicode_DecodeUTF8(record->msg, strlen(record->msg), "replace"));
+
+		r->dequeue_pos = pos + 1;
+		__atomic_store_n(&record->sequence, pos + r->mask + 1,
+						 __ATOMIC_RELEASE);
+
+		if (!py_record || PyList_Append(py_records, py_record) == -1) {
+			Py_XDECREF(py_record);
+			Py_DECREF(py_records);
+			return NULL;
+		}
+		Py_DECREF(py_record);
+	}
+
+	if (r) {
+		dropped = __atomic_exchange_n(&r->dropped, 0, __ATOMIC_RELAXED);
+	}
+
+	return Py_BuildValue("(Nn)", py_records, (Py_ssize_t)dropped);
+}
+
 PyObject *Aerospike_Set_Log_Handler(PyObject *parent, PyObject *args,
 									PyObject *kwds)
 {
@@ -195,12 +467,13 @@ PyObject *Aerospike_Set_Log_Handler(PyObject *parent, PyObject *args,
 		user_callback.callback = py_callback;
 
 		// Register callback to C-SDK
-		as_log_set_callback((as_log_callback)log_cb);
+		handler_cb = (as_log_callback)log_cb;
 	}
 	else {
 		// Register callback to C-SDK
-		as_log_set_callback((as_log_callback)console_log_cb);
+		handler_cb = (as_log_callback)console_log_cb;
 	}
+	as_log_set_callback(handler_cb);
 
 	return PyLong_FromLong(0);
 }
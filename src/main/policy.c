@@ -32,6 +32,9 @@
 #include "conversions.h"
 #include "policy.h"
 #include "macros.h"
+#include "results_queue.h"
+#include "policy_object.h"
+#include "record_cache.h"
 
 #define MAP_WRITE_FLAGS_KEY "map_write_flags"
 #define BIT_WRITE_FLAGS_KEY "bit_write_flags"
@@ -49,6 +52,13 @@
 
 #define POLICY_UPDATE() *policy_p = policy;
 
+#define POLICY_FROM_COMPILED(__policy, __kind, __filter_exp, __exp_list_p)    \
+	if (py_policy && AerospikePolicy_Check(py_policy)) {                       \
+		return AerospikePolicy_Copy(err, py_policy, __kind, policy,            \
+									(void **)policy_p, sizeof(__policy),       \
+									__filter_exp, __exp_list_p);               \
+	}
+
 #define POLICY_SET_FIELD(__field, __type)                                      \
 	{                                                                          \
 		PyObject *py_field = PyDict_GetItemString(py_policy, #__field);        \
@@ -173,6 +183,8 @@ static AerospikeConstants aerospike_constants[] = {
 	{SEND_BOOL_AS_PY_BYTES, "PY_BYTES"},
 	{SEND_BOOL_AS_INTEGER, "INTEGER"},
 	{SEND_BOOL_AS_AS_BOOL, "AS_BOOL"},
+	{RECORD_CACHE_POLICY_LRU, "CACHE_POLICY_LRU"},
+	{RECORD_CACHE_POLICY_LFU, "CACHE_POLICY_LFU"},
 	{AS_INDEX_STRING, "INDEX_STRING"},
 	{AS_INDEX_NUMERIC, "INDEX_NUMERIC"},
 	{AS_INDEX_GEO2DSPHERE, "INDEX_GEO2DSPHERE"},
@@ -524,6 +536,13 @@ void set_scan_options(as_error *err, as_scan *scan_p, PyObject *py_options)
 					break;
 				}
 			}
+			else if (strcmp("compact_records", key_name) == 0 ||
+					 strcmp("chunk_size", key_name) == 0 ||
+					 strcmp("queue_size", key_name) == 0) {
+				// Only change how the results are delivered, see
+				// get_compact_records() and get_chunk_options().
+				continue;
+			}
 			else {
 				as_error_update(err, AEROSPIKE_ERR_PARAM,
 								"Invalid value for scan options");
@@ -559,6 +578,102 @@ as_status set_query_options(as_error *err, PyObject *query_options,
 	}
 	return AEROSPIKE_OK;
 }
+/**
+ * Reads the compact_records option of query and scan results.
+ */
+as_status get_compact_records(as_error *err, PyObject *py_options,
+							  bool *compact_records)
+{
+	*compact_records = false;
+
+	if (!py_options || !PyDict_Check(py_options)) {
+		return AEROSPIKE_OK;
+	}
+
+	PyObject *py_compact = PyDict_GetItemString(py_options, "compact_records");
+	if (py_compact) {
+		if (!PyBool_Check(py_compact)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "compact_records value must be a bool");
+		}
+		*compact_records = (Py_True == py_compact);
+	}
+	return AEROSPIKE_OK;
+}
+
+static as_status get_uint32_option(as_error *err, PyObject *py_options,
+								   const char *name, uint32_t *value)
+{
+	PyObject *py_value = PyDict_GetItemString(py_options, name);
+	if (!py_value) {
+		return AEROSPIKE_OK;
+	}
+
+	if (!PyInt_Check(py_value) && !PyLong_Check(py_value)) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "%s value must be an integer", name);
+	}
+
+	long long val = PyLong_AsLongLong(py_value);
+	if (PyErr_Occurred() || val <= 0 || val > UINT32_MAX) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "%s value must be a positive 32 bit integer",
+							   name);
+	}
+
+	*value = (uint32_t)val;
+	return AEROSPIKE_OK;
+}
+
+/**
+ * Reads the chunk_size and queue_size options of query and scan foreach.
+ * chunk_size is 0 when the callback is invoked for each record.
+ */
+as_status get_chunk_options(as_error *err, PyObject *py_options,
+							uint32_t *chunk_size, uint32_t *queue_size)
+{
+	*chunk_size = 0;
+	*queue_size = RESULTS_QUEUE_DEFAULT_CAPACITY;
+
+	if (!py_options || !PyDict_Check(py_options)) {
+		return AEROSPIKE_OK;
+	}
+
+	if (get_uint32_option(err, py_options, "chunk_size", chunk_size) !=
+		AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	if (get_uint32_option(err, py_options, "queue_size", queue_size) !=
+		AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	return AEROSPIKE_OK;
+}
+
+/**
+ * Reads the max_keys_per_batch batch policy, 0 when the keys are not split
+ * into sub-batches. It is not part of as_policy_batch.
+ */
+as_status get_max_keys_per_batch(as_error *err, PyObject *py_policy,
+								 uint32_t *max_keys)
+{
+	*max_keys = 0;
+
+	if (py_policy && AerospikePolicy_Check(py_policy)) {
+		AerospikePolicy_Max_Keys_Per_Batch(py_policy, max_keys);
+		return AEROSPIKE_OK;
+	}
+
+	if (!py_policy || !PyDict_Check(py_policy)) {
+		return AEROSPIKE_OK;
+	}
+
+	return get_uint32_option(err, py_policy, "max_keys_per_batch", max_keys);
+}
+
 /**
  * Declares policy constants.
  */
@@ -598,6 +713,9 @@ as_status pyobject_to_policy_admin(AerospikeClient *self, as_error *err,
 								   as_policy_admin *config_admin_policy)
 {
 
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_admin, POLICY_KIND_ADMIN, NULL, NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_admin);
@@ -627,6 +745,11 @@ as_status pyobject_to_policy_apply(AerospikeClient *self, as_error *err,
 								   as_policy_apply *config_apply_policy,
 								   as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_apply, POLICY_KIND_APPLY,
+						 &policy->base.filter_exp,
+						 exp_list ? exp_list_p : NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_apply);
@@ -671,6 +794,9 @@ as_status pyobject_to_policy_info(as_error *err, PyObject *py_policy,
 								  as_policy_info **policy_p,
 								  as_policy_info *config_info_policy)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_info, POLICY_KIND_INFO, NULL, NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_info);
@@ -703,6 +829,11 @@ as_status pyobject_to_policy_query(AerospikeClient *self, as_error *err,
 								   as_policy_query *config_query_policy,
 								   as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_query, POLICY_KIND_QUERY,
+						 &policy->base.filter_exp,
+						 exp_list ? exp_list_p : NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_query);
@@ -746,6 +877,11 @@ as_status pyobject_to_policy_read(AerospikeClient *self, as_error *err,
 								  as_policy_read *config_read_policy,
 								  as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_read, POLICY_KIND_READ,
+						 &policy->base.filter_exp,
+						 exp_list ? exp_list_p : NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_read);
@@ -795,6 +931,11 @@ as_status pyobject_to_policy_remove(AerospikeClient *self, as_error *err,
 									as_policy_remove *config_remove_policy,
 									as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_remove, POLICY_KIND_REMOVE,
+						 &policy->base.filter_exp,
+						 exp_list ? exp_list_p : NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_remove);
@@ -842,6 +983,11 @@ as_status pyobject_to_policy_scan(AerospikeClient *self, as_error *err,
 								  as_policy_scan *config_scan_policy,
 								  as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_scan, POLICY_KIND_SCAN,
+						 &policy->base.filter_exp,
+						 exp_list ? exp_list_p : NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_scan);
@@ -886,6 +1032,11 @@ as_status pyobject_to_policy_write(AerospikeClient *self, as_error *err,
 								   as_policy_write *config_write_policy,
 								   as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_write, POLICY_KIND_WRITE,
+						 &policy->base.filter_exp,
+						 exp_list ? exp_list_p : NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_write);
@@ -935,6 +1086,11 @@ as_status pyobject_to_policy_operate(AerospikeClient *self, as_error *err,
 									 as_policy_operate *config_operate_policy,
 									 as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_operate, POLICY_KIND_OPERATE,
+						 &policy->base.filter_exp,
+						 exp_list ? exp_list_p : NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_operate);
@@ -986,6 +1142,11 @@ as_status pyobject_to_policy_batch(AerospikeClient *self, as_error *err,
 								   as_policy_batch *config_batch_policy,
 								   as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_batch, POLICY_KIND_BATCH,
+						 &policy->base.filter_exp,
+						 exp_list ? exp_list_p : NULL);
+
 	if(py_policy && py_policy != Py_None) {
 		// Initialize Policy
 		POLICY_INIT(as_policy_batch);
@@ -1033,6 +1194,10 @@ as_status pyobject_to_batch_write_policy(AerospikeClient *self, as_error *err,
 										 as_policy_batch_write **policy_p,
 										 as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_batch_write, POLICY_KIND_BATCH_WRITE,
+						 &policy->filter_exp, exp_list_p);
+
 	POLICY_INIT(as_policy_batch_write);
 
 	// Set policy fields
@@ -1058,6 +1223,10 @@ as_status pyobject_to_batch_read_policy(AerospikeClient *self, as_error *err,
 										as_policy_batch_read **policy_p,
 										as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_batch_read, POLICY_KIND_BATCH_READ,
+						 &policy->filter_exp, exp_list_p);
+
 	POLICY_INIT(as_policy_batch_read);
 
 	// Set policy fields
@@ -1080,6 +1249,10 @@ as_status pyobject_to_batch_apply_policy(AerospikeClient *self, as_error *err,
 										 as_policy_batch_apply **policy_p,
 										 as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_batch_apply, POLICY_KIND_BATCH_APPLY,
+						 &policy->filter_exp, exp_list_p);
+
 	POLICY_INIT(as_policy_batch_apply);
 
 	// Set policy fields
@@ -1104,6 +1277,10 @@ as_status pyobject_to_batch_remove_policy(AerospikeClient *self, as_error *err,
 										  as_policy_batch_remove **policy_p,
 										  as_exp *exp_list, as_exp **exp_list_p)
 {
+	// Policy converted by compile_policy()
+	POLICY_FROM_COMPILED(as_policy_batch_remove, POLICY_KIND_BATCH_REMOVE,
+						 &policy->filter_exp, exp_list_p);
+
 	POLICY_INIT(as_policy_batch_remove);
 
 	// Set policy fields
@@ -0,0 +1,310 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+#include <aerospike/as_policy.h>
+#include <citrusleaf/alloc.h>
+
+#include "conversions.h"
+#include "macros.h"
+#include "policy.h"
+#include "policy_object.h"
+
+static PyTypeObject AerospikePolicy_Type;
+
+/*
+ * Mapping of policy kind to the name compile_policy() takes.
+ */
+static const struct {
+	aerospike_policy_kind kind;
+	const char *name;
+} policy_kind_names[] = {{POLICY_KIND_READ, "read"},
+						 {POLICY_KIND_WRITE, "write"},
+						 {POLICY_KIND_APPLY, "apply"},
+						 {POLICY_KIND_REMOVE, "remove"},
+						 {POLICY_KIND_OPERATE, "operate"},
+						 {POLICY_KIND_QUERY, "query"},
+						 {POLICY_KIND_SCAN, "scan"},
+						 {POLICY_KIND_BATCH, "batch"},
+						 {POLICY_KIND_BATCH_WRITE, "batch_write"},
+						 {POLICY_KIND_BATCH_READ, "batch_read"},
+						 {POLICY_KIND_BATCH_APPLY, "batch_apply"},
+						 {POLICY_KIND_BATCH_REMOVE, "batch_remove"},
+						 {POLICY_KIND_INFO, "info"},
+						 {POLICY_KIND_ADMIN, "admin"}};
+
+#define POLICY_KIND_NAMES_SIZE                                                 \
+	(sizeof(policy_kind_names) / sizeof(policy_kind_names[0]))
+
+static const char *policy_kind_name(aerospike_policy_kind kind)
+{
+	for (size_t i = 0; i < POLICY_KIND_NAMES_SIZE; i++) {
+		if (policy_kind_names[i].kind == kind) {
+			return policy_kind_names[i].name;
+		}
+	}
+	return NULL;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject *AerospikePolicy_Get_Kind(AerospikePolicy *self,
+										  void *closure)
+{
+	return PyString_FromString(policy_kind_name(self->kind));
+}
+
+static PyGetSetDef AerospikePolicy_Type_GetSet[] = {
+	{"kind", (getter)AerospikePolicy_Get_Kind, NULL,
+	 "Kind of the policy, as passed to compile_policy().", NULL},
+	{NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject *AerospikePolicy_Type_Repr(AerospikePolicy *self)
+{
+	return PyUnicode_FromFormat("<aerospike.Policy kind='%s'>",
+							   policy_kind_name(self->kind));
+}
+
+static void AerospikePolicy_Type_Dealloc(AerospikePolicy *self)
+{
+	if (self->exp) {
+		as_exp_destroy(self->exp);
+	}
+
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikePolicy_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.Policy",
+	.tp_basicsize = sizeof(AerospikePolicy),
+	.tp_dealloc = (destructor)AerospikePolicy_Type_Dealloc,
+	.tp_repr = (reprfunc)AerospikePolicy_Type_Repr,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "Policy converted once by compile_policy(), accepted in place\n"
+			  "of a policy dict of the same kind.\n",
+	.tp_getset = AerospikePolicy_Type_GetSet};
+
+PyTypeObject *AerospikePolicy_Ready()
+{
+	return PyType_Ready(&AerospikePolicy_Type) == 0 ? &AerospikePolicy_Type
+													: NULL;
+}
+
+bool AerospikePolicy_Check(PyObject *py_obj)
+{
+	return PyObject_TypeCheck(py_obj, &AerospikePolicy_Type);
+}
+
+static as_status policy_kind_from_pyobject(as_error *err, PyObject *py_kind,
+										   aerospike_policy_kind *kind)
+{
+	if (PyString_Check(py_kind)) {
+		const char *name = PyString_AsString(py_kind);
+		for (size_t i = 0; i < POLICY_KIND_NAMES_SIZE; i++) {
+			if (!strcmp(policy_kind_names[i].name, name)) {
+				*kind = policy_kind_names[i].kind;
+				return AEROSPIKE_OK;
+			}
+		}
+	}
+
+	return as_error_update(err, AEROSPIKE_ERR_PARAM,
+						   "kind must be the name of a policy kind");
+}
+
+AerospikePolicy *AerospikePolicy_New(AerospikeClient *client, as_error *err,
+									 PyObject *py_kind, PyObject *py_policy)
+{
+	aerospike_policy_kind kind;
+	as_policies *defaults = &client->as->config.policies;
+	as_exp exp_list;
+	void *policy_p = NULL;
+
+	if (policy_kind_from_pyobject(err, py_kind, &kind) != AEROSPIKE_OK) {
+		return NULL;
+	}
+
+	if (py_policy && AerospikePolicy_Check(py_policy)) {
+		as_error_update(err, AEROSPIKE_ERR_PARAM, "policy must be a dict");
+		return NULL;
+	}
+
+	AerospikePolicy *self =
+		PyObject_New(AerospikePolicy, &AerospikePolicy_Type);
+	if (!self) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to allocate policy");
+		return NULL;
+	}
+
+	self->kind = kind;
+	self->exp = NULL;
+	self->max_keys_per_batch = 0;
+
+	switch (kind) {
+	case POLICY_KIND_READ:
+		pyobject_to_policy_read(client, err, py_policy, &self->policy.read,
+								(as_policy_read **)&policy_p, &defaults->read,
+								&exp_list, &self->exp);
+		break;
+	case POLICY_KIND_WRITE:
+		pyobject_to_policy_write(client, err, py_policy, &self->policy.write,
+								 (as_policy_write **)&policy_p,
+								 &defaults->write, &exp_list, &self->exp);
+		break;
+	case POLICY_KIND_APPLY:
+		pyobject_to_policy_apply(client, err, py_policy, &self->policy.apply,
+								 (as_policy_apply **)&policy_p,
+								 &defaults->apply, &exp_list, &self->exp);
+		break;
+	case POLICY_KIND_REMOVE:
+		pyobject_to_policy_remove(client, err, py_policy, &self->policy.remove,
+								  (as_policy_remove **)&policy_p,
+								  &defaults->remove, &exp_list, &self->exp);
+		break;
+	case POLICY_KIND_OPERATE:
+		pyobject_to_policy_operate(client, err, py_policy,
+								   &self->policy.operate,
+								   (as_policy_operate **)&policy_p,
+								   &defaults->operate, &exp_list, &self->exp);
+		break;
+	case POLICY_KIND_QUERY:
+		pyobject_to_policy_query(client, err, py_policy, &self->policy.query,
+								 (as_policy_query **)&policy_p,
+								 &defaults->query, &exp_list, &self->exp);
+		break;
+	case POLICY_KIND_SCAN:
+		pyobject_to_policy_scan(client, err, py_policy, &self->policy.scan,
+								(as_policy_scan **)&policy_p, &defaults->scan,
+								&exp_list, &self->exp);
+		break;
+	case POLICY_KIND_BATCH:
+		if (pyobject_to_policy_batch(client, err, py_policy,
+									 &self->policy.batch,
+									 (as_policy_batch **)&policy_p,
+									 &defaults->batch, &exp_list,
+									 &self->exp) == AEROSPIKE_OK) {
+			get_max_keys_per_batch(err, py_policy, &self->max_keys_per_batch);
+		}
+		break;
+	case POLICY_KIND_BATCH_WRITE:
+		pyobject_to_batch_write_policy(client, err, py_policy,
+									   &self->policy.batch_write,
+									   (as_policy_batch_write **)&policy_p,
+									   &exp_list, &self->exp);
+		break;
+	case POLICY_KIND_BATCH_READ:
+		pyobject_to_batch_read_policy(client, err, py_policy,
+									  &self->policy.batch_read,
+									  (as_policy_batch_read **)&policy_p,
+									  &exp_list, &self->exp);
+		break;
+	case POLICY_KIND_BATCH_APPLY:
+		pyobject_to_batch_apply_policy(client, err, py_policy,
+									   &self->policy.batch_apply,
+									   (as_policy_batch_apply **)&policy_p,
+									   &exp_list, &self->exp);
+		break;
+	case POLICY_KIND_BATCH_REMOVE:
+		pyobject_to_batch_remove_policy(client, err, py_policy,
+										&self->policy.batch_remove,
+										(as_policy_batch_remove **)&policy_p,
+										&exp_list, &self->exp);
+		break;
+	case POLICY_KIND_INFO:
+		pyobject_to_policy_info(err, py_policy, &self->policy.info,
+								(as_policy_info **)&policy_p, &defaults->info);
+		break;
+	case POLICY_KIND_ADMIN:
+		pyobject_to_policy_admin(client, err, py_policy, &self->policy.admin,
+								 (as_policy_admin **)&policy_p,
+								 &defaults->admin);
+		break;
+	}
+
+	// The batch record policies are left unset for a None policy.
+	self->has_policy = policy_p != NULL;
+
+	if (err->code != AEROSPIKE_OK) {
+		Py_DECREF(self);
+		return NULL;
+	}
+
+	return self;
+}
+
+as_status AerospikePolicy_Copy(as_error *err, PyObject *py_policy,
+							   aerospike_policy_kind kind, void *policy,
+							   void **policy_p, size_t size,
+							   as_exp **filter_exp, as_exp **exp_list_p)
+{
+	AerospikePolicy *compiled = (AerospikePolicy *)py_policy;
+
+	as_error_reset(err);
+
+	if (compiled->kind != kind) {
+		return as_error_update(err, AEROSPIKE_ERR_PARAM,
+							   "policy must be a %s policy, not a %s policy",
+							   policy_kind_name(kind),
+							   policy_kind_name(compiled->kind));
+	}
+
+	if (!compiled->has_policy) {
+		return err->code;
+	}
+
+	memcpy(policy, &compiled->policy, size);
+
+	if (filter_exp) {
+		*filter_exp = NULL;
+	}
+
+	// The expression is copied, so that the command owns it like an
+	// expression converted from a dict, even if the policy is freed first.
+	if (filter_exp && exp_list_p && compiled->exp) {
+		size_t exp_size = sizeof(as_exp) + compiled->exp->packed_sz;
+		as_exp *exp = cf_malloc(exp_size);
+		memcpy(exp, compiled->exp, exp_size);
+		*filter_exp = exp;
+		*exp_list_p = exp;
+	}
+
+	*policy_p = policy;
+
+	return err->code;
+}
+
+void AerospikePolicy_Max_Keys_Per_Batch(PyObject *py_policy,
+										uint32_t *max_keys)
+{
+	*max_keys = ((AerospikePolicy *)py_policy)->max_keys_per_batch;
+}
@@ -0,0 +1,144 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <pthread.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+#include <citrusleaf/alloc.h>
+
+#include "pool.h"
+
+// Released blocks kept per thread, beyond that they go back to the allocator.
+#define AS_POOL_MAX_CACHED_BLOCKS 16
+
+typedef struct {
+	as_static_pool_block *blocks;
+	uint32_t size;
+} pool_block_cache;
+
+static pthread_key_t block_cache_key;
+static pthread_once_t block_cache_once = PTHREAD_ONCE_INIT;
+
+static void block_cache_destroy(void *ptr)
+{
+	pool_block_cache *cache = (pool_block_cache *)ptr;
+
+	while (cache->blocks) {
+		as_static_pool_block *block = cache->blocks;
+		cache->blocks = block->next;
+		cf_free(block);
+	}
+	cf_free(cache);
+}
+
+static void block_cache_key_create(void)
+{
+	pthread_key_create(&block_cache_key, block_cache_destroy);
+}
+
+static pool_block_cache *block_cache_get(void)
+{
+	pthread_once(&block_cache_once, block_cache_key_create);
+
+	pool_block_cache *cache = pthread_getspecific(block_cache_key);
+	if (!cache) {
+		cache = cf_malloc(sizeof(pool_block_cache));
+		if (!cache) {
+			return NULL;
+		}
+		cache->blocks = NULL;
+		cache->size = 0;
+		pthread_setspecific(block_cache_key, cache);
+	}
+	return cache;
+}
+
+static as_static_pool_block *block_new(void)
+{
+	pool_block_cache *cache = block_cache_get();
+	as_static_pool_block *block = NULL;
+
+	if (cache && cache->blocks) {
+		block = cache->blocks;
+		cache->blocks = block->next;
+		cache->size--;
+	}
+	else {
+		block = cf_malloc(sizeof(as_static_pool_block));
+		if (!block) {
+			return NULL;
+		}
+	}
+
+	block->next = NULL;
+	return block;
+}
+
+as_static_pool *as_static_pool_new(void)
+{
+	as_static_pool *static_pool = cf_malloc(sizeof(as_static_pool));
+	memset(static_pool, 0, sizeof(as_static_pool));
+	return static_pool;
+}
+
+as_bytes *as_static_pool_get_bytes(as_static_pool *static_pool)
+{
+	uint32_t index = static_pool->current_bytes_id % AS_POOL_BLOCK_SIZE;
+
+	if (!static_pool->tail || (index == 0 && static_pool->current_bytes_id)) {
+		as_static_pool_block *block = block_new();
+		if (!block) {
+			return NULL;
+		}
+
+		if (static_pool->tail) {
+			static_pool->tail->next = block;
+		}
+		else {
+			static_pool->head = block;
+		}
+		static_pool->tail = block;
+	}
+
+	as_bytes *bytes = &static_pool->tail->bytes_pool[index];
+	memset(bytes, 0, sizeof(as_bytes));
+	static_pool->current_bytes_id++;
+	return bytes;
+}
+
+void as_static_pool_release(as_static_pool *static_pool)
+{
+	pool_block_cache *cache = block_cache_get();
+
+	while (static_pool->head) {
+		as_static_pool_block *block = static_pool->head;
+		static_pool->head = block->next;
+
+		if (cache && cache->size < AS_POOL_MAX_CACHED_BLOCKS) {
+			block->next = cache->blocks;
+			cache->blocks = block;
+			cache->size++;
+		}
+		else {
+			cf_free(block);
+		}
+	}
+
+	static_pool->tail = NULL;
+	static_pool->current_bytes_id = 0;
+}
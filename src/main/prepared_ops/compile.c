@@ -0,0 +1,437 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_operations.h>
+#include <citrusleaf/alloc.h>
+
+#include "cdt_operation_utils.h"
+#include "conversions.h"
+#include "operate.h"
+#include "policy.h"
+#include "prepared_ops.h"
+#include "serializer.h"
+
+static bool is_compiled_operation(long operation)
+{
+	switch (operation) {
+	case AS_OPERATOR_READ:
+	case AS_OPERATOR_WRITE:
+	case AS_OPERATOR_INCR:
+	case AS_OPERATOR_APPEND:
+	case AS_OPERATOR_PREPEND:
+		return true;
+	default:
+		return false;
+	}
+}
+
+// List and map ops with a val that are converted without add_op().
+static bool is_compiled_cdt_operation(long operation)
+{
+	switch (operation) {
+	case OP_LIST_APPEND:
+	case OP_LIST_APPEND_ITEMS:
+	case OP_LIST_INSERT:
+	case OP_LIST_INSERT_ITEMS:
+	case OP_LIST_INCREMENT:
+	case OP_LIST_SET:
+	case OP_MAP_PUT:
+	case OP_MAP_INCREMENT:
+	case OP_MAP_DECREMENT:
+		return true;
+	default:
+		return false;
+	}
+}
+
+// Converts the ctx, policy, index and key of a list or map op with a val.
+static as_status compiled_cdt_op_init(AerospikeClient *self, as_error *err,
+									  compiled_op *cop, long operation)
+{
+	if (operation == OP_LIST_INSERT || operation == OP_LIST_INSERT_ITEMS ||
+		operation == OP_LIST_INCREMENT || operation == OP_LIST_SET) {
+		if (get_int64_t(err, AS_PY_INDEX_KEY, cop->py_op, &cop->index) !=
+			AEROSPIKE_OK) {
+			return err->code;
+		}
+	}
+
+	if (operation == OP_MAP_PUT || operation == OP_MAP_INCREMENT ||
+		operation == OP_MAP_DECREMENT) {
+		PyObject *py_map_policy =
+			PyDict_GetItemString(cop->py_op, AS_PY_MAP_POLICY);
+
+		cop->py_key = PyDict_GetItemString(cop->py_op, "key");
+		if (!cop->py_key) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "Operation requires key parameter");
+		}
+		as_map_policy_init(&cop->map_policy);
+		if (py_map_policy &&
+			pyobject_to_map_policy(err, py_map_policy, &cop->map_policy) !=
+				AEROSPIKE_OK) {
+			return err->code;
+		}
+	}
+	else if (get_list_policy(err, cop->py_op, &cop->list_policy,
+							 &cop->list_policy_in_use) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	return get_cdt_ctx(self, err, &cop->ctx, cop->py_op, &cop->ctx_in_use,
+					   cop->static_pool, SERIALIZER_PYTHON);
+}
+
+// Packs a list, map, bit, HLL or expression op once. The op is left to
+// add_op(), which reports any error, if it can't be converted here.
+static void compiled_op_pack(AerospikeClient *self, compiled_op *cop,
+							 long operation, const char *bin)
+{
+	as_error err;
+	as_error_init(&err);
+	long op = 0;
+	long return_type = -1;
+
+	cop->static_pool = as_static_pool_new();
+	as_operations *packed = as_operations_new(1);
+	as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 4);
+
+	add_op(self, &err, cop->py_op, unicodeStrVector, cop->static_pool, packed,
+		   &op, &return_type);
+
+	for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+		free(as_vector_get_ptr(unicodeStrVector, i));
+	}
+	as_vector_destroy(unicodeStrVector);
+
+	if (err.code == AEROSPIKE_OK && packed->binops.size == 1) {
+		as_bin *packed_bin = &packed->binops.entries[0].bin;
+
+		if (!cop->py_value) {
+			// The packed value is shared, so it must be reference counted.
+			if (packed_bin->valuep &&
+				packed_bin->valuep != &packed_bin->value &&
+				((as_val *)packed_bin->valuep)->free) {
+				cop->packed = packed;
+				return;
+			}
+		}
+		else if (bin && is_compiled_cdt_operation(operation) &&
+				 compiled_cdt_op_init(self, &err, cop, operation) ==
+					 AEROSPIKE_OK) {
+			strcpy(cop->bin, bin);
+			cop->operation = operation;
+		}
+	}
+
+	as_operations_destroy(packed);
+	PyErr_Clear();
+}
+
+as_status compiled_ops_init(AerospikeClient *self, as_error *err,
+							PyObject *py_ops, compiled_op *compiled,
+							Py_ssize_t *values_size)
+{
+	Py_ssize_t ops_size = PyList_Size(py_ops);
+	Py_ssize_t columns = 0;
+
+	for (Py_ssize_t i = 0; i < ops_size; i++) {
+		PyObject *py_op = PyList_GetItem(py_ops, i);
+		compiled_op *cop = &compiled[i];
+
+		if (!PyDict_Check(py_op)) {
+			return as_error_update(
+				err, AEROSPIKE_ERR_PARAM,
+				"op should be an aerospike operation dictionary");
+		}
+
+		// Later changes to the caller's dict do not affect the compiled op.
+		cop->py_op = PyDict_Copy(py_op);
+		if (!cop->py_op) {
+			PyErr_Clear();
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+								   "Unable to copy operation");
+		}
+		cop->operation = -1;
+		cop->column = -1;
+
+		Py_ssize_t fast_size = 2;
+		cop->py_value = PyDict_GetItemString(cop->py_op, "val");
+		if (cop->py_value) {
+			Py_INCREF(cop->py_value);
+			cop->column = columns++;
+			fast_size++;
+		}
+
+		// Anything unexpected is left to add_op(), which reports it.
+		PyObject *py_operation = PyDict_GetItemString(cop->py_op, "op");
+		if (!py_operation || !PyLong_Check(py_operation)) {
+			continue;
+		}
+
+		long operation = PyLong_AsLong(py_operation);
+		if (PyErr_Occurred()) {
+			PyErr_Clear();
+			continue;
+		}
+
+		const char *bin = NULL;
+		PyObject *py_bin = PyDict_GetItemString(cop->py_op, "bin");
+		if (py_bin && PyUnicode_Check(py_bin)) {
+			bin = PyUnicode_AsUTF8(py_bin);
+			if (!bin) {
+				PyErr_Clear();
+			}
+			else if (strlen(bin) > AS_BIN_NAME_MAX_LEN) {
+				bin = NULL;
+			}
+		}
+
+		// The python client's list, map, bit, HLL and expression op codes.
+		if (operation >= OP_LIST_APPEND) {
+			compiled_op_pack(self, cop, operation, bin);
+			continue;
+		}
+
+		// add_op() reports a missing value, or ignores one that is not used.
+		if (!bin || PyDict_Size(cop->py_op) != fast_size ||
+			!is_compiled_operation(operation) ||
+			opRequiresValue(operation) != (cop->py_value != NULL)) {
+			continue;
+		}
+
+		strcpy(cop->bin, bin);
+		cop->operation = operation;
+	}
+
+	*values_size = columns;
+	return AEROSPIKE_OK;
+}
+
+void compiled_ops_release(compiled_op *compiled, Py_ssize_t size)
+{
+	for (Py_ssize_t i = 0; i < size; i++) {
+		compiled_op *cop = &compiled[i];
+
+		if (cop->packed) {
+			as_operations_destroy(cop->packed);
+			cop->packed = NULL;
+		}
+		if (cop->ctx_in_use) {
+			as_cdt_ctx_destroy(&cop->ctx);
+			cop->ctx_in_use = false;
+		}
+		if (cop->static_pool) {
+			POOL_RELEASE(cop->static_pool);
+			cf_free(cop->static_pool);
+			cop->static_pool = NULL;
+		}
+		Py_CLEAR(cop->py_op);
+		Py_CLEAR(cop->py_value);
+	}
+}
+
+// Adds a list or map op converted by compiled_cdt_op_init() with py_value.
+static as_status compiled_cdt_op_add(AerospikeClient *self, as_error *err,
+									 compiled_op *cop, PyObject *py_value,
+									 as_static_pool *static_pool,
+									 as_operations *ops)
+{
+	as_val *val = NULL;
+	as_val *key = NULL;
+	as_cdt_ctx *ctx = cop->ctx_in_use ? &cop->ctx : NULL;
+	as_list_policy *list_policy =
+		cop->list_policy_in_use ? &cop->list_policy : NULL;
+	bool added = false;
+
+	if (cop->operation == OP_LIST_APPEND_ITEMS ||
+		cop->operation == OP_LIST_INSERT_ITEMS) {
+		if (!PyList_Check(py_value)) {
+			return as_error_update(err, AEROSPIKE_ERR_PARAM,
+								   "Value must be a list");
+		}
+		if (pyobject_to_list(self, err, py_value, (as_list **)&val,
+							 static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+			return err->code;
+		}
+	}
+	else if (pyobject_to_val(self, err, py_value, &val, static_pool,
+							 SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+		return err->code;
+	}
+
+	if (cop->py_key && pyobject_to_val(self, err, cop->py_key, &key,
+									   static_pool, SERIALIZER_PYTHON) !=
+						   AEROSPIKE_OK) {
+		as_val_destroy(val);
+		return err->code;
+	}
+
+	switch (cop->operation) {
+	case OP_LIST_APPEND:
+		added = as_operations_list_append(ops, cop->bin, ctx, list_policy, val);
+		break;
+	case OP_LIST_APPEND_ITEMS:
+		added = as_operations_list_append_items(ops, cop->bin, ctx, list_policy,
+												(as_list *)val);
+		break;
+	case OP_LIST_INSERT:
+		added = as_operations_list_insert(ops, cop->bin, ctx, list_policy,
+										  cop->index, val);
+		break;
+	case OP_LIST_INSERT_ITEMS:
+		added = as_operations_list_insert_items(
+			ops, cop->bin, ctx, list_policy, cop->index, (as_list *)val);
+		break;
+	case OP_LIST_INCREMENT:
+		added = as_operations_list_increment(ops, cop->bin, ctx, list_policy,
+											 cop->index, val);
+		break;
+	case OP_LIST_SET:
+		added = as_operations_list_set(ops, cop->bin, ctx, list_policy,
+									   cop->index, val);
+		break;
+	case OP_MAP_PUT:
+		added = as_operations_map_put(ops, cop->bin, ctx, &cop->map_policy,
+									  key, val);
+		break;
+	case OP_MAP_INCREMENT:
+		added = as_operations_map_increment(ops, cop->bin, ctx,
+											&cop->map_policy, key, val);
+		break;
+	case OP_MAP_DECREMENT:
+		added = as_operations_map_decrement(ops, cop->bin, ctx,
+											&cop->map_policy, key, val);
+		break;
+	}
+
+	if (!added) {
+		as_val_destroy(val);
+		if (key) {
+			as_val_destroy(key);
+		}
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Failed to add operation");
+	}
+
+	return AEROSPIKE_OK;
+}
+
+as_status compiled_op_add(AerospikeClient *self, as_error *err,
+						  compiled_op *cop, PyObject *py_values,
+						  as_vector *unicodeStrVector,
+						  as_static_pool *static_pool, as_operations *ops)
+{
+	PyObject *py_value = cop->py_value;
+	if (py_values && cop->column >= 0) {
+		py_value = PySequence_Fast_GET_ITEM(py_values, cop->column);
+	}
+
+	if (cop->packed) {
+		as_binop *packed = &cop->packed->binops.entries[0];
+		if (ops->binops.size >= ops->binops.capacity) {
+			return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+								   "Unable to add operation");
+		}
+		as_binop *binop = &ops->binops.entries[ops->binops.size++];
+		binop->op = packed->op;
+		as_bin_init(&binop->bin, packed->bin.name,
+					(as_bin_value *)as_val_reserve(packed->bin.valuep));
+		return AEROSPIKE_OK;
+	}
+
+	if (cop->operation >= OP_LIST_APPEND) {
+		return compiled_cdt_op_add(self, err, cop, py_value, static_pool, ops);
+	}
+
+	switch (cop->operation) {
+	case AS_OPERATOR_READ:
+		as_operations_add_read(ops, cop->bin);
+		return AEROSPIKE_OK;
+	case AS_OPERATOR_WRITE:;
+		as_val *put_val = NULL;
+		if (pyobject_to_val(self, err, py_value, &put_val, static_pool,
+							SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+			return err->code;
+		}
+		as_operations_add_write(ops, cop->bin, (as_bin_value *)put_val);
+		return AEROSPIKE_OK;
+	case AS_OPERATOR_INCR:
+		if (PyFloat_Check(py_value)) {
+			as_operations_add_incr_double(ops, cop->bin,
+										  PyFloat_AsDouble(py_value));
+			return AEROSPIKE_OK;
+		}
+		if (PyLong_Check(py_value)) {
+			long offset = PyLong_AsLong(py_value);
+			if (offset == -1 && PyErr_Occurred()) {
+				PyErr_Clear();
+				break;
+			}
+			as_operations_add_incr(ops, cop->bin, offset);
+			return AEROSPIKE_OK;
+		}
+		break;
+	case AS_OPERATOR_APPEND:
+	case AS_OPERATOR_PREPEND:
+		if (PyUnicode_Check(py_value)) {
+			const char *val = PyUnicode_AsUTF8(py_value);
+			if (!val) {
+				PyErr_Clear();
+				break;
+			}
+			if (cop->operation == AS_OPERATOR_APPEND) {
+				as_operations_add_append_strp(ops, cop->bin, cf_strdup(val),
+											  true);
+			}
+			else {
+				as_operations_add_prepend_strp(ops, cop->bin, cf_strdup(val),
+											   true);
+			}
+			return AEROSPIKE_OK;
+		}
+		break;
+	}
+
+	long operation = 0;
+	long return_type = -1;
+
+	if (py_value == cop->py_value) {
+		return add_op(self, err, cop->py_op, unicodeStrVector, static_pool,
+					  ops, &operation, &return_type);
+	}
+
+	// Values not handled above go through the regular conversion, which also
+	// reports type errors.
+	PyObject *py_op = PyDict_Copy(cop->py_op);
+	if (!py_op || PyDict_SetItemString(py_op, "val", py_value) == -1) {
+		PyErr_Clear();
+		Py_XDECREF(py_op);
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to substitute an op value");
+	}
+
+	add_op(self, err, py_op, unicodeStrVector, static_pool, ops, &operation,
+		   &return_type);
+	Py_DECREF(py_op);
+
+	return err->code;
+}
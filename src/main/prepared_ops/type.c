@@ -0,0 +1,162 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+#include <aerospike/as_operations.h>
+#include <citrusleaf/alloc.h>
+
+#include "policy.h"
+#include "prepared_ops.h"
+
+static PyTypeObject AerospikePreparedOps_Type;
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject *AerospikePreparedOps_Get_Values_Size(AerospikePreparedOps *self,
+													  void *closure)
+{
+	return PyLong_FromSsize_t(self->values_size);
+}
+
+static PyGetSetDef AerospikePreparedOps_Type_GetSet[] = {
+	{"values_size", (getter)AerospikePreparedOps_Get_Values_Size, NULL,
+	 "Number of values operate_prepared() takes, one per op with a val.",
+	 NULL},
+	{NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static void AerospikePreparedOps_Type_Dealloc(AerospikePreparedOps *self)
+{
+	if (self->ops) {
+		compiled_ops_release(self->ops, self->ops_size);
+		cf_free(self->ops);
+	}
+
+	if (self->exp_list_p) {
+		as_exp_destroy(self->exp_list_p);
+	}
+
+	Py_XDECREF(self->client);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikePreparedOps_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.PreparedOps",
+	.tp_basicsize = sizeof(AerospikePreparedOps),
+	.tp_dealloc = (destructor)AerospikePreparedOps_Type_Dealloc,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "Operations and operate policy converted once by\n"
+			  "prepare_operate(), for use with operate_prepared().\n",
+	.tp_getset = AerospikePreparedOps_Type_GetSet};
+
+PyTypeObject *AerospikePreparedOps_Ready()
+{
+	return PyType_Ready(&AerospikePreparedOps_Type) == 0
+			   ? &AerospikePreparedOps_Type
+			   : NULL;
+}
+
+bool AerospikePreparedOps_Check(PyObject *py_obj)
+{
+	return PyObject_TypeCheck(py_obj, &AerospikePreparedOps_Type);
+}
+
+AerospikePreparedOps *AerospikePreparedOps_New(AerospikeClient *client,
+											   as_error *err, PyObject *py_ops,
+											   PyObject *py_policy)
+{
+	as_exp exp_list;
+	as_vector *unicodeStrVector = NULL;
+	as_static_pool static_pool;
+	memset(&static_pool, 0, sizeof(static_pool));
+	as_operations ops;
+	Py_ssize_t ops_size = PyList_Size(py_ops);
+	as_operations_inita(&ops, ops_size);
+
+	AerospikePreparedOps *self =
+		PyObject_New(AerospikePreparedOps, &AerospikePreparedOps_Type);
+	if (!self) {
+		PyErr_Clear();
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to allocate prepared ops");
+		goto CLEANUP;
+	}
+
+	Py_INCREF(client);
+	self->client = client;
+	self->ops = cf_calloc(ops_size, sizeof(compiled_op));
+	self->ops_size = ops_size;
+	self->values_size = 0;
+	self->policy_p = NULL;
+	self->exp_list_p = NULL;
+
+	if (py_policy) {
+		if (pyobject_to_policy_operate(
+				client, err, py_policy, &self->policy, &self->policy_p,
+				&client->as->config.policies.operate, &exp_list,
+				&self->exp_list_p) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (compiled_ops_init(client, err, py_ops, self->ops,
+						  &self->values_size) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	// Convert the ops once with the values of the op dicts, so that invalid
+	// ops are reported here rather than by every operate_prepared().
+	unicodeStrVector = as_vector_create(sizeof(char *), 128);
+	for (Py_ssize_t i = 0; i < ops_size; i++) {
+		if (compiled_op_add(client, err, &self->ops[i], NULL,
+							unicodeStrVector, &static_pool,
+							&ops) != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+CLEANUP:
+	if (unicodeStrVector) {
+		for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+			free(as_vector_get_ptr(unicodeStrVector, i));
+		}
+		as_vector_destroy(unicodeStrVector);
+	}
+
+	as_operations_destroy(&ops);
+	POOL_RELEASE(&static_pool);
+
+	if (err->code != AEROSPIKE_OK) {
+		Py_XDECREF(self);
+		return NULL;
+	}
+
+	return self;
+}
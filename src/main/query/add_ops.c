@@ -47,9 +47,10 @@ AerospikeQuery *AerospikeQuery_Add_Ops(AerospikeQuery *self, PyObject *args,
 	long operation;
 	self->unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-	self->static_pool = &static_pool;
+	// The operations keep pointing into the pool until the query is destroyed.
+	if (!self->static_pool) {
+		self->static_pool = as_static_pool_new();
+	}
 
 	as_error err;
 	as_error_init(&err);
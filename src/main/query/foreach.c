@@ -27,6 +27,8 @@
 #include "exceptions.h"
 #include "query.h"
 #include "policy.h"
+#include "record.h"
+#include "results_queue.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
@@ -34,8 +36,35 @@ typedef struct {
 	PyObject *callback;
 	AerospikeClient *client;
 	int partition_query;
+	bool compact_records;
 } LocalData;
 
+typedef struct {
+	as_query *query;
+	as_policy_query *policy_p;
+	as_partition_filter *partition_filter_p;
+	as_partitions_status *ps;
+} QueryCommand;
+
+static void foreach_run(aerospike *as, as_error *err, void *command,
+						results_queue_callback callback, void *udata)
+{
+	QueryCommand *cmd = (QueryCommand *)command;
+
+	if (cmd->partition_filter_p) {
+		if (cmd->ps) {
+			as_partition_filter_set_partitions(cmd->partition_filter_p,
+											   cmd->ps);
+		}
+		aerospike_query_partitions(as, err, cmd->policy_p, cmd->query,
+								   cmd->partition_filter_p, callback, udata);
+	}
+	else {
+		aerospike_query_foreach(as, err, cmd->policy_p, cmd->query, callback,
+								udata);
+	}
+}
+
 static bool each_result(const as_val *val, void *udata)
 {
 	bool rval = true;
@@ -59,7 +88,12 @@ static bool each_result(const as_val *val, void *udata)
 	gstate = PyGILState_Ensure();
 
 	// Convert as_val to a Python Object
-	val_to_pyobject(data->client, err, val, &py_result);
+	if (data->compact_records) {
+		val_to_compact_pyobject(data->client, err, val, &py_result);
+	}
+	else {
+		val_to_pyobject(data->client, err, val, &py_result);
+	}
 
 	// The record could not be converted to a python object
 	if (!py_result) {
@@ -147,6 +181,7 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 	data.callback = py_callback;
 	data.client = self->client;
 	data.partition_query = 0;
+	data.compact_records = false;
 
 	as_error_init(&data.error);
 
@@ -163,6 +198,11 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 	as_partition_filter *partition_filter_p = NULL;
 	as_partitions_status *ps = NULL;
 
+	QueryCommand cmd;
+	uint32_t chunk_size = 0;
+	uint32_t queue_size = 0;
+	results_queue *queue = NULL;
+
 	// Initialize error
 	as_error_init(&err);
 
@@ -205,28 +245,44 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 		goto CLEANUP;
 	}
 
-	Py_BEGIN_ALLOW_THREADS
-
-	// Invoke operation
-	if (partition_filter_p) {
-		if (ps) {
-			as_partition_filter_set_partitions(partition_filter_p, ps);
-		}
+	if (get_compact_records(&err, py_options, &data.compact_records) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
 
-		aerospike_query_partitions(self->client->as, &data.error,
-								   query_policy_p, &self->query,
-								   partition_filter_p, each_result, &data);
+	if (get_chunk_options(&err, py_options, &chunk_size, &queue_size) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
 
-		if (ps) {
-			as_partitions_status_release(ps);
+	cmd.query = &self->query;
+	cmd.policy_p = query_policy_p;
+	cmd.partition_filter_p = partition_filter_p;
+	cmd.ps = ps;
+
+	if (chunk_size) {
+		// The records are buffered by a worker thread without the GIL and
+		// handed to the callback in chunks from this thread.
+		queue = results_queue_start(self->client->as, &data.error, queue_size,
+									foreach_run, NULL, &cmd);
+		if (queue) {
+			results_queue_deliver(queue, self->client, &data.error,
+								  py_callback, chunk_size,
+								  data.compact_records, data.partition_query);
 		}
 	}
 	else {
-		aerospike_query_foreach(self->client->as, &err, query_policy_p,
-								&self->query, each_result, &data);
+		Py_BEGIN_ALLOW_THREADS
+		// Invoke operation
+		foreach_run(self->client->as,
+					partition_filter_p ? &data.error : &err, &cmd, each_result,
+					&data);
+		Py_END_ALLOW_THREADS
 	}
 
-	Py_END_ALLOW_THREADS
+	if (ps) {
+		as_partitions_status_release(ps);
+	}
 
 	if (data.error.code != AEROSPIKE_OK) {
 		as_error_update(&data.error, data.error.code, NULL);
@@ -244,21 +300,10 @@ CLEANUP:
 	self->query.apply.arglist = NULL;
 
 	if (err.code != AEROSPIKE_OK || data.error.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		PyObject *exception_type = NULL;
-		if (err.code != AEROSPIKE_OK) {
-			error_to_pyobject(&err, &py_err);
-			exception_type = raise_exception(&err);
-		}
-		if (data.error.code != AEROSPIKE_OK) {
-			error_to_pyobject(&data.error, &py_err);
-			exception_type = raise_exception(&data.error);
-		}
-		if (PyObject_HasAttrString(exception_type, "name")) {
-			PyObject_SetAttrString(exception_type, "name", Py_None);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		// The error reported by the callbacks takes precedence.
+		as_error *error_p =
+			data.error.code != AEROSPIKE_OK ? &data.error : &err;
+		raise_exception_base(error_p, NULL, NULL, NULL, NULL, Py_None);
 		return NULL;
 	}
 
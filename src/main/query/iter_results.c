@@ -0,0 +1,169 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/aerospike_query.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_query.h>
+#include <citrusleaf/alloc.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "query.h"
+#include "policy.h"
+#include "results_iterator.h"
+
+// Everything the worker thread of the iterator needs to run the query.
+typedef struct {
+	as_query *query;
+	as_policy_query policy;
+	as_policy_query *policy_p;
+	as_exp exp_list;
+	as_exp *exp_list_p;
+	as_partition_filter partition_filter;
+	as_partition_filter *partition_filter_p;
+	as_partitions_status *ps;
+} QueryCommand;
+
+static void query_command_run(aerospike *as, as_error *err, void *command,
+							  results_queue_callback callback, void *udata)
+{
+	QueryCommand *cmd = (QueryCommand *)command;
+
+	if (cmd->partition_filter_p) {
+		if (cmd->ps) {
+			as_partition_filter_set_partitions(cmd->partition_filter_p,
+											   cmd->ps);
+		}
+		aerospike_query_partitions(as, err, cmd->policy_p, cmd->query,
+								   cmd->partition_filter_p, callback, udata);
+	}
+	else {
+		aerospike_query_foreach(as, err, cmd->policy_p, cmd->query, callback,
+								udata);
+	}
+}
+
+static void query_command_destroy(void *command)
+{
+	QueryCommand *cmd = (QueryCommand *)command;
+
+	if (cmd->ps) {
+		as_partitions_status_release(cmd->ps);
+	}
+	if (cmd->exp_list_p) {
+		as_exp_destroy(cmd->exp_list_p);
+	}
+	cf_free(cmd);
+}
+
+PyObject *AerospikeQuery_Iter_Results(AerospikeQuery *self, PyObject *args,
+									  PyObject *kwds)
+{
+	PyObject *py_policy = NULL;
+	PyObject *py_options = NULL;
+	PyObject *py_iter = NULL;
+	unsigned long buffer = RESULTS_QUEUE_DEFAULT_CAPACITY;
+	bool compact_records = false;
+	QueryCommand *cmd = NULL;
+
+	static char *kwlist[] = {"policy", "options", "buffer", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOk:iter_results", kwlist,
+									&py_policy, &py_options,
+									&buffer) == false) {
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+
+	if (!self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (buffer == 0 || buffer > UINT32_MAX) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"buffer must be a positive 32 bit integer");
+		goto CLEANUP;
+	}
+
+	cmd = cf_malloc(sizeof(QueryCommand));
+	memset(cmd, 0, sizeof(QueryCommand));
+	cmd->query = &self->query;
+
+	// The policy and expressions must outlive this call, convert them into
+	// the command.
+	pyobject_to_policy_query(self->client, &err, py_policy, &cmd->policy,
+							 &cmd->policy_p,
+							 &self->client->as->config.policies.query,
+							 &cmd->exp_list, &cmd->exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (set_query_options(&err, py_options, &self->query) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (get_compact_records(&err, py_options, &compact_records) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy) {
+		PyObject *py_partition_filter =
+			PyDict_GetItemString(py_policy, "partition_filter");
+		if (py_partition_filter) {
+			if (convert_partition_filter(self->client, py_partition_filter,
+										 &cmd->partition_filter, &cmd->ps,
+										 &err) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+			cmd->partition_filter_p = &cmd->partition_filter;
+		}
+	}
+	as_error_reset(&err);
+
+	// The iterator owns the command from now on.
+	py_iter = AerospikeResultsIterator_New(
+		self->client, (PyObject *)self, &err, (uint32_t)buffer,
+		compact_records, query_command_run, query_command_destroy, cmd);
+	cmd = NULL;
+
+CLEANUP:
+	if (cmd) {
+		query_command_destroy(cmd);
+	}
+
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return py_iter;
+}
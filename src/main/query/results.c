@@ -28,6 +28,7 @@
 #include "exceptions.h"
 #include "query.h"
 #include "policy.h"
+#include "record.h"
 
 #undef TRACE
 #define TRACE()
@@ -35,6 +36,7 @@
 typedef struct {
 	PyObject *py_results;
 	AerospikeClient *client;
+	bool compact_records;
 } LocalData;
 
 static bool each_result(const as_val *val, void *udata)
@@ -53,7 +55,12 @@ static bool each_result(const as_val *val, void *udata)
 	PyGILState_STATE gstate;
 	gstate = PyGILState_Ensure();
 
-	val_to_pyobject(data->client, &err, val, &py_result);
+	if (data->compact_records) {
+		val_to_compact_pyobject(data->client, &err, val, &py_result);
+	}
+	else {
+		val_to_pyobject(data->client, &err, val, &py_result);
+	}
 
 	if (py_result) {
 		PyList_Append(py_results, py_result);
@@ -75,6 +82,7 @@ PyObject *AerospikeQuery_Results(AerospikeQuery *self, PyObject *args,
 
 	LocalData data;
 	data.client = self->client;
+	data.compact_records = false;
 
 	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OO:results", kwlist,
 									&py_policy, &py_options) == false) {
@@ -118,6 +126,11 @@ PyObject *AerospikeQuery_Results(AerospikeQuery *self, PyObject *args,
 		goto CLEANUP;
 	}
 
+	if (get_compact_records(&err, py_options, &data.compact_records) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	if (py_policy) {
 		PyObject *py_partition_filter =
 			PyDict_GetItemString(py_policy, "partition_filter");
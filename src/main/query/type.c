@@ -52,6 +52,12 @@ PyDoc_STRVAR(results_doc, "results([policy]) -> list of (key, meta, bins)\n\
 \n\
 Buffer the records resulting from the query, and return them as a list of records.");
 
+PyDoc_STRVAR(iter_results_doc,
+			 "iter_results([policy[, options[, buffer]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Run the query in the background and return an iterator over the records. At most buffer \
+records are held in memory, the query waits for the consumer when the buffer is full.");
+
 PyDoc_STRVAR(select_doc, "select(bin1[, bin2[, bin3..]])\n\
 \n\
 Set a filter on the record bins resulting from results() or foreach(). \
@@ -98,6 +104,9 @@ static PyMethodDef AerospikeQuery_Type_Methods[] = {
 	{"results", (PyCFunction)AerospikeQuery_Results,
 	 METH_VARARGS | METH_KEYWORDS, results_doc},
 
+	{"iter_results", (PyCFunction)AerospikeQuery_Iter_Results,
+	 METH_VARARGS | METH_KEYWORDS, iter_results_doc},
+
 	{"select", (PyCFunction)AerospikeQuery_Select, METH_VARARGS | METH_KEYWORDS,
 	 select_doc},
 
@@ -247,6 +256,11 @@ static void AerospikeQuery_Type_Dealloc(AerospikeQuery *self)
 
 	as_query_destroy(&self->query);
 
+	if (self->static_pool != NULL) {
+		POOL_RELEASE(self->static_pool);
+		cf_free(self->static_pool);
+	}
+
 	if (self->unicodeStrVector != NULL) {
 		for (unsigned int i = 0; i < self->unicodeStrVector->size; ++i) {
 			free(as_vector_get_ptr(self->unicodeStrVector, i));
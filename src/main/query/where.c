@@ -59,11 +59,14 @@ static int AerospikeQuery_Where_Add(AerospikeQuery *self,
 	int rc = 0;
 
 	if(py_ctx) {
-		as_static_pool static_pool;
-		memset(&static_pool, 0, sizeof(static_pool));
+		// The context keeps pointing into the pool until the query is
+		// destroyed.
+		if (!self->static_pool) {
+			self->static_pool = as_static_pool_new();
+		}
 		pctx = cf_malloc(sizeof(as_cdt_ctx));
 		memset(pctx, 0, sizeof(as_cdt_ctx));
-		if (get_cdt_ctx(self->client, &err, pctx, py_ctx, &ctx_in_use, &static_pool,
+		if (get_cdt_ctx(self->client, &err, pctx, py_ctx, &ctx_in_use, self->static_pool,
 						SERIALIZER_PYTHON) != AEROSPIKE_OK) {
 			return err.code;
 		}
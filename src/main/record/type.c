@@ -0,0 +1,322 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <structmember.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+#include <citrusleaf/alloc.h>
+
+#include "completion_queue.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "record.h"
+
+static PyTypeObject AerospikeRecord_Type;
+
+/*******************************************************************************
+ * HELPERS
+ ******************************************************************************/
+
+static as_status record_convert_bins(AerospikeRecord *self, as_error *err)
+{
+	PyObject *py_bins = NULL;
+
+	if (self->py_bins) {
+		return AEROSPIKE_OK;
+	}
+
+	if (bins_to_pyobject(self->client, err, self->rec, &py_bins, false) !=
+		AEROSPIKE_OK) {
+		return err->code;
+	}
+	self->py_bins = py_bins;
+
+	// The bins live in the dict from now on.
+	as_record_destroy(self->rec);
+	self->rec = NULL;
+
+	return AEROSPIKE_OK;
+}
+
+as_status val_to_compact_pyobject(AerospikeClient *self, as_error *err,
+								  const as_val *val, PyObject **obj)
+{
+	as_error_reset(err);
+	*obj = NULL;
+
+	if (!val || as_val_type(val) != AS_REC) {
+		return val_to_pyobject(self, err, val, obj);
+	}
+
+	as_record *rec = as_record_fromval(val);
+	AerospikeRecord *py_rec =
+		PyObject_New(AerospikeRecord, &AerospikeRecord_Type);
+	if (!py_rec) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to allocate record");
+	}
+
+	Py_INCREF(self);
+	py_rec->client = self;
+	// The record is owned by the C client and released after the callback.
+	py_rec->rec = completion_record_copy(rec);
+	completion_key_copy(&py_rec->key, &rec->key);
+	py_rec->ttl = rec->ttl;
+	py_rec->gen = rec->gen;
+	py_rec->py_key = NULL;
+	py_rec->py_bins = NULL;
+
+	*obj = (PyObject *)py_rec;
+	return AEROSPIKE_OK;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject *AerospikeRecord_Get_Key(AerospikeRecord *self, void *closure)
+{
+	as_error err;
+	as_error_init(&err);
+
+	if (!self->py_key &&
+		key_to_pyobject(&err, &self->key, &self->py_key) != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	Py_INCREF(self->py_key);
+	return self->py_key;
+}
+
+static PyObject *AerospikeRecord_Get_Meta(AerospikeRecord *self,
+										  void *closure)
+{
+	// Same layout as metadata_to_pyobject(), built on each access.
+	PyObject *py_ttl = PyInt_FromLong(self->ttl);
+	PyObject *py_gen = PyInt_FromLong(self->gen);
+
+	PyObject *py_meta = PyDict_New();
+	PyDict_SetItemString(py_meta, "ttl", py_ttl);
+	PyDict_SetItemString(py_meta, "gen", py_gen);
+
+	Py_DECREF(py_ttl);
+	Py_DECREF(py_gen);
+
+	return py_meta;
+}
+
+static PyObject *AerospikeRecord_Get_Bins(AerospikeRecord *self,
+										  void *closure)
+{
+	as_error err;
+	as_error_init(&err);
+
+	if (record_convert_bins(self, &err) != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	Py_INCREF(self->py_bins);
+	return self->py_bins;
+}
+
+static PyObject *AerospikeRecord_Get(AerospikeRecord *self, PyObject *args,
+									 PyObject *kwds)
+{
+	char *name = NULL;
+	PyObject *py_default = Py_None;
+	PyObject *py_value = NULL;
+
+	static char *kwlist[] = {"bin", "default", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "s|O:get", kwlist, &name,
+									&py_default) == false) {
+		return NULL;
+	}
+
+	if (self->py_bins) {
+		py_value = PyDict_GetItemString(self->py_bins, name);
+		py_value = py_value ? py_value : py_default;
+		Py_INCREF(py_value);
+		return py_value;
+	}
+
+	// Only convert the requested bin.
+	as_val *val = (as_val *)as_record_get(self->rec, name);
+	if (!val) {
+		Py_INCREF(py_default);
+		return py_default;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (val_to_pyobject(self->client, &err, val, &py_value) != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return py_value;
+}
+
+static PyObject *AerospikeRecord_To_Tuple(AerospikeRecord *self,
+										  PyObject *unused)
+{
+	PyObject *py_key = AerospikeRecord_Get_Key(self, NULL);
+	PyObject *py_meta = AerospikeRecord_Get_Meta(self, NULL);
+	PyObject *py_bins = AerospikeRecord_Get_Bins(self, NULL);
+
+	if (!py_key || !py_bins) {
+		Py_XDECREF(py_key);
+		Py_XDECREF(py_meta);
+		Py_XDECREF(py_bins);
+		return NULL;
+	}
+
+	PyObject *py_rec = PyTuple_New(3);
+	PyTuple_SetItem(py_rec, 0, py_key);
+	PyTuple_SetItem(py_rec, 1, py_meta);
+	PyTuple_SetItem(py_rec, 2, py_bins);
+
+	return py_rec;
+}
+
+PyDoc_STRVAR(get_doc, "get(bin[, default]) -> value\n\
+\n\
+Returns the value of a single bin, or default if the record has no such bin. \
+Only that bin is converted to a Python object.");
+
+PyDoc_STRVAR(to_tuple_doc, "to_tuple() -> (key, meta, bins)\n\
+\n\
+Returns the record as the tuple returned by the default result format.");
+
+static PyMethodDef AerospikeRecord_Type_Methods[] = {
+	{"get", (PyCFunction)AerospikeRecord_Get, METH_VARARGS | METH_KEYWORDS,
+	 get_doc},
+	{"to_tuple", (PyCFunction)AerospikeRecord_To_Tuple, METH_NOARGS,
+	 to_tuple_doc},
+	{NULL}};
+
+static PyGetSetDef AerospikeRecord_Type_GetSet[] = {
+	{"key", (getter)AerospikeRecord_Get_Key, NULL,
+	 "The key tuple (namespace, set, primary key, digest).", NULL},
+	{"meta", (getter)AerospikeRecord_Get_Meta, NULL,
+	 "A dict with the ttl and gen of the record.", NULL},
+	{"bins", (getter)AerospikeRecord_Get_Bins, NULL,
+	 "A dict of the bins of the record.", NULL},
+	{NULL}};
+
+static PyMemberDef AerospikeRecord_Type_Members[] = {
+	{"ttl", T_UINT, offsetof(AerospikeRecord, ttl), READONLY,
+	 "The time to live of the record in seconds."},
+	{"gen", T_USHORT, offsetof(AerospikeRecord, gen), READONLY,
+	 "The generation of the record."},
+	{NULL}};
+
+/*******************************************************************************
+ * SEQUENCE PROTOCOL
+ ******************************************************************************/
+
+// A record unpacks like the (key, meta, bins) tuple.
+static Py_ssize_t AerospikeRecord_Type_Length(AerospikeRecord *self)
+{
+	return 3;
+}
+
+static PyObject *AerospikeRecord_Type_Item(AerospikeRecord *self,
+										   Py_ssize_t i)
+{
+	switch (i) {
+	case 0:
+		return AerospikeRecord_Get_Key(self, NULL);
+	case 1:
+		return AerospikeRecord_Get_Meta(self, NULL);
+	case 2:
+		return AerospikeRecord_Get_Bins(self, NULL);
+	default:
+		PyErr_SetString(PyExc_IndexError, "record index out of range");
+		return NULL;
+	}
+}
+
+static PySequenceMethods AerospikeRecord_Type_Sequence = {
+	.sq_length = (lenfunc)AerospikeRecord_Type_Length,
+	.sq_item = (ssizeargfunc)AerospikeRecord_Type_Item};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static PyObject *AerospikeRecord_Type_Repr(AerospikeRecord *self)
+{
+	PyObject *py_rec = AerospikeRecord_To_Tuple(self, NULL);
+	if (!py_rec) {
+		return NULL;
+	}
+
+	PyObject *py_repr = PyUnicode_FromFormat("Record%R", py_rec);
+	Py_DECREF(py_rec);
+	return py_repr;
+}
+
+static void AerospikeRecord_Type_Dealloc(AerospikeRecord *self)
+{
+	Py_XDECREF(self->py_key);
+	Py_XDECREF(self->py_bins);
+
+	if (self->rec) {
+		as_record_destroy(self->rec);
+	}
+	as_key_destroy(&self->key);
+
+	Py_XDECREF(self->client);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeRecord_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.Record",
+	.tp_basicsize = sizeof(AerospikeRecord),
+	.tp_dealloc = (destructor)AerospikeRecord_Type_Dealloc,
+	.tp_repr = (reprfunc)AerospikeRecord_Type_Repr,
+	.tp_as_sequence = &AerospikeRecord_Type_Sequence,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "A record returned by a query or scan with the compact_records\n"
+			  "option. The key tuple, meta dict and bins dict are only built\n"
+			  "when accessed.\n",
+	.tp_methods = AerospikeRecord_Type_Methods,
+	.tp_members = AerospikeRecord_Type_Members,
+	.tp_getset = AerospikeRecord_Type_GetSet};
+
+PyTypeObject *AerospikeRecord_Ready()
+{
+	return PyType_Ready(&AerospikeRecord_Type) == 0 ? &AerospikeRecord_Type
+													: NULL;
+}
+
+PyObject *AerospikeRecord_Get_Type()
+{
+	return (PyObject *)&AerospikeRecord_Type;
+}
@@ -0,0 +1,718 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_geojson.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_map.h>
+#include <aerospike/as_msgpack.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_record_iterator.h>
+#include <aerospike/as_string.h>
+#include <citrusleaf/alloc.h>
+#include <citrusleaf/cf_clock.h>
+
+#include "completion_queue.h"
+#include "conversions.h"
+#include "record_cache.h"
+
+#define RECORD_CACHE_CAPSULE "aerospike.record_cache_entry"
+
+// Entries sampled to pick the least frequently used one to evict.
+#define RECORD_CACHE_LFU_SAMPLES 8
+
+// Estimated overhead of an entry, on top of its bins.
+#define RECORD_CACHE_ENTRY_OVERHEAD 64
+
+typedef struct record_cache_entry_s {
+	// The bins as read, converted on every hit so that callers never share
+	// the objects of a cached record.
+	as_record *bins;
+	// The names of the bins that were read, NULL when all the bins were.
+	PyObject *bin_names;
+	uint32_t gen;
+	// The ttl as read, AS_RECORD_NO_EXPIRE_TTL for records that never expire.
+	uint32_t ttl;
+	// When the record expires and when the entry expires, 0 for never.
+	uint64_t record_expires_ms;
+	uint64_t expires_ms;
+	uint64_t size;
+	uint64_t hits;
+	// The shared memory sequence when the entry was last known to match the
+	// shared memory.
+	uint32_t shm_seq;
+} record_cache_entry;
+
+static void record_cache_entry_destroy(PyObject *py_capsule)
+{
+	record_cache_entry *entry =
+		PyCapsule_GetPointer(py_capsule, RECORD_CACHE_CAPSULE);
+	if (entry) {
+		if (entry->bins) {
+			as_record_destroy(entry->bins);
+		}
+		Py_XDECREF(entry->bin_names);
+		cf_free(entry);
+	}
+}
+
+static record_cache_entry *record_cache_entry_get(PyObject *py_capsule)
+{
+	return PyCapsule_GetPointer(py_capsule, RECORD_CACHE_CAPSULE);
+}
+
+// Parses the (namespace, set) tuples of the sets config.
+static int record_cache_sets_init(record_cache *cache, PyObject *py_sets)
+{
+	if (!PyList_Check(py_sets) && !PyTuple_Check(py_sets)) {
+		return -1;
+	}
+
+	cache->sets = PyDict_New();
+	if (!cache->sets) {
+		return -1;
+	}
+
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(py_sets);
+	for (Py_ssize_t i = 0; i < size; i++) {
+		PyObject *py_ns_set = PySequence_Fast_GET_ITEM(py_sets, i);
+		if (!PyTuple_Check(py_ns_set) || PyTuple_GET_SIZE(py_ns_set) != 2 ||
+			!PyUnicode_Check(PyTuple_GET_ITEM(py_ns_set, 0)) ||
+			!PyUnicode_Check(PyTuple_GET_ITEM(py_ns_set, 1))) {
+			return -1;
+		}
+
+		PyObject *py_ns = PyTuple_GET_ITEM(py_ns_set, 0);
+		PyObject *py_set_names = PyDict_GetItem(cache->sets, py_ns);
+		if (!py_set_names) {
+			py_set_names = PySet_New(NULL);
+			if (!py_set_names ||
+				PyDict_SetItem(cache->sets, py_ns, py_set_names) == -1) {
+				Py_XDECREF(py_set_names);
+				return -1;
+			}
+			Py_DECREF(py_set_names);
+		}
+
+		if (PySet_Add(py_set_names, PyTuple_GET_ITEM(py_ns_set, 1)) == -1) {
+			return -1;
+		}
+	}
+
+	return 0;
+}
+
+static int record_cache_uint_config(PyObject *py_config, const char *name,
+									uint64_t max, uint64_t *value)
+{
+	PyObject *py_value = PyDict_GetItemString(py_config, name);
+	if (!py_value) {
+		return 0;
+	}
+
+	if (!PyLong_Check(py_value) || PyBool_Check(py_value)) {
+		return -1;
+	}
+
+	unsigned long long v = PyLong_AsUnsignedLongLong(py_value);
+	if (PyErr_Occurred() || v > max) {
+		PyErr_Clear();
+		return -1;
+	}
+
+	*value = v;
+	return 0;
+}
+
+int record_cache_init(AerospikeClient *self, PyObject *py_config)
+{
+	self->record_cache = NULL;
+
+	if (!py_config || py_config == Py_None) {
+		return 0;
+	}
+
+	if (!PyDict_Check(py_config)) {
+		return -1;
+	}
+
+	uint64_t max_entries = 1024;
+	uint64_t max_bytes = 0;
+	uint64_t max_ttl = 0;
+	uint64_t policy = RECORD_CACHE_POLICY_LRU;
+
+	if (record_cache_uint_config(py_config, "max_entries", UINT32_MAX,
+								 &max_entries) == -1 ||
+		record_cache_uint_config(py_config, "max_bytes", UINT64_MAX,
+								 &max_bytes) == -1 ||
+		record_cache_uint_config(py_config, "max_ttl", UINT32_MAX / 1000,
+								 &max_ttl) == -1 ||
+		record_cache_uint_config(py_config, "policy", RECORD_CACHE_POLICY_LFU,
+								 &policy) == -1 ||
+		!max_entries) {
+		return -1;
+	}
+
+	record_cache *cache = cf_malloc(sizeof(record_cache));
+	memset(cache, 0, sizeof(record_cache));
+	cache->max_entries = (uint32_t)max_entries;
+	cache->max_bytes = max_bytes;
+	cache->max_ttl_ms = (uint32_t)(max_ttl * 1000);
+	cache->policy = (record_cache_policy)policy;
+	self->record_cache = cache;
+
+	cache->entries = PyDict_New();
+	if (!cache->entries) {
+		return -1;
+	}
+
+	PyObject *py_sets = PyDict_GetItemString(py_config, "sets");
+	if (py_sets && py_sets != Py_None &&
+		record_cache_sets_init(cache, py_sets) == -1) {
+		PyErr_Clear();
+		return -1;
+	}
+
+	// Shared records are only dropped by writes from the host, so they must
+	// expire to ever see writes from elsewhere.
+	PyObject *py_shm = PyDict_GetItemString(py_config, "shm");
+	if (py_shm && py_shm != Py_None &&
+		(!max_ttl || record_cache_shm_attach(py_shm, &cache->shm) == -1)) {
+		return -1;
+	}
+
+	return 0;
+}
+
+uint64_t record_cache_seq(AerospikeClient *self)
+{
+	record_cache *cache = self->record_cache;
+	if (!cache) {
+		return 0;
+	}
+
+	// The local sequence in the high half, the shared one in the low half.
+	uint64_t seq = (uint64_t)(uint32_t)cache->write_seq << 32;
+	if (cache->shm) {
+		seq |= record_cache_shm_seq(cache->shm);
+	}
+	return seq;
+}
+
+// Returns a new reference to the cache key of key, or NULL if the set of key
+// is not cached.
+static PyObject *record_cache_key(record_cache *cache, as_key *key)
+{
+	if (cache->sets) {
+		PyObject *py_set_names = PyDict_GetItemString(cache->sets, key->ns);
+		if (!py_set_names) {
+			return NULL;
+		}
+
+		PyObject *py_set = PyUnicode_FromString(key->set);
+		int contains = py_set ? PySet_Contains(py_set_names, py_set) : -1;
+		Py_XDECREF(py_set);
+		if (contains != 1) {
+			PyErr_Clear();
+			return NULL;
+		}
+	}
+
+	as_digest *digest = as_key_digest(key);
+	if (!digest) {
+		return NULL;
+	}
+
+	// The digest already covers the set and the user key.
+	size_t ns_len = strlen(key->ns);
+	PyObject *py_cache_key =
+		PyBytes_FromStringAndSize(NULL, ns_len + 1 + AS_DIGEST_VALUE_SIZE);
+	if (!py_cache_key) {
+		PyErr_Clear();
+		return NULL;
+	}
+
+	char *buf = PyBytes_AS_STRING(py_cache_key);
+	memcpy(buf, key->ns, ns_len + 1);
+	memcpy(buf + ns_len + 1, digest->value, AS_DIGEST_VALUE_SIZE);
+	return py_cache_key;
+}
+
+static void record_cache_remove(record_cache *cache, PyObject *py_cache_key)
+{
+	PyObject *py_capsule = PyDict_GetItem(cache->entries, py_cache_key);
+	if (py_capsule) {
+		cache->bytes -= record_cache_entry_get(py_capsule)->size;
+		PyDict_DelItem(cache->entries, py_cache_key);
+	}
+}
+
+// Evicts the least recently used entry, or the least frequently used one of
+// the oldest entries.
+static void record_cache_evict(record_cache *cache)
+{
+	Py_ssize_t pos = 0;
+	PyObject *py_cache_key = NULL;
+	PyObject *py_capsule = NULL;
+	PyObject *py_victim = NULL;
+	uint64_t min_hits = UINT64_MAX;
+
+	for (int i = 0; i < RECORD_CACHE_LFU_SAMPLES &&
+					PyDict_Next(cache->entries, &pos, &py_cache_key, &py_capsule);
+		 i++) {
+		uint64_t hits = record_cache_entry_get(py_capsule)->hits;
+		if (!py_victim || hits < min_hits) {
+			py_victim = py_cache_key;
+			min_hits = hits;
+		}
+
+		if (cache->policy == RECORD_CACHE_POLICY_LRU) {
+			break;
+		}
+	}
+
+	if (py_victim) {
+		Py_INCREF(py_victim);
+		record_cache_remove(cache, py_victim);
+		Py_DECREF(py_victim);
+	}
+}
+
+// Adds entry to the cache, evicting entries to make room for it. Takes
+// ownership of entry. Returns the capsule of the entry, a borrowed reference,
+// or NULL if it was not added.
+static PyObject *record_cache_insert(record_cache *cache,
+									 PyObject *py_cache_key,
+									 record_cache_entry *entry)
+{
+	record_cache_remove(cache, py_cache_key);
+
+	PyObject *py_capsule = PyCapsule_New(entry, RECORD_CACHE_CAPSULE,
+										 record_cache_entry_destroy);
+	if (!py_capsule) {
+		if (entry->bins) {
+			as_record_destroy(entry->bins);
+		}
+		Py_XDECREF(entry->bin_names);
+		cf_free(entry);
+		return NULL;
+	}
+
+	if (!entry->bins || (cache->max_bytes && entry->size > cache->max_bytes)) {
+		Py_DECREF(py_capsule);
+		return NULL;
+	}
+
+	while (PyDict_Size(cache->entries) &&
+		   ((uint32_t)PyDict_Size(cache->entries) >= cache->max_entries ||
+			(cache->max_bytes &&
+			 cache->bytes + entry->size > cache->max_bytes))) {
+		record_cache_evict(cache);
+	}
+
+	int rc = PyDict_SetItem(cache->entries, py_cache_key, py_capsule);
+	Py_DECREF(py_capsule);
+	if (rc == -1) {
+		return NULL;
+	}
+
+	cache->bytes += entry->size;
+	return py_capsule;
+}
+
+// Caps the expiry of entry to the max_ttl of the cache.
+static void record_cache_cap_expiry(record_cache *cache,
+									record_cache_entry *entry, uint64_t now)
+{
+	if (cache->max_ttl_ms &&
+		(!entry->expires_ms || entry->expires_ms > now + cache->max_ttl_ms)) {
+		entry->expires_ms = now + cache->max_ttl_ms;
+	}
+}
+
+static bool record_cache_bins_set(const as_val *key, const as_val *val,
+								  void *udata)
+{
+	as_string *name = as_string_fromval(key);
+	if (!name) {
+		return false;
+	}
+	as_val *value = as_val_reserve((as_val *)val);
+	if (!as_record_set((as_record *)udata, as_string_get(name),
+					   (as_bin_value *)value)) {
+		as_val_destroy(value);
+		return false;
+	}
+	return true;
+}
+
+// Returns a record holding the bins of the bin name to value map, or NULL if
+// a key is not a bin name. The values are shared with the map.
+static as_record *record_cache_bins_from_map(const as_map *map)
+{
+	as_record *bins = as_record_new(as_map_size(map));
+	if (!as_map_foreach(map, record_cache_bins_set, bins)) {
+		as_record_destroy(bins);
+		return NULL;
+	}
+	return bins;
+}
+
+// Copies the record of key from the shared memory to the cache. Returns the
+// capsule of the entry, a borrowed reference, or NULL if there is none.
+static PyObject *record_cache_shm_load(record_cache *cache, as_key *key,
+									   PyObject *py_cache_key)
+{
+	uint32_t shm_seq = record_cache_shm_seq(cache->shm);
+	record_cache_shm_record record;
+	if (!record_cache_shm_get(cache->shm, key, &record)) {
+		return NULL;
+	}
+
+	record_cache_entry *entry = cf_malloc(sizeof(record_cache_entry));
+	memset(entry, 0, sizeof(record_cache_entry));
+	entry->bins = record_cache_bins_from_map(record.bins);
+	as_map_destroy(record.bins);
+	entry->gen = record.gen;
+	entry->ttl = record.ttl;
+	entry->record_expires_ms = record.record_expires_ms;
+	entry->expires_ms = record.expires_ms;
+	entry->size = RECORD_CACHE_ENTRY_OVERHEAD + record.size;
+	entry->shm_seq = shm_seq;
+	record_cache_cap_expiry(cache, entry, cf_getms());
+
+	return record_cache_insert(cache, py_cache_key, entry);
+}
+
+// Estimates the memory used by the bins of rec.
+static uint64_t record_cache_estimate_size(const as_record *rec)
+{
+	uint64_t size = RECORD_CACHE_ENTRY_OVERHEAD;
+	as_record_iterator it;
+	as_record_iterator_init(&it, rec);
+
+	while (as_record_iterator_has_next(&it)) {
+		as_bin *bin = as_record_iterator_next(&it);
+		as_val *val = (as_val *)as_bin_get_value(bin);
+		size += strlen(as_bin_get_name(bin)) + sizeof(PyObject *) * 2;
+
+		switch (as_val_type(val)) {
+		case AS_STRING:
+			size += as_string_len((as_string *)val);
+			break;
+		case AS_BYTES:
+			size += as_bytes_size((as_bytes *)val);
+			break;
+		case AS_GEOJSON:
+			size += strlen(as_geojson_get((as_geojson *)val));
+			break;
+		case AS_LIST:
+		case AS_MAP: {
+			// Size of the packed value, without packing it.
+			as_packer pk = {
+				.head = NULL, .tail = NULL, .buffer = NULL, .offset = 0,
+				.capacity = UINT32_MAX};
+			as_pack_val(&pk, val);
+			size += pk.offset;
+			break;
+		}
+		default:
+			size += sizeof(int64_t);
+			break;
+		}
+	}
+
+	as_record_iterator_destroy(&it);
+	return size;
+}
+
+// Returns a new dict of the bins of entry named in py_bin_names, or NULL if
+// the entry does not hold all of them.
+static PyObject *record_cache_entry_bins(AerospikeClient *self,
+										 record_cache_entry *entry,
+										 PyObject *py_bin_names)
+{
+	PyObject *py_bins = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	if (!py_bin_names) {
+		if (entry->bin_names ||
+			bins_to_pyobject(self, &err, entry->bins, &py_bins, false) !=
+				AEROSPIKE_OK) {
+			return NULL;
+		}
+		return py_bins;
+	}
+
+	py_bins = PyDict_New();
+	Py_ssize_t size = PySequence_Fast_GET_SIZE(py_bin_names);
+
+	for (Py_ssize_t i = 0; py_bins && i < size; i++) {
+		PyObject *py_name = PySequence_Fast_GET_ITEM(py_bin_names, i);
+		const char *name =
+			PyUnicode_Check(py_name) ? PyUnicode_AsUTF8(py_name) : NULL;
+		if (!name || (entry->bin_names &&
+					  PySet_Contains(entry->bin_names, py_name) != 1)) {
+			Py_CLEAR(py_bins);
+			break;
+		}
+
+		// Bins missing from the record are left out, like a select does.
+		as_val *val = (as_val *)as_record_get(entry->bins, name);
+		if (!val) {
+			continue;
+		}
+
+		PyObject *py_value = NULL;
+		if (val_to_pyobject(self, &err, val, &py_value) != AEROSPIKE_OK ||
+			PyDict_SetItem(py_bins, py_name, py_value) == -1) {
+			Py_CLEAR(py_bins);
+		}
+		Py_XDECREF(py_value);
+	}
+
+	PyErr_Clear();
+	return py_bins;
+}
+
+bool record_cache_get(AerospikeClient *self, as_key *key,
+					  PyObject *py_bin_names, const as_exp *filter_exp,
+					  PyObject **py_rec)
+{
+	record_cache *cache = self->record_cache;
+	if (!cache || filter_exp) {
+		return false;
+	}
+
+	PyObject *py_cache_key = record_cache_key(cache, key);
+	if (!py_cache_key) {
+		return false;
+	}
+
+	PyObject *py_key = NULL;
+	PyObject *py_meta = NULL;
+	PyObject *py_bins = NULL;
+	bool found = false;
+
+	PyObject *py_capsule = PyDict_GetItem(cache->entries, py_cache_key);
+	if (!py_capsule && cache->shm) {
+		py_capsule = record_cache_shm_load(cache, key, py_cache_key);
+	}
+	if (!py_capsule) {
+		goto CLEANUP;
+	}
+
+	record_cache_entry *entry = record_cache_entry_get(py_capsule);
+	uint64_t now = cf_getms();
+	if (entry->expires_ms && entry->expires_ms <= now) {
+		record_cache_remove(cache, py_cache_key);
+		goto CLEANUP;
+	}
+
+	if (cache->shm) {
+		// Another process wrote since the entry was checked, so only keep it
+		// if the shared memory still holds the same record.
+		uint32_t shm_seq = record_cache_shm_seq(cache->shm);
+		if (entry->shm_seq != shm_seq) {
+			if (!record_cache_shm_contains(cache->shm, key, entry->gen)) {
+				record_cache_remove(cache, py_cache_key);
+				goto CLEANUP;
+			}
+			entry->shm_seq = shm_seq;
+		}
+	}
+
+	py_bins = record_cache_entry_bins(self, entry, py_bin_names);
+	if (!py_bins) {
+		goto CLEANUP;
+	}
+
+	as_error err;
+	as_error_init(&err);
+	if (key_to_pyobject(&err, key, &py_key) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	uint32_t ttl = entry->ttl;
+	if (entry->record_expires_ms) {
+		// Round up, the record has not expired yet.
+		ttl = (uint32_t)((entry->record_expires_ms - now + 999) / 1000);
+	}
+	py_meta = Py_BuildValue("{s:I,s:I}", "ttl", ttl, "gen", entry->gen);
+	if (!py_meta) {
+		goto CLEANUP;
+	}
+
+	*py_rec = PyTuple_Pack(3, py_key, py_meta, py_bins);
+	found = *py_rec != NULL;
+
+	entry->hits++;
+	if (found && cache->policy == RECORD_CACHE_POLICY_LRU) {
+		// Move the entry to the end, as the most recently used.
+		Py_INCREF(py_capsule);
+		PyDict_DelItem(cache->entries, py_cache_key);
+		PyDict_SetItem(cache->entries, py_cache_key, py_capsule);
+		Py_DECREF(py_capsule);
+	}
+
+CLEANUP:
+	Py_XDECREF(py_key);
+	Py_XDECREF(py_meta);
+	Py_XDECREF(py_bins);
+	Py_DECREF(py_cache_key);
+	PyErr_Clear();
+	return found;
+}
+
+void record_cache_put(AerospikeClient *self, as_key *key, const as_record *rec,
+					  PyObject *py_rec, PyObject *py_bin_names,
+					  const as_exp *filter_exp, uint64_t seq)
+{
+	record_cache *cache = self->record_cache;
+
+	// Skip records written to while the read was in flight.
+	if (!cache || filter_exp ||
+		(uint32_t)(seq >> 32) != (uint32_t)cache->write_seq || !rec ||
+		!py_rec || !PyTuple_Check(py_rec) || PyTuple_GET_SIZE(py_rec) != 3 ||
+		!PyDict_Check(PyTuple_GET_ITEM(py_rec, 2))) {
+		return;
+	}
+
+	PyObject *py_cache_key = record_cache_key(cache, key);
+	if (!py_cache_key) {
+		return;
+	}
+
+	record_cache_entry *entry = cf_malloc(sizeof(record_cache_entry));
+	memset(entry, 0, sizeof(record_cache_entry));
+
+	// Values stored inline in the bins of rec are copied.
+	entry->bins = completion_record_copy(rec);
+	if (py_bin_names) {
+		entry->bin_names = PyFrozenSet_New(py_bin_names);
+	}
+	entry->gen = rec->gen;
+	entry->ttl = rec->ttl;
+	entry->size = record_cache_estimate_size(rec);
+	entry->shm_seq = (uint32_t)seq;
+
+	uint64_t now = cf_getms();
+	if (rec->ttl != AS_RECORD_NO_EXPIRE_TTL) {
+		entry->record_expires_ms = now + (uint64_t)rec->ttl * 1000;
+		entry->expires_ms = entry->record_expires_ms;
+	}
+	record_cache_cap_expiry(cache, entry, now);
+
+	if (!py_bin_names && cache->shm) {
+		// Only whole records are shared, so they can serve any read.
+		record_cache_shm_put(cache->shm, key, rec, entry->record_expires_ms,
+							 entry->expires_ms, (uint32_t)seq);
+	}
+
+	if (py_bin_names && !entry->bin_names) {
+		as_record_destroy(entry->bins);
+		entry->bins = NULL;
+	}
+	record_cache_insert(cache, py_cache_key, entry);
+
+	Py_DECREF(py_cache_key);
+	PyErr_Clear();
+}
+
+void record_cache_invalidate(AerospikeClient *self, as_key *key)
+{
+	record_cache *cache = self->record_cache;
+	if (!cache) {
+		return;
+	}
+
+	cache->write_seq++;
+	if (cache->shm) {
+		// Other processes may cache sets that this one does not.
+		record_cache_shm_invalidate(cache->shm, key);
+	}
+
+	PyObject *py_cache_key = record_cache_key(cache, key);
+	if (py_cache_key) {
+		record_cache_remove(cache, py_cache_key);
+		Py_DECREF(py_cache_key);
+	}
+	PyErr_Clear();
+}
+
+void record_cache_invalidate_batch(AerospikeClient *self, as_batch *batch)
+{
+	if (!self->record_cache || !batch) {
+		return;
+	}
+
+	for (uint32_t i = 0; i < batch->keys.size; i++) {
+		record_cache_invalidate(self, &batch->keys.entries[i]);
+	}
+}
+
+void record_cache_invalidate_records(AerospikeClient *self,
+									 as_batch_records *records)
+{
+	if (!self->record_cache || !records) {
+		return;
+	}
+
+	for (uint32_t i = 0; i < records->list.size; i++) {
+		as_batch_base_record *record = as_vector_get(&records->list, i);
+		record_cache_invalidate(self, &record->key);
+	}
+}
+
+void record_cache_clear(AerospikeClient *self)
+{
+	record_cache *cache = self->record_cache;
+	if (!cache) {
+		return;
+	}
+
+	cache->write_seq++;
+	PyDict_Clear(cache->entries);
+	cache->bytes = 0;
+
+	if (cache->shm) {
+		record_cache_shm_clear(cache->shm);
+	}
+}
+
+void record_cache_destroy(AerospikeClient *self)
+{
+	record_cache *cache = self->record_cache;
+	if (!cache) {
+		return;
+	}
+
+	Py_CLEAR(cache->entries);
+	Py_CLEAR(cache->sets);
+	if (cache->shm) {
+		record_cache_shm_detach(cache->shm);
+	}
+	cf_free(cache);
+	self->record_cache = NULL;
+}
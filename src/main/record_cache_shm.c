@@ -0,0 +1,589 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <sched.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+#include <sys/file.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_list.h>
+#include <aerospike/as_map.h>
+#include <aerospike/as_msgpack.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_record_iterator.h>
+#include <aerospike/as_string.h>
+#include <citrusleaf/alloc.h>
+#include <citrusleaf/cf_clock.h>
+
+#include "record_cache_shm.h"
+
+#define RECORD_CACHE_SHM_MAGIC 0x52435348
+#define RECORD_CACHE_SHM_LAYOUT 1
+#define RECORD_CACHE_SHM_DEFAULT_KEY 0xA9100000
+#define RECORD_CACHE_SHM_DEFAULT_RECORDS 4096
+#define RECORD_CACHE_SHM_DEFAULT_RECORD_SIZE 4096
+#define RECORD_CACHE_SHM_MAX_RECORD_SIZE (1024 * 1024)
+
+// Attempts to lock a slot written to by another process, before giving up.
+#define RECORD_CACHE_SHM_LOCK_SPINS 1000
+
+// Milliseconds to wait for the process creating the segment to set it up.
+#define RECORD_CACHE_SHM_ATTACH_WAIT_MS 1000
+
+typedef struct record_cache_shm_header_s {
+	// Set last by the process creating the segment.
+	uint32_t magic;
+	uint32_t layout;
+	uint32_t n_slots;
+	uint32_t max_record_size;
+	// Bumped by every invalidation, from any process.
+	uint64_t write_seq;
+	uint8_t pad[40];
+} record_cache_shm_header;
+
+typedef struct record_cache_shm_slot_s {
+	// Odd while a process writes to the slot.
+	uint32_t version;
+	// Size of the packed bins, 0 for an empty slot.
+	uint32_t size;
+	uint32_t gen;
+	uint32_t ttl;
+	uint64_t record_expires_ms;
+	uint64_t expires_ms;
+	char ns[AS_NAMESPACE_MAX_SIZE];
+	uint8_t digest[AS_DIGEST_VALUE_SIZE];
+	uint8_t data[];
+} record_cache_shm_slot;
+
+struct record_cache_shm_s {
+	record_cache_shm_header *header;
+	uint8_t *slots;
+	size_t size;
+	uint32_t n_slots;
+	uint32_t max_record_size;
+	size_t slot_stride;
+};
+
+static record_cache_shm_slot *shm_slot_get(record_cache_shm *shm,
+										   const as_digest *digest)
+{
+	uint32_t hash;
+	memcpy(&hash, digest->value + 8, sizeof(hash));
+	return (record_cache_shm_slot *)(shm->slots + (size_t)(hash % shm->n_slots) *
+													  shm->slot_stride);
+}
+
+static bool shm_slot_matches(const record_cache_shm_slot *slot,
+							 const as_key *key, const as_digest *digest)
+{
+	return slot->size && !strncmp(slot->ns, key->ns, AS_NAMESPACE_MAX_SIZE) &&
+		   !memcmp(slot->digest, digest->value, AS_DIGEST_VALUE_SIZE);
+}
+
+static bool shm_slot_lock(record_cache_shm_slot *slot, int spins)
+{
+	for (int i = 0; i < spins; i++) {
+		uint32_t version = __atomic_load_n(&slot->version, __ATOMIC_RELAXED);
+		if (!(version & 1) &&
+			__atomic_compare_exchange_n(&slot->version, &version, version + 1,
+										false, __ATOMIC_ACQUIRE,
+										__ATOMIC_RELAXED)) {
+			return true;
+		}
+		sched_yield();
+	}
+	return false;
+}
+
+static void shm_slot_unlock(record_cache_shm_slot *slot)
+{
+	__atomic_add_fetch(&slot->version, 1, __ATOMIC_RELEASE);
+}
+
+static bool shm_val_is_plain(const as_val *val);
+
+static bool shm_list_item_is_plain(as_val *val, void *udata)
+{
+	return shm_val_is_plain(val);
+}
+
+static bool shm_map_entry_is_plain(const as_val *key, const as_val *val,
+								   void *udata)
+{
+	return shm_val_is_plain(key) && shm_val_is_plain(val);
+}
+
+// Returns true if val holds no pickled bytes, at any depth. Pickled bytes are
+// never shared, so that no process unpickles what another one wrote.
+static bool shm_val_is_plain(const as_val *val)
+{
+	if (!val) {
+		return true;
+	}
+
+	switch (as_val_type(val)) {
+	case AS_BYTES:
+		return as_bytes_get_type((as_bytes *)val) != AS_BYTES_PYTHON;
+	case AS_LIST:
+		return as_list_foreach((as_list *)val, shm_list_item_is_plain, NULL);
+	case AS_MAP:
+		return as_map_foreach((as_map *)val, shm_map_entry_is_plain, NULL);
+	default:
+		return true;
+	}
+}
+
+static int shm_uint_config(PyObject *py_config, const char *name,
+						   uint64_t max, uint64_t *value)
+{
+	PyObject *py_value = PyDict_GetItemString(py_config, name);
+	if (!py_value) {
+		return 0;
+	}
+
+	if (!PyLong_Check(py_value) || PyBool_Check(py_value)) {
+		return -1;
+	}
+
+	unsigned long long v = PyLong_AsUnsignedLongLong(py_value);
+	if (PyErr_Occurred() || !v || v > max) {
+		PyErr_Clear();
+		return -1;
+	}
+
+	*value = v;
+	return 0;
+}
+
+// Returns true if the segment belongs to the user of this process, and no
+// other user can read or write it.
+static bool shm_owned(int fd)
+{
+	struct stat st;
+	return fstat(fd, &st) == 0 && st.st_uid == geteuid() &&
+		   !(st.st_mode & (S_IRWXG | S_IRWXO));
+}
+
+// Waits for the process creating the segment to size it and set it up.
+// Returns 0 once it is set up, 1 if it is still not, and -1 if it was created
+// with another layout.
+static int shm_wait_ready(int fd, size_t size, record_cache_shm_header **header)
+{
+	struct stat st;
+
+	for (int ms = 0; ms < RECORD_CACHE_SHM_ATTACH_WAIT_MS; ms++) {
+		if (fstat(fd, &st) == -1) {
+			return -1;
+		}
+
+		if ((size_t)st.st_size == size) {
+			if (!*header) {
+				void *addr =
+					mmap(NULL, size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+				if (addr == MAP_FAILED) {
+					return -1;
+				}
+				*header = addr;
+			}
+
+			if (__atomic_load_n(&(*header)->magic, __ATOMIC_ACQUIRE) ==
+				RECORD_CACHE_SHM_MAGIC) {
+				return 0;
+			}
+		}
+		else if (st.st_size) {
+			// Created with another layout.
+			return -1;
+		}
+
+		usleep(1000);
+	}
+
+	return 1;
+}
+
+// Unlinks the segment opened as fd, unless name was already given to
+// another segment.
+static void shm_unlink_stale(const char *name, int fd)
+{
+	struct stat st;
+	struct stat named_st;
+
+	int named_fd = shm_open(name, O_RDONLY, 0);
+	if (named_fd == -1) {
+		return;
+	}
+
+	if (fstat(fd, &st) == 0 && fstat(named_fd, &named_st) == 0 &&
+		st.st_dev == named_st.st_dev && st.st_ino == named_st.st_ino) {
+		shm_unlink(name);
+	}
+	close(named_fd);
+}
+
+// Creates and sets up the segment. Returns 0 once it is set up, 1 if it
+// already exists, and -1 on error.
+static int shm_create(const char *name, size_t size, uint32_t n_slots,
+					  uint32_t max_record_size, record_cache_shm_header **header)
+{
+	int fd = shm_open(name, O_RDWR | O_CREAT | O_EXCL, 0600);
+	if (fd == -1) {
+		return errno == EEXIST ? 1 : -1;
+	}
+
+	// Held until the segment is set up, so that the other processes can tell
+	// a creator which died from one which is still at it.
+	flock(fd, LOCK_EX);
+
+	int rc = -1;
+	if (ftruncate(fd, (off_t)size) == 0) {
+		void *addr = mmap(NULL, size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+		if (addr != MAP_FAILED) {
+			*header = addr;
+			(*header)->layout = RECORD_CACHE_SHM_LAYOUT;
+			(*header)->n_slots = n_slots;
+			(*header)->max_record_size = max_record_size;
+			__atomic_store_n(&(*header)->magic, RECORD_CACHE_SHM_MAGIC,
+							 __ATOMIC_RELEASE);
+			rc = 0;
+		}
+	}
+
+	if (rc == -1) {
+		shm_unlink(name);
+	}
+
+	// The mapping stays valid after the descriptor is closed.
+	close(fd);
+	return rc;
+}
+
+// Attaches to the segment created by another process. Returns 0 once
+// attached, 1 if the segment is gone or was left unset by a creator which
+// died, and -1 on error.
+static int shm_open_existing(const char *name, size_t size, uint32_t n_slots,
+							 uint32_t max_record_size,
+							 record_cache_shm_header **header)
+{
+	int fd = shm_open(name, O_RDWR, 0);
+	if (fd == -1) {
+		return errno == ENOENT ? 1 : -1;
+	}
+
+	// Records are unpacked from the segment, so it must not be writable by
+	// anyone else.
+	int rc = shm_owned(fd) ? shm_wait_ready(fd, size, header) : -1;
+
+	if (rc == 1) {
+		// The creator holds the lock until it sets up the segment.
+		if (flock(fd, LOCK_EX | LOCK_NB) == 0 &&
+			(!*header || __atomic_load_n(&(*header)->magic, __ATOMIC_ACQUIRE) !=
+							 RECORD_CACHE_SHM_MAGIC)) {
+			shm_unlink_stale(name, fd);
+		}
+		else {
+			rc = -1;
+		}
+	}
+	else if (rc == 0 && ((*header)->layout != RECORD_CACHE_SHM_LAYOUT ||
+						 (*header)->n_slots != n_slots ||
+						 (*header)->max_record_size != max_record_size)) {
+		rc = -1;
+	}
+
+	if (rc != 0 && *header) {
+		munmap(*header, size);
+		*header = NULL;
+	}
+
+	close(fd);
+	return rc;
+}
+
+int record_cache_shm_attach(PyObject *py_config, record_cache_shm **shm)
+{
+	*shm = NULL;
+
+	if (!PyDict_Check(py_config)) {
+		return -1;
+	}
+
+	uint64_t shm_key = RECORD_CACHE_SHM_DEFAULT_KEY;
+	uint64_t n_slots = RECORD_CACHE_SHM_DEFAULT_RECORDS;
+	uint64_t max_record_size = RECORD_CACHE_SHM_DEFAULT_RECORD_SIZE;
+
+	if (shm_uint_config(py_config, "shm_key", UINT32_MAX, &shm_key) == -1 ||
+		shm_uint_config(py_config, "max_records", UINT32_MAX, &n_slots) ==
+			-1 ||
+		shm_uint_config(py_config, "max_record_size",
+						RECORD_CACHE_SHM_MAX_RECORD_SIZE,
+						&max_record_size) == -1) {
+		return -1;
+	}
+
+	PyObject *py_reset = PyDict_GetItemString(py_config, "reset");
+	if (py_reset && !PyBool_Check(py_reset)) {
+		return -1;
+	}
+
+	size_t slot_stride = (sizeof(record_cache_shm_slot) + max_record_size + 7) &
+						 ~(size_t)7;
+	size_t size = sizeof(record_cache_shm_header) + n_slots * slot_stride;
+
+	char name[64];
+	snprintf(name, sizeof(name), "/aerospike_record_cache_%08x",
+			 (uint32_t)shm_key);
+
+	if (py_reset == Py_True) {
+		// Processes still attached keep the old segment until they detach.
+		shm_unlink(name);
+	}
+
+	record_cache_shm_header *header = NULL;
+	int rc = 1;
+
+	// Retried once, if a stale segment is unlinked or the segment is unlinked
+	// between the two opens.
+	for (int i = 0; i < 2 && rc == 1; i++) {
+		rc = shm_create(name, size, (uint32_t)n_slots,
+						(uint32_t)max_record_size, &header);
+		if (rc == 1) {
+			rc = shm_open_existing(name, size, (uint32_t)n_slots,
+								   (uint32_t)max_record_size, &header);
+		}
+	}
+
+	if (rc != 0) {
+		return -1;
+	}
+
+	*shm = cf_malloc(sizeof(record_cache_shm));
+	(*shm)->header = header;
+	(*shm)->slots = (uint8_t *)(header + 1);
+	(*shm)->size = size;
+	(*shm)->n_slots = (uint32_t)n_slots;
+	(*shm)->max_record_size = (uint32_t)max_record_size;
+	(*shm)->slot_stride = slot_stride;
+	return 0;
+}
+
+uint32_t record_cache_shm_seq(record_cache_shm *shm)
+{
+	return (uint32_t)__atomic_load_n(&shm->header->write_seq,
+									 __ATOMIC_SEQ_CST);
+}
+
+bool record_cache_shm_get(record_cache_shm *shm, as_key *key,
+						  record_cache_shm_record *record)
+{
+	as_digest *digest = as_key_digest(key);
+	if (!digest) {
+		return false;
+	}
+
+	record_cache_shm_slot *slot = shm_slot_get(shm, digest);
+	uint32_t version = __atomic_load_n(&slot->version, __ATOMIC_ACQUIRE);
+	if (version & 1) {
+		return false;
+	}
+
+	// Copy the slot out, and only use the copy if no process wrote to the
+	// slot in the meantime.
+	record_cache_shm_slot head;
+	memcpy(&head, slot, sizeof(head));
+	if (!shm_slot_matches(&head, key, digest) ||
+		head.size > shm->max_record_size ||
+		(head.expires_ms && head.expires_ms <= cf_getms())) {
+		return false;
+	}
+
+	uint8_t *data = cf_malloc(head.size);
+	memcpy(data, slot->data, head.size);
+
+	__atomic_thread_fence(__ATOMIC_ACQUIRE);
+	if (__atomic_load_n(&slot->version, __ATOMIC_RELAXED) != version) {
+		cf_free(data);
+		return false;
+	}
+
+	as_unpacker pk = {.buffer = data, .length = head.size, .offset = 0};
+	as_val *val = NULL;
+	bool found = false;
+
+	if (as_unpack_val(&pk, &val) == 0 && val &&
+		as_val_type(val) == AS_MAP && shm_val_is_plain(val)) {
+		// The unpacked values are copies, they outlive data.
+		record->bins = (as_map *)val;
+		found = true;
+	}
+	else if (val) {
+		as_val_destroy(val);
+	}
+	cf_free(data);
+
+	if (found) {
+		record->gen = head.gen;
+		record->ttl = head.ttl;
+		record->record_expires_ms = head.record_expires_ms;
+		record->expires_ms = head.expires_ms;
+		record->size = head.size;
+	}
+
+	return found;
+}
+
+bool record_cache_shm_contains(record_cache_shm *shm, as_key *key,
+							   uint32_t gen)
+{
+	as_digest *digest = as_key_digest(key);
+	if (!digest) {
+		return false;
+	}
+
+	record_cache_shm_slot *slot = shm_slot_get(shm, digest);
+	uint32_t version = __atomic_load_n(&slot->version, __ATOMIC_ACQUIRE);
+	if (version & 1) {
+		return false;
+	}
+
+	record_cache_shm_slot head;
+	memcpy(&head, slot, sizeof(head));
+
+	__atomic_thread_fence(__ATOMIC_ACQUIRE);
+	return __atomic_load_n(&slot->version, __ATOMIC_RELAXED) == version &&
+		   shm_slot_matches(&head, key, digest) && head.gen == gen;
+}
+
+// Packs the bins of rec as a map of bin name to value. Returns the packed
+// size, or 0 if the bins do not fit in capacity, hold pickled bytes or can
+// not be packed.
+static uint32_t shm_pack_bins(const as_record *rec, uint8_t *buffer,
+							  uint32_t capacity)
+{
+	as_packer pk = {.head = NULL,
+					.tail = NULL,
+					.buffer = buffer,
+					.offset = 0,
+					.capacity = capacity};
+
+	if (as_pack_map_header(&pk, as_record_numbins(rec)) != 0) {
+		return 0;
+	}
+
+	as_record_iterator it;
+	as_record_iterator_init(&it, rec);
+	bool packed = true;
+
+	while (packed && as_record_iterator_has_next(&it)) {
+		as_bin *bin = as_record_iterator_next(&it);
+		as_string name;
+		as_string_init(&name, as_bin_get_name(bin), false);
+
+		packed = shm_val_is_plain((as_val *)as_bin_get_value(bin)) &&
+				 as_pack_val(&pk, (as_val *)&name) == 0 &&
+				 as_pack_val(&pk, (as_val *)as_bin_get_value(bin)) == 0;
+	}
+
+	as_record_iterator_destroy(&it);
+	return packed ? pk.offset : 0;
+}
+
+void record_cache_shm_put(record_cache_shm *shm, as_key *key,
+						  const as_record *rec, uint64_t record_expires_ms,
+						  uint64_t expires_ms, uint32_t seq)
+{
+	as_digest *digest = as_key_digest(key);
+	if (!digest) {
+		return;
+	}
+
+	// Pack before locking, to keep the slot locked for a copy only.
+	uint8_t *data = cf_malloc(shm->max_record_size);
+	uint32_t size = shm_pack_bins(rec, data, shm->max_record_size);
+
+	record_cache_shm_slot *slot = shm_slot_get(shm, digest);
+	if (!size || !shm_slot_lock(slot, 1)) {
+		cf_free(data);
+		return;
+	}
+
+	// Checked under the lock, as invalidations bump the sequence before
+	// locking the slot.
+	if (record_cache_shm_seq(shm) == seq) {
+		slot->size = size;
+		slot->gen = rec->gen;
+		slot->ttl = rec->ttl;
+		slot->record_expires_ms = record_expires_ms;
+		slot->expires_ms = expires_ms;
+		strncpy(slot->ns, key->ns, AS_NAMESPACE_MAX_SIZE);
+		memcpy(slot->digest, digest->value, AS_DIGEST_VALUE_SIZE);
+		memcpy(slot->data, data, size);
+	}
+
+	shm_slot_unlock(slot);
+	cf_free(data);
+}
+
+void record_cache_shm_invalidate(record_cache_shm *shm, as_key *key)
+{
+	__atomic_add_fetch(&shm->header->write_seq, 1, __ATOMIC_SEQ_CST);
+
+	as_digest *digest = as_key_digest(key);
+	if (!digest) {
+		return;
+	}
+
+	// A slot left locked by a process which died is never read, so it is
+	// fine to give up on it.
+	record_cache_shm_slot *slot = shm_slot_get(shm, digest);
+	if (shm_slot_lock(slot, RECORD_CACHE_SHM_LOCK_SPINS)) {
+		if (shm_slot_matches(slot, key, digest)) {
+			slot->size = 0;
+		}
+		shm_slot_unlock(slot);
+	}
+}
+
+void record_cache_shm_clear(record_cache_shm *shm)
+{
+	__atomic_add_fetch(&shm->header->write_seq, 1, __ATOMIC_SEQ_CST);
+
+	for (uint32_t i = 0; i < shm->n_slots; i++) {
+		record_cache_shm_slot *slot =
+			(record_cache_shm_slot *)(shm->slots + i * shm->slot_stride);
+		if (shm_slot_lock(slot, RECORD_CACHE_SHM_LOCK_SPINS)) {
+			slot->size = 0;
+			shm_slot_unlock(slot);
+		}
+	}
+}
+
+void record_cache_shm_detach(record_cache_shm *shm)
+{
+	munmap(shm->header, shm->size);
+	cf_free(shm);
+}
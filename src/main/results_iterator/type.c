@@ -0,0 +1,223 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "conversions.h"
+#include "exceptions.h"
+#include "record.h"
+#include "results_iterator.h"
+#include "results_queue.h"
+
+typedef struct {
+	PyObject_HEAD
+	AerospikeClient *client;
+	// Query or Scan object owning the command.
+	PyObject *py_source;
+	bool compact_records;
+	// NULL once the results are exhausted or the iterator is closed.
+	results_queue *queue;
+	// Set while __next__ waits on the queue without the GIL. The queue is
+	// not freed meanwhile, close() only cancels it and sets closed.
+	bool popping;
+	bool closed;
+} AerospikeResultsIterator;
+
+static PyTypeObject AerospikeResultsIterator_Type;
+
+/**
+ * Cancels the command if it is still running and releases the buffered
+ * results. Needs the GIL.
+ */
+static void results_iterator_stop(AerospikeResultsIterator *self,
+								  as_error *err)
+{
+	results_queue *queue = self->queue;
+
+	if (!queue) {
+		return;
+	}
+	self->queue = NULL;
+
+	Py_BEGIN_ALLOW_THREADS
+	results_queue_destroy(queue, err);
+	Py_END_ALLOW_THREADS
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject *AerospikeResultsIterator_Next(AerospikeResultsIterator *self)
+{
+	as_val *val = NULL;
+	uint32_t count = 0;
+	PyObject *py_result = NULL;
+	as_error err;
+	as_error_init(&err);
+
+	if (!self->queue) {
+		return NULL;
+	}
+	if (self->popping) {
+		PyErr_SetString(PyExc_ValueError, "ResultsIterator already executing");
+		return NULL;
+	}
+
+	results_queue *queue = self->queue;
+	self->popping = true;
+	Py_BEGIN_ALLOW_THREADS
+	count = results_queue_pop(queue, &val, 1);
+	Py_END_ALLOW_THREADS
+	self->popping = false;
+
+	if (self->closed) {
+		// Closed by another thread while waiting, the queue is freed here.
+		if (count) {
+			as_val_destroy(val);
+		}
+		results_iterator_stop(self, NULL);
+		return NULL;
+	}
+
+	if (!count) {
+		// All the results were consumed, raise the error of the command, if
+		// any, or stop the iteration.
+		results_iterator_stop(self, &err);
+		if (err.code != AEROSPIKE_OK) {
+			raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		}
+		return NULL;
+	}
+
+	if (self->compact_records) {
+		val_to_compact_pyobject(self->client, &err, val, &py_result);
+	}
+	else {
+		val_to_pyobject(self->client, &err, val, &py_result);
+	}
+	as_val_destroy(val);
+
+	if (err.code != AEROSPIKE_OK) {
+		Py_XDECREF(py_result);
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return py_result;
+}
+
+static PyObject *AerospikeResultsIterator_Close(AerospikeResultsIterator *self,
+												PyObject *unused)
+{
+	if (self->popping) {
+		// Another thread waits on the queue, it frees the queue once woken.
+		self->closed = true;
+		results_queue_cancel(self->queue);
+	}
+	else {
+		results_iterator_stop(self, NULL);
+	}
+
+	Py_INCREF(Py_None);
+	return Py_None;
+}
+
+PyDoc_STRVAR(close_doc, "close() -> None\n\
+\n\
+Stops the query or scan and releases the buffered results. The iterator is \
+exhausted afterwards.");
+
+static PyMethodDef AerospikeResultsIterator_Type_Methods[] = {
+	{"close", (PyCFunction)AerospikeResultsIterator_Close, METH_NOARGS,
+	 close_doc},
+	{NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static void AerospikeResultsIterator_Type_Dealloc(AerospikeResultsIterator *self)
+{
+	results_iterator_stop(self, NULL);
+
+	Py_XDECREF(self->py_source);
+	Py_XDECREF(self->client);
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeResultsIterator_Type = {
+	PyVarObject_HEAD_INIT(NULL, 0).tp_name = "aerospike.ResultsIterator",
+	.tp_basicsize = sizeof(AerospikeResultsIterator),
+	.tp_dealloc = (destructor)AerospikeResultsIterator_Type_Dealloc,
+	.tp_flags = Py_TPFLAGS_DEFAULT,
+	.tp_doc = "Iterator over the results of a query or scan, returned by\n"
+			  "iter_results(). The results are buffered in a bounded queue\n"
+			  "filled by a background thread.\n",
+	.tp_iter = PyObject_SelfIter,
+	.tp_iternext = (iternextfunc)AerospikeResultsIterator_Next,
+	.tp_methods = AerospikeResultsIterator_Type_Methods};
+
+PyTypeObject *AerospikeResultsIterator_Ready()
+{
+	return PyType_Ready(&AerospikeResultsIterator_Type) == 0
+			   ? &AerospikeResultsIterator_Type
+			   : NULL;
+}
+
+PyObject *AerospikeResultsIterator_New(AerospikeClient *client,
+									   PyObject *py_source, as_error *err,
+									   uint32_t buffer, bool compact_records,
+									   results_queue_run_fn run,
+									   results_queue_destroy_fn destroy,
+									   void *command)
+{
+	AerospikeResultsIterator *self = PyObject_New(
+		AerospikeResultsIterator, &AerospikeResultsIterator_Type);
+	if (!self) {
+		PyErr_Clear();
+		destroy(command);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to allocate results iterator");
+		return NULL;
+	}
+
+	Py_INCREF(client);
+	self->client = client;
+	Py_INCREF(py_source);
+	self->py_source = py_source;
+	self->compact_records = compact_records;
+	self->queue = NULL;
+	self->popping = false;
+	self->closed = false;
+
+	self->queue =
+		results_queue_start(client->as, err, buffer, run, destroy, command);
+	if (!self->queue) {
+		Py_DECREF(self);
+		return NULL;
+	}
+
+	return (PyObject *)self;
+}
@@ -0,0 +1,287 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_partition.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_val.h>
+#include <citrusleaf/alloc.h>
+
+#include "completion_queue.h"
+#include "conversions.h"
+#include "record.h"
+#include "results_queue.h"
+
+static as_val *results_queue_copy(const as_val *val)
+{
+	if (as_val_type(val) != AS_REC) {
+		return as_val_reserve(val);
+	}
+
+	// Records are destroyed by the C client when the callback returns.
+	as_record *rec = as_record_fromval(val);
+	as_record *copy = completion_record_copy(rec);
+	completion_key_copy(&copy->key, &rec->key);
+	return (as_val *)copy;
+}
+
+static bool results_queue_push(const as_val *val, void *udata)
+{
+	results_queue *queue = (results_queue *)udata;
+
+	if (!val) {
+		return false;
+	}
+
+	as_val *copy = results_queue_copy(val);
+
+	pthread_mutex_lock(&queue->lock);
+
+	// Backpressure, wait for the consumer to catch up.
+	while (queue->size == queue->capacity && !queue->cancelled) {
+		pthread_cond_wait(&queue->not_full, &queue->lock);
+	}
+
+	if (queue->cancelled) {
+		pthread_mutex_unlock(&queue->lock);
+		as_val_destroy(copy);
+		return false;
+	}
+
+	queue->entries[(queue->head + queue->size) % queue->capacity] = copy;
+	queue->size++;
+	pthread_cond_signal(&queue->not_empty);
+
+	pthread_mutex_unlock(&queue->lock);
+
+	return true;
+}
+
+static void *results_queue_worker(void *udata)
+{
+	results_queue *queue = (results_queue *)udata;
+	as_error err;
+	as_error_init(&err);
+
+	queue->run(queue->as, &err, queue->command, results_queue_push, queue);
+
+	pthread_mutex_lock(&queue->lock);
+	as_error_copy(&queue->error, &err);
+	queue->done = true;
+	pthread_cond_signal(&queue->not_empty);
+	pthread_mutex_unlock(&queue->lock);
+
+	return NULL;
+}
+
+static void results_queue_free(results_queue *queue)
+{
+	while (queue->size) {
+		as_val_destroy(queue->entries[queue->head]);
+		queue->head = (queue->head + 1) % queue->capacity;
+		queue->size--;
+	}
+
+	if (queue->destroy) {
+		queue->destroy(queue->command);
+	}
+
+	pthread_cond_destroy(&queue->not_full);
+	pthread_cond_destroy(&queue->not_empty);
+	pthread_mutex_destroy(&queue->lock);
+	cf_free(queue->entries);
+	cf_free(queue);
+}
+
+results_queue *results_queue_start(aerospike *as, as_error *err,
+								   uint32_t capacity, results_queue_run_fn run,
+								   results_queue_destroy_fn destroy,
+								   void *command)
+{
+	results_queue *queue = cf_malloc(sizeof(results_queue));
+	queue->as = as;
+	queue->run = run;
+	queue->destroy = destroy;
+	queue->command = command;
+
+	pthread_mutex_init(&queue->lock, NULL);
+	pthread_cond_init(&queue->not_empty, NULL);
+	pthread_cond_init(&queue->not_full, NULL);
+	queue->entries = cf_malloc(sizeof(as_val *) * capacity);
+	queue->capacity = capacity;
+	queue->head = 0;
+	queue->size = 0;
+	queue->done = false;
+	queue->cancelled = false;
+	as_error_init(&queue->error);
+
+	if (pthread_create(&queue->thread, NULL, results_queue_worker, queue) !=
+		0) {
+		results_queue_free(queue);
+		as_error_update(err, AEROSPIKE_ERR_CLIENT,
+						"Unable to start the results thread");
+		return NULL;
+	}
+
+	return queue;
+}
+
+uint32_t results_queue_pop(results_queue *queue, as_val **vals, uint32_t max)
+{
+	uint32_t count = 0;
+
+	pthread_mutex_lock(&queue->lock);
+
+	while (queue->size == 0 && !queue->done) {
+		pthread_cond_wait(&queue->not_empty, &queue->lock);
+	}
+
+	while (queue->size && count < max) {
+		vals[count++] = queue->entries[queue->head];
+		queue->head = (queue->head + 1) % queue->capacity;
+		queue->size--;
+	}
+
+	if (count) {
+		pthread_cond_broadcast(&queue->not_full);
+	}
+
+	pthread_mutex_unlock(&queue->lock);
+
+	return count;
+}
+
+void results_queue_cancel(results_queue *queue)
+{
+	pthread_mutex_lock(&queue->lock);
+	if (!queue->done) {
+		queue->cancelled = true;
+		pthread_cond_broadcast(&queue->not_full);
+	}
+	pthread_mutex_unlock(&queue->lock);
+}
+
+void results_queue_destroy(results_queue *queue, as_error *err)
+{
+	results_queue_cancel(queue);
+
+	pthread_join(queue->thread, NULL);
+
+	if (err && !queue->cancelled) {
+		as_error_copy(err, &queue->error);
+	}
+
+	results_queue_free(queue);
+}
+
+static PyObject *results_queue_convert(AerospikeClient *client, as_error *err,
+									   as_val *val, bool compact_records,
+									   bool partition_ids)
+{
+	PyObject *py_result = NULL;
+
+	if (compact_records) {
+		val_to_compact_pyobject(client, err, val, &py_result);
+	}
+	else {
+		val_to_pyobject(client, err, val, &py_result);
+	}
+
+	if (!py_result || !partition_ids) {
+		return py_result;
+	}
+
+	uint32_t part_id = 0;
+	as_record *rec = as_record_fromval(val);
+
+	if (rec && rec->key.digest.init) {
+		part_id = as_partition_getid(rec->key.digest.value, CLUSTER_NPARTITIONS);
+	}
+
+	PyObject *py_pair = PyTuple_New(2);
+	PyTuple_SetItem(py_pair, 0, PyLong_FromLong(part_id));
+	PyTuple_SetItem(py_pair, 1, py_result);
+
+	return py_pair;
+}
+
+as_status results_queue_deliver(results_queue *queue, AerospikeClient *client,
+								as_error *err, PyObject *py_callback,
+								uint32_t chunk_size, bool compact_records,
+								bool partition_ids)
+{
+	as_val **vals = cf_malloc(sizeof(as_val *) * chunk_size);
+	uint32_t count = 0;
+	bool stop = false;
+
+	while (!stop) {
+		Py_BEGIN_ALLOW_THREADS
+		count = results_queue_pop(queue, vals, chunk_size);
+		Py_END_ALLOW_THREADS
+
+		if (!count) {
+			break;
+		}
+
+		PyObject *py_chunk = PyList_New(0);
+
+		for (uint32_t i = 0; i < count; i++) {
+			PyObject *py_result = NULL;
+
+			if (err->code == AEROSPIKE_OK) {
+				py_result = results_queue_convert(client, err, vals[i],
+												  compact_records,
+												  partition_ids);
+			}
+			as_val_destroy(vals[i]);
+
+			if (py_result) {
+				PyList_Append(py_chunk, py_result);
+				Py_DECREF(py_result);
+			}
+		}
+
+		if (err->code != AEROSPIKE_OK) {
+			Py_DECREF(py_chunk);
+			break;
+		}
+
+		PyObject *py_return =
+			PyObject_CallFunctionObjArgs(py_callback, py_chunk, NULL);
+		Py_DECREF(py_chunk);
+
+		if (!py_return) {
+			as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							"Callback function contains an error");
+			break;
+		}
+
+		stop = (py_return == Py_False);
+		Py_DECREF(py_return);
+	}
+
+	cf_free(vals);
+
+	Py_BEGIN_ALLOW_THREADS
+	results_queue_destroy(queue, err->code == AEROSPIKE_OK ? err : NULL);
+	Py_END_ALLOW_THREADS
+
+	return err->code;
+}
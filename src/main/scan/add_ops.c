@@ -45,9 +45,10 @@ AerospikeScan *AerospikeScan_Add_Ops(AerospikeScan *self, PyObject *args,
 	long operation;
 	self->unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
-	self->static_pool = &static_pool;
+	// The operations keep pointing into the pool until the scan is destroyed.
+	if (!self->static_pool) {
+		self->static_pool = as_static_pool_new();
+	}
 
 	as_error err;
 	as_error_init(&err);
@@ -50,8 +50,11 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
 		return NULL;
 	}
 
-	as_static_pool static_pool;
-	memset(&static_pool, 0, sizeof(static_pool));
+	// The argument list keeps pointing into the pool until the scan is
+	// destroyed.
+	if (!self->static_pool) {
+		self->static_pool = as_static_pool_new();
+	}
 
 	as_error err;
 	as_error_init(&err);
@@ -116,7 +119,7 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
 		for (int i = 0; i < size; i++) {
 			PyObject *py_val = PyList_GetItem(py_args, (Py_ssize_t)i);
 			as_val *val = NULL;
-			pyobject_to_val(self->client, &err, py_val, &val, &static_pool,
+			pyobject_to_val(self->client, &err, py_val, &val, self->static_pool,
 							SERIALIZER_PYTHON);
 			if (err.code != AEROSPIKE_OK) {
 				as_error_update(&err, err.code, NULL);
@@ -140,7 +143,6 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
 	Py_END_ALLOW_THREADS
 
 CLEANUP:
-	POOL_DESTROY(&static_pool);
 
 	if (py_ufunction) {
 		Py_DECREF(py_ufunction);
@@ -151,17 +153,7 @@ CLEANUP:
 	}
 
 	if (err.code != AEROSPIKE_OK) {
-		PyObject *py_err = NULL;
-		error_to_pyobject(&err, &py_err);
-		PyObject *exception_type = raise_exception(&err);
-		if (PyObject_HasAttrString(exception_type, "module")) {
-			PyObject_SetAttrString(exception_type, "module", py_module);
-		}
-		if (PyObject_HasAttrString(exception_type, "func")) {
-			PyObject_SetAttrString(exception_type, "func", py_function);
-		}
-		PyErr_SetObject(exception_type, py_err);
-		Py_DECREF(py_err);
+		raise_exception_base(&err, NULL, NULL, py_module, py_function, NULL);
 		return NULL;
 	}
 
@@ -27,6 +27,8 @@
 #include "exceptions.h"
 #include "scan.h"
 #include "policy.h"
+#include "record.h"
+#include "results_queue.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
@@ -34,8 +36,40 @@ typedef struct {
 	PyObject *callback;
 	AerospikeClient *client;
 	int partition_scan;
+	bool compact_records;
 } LocalData;
 
+typedef struct {
+	as_scan *scan;
+	as_policy_scan *policy_p;
+	as_partition_filter *partition_filter_p;
+	as_partitions_status *ps;
+	char *nodename;
+} ScanCommand;
+
+static void foreach_run(aerospike *as, as_error *err, void *command,
+						results_queue_callback callback, void *udata)
+{
+	ScanCommand *cmd = (ScanCommand *)command;
+
+	if (cmd->partition_filter_p) {
+		if (cmd->ps) {
+			as_partition_filter_set_partitions(cmd->partition_filter_p,
+											   cmd->ps);
+		}
+		aerospike_scan_partitions(as, err, cmd->policy_p, cmd->scan,
+								  cmd->partition_filter_p, callback, udata);
+	}
+	else if (cmd->nodename) {
+		aerospike_scan_node(as, err, cmd->policy_p, cmd->scan, cmd->nodename,
+							callback, udata);
+	}
+	else {
+		aerospike_scan_foreach(as, err, cmd->policy_p, cmd->scan, callback,
+							   udata);
+	}
+}
+
 static bool each_result(const as_val *val, void *udata)
 {
 	bool rval = true;
@@ -68,7 +102,12 @@ static bool each_result(const as_val *val, void *udata)
 	gstate = PyGILState_Ensure();
 
 	// Convert as_val to a Python Object
-	val_to_pyobject(data->client, err, val, &py_result);
+	if (data->compact_records) {
+		val_to_compact_pyobject(data->client, err, val, &py_result);
+	}
+	else {
+		val_to_pyobject(data->client, err, val, &py_result);
+	}
 
 	if (!py_result) {
 		PyGILState_Release(gstate);
@@ -143,6 +182,11 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 	as_partition_filter *partition_filter_p = NULL;
 	as_partitions_status *ps = NULL;
 
+	ScanCommand cmd;
+	uint32_t chunk_size = 0;
+	uint32_t queue_size = 0;
+	results_queue *queue = NULL;
+
 	// Python Function Keyword Arguments
 	static char *kwlist[] = {"callback", "policy", "options", "nodename", NULL};
 
@@ -158,6 +202,7 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 	data.callback = py_callback;
 	data.client = self->client;
 	data.partition_scan = 0;
+	data.compact_records = false;
 
 	as_error_init(&data.error);
 
@@ -203,6 +248,16 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 		}
 	}
 
+	if (get_compact_records(&data.error, py_options, &data.compact_records) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (get_chunk_options(&data.error, py_options, &chunk_size,
+						  &queue_size) != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	if (py_nodename) {
 		if (PyString_Check(py_nodename)) {
 			nodename = PyString_AsString(py_nodename);
@@ -223,30 +278,35 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 		}
 	}
 
-	// We are spawning multiple threads
-	Py_BEGIN_ALLOW_THREADS
-	// Invoke operation
-	if (partition_filter_p) {
-		if (ps) {
-			as_partition_filter_set_partitions(partition_filter_p, ps);
-		}
-		aerospike_scan_partitions(self->client->as, &data.error, scan_policy_p,
-								  &self->scan, partition_filter_p, each_result,
-								  &data);
-		if (ps) {
-			as_partitions_status_release(ps);
+	cmd.scan = &self->scan;
+	cmd.policy_p = scan_policy_p;
+	cmd.partition_filter_p = partition_filter_p;
+	cmd.ps = ps;
+	cmd.nodename = nodename;
+
+	if (chunk_size) {
+		// The records are buffered by a worker thread without the GIL and
+		// handed to the callback in chunks from this thread.
+		queue = results_queue_start(self->client->as, &data.error, queue_size,
+									foreach_run, NULL, &cmd);
+		if (queue) {
+			results_queue_deliver(queue, self->client, &data.error,
+								  py_callback, chunk_size,
+								  data.compact_records, data.partition_scan);
 		}
 	}
-	else if (nodename) {
-		aerospike_scan_node(self->client->as, &data.error, scan_policy_p,
-							&self->scan, nodename, each_result, &data);
-	}
 	else {
-		aerospike_scan_foreach(self->client->as, &data.error, scan_policy_p,
-							   &self->scan, each_result, &data);
+		// We are spawning multiple threads
+		Py_BEGIN_ALLOW_THREADS
+		// Invoke operation
+		foreach_run(self->client->as, &data.error, &cmd, each_result, &data);
+		// We are done using multiple threads
+		Py_END_ALLOW_THREADS
+	}
+
+	if (ps) {
+		as_partitions_status_release(ps);
 	}
-	// We are done using multiple threads
-	Py_END_ALLOW_THREADS
 
 	if (data.error.code != AEROSPIKE_OK) {
 		goto CLEANUP;
@@ -0,0 +1,205 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/aerospike_scan.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_scan.h>
+#include <aerospike/as_partition.h>
+#include <citrusleaf/alloc.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "results_iterator.h"
+#include "scan.h"
+
+// Everything the worker thread of the iterator needs to run the scan.
+typedef struct {
+	as_scan *scan;
+	as_policy_scan policy;
+	as_policy_scan *policy_p;
+	as_exp exp_list;
+	as_exp *exp_list_p;
+	as_partition_filter partition_filter;
+	as_partition_filter *partition_filter_p;
+	as_partitions_status *ps;
+	char *nodename;
+} ScanCommand;
+
+static void scan_command_run(aerospike *as, as_error *err, void *command,
+							 results_queue_callback callback, void *udata)
+{
+	ScanCommand *cmd = (ScanCommand *)command;
+
+	if (cmd->partition_filter_p) {
+		if (cmd->ps) {
+			as_partition_filter_set_partitions(cmd->partition_filter_p,
+											   cmd->ps);
+		}
+		aerospike_scan_partitions(as, err, cmd->policy_p, cmd->scan,
+								  cmd->partition_filter_p, callback, udata);
+	}
+	else if (cmd->nodename) {
+		aerospike_scan_node(as, err, cmd->policy_p, cmd->scan, cmd->nodename,
+							callback, udata);
+	}
+	else {
+		aerospike_scan_foreach(as, err, cmd->policy_p, cmd->scan, callback,
+							   udata);
+	}
+}
+
+static void scan_command_destroy(void *command)
+{
+	ScanCommand *cmd = (ScanCommand *)command;
+
+	if (cmd->ps) {
+		as_partitions_status_release(cmd->ps);
+	}
+	if (cmd->exp_list_p) {
+		as_exp_destroy(cmd->exp_list_p);
+	}
+	if (cmd->nodename) {
+		cf_free(cmd->nodename);
+	}
+	cf_free(cmd);
+}
+
+PyObject *AerospikeScan_Iter_Results(AerospikeScan *self, PyObject *args,
+									 PyObject *kwds)
+{
+	PyObject *py_policy = NULL;
+	PyObject *py_nodename = NULL;
+	PyObject *py_options = NULL;
+	PyObject *py_ustr = NULL;
+	PyObject *py_iter = NULL;
+	unsigned long buffer = RESULTS_QUEUE_DEFAULT_CAPACITY;
+	bool compact_records = false;
+	ScanCommand *cmd = NULL;
+
+	static char *kwlist[] = {"policy", "nodename", "options", "buffer", NULL};
+
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOOk:iter_results", kwlist,
+									&py_policy, &py_nodename, &py_options,
+									&buffer) == false) {
+		return NULL;
+	}
+
+	as_error err;
+	as_error_init(&err);
+
+	if (!self || !self->client->as) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+		goto CLEANUP;
+	}
+	if (!self->client->is_conn_16) {
+		as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+						"No connection to aerospike cluster");
+		goto CLEANUP;
+	}
+
+	if (buffer == 0 || buffer > UINT32_MAX) {
+		as_error_update(&err, AEROSPIKE_ERR_PARAM,
+						"buffer must be a positive 32 bit integer");
+		goto CLEANUP;
+	}
+
+	cmd = cf_malloc(sizeof(ScanCommand));
+	memset(cmd, 0, sizeof(ScanCommand));
+	cmd->scan = &self->scan;
+
+	// The policy and expressions must outlive this call, convert them into
+	// the command.
+	pyobject_to_policy_scan(self->client, &err, py_policy, &cmd->policy,
+							&cmd->policy_p,
+							&self->client->as->config.policies.scan,
+							&cmd->exp_list, &cmd->exp_list_p);
+	if (err.code != AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_policy) {
+		PyObject *py_partition_filter =
+			PyDict_GetItemString(py_policy, "partition_filter");
+		if (py_partition_filter) {
+			if (convert_partition_filter(self->client, py_partition_filter,
+										 &cmd->partition_filter, &cmd->ps,
+										 &err) != AEROSPIKE_OK) {
+				goto CLEANUP;
+			}
+			cmd->partition_filter_p = &cmd->partition_filter;
+		}
+	}
+	as_error_reset(&err);
+
+	if (py_options && PyDict_Check(py_options)) {
+		set_scan_options(&err, &self->scan, py_options);
+		if (err.code != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (get_compact_records(&err, py_options, &compact_records) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
+	if (py_nodename) {
+		if (PyString_Check(py_nodename)) {
+			cmd->nodename = cf_strdup(PyString_AsString(py_nodename));
+		}
+		else if (PyUnicode_Check(py_nodename)) {
+			/* The decoding could fail, so we need to check for null */
+			py_ustr = PyUnicode_AsUTF8String(py_nodename);
+			if (!py_ustr) {
+				as_error_update(&err, AEROSPIKE_ERR_PARAM,
+								"Invalid unicode nodename");
+				goto CLEANUP;
+			}
+			cmd->nodename = cf_strdup(PyBytes_AsString(py_ustr));
+		}
+		else {
+			as_error_update(&err, AEROSPIKE_ERR_PARAM,
+							"nodename must be a string");
+			goto CLEANUP;
+		}
+	}
+
+	// The iterator owns the command from now on.
+	py_iter = AerospikeResultsIterator_New(
+		self->client, (PyObject *)self, &err, (uint32_t)buffer,
+		compact_records, scan_command_run, scan_command_destroy, cmd);
+	cmd = NULL;
+
+CLEANUP:
+	if (cmd) {
+		scan_command_destroy(cmd);
+	}
+
+	Py_XDECREF(py_ustr);
+
+	if (err.code != AEROSPIKE_OK) {
+		raise_exception_base(&err, NULL, NULL, NULL, NULL, NULL);
+		return NULL;
+	}
+
+	return py_iter;
+}
@@ -27,6 +27,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "record.h"
 #include "scan.h"
 
 #undef TRACE
@@ -35,6 +36,7 @@
 typedef struct {
 	PyObject *py_results;
 	AerospikeClient *client;
+	bool compact_records;
 } LocalData;
 
 static bool each_result(const as_val *val, void *udata)
@@ -53,7 +55,12 @@ static bool each_result(const as_val *val, void *udata)
 	PyGILState_STATE gstate;
 	gstate = PyGILState_Ensure();
 
-	val_to_pyobject(data->client, &err, val, &py_result);
+	if (data->compact_records) {
+		val_to_compact_pyobject(data->client, &err, val, &py_result);
+	}
+	else {
+		val_to_pyobject(data->client, &err, val, &py_result);
+	}
 
 	if (py_result) {
 		PyList_Append(py_results, py_result);
@@ -71,6 +78,7 @@ PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
 	PyObject *py_policy = NULL;
 	PyObject *py_results = NULL;
 	PyObject *py_nodename = NULL;
+	PyObject *py_options = NULL;
 	PyObject *py_ustr = NULL;
 
 	as_static_pool static_pool;
@@ -82,7 +90,8 @@ PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
 	char *nodename = NULL;
 	LocalData data;
 	data.client = self->client;
-	static char *kwlist[] = {"policy", "nodename", NULL};
+	data.compact_records = false;
+	static char *kwlist[] = {"policy", "nodename", "options", NULL};
 
 	// For converting expressions.
 	as_exp exp_list;
@@ -92,8 +101,9 @@ PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
 	as_partition_filter *partition_filter_p = NULL;
 	as_partitions_status *ps = NULL;
 
-	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OO:results", kwlist,
-									&py_policy, &py_nodename) == false) {
+	if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOO:results", kwlist,
+									&py_policy, &py_nodename,
+									&py_options) == false) {
 		return NULL;
 	}
 
@@ -132,6 +142,18 @@ PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
 	}
 	as_error_reset(&err);
 
+	if (py_options && PyDict_Check(py_options)) {
+		set_scan_options(&err, &self->scan, py_options);
+		if (err.code != AEROSPIKE_OK) {
+			goto CLEANUP;
+		}
+	}
+
+	if (get_compact_records(&err, py_options, &data.compact_records) !=
+		AEROSPIKE_OK) {
+		goto CLEANUP;
+	}
+
 	/*
 	 * If the user specified a nodename, validate and convert it to a char*
 	 */
@@ -39,13 +39,19 @@ PyDoc_STRVAR(foreach_doc, "foreach(callback[, policy[, options [, nodename]])\n\
 Invoke the callback function for each of the records streaming back from the scan. If provided \
 nodename should be the Node ID of a node to limit the scan to.");
 
+PyDoc_STRVAR(iter_results_doc,
+			 "iter_results([policy [, nodename[, options[, buffer]]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Run the scan in the background and return an iterator over the records. At most buffer \
+records are held in memory, the scan waits for the consumer when the buffer is full.");
+
 PyDoc_STRVAR(select_doc, "select(bin1[, bin2[, bin3..]])\n\
 \n\
 Set a filter on the record bins resulting from results() or foreach(). \
 If a selected bin does not exist in a record it will not appear in the bins portion of that record tuple.");
 
 PyDoc_STRVAR(results_doc,
-			 "results([policy [, nodename]) -> list of (key, meta, bins)\n\
+			 "results([policy [, nodename[, options]]) -> list of (key, meta, bins)\n\
 \n\
 Buffer the records resulting from the scan, and return them as a list of records.If provided \
 nodename should be the Node ID of a node to limit the scan to.");
@@ -79,6 +85,9 @@ static PyMethodDef AerospikeScan_Type_Methods[] = {
 	{"results", (PyCFunction)AerospikeScan_Results,
 	 METH_VARARGS | METH_KEYWORDS, results_doc},
 
+	{"iter_results", (PyCFunction)AerospikeScan_Iter_Results,
+	 METH_VARARGS | METH_KEYWORDS, iter_results_doc},
+
 	{"execute_background", (PyCFunction)AerospikeScan_ExecuteBackground,
 	 METH_VARARGS | METH_KEYWORDS, results_doc},
 
@@ -168,6 +177,11 @@ static void AerospikeScan_Type_Dealloc(AerospikeScan *self)
 {
 	as_scan_destroy(&self->scan);
 
+	if (self->static_pool != NULL) {
+		POOL_RELEASE(self->static_pool);
+		cf_free(self->static_pool);
+	}
+
 	if (self->unicodeStrVector != NULL) {
 		for (unsigned int i = 0; i < self->unicodeStrVector->size; ++i) {
 			free(as_vector_get_ptr(self->unicodeStrVector, i));
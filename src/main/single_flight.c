@@ -0,0 +1,295 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+// y# takes a Py_SSIZE_T length
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_record.h>
+#include <citrusleaf/alloc.h>
+
+#include "completion_queue.h"
+#include "conversions.h"
+#include "single_flight.h"
+
+#define SINGLE_FLIGHT_CAPSULE "aerospike.single_flight"
+
+struct single_flight_s {
+	// Key of the flight in the flights of the client, NULL once finished.
+	PyObject *py_flight_key;
+	// Holds the policy, so its id is not reused while the flight is keyed by
+	// it.
+	PyObject *py_policy;
+	// Converts the record for the readers, which hold references to it.
+	AerospikeClient *client;
+	pthread_mutex_t lock;
+	pthread_cond_t done_cond;
+	bool done;
+	// The leader and the reads which joined it.
+	uint32_t refs;
+	// A copy of the record read by the leader, converted for every reader so
+	// that readers do not share values. NULL on error or on a miss.
+	as_record *rec;
+	// Set when the leader returned None for a missing record.
+	bool miss;
+	as_error error;
+	// (callback, key, record key) tuples of the async reads which joined the
+	// flight.
+	PyObject *py_callbacks;
+};
+
+void single_flight_init(AerospikeClient *self, PyObject *py_enabled)
+{
+	self->single_flights = NULL;
+
+	if (py_enabled && PyBool_Check(py_enabled) && py_enabled == Py_True) {
+		self->single_flights = PyDict_New();
+	}
+}
+
+// Returns a new reference to the key of the flight reading key, or NULL if
+// the read can not be coalesced.
+static PyObject *single_flight_key(as_key *key, PyObject *py_bins,
+								   PyObject *py_policy, bool async)
+{
+	as_digest *digest = as_key_digest(key);
+	if (!digest) {
+		return NULL;
+	}
+
+	PyObject *py_bin_names = Py_None;
+	Py_INCREF(py_bin_names);
+	if (py_bins) {
+		Py_DECREF(py_bin_names);
+		py_bin_names = PySequence_Tuple(py_bins);
+	}
+
+	// Policies are matched by identity, comparing their contents would cost
+	// more than the reads saved.
+	PyObject *py_flight_key = NULL;
+	if (py_bin_names) {
+		py_flight_key = Py_BuildValue(
+			"(sy#Oni)", key->ns, digest->value,
+			(Py_ssize_t)AS_DIGEST_VALUE_SIZE, py_bin_names,
+			(Py_ssize_t)(py_policy && py_policy != Py_None ? py_policy : NULL),
+			(int)async);
+		Py_DECREF(py_bin_names);
+	}
+
+	// Bin names which are not hashable are left to fail in the read itself.
+	if (py_flight_key && PyObject_Hash(py_flight_key) == -1) {
+		Py_CLEAR(py_flight_key);
+	}
+
+	PyErr_Clear();
+	return py_flight_key;
+}
+
+single_flight *single_flight_join(AerospikeClient *self, as_key *key,
+								  PyObject *py_bins, PyObject *py_policy,
+								  bool async, bool *leader)
+{
+	*leader = false;
+
+	if (!self->single_flights) {
+		return NULL;
+	}
+
+	PyObject *py_flight_key = single_flight_key(key, py_bins, py_policy, async);
+	if (!py_flight_key) {
+		return NULL;
+	}
+
+	PyObject *py_capsule = PyDict_GetItem(self->single_flights, py_flight_key);
+	if (py_capsule) {
+		single_flight *flight =
+			PyCapsule_GetPointer(py_capsule, SINGLE_FLIGHT_CAPSULE);
+		flight->refs++;
+		Py_DECREF(py_flight_key);
+		return flight;
+	}
+
+	single_flight *flight = cf_malloc(sizeof(single_flight));
+	memset(flight, 0, sizeof(single_flight));
+	pthread_mutex_init(&flight->lock, NULL);
+	pthread_cond_init(&flight->done_cond, NULL);
+	as_error_init(&flight->error);
+	flight->refs = 1;
+	flight->client = self;
+
+	py_capsule = PyCapsule_New(flight, SINGLE_FLIGHT_CAPSULE, NULL);
+	if (!py_capsule ||
+		PyDict_SetItem(self->single_flights, py_flight_key, py_capsule) == -1) {
+		Py_XDECREF(py_capsule);
+		Py_DECREF(py_flight_key);
+		PyErr_Clear();
+		single_flight_release(flight);
+		return NULL;
+	}
+	Py_DECREF(py_capsule);
+
+	flight->py_flight_key = py_flight_key;
+	if (py_policy && py_policy != Py_None) {
+		Py_INCREF(py_policy);
+		flight->py_policy = py_policy;
+	}
+
+	*leader = true;
+	return flight;
+}
+
+as_status single_flight_result(single_flight *flight, as_error *err,
+							   PyObject *py_key, PyObject **py_rec)
+{
+	if (flight->miss) {
+		Py_INCREF(Py_None);
+		*py_rec = Py_None;
+		return err->code;
+	}
+
+	if (!flight->rec) {
+		return as_error_copy(err, &flight->error);
+	}
+
+	// Every reader gets its own meta, bins and values.
+	PyObject *py_meta = NULL;
+	PyObject *py_bins = NULL;
+	if (metadata_to_pyobject(err, flight->rec, &py_meta) != AEROSPIKE_OK ||
+		bins_to_pyobject(flight->client, err, flight->rec, &py_bins, false) !=
+			AEROSPIKE_OK) {
+		Py_XDECREF(py_meta);
+		return err->code;
+	}
+
+	*py_rec = PyTuple_Pack(3, py_key, py_meta, py_bins);
+	Py_DECREF(py_meta);
+	Py_DECREF(py_bins);
+
+	if (!*py_rec) {
+		PyErr_Clear();
+		return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+							   "Unable to copy the coalesced record");
+	}
+	return err->code;
+}
+
+as_status single_flight_await(single_flight *flight, as_error *err,
+							  as_key *key, PyObject **py_rec)
+{
+	Py_BEGIN_ALLOW_THREADS
+	pthread_mutex_lock(&flight->lock);
+	while (!flight->done) {
+		pthread_cond_wait(&flight->done_cond, &flight->lock);
+	}
+	pthread_mutex_unlock(&flight->lock);
+	Py_END_ALLOW_THREADS
+
+	PyObject *py_key = NULL;
+	if (key_to_pyobject(err, key, &py_key) == AEROSPIKE_OK) {
+		single_flight_result(flight, err, py_key, py_rec);
+	}
+	Py_XDECREF(py_key);
+	return err->code;
+}
+
+int single_flight_add_callback(single_flight *flight, PyObject *py_callback,
+							   PyObject *py_key, PyObject *py_rec_key)
+{
+	if (!flight->py_callbacks) {
+		flight->py_callbacks = PyList_New(0);
+		if (!flight->py_callbacks) {
+			return -1;
+		}
+	}
+
+	PyObject *py_entry = PyTuple_Pack(3, py_callback, py_key, py_rec_key);
+	int rc = py_entry ? PyList_Append(flight->py_callbacks, py_entry) : -1;
+	Py_XDECREF(py_entry);
+	return rc;
+}
+
+PyObject *single_flight_callbacks(single_flight *flight)
+{
+	if (!flight->py_callbacks) {
+		return PyList_New(0);
+	}
+	return PyList_GetSlice(flight->py_callbacks, 0,
+						   PyList_GET_SIZE(flight->py_callbacks));
+}
+
+void single_flight_finish(AerospikeClient *self, single_flight *flight,
+						  const as_record *rec, PyObject *py_rec,
+						  as_error *err)
+{
+	if (flight->py_flight_key) {
+		// Reads from now on start a new flight.
+		if (self->single_flights &&
+			PyDict_DelItem(self->single_flights, flight->py_flight_key) ==
+				-1) {
+			PyErr_Clear();
+		}
+		Py_CLEAR(flight->py_flight_key);
+	}
+
+	if (err->code != AEROSPIKE_OK) {
+		as_error_copy(&flight->error, err);
+	}
+	else if (py_rec == Py_None) {
+		flight->miss = true;
+	}
+	else if (rec) {
+		// The leader's record is destroyed once it returns.
+		flight->rec = completion_record_copy(rec);
+	}
+
+	if (err->code == AEROSPIKE_OK && !flight->miss && !flight->rec) {
+		as_error_update(&flight->error, AEROSPIKE_ERR_CLIENT,
+						"Coalesced read returned no record");
+	}
+
+	pthread_mutex_lock(&flight->lock);
+	flight->done = true;
+	pthread_cond_broadcast(&flight->done_cond);
+	pthread_mutex_unlock(&flight->lock);
+}
+
+void single_flight_release(single_flight *flight)
+{
+	if (flight->refs > 1) {
+		flight->refs--;
+		return;
+	}
+
+	Py_XDECREF(flight->py_flight_key);
+	Py_XDECREF(flight->py_policy);
+	if (flight->rec) {
+		as_record_destroy(flight->rec);
+	}
+	Py_XDECREF(flight->py_callbacks);
+	pthread_cond_destroy(&flight->done_cond);
+	pthread_mutex_destroy(&flight->lock);
+	cf_free(flight);
+}
+
+void single_flight_destroy(AerospikeClient *self)
+{
+	Py_CLEAR(self->single_flights);
+}
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import asyncio
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.awaitable import AsyncClient
+    from aerospike_helpers.operations import operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+aerospike.init_async()
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestAsyncClient():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.async_client = AsyncClient(self.as_connection)
+        self.keys = [('test', 'demo', 'async_client_%d' % i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'i': i})
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    self.as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.asyncio
+    async def test_pos_concurrent_gets_same_key(self):
+        """
+            Concurrent gets for the same key each resolve their own future.
+        """
+        results = await asyncio.gather(
+            *[self.async_client.get(self.keys[0]) for _ in range(50)])
+        for _, _, bins in results:
+            assert bins == {'i': 0}
+
+    @pytest.mark.asyncio
+    async def test_pos_put_then_get(self):
+        assert 0 == await self.async_client.put(self.keys[1], {'i': 100})
+        _, _, bins = await self.async_client.get(self.keys[1])
+        assert bins == {'i': 100}
+
+    @pytest.mark.asyncio
+    async def test_pos_operate(self):
+        ops = [operations.increment('i', 1), operations.read('i')]
+        _, _, bins = await self.async_client.operate(self.keys[2], ops)
+        assert bins == {'i': 3}
+
+    @pytest.mark.asyncio
+    async def test_pos_exists_and_remove(self):
+        _, meta = await self.async_client.exists(self.keys[3])
+        assert meta is not None
+        await self.async_client.remove(self.keys[3])
+        with pytest.raises(e.RecordNotFound):
+            await self.async_client.get(self.keys[3])
+
+    @pytest.mark.asyncio
+    async def test_pos_get_many(self):
+        records = await self.async_client.get_many(self.keys)
+        assert [bins for _, _, bins in records] == [{'i': i} for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_neg_get_missing_record_exception_instance(self):
+        key = ('test', 'demo', 'async_client_non_existent')
+        with pytest.raises(e.RecordNotFound) as err_info:
+            await self.async_client.get(key)
+        assert err_info.value.code == aerospike.exception.RecordNotFound.code
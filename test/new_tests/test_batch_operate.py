@@ -12,6 +12,7 @@ except:
     print("Please install aerospike python client.")
     sys.exit(1)
 
+from aerospike_helpers.batch import records as br
 from aerospike_helpers import expressions as exp
 from aerospike_helpers.operations import operations as op
 from aerospike import exception as e
@@ -176,6 +177,19 @@ class TestBatchOperate(TestBaseClass):
             assert batch_rec.key[:3] == keys[i] # checking key
             assert batch_rec.record[0][:3] == keys[i] # checking key in record
 
+    def test_batch_operate_result_type_pos(self):
+        """
+        Test that results are BatchRecord instances filled in from C.
+        """
+
+        res = self.as_connection.batch_operate(self.keys, [op.read("count")])
+
+        for i, batch_rec in enumerate(res.batch_records):
+            assert type(batch_rec) is br.BatchRecord
+            assert batch_rec.result == 0
+            assert batch_rec.in_doubt is False
+            assert batch_rec.record[2] == {"count": i}
+
     def test_batch_operate_many_pos(self):
         """
         Test batch operate with many keys.
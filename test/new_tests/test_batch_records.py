@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
 import sys
 
 import pytest
@@ -48,3 +50,50 @@ class TestBatchRecords(TestBaseClass):
         bwr = br.BatchRecords()
 
         assert len(bwr.batch_records) == 0
+
+    def test_batch_record_defaults_pos(self):
+        """
+        Test that the C base sets the default result fields.
+        """
+
+        b = br.Write(("test", "demo", 1), ops=[op.read("a")])
+
+        assert isinstance(b, aerospike._BatchRecordBase)
+        assert b.key == ("test", "demo", 1)
+        assert b.record is None
+        assert b.result == 0
+        assert b.in_doubt is False
+        assert b._type == 1 and b._has_write
+
+    def test_batch_record_attributes_pos(self):
+        """
+        Test that attributes other than the documented ones can be set.
+        """
+
+        b = br.Remove(("test", "demo", 1))
+        b.not_a_field = 1
+
+        assert b.not_a_field == 1
+        assert b.__dict__ == {"not_a_field": 1}
+
+    @pytest.mark.parametrize("copier", [
+        lambda b: pickle.loads(pickle.dumps(b)),
+        copy.copy,
+        copy.deepcopy,
+    ])
+    def test_batch_record_copy_pos(self, copier):
+        """
+        Test that batch records are pickled and copied with all their fields.
+        """
+
+        b = br.Write(("test", "demo", 1), ops=[op.read("a")], policy={"key": 1})
+        b.record = (("test", "demo", 1), {"gen": 1}, {"a": 1})
+        b.result = 2
+        b.in_doubt = True
+        b.tag = "tag"
+
+        c = copier(b)
+
+        assert type(c) is br.Write
+        assert (c.key, c.record, c.result, c.in_doubt) == (b.key, b.record, 2, True)
+        assert (c.ops, c.policy, c.tag) == (b.ops, b.policy, "tag")
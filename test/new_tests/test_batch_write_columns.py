@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+from aerospike_helpers.batch import records as br
+from aerospike_helpers.operations import operations as op
+from aerospike_helpers.operations import list_operations as lop
+from aerospike import exception as e
+from .test_base_class import TestBaseClass
+from .as_status_codes import AerospikeStatus
+
+
+class TestBatchWriteColumns(TestBaseClass):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        if self.server_version < [6, 0]:
+            pytest.mark.xfail(reason="Servers older than 6.0 do not support batch writes.")
+            pytest.xfail()
+
+        self.keys = [('test', 'demo', 'write_columns_%d' % i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'count': i, 'name': 'name', 'ilist': [i]})
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_batch_write_columns_pos(self):
+        ops = [
+            op.write('name', None),
+            op.increment('count', None),
+            op.append('name', None),
+            op.read('count'),
+        ]
+        values = [('name%d' % i, 10 * i, '_x') for i in range(5)]
+
+        res = self.as_connection.batch_write_columns(self.keys, ops, values)
+
+        assert isinstance(res, br.BatchRecords)
+        assert res.result == AerospikeStatus.AEROSPIKE_OK
+        assert len(res.batch_records) == len(self.keys)
+        for i, batch_record in enumerate(res.batch_records):
+            assert isinstance(batch_record, br.BatchRecord)
+            assert batch_record.key[:3] == self.keys[i]
+            assert batch_record.result == AerospikeStatus.AEROSPIKE_OK
+            assert batch_record.record[2]['count'] == 11 * i
+
+        for i, key in enumerate(self.keys):
+            _, _, bins = self.as_connection.get(key)
+            assert bins['name'] == 'name%d_x' % i
+
+    def test_batch_write_columns_fallback_ops_pos(self):
+        # CDT ops and non str values take the regular op conversion
+        ops = [
+            lop.list_append('ilist', None),
+            op.increment('score', None),
+            op.write('blob', None),
+        ]
+        values = [[i, 1.5, {'i': i}] for i in range(5)]
+
+        res = self.as_connection.batch_write_columns(self.keys, ops, values)
+
+        assert res.result == AerospikeStatus.AEROSPIKE_OK
+        for i, key in enumerate(self.keys):
+            _, _, bins = self.as_connection.get(key)
+            assert bins['ilist'] == [i, i]
+            assert bins['score'] == 1.5
+            assert bins['blob'] == {'i': i}
+
+    def test_batch_write_columns_no_values_pos(self):
+        ops = [op.touch(), op.read('count')]
+        res = self.as_connection.batch_write_columns(
+            self.keys, ops, [()] * len(self.keys),
+            policy_batch_write={'key': aerospike.POLICY_KEY_SEND})
+
+        assert res.result == AerospikeStatus.AEROSPIKE_OK
+        assert [r.record[2]['count'] for r in res.batch_records] == list(range(5))
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [('a', 1)] * 4,
+            [('a',)] * 5,
+            [{'name': 'a', 'count': 1}] * 5,
+            ('a', 1),
+        ])
+    def test_batch_write_columns_bad_values_neg(self, values):
+        ops = [op.write('name', None), op.increment('count', None)]
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_write_columns(self.keys, ops, values)
+
+    def test_batch_write_columns_empty_ops_neg(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_write_columns(self.keys, [], [()] * 5)
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            aerospike.OPERATOR_WRITE,
+            aerospike.OPERATOR_INCR,
+            aerospike.OPERATOR_APPEND,
+            aerospike.OPERATOR_PREPEND,
+        ])
+    def test_batch_write_columns_op_without_val_neg(self, operation):
+        ops = [{'op': operation, 'bin': 'name'}]
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_write_columns(self.keys, ops, [()] * 5)
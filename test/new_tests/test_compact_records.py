@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from .test_base_class import TestBaseClass
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestCompactRecords(TestBaseClass):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'compact', i) for i in range(10)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'name': 'name%d' % i, 'age': i},
+                              policy={'key': aerospike.POLICY_KEY_SEND})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_scan_results_compact_records(self):
+        scan = self.as_connection.scan('test', 'compact')
+        records = scan.results(options={'compact_records': True})
+
+        assert len(records) == len(self.keys)
+        for record in records:
+            assert isinstance(record, aerospike.Record)
+            assert record.gen >= 1
+            assert record.meta == {'ttl': record.ttl, 'gen': record.gen}
+            assert record.get('name') == 'name%d' % record.get('age')
+            assert record.get('missing', 'default') == 'default'
+
+    def test_pos_compact_record_unpacks_like_tuple(self):
+        scan = self.as_connection.scan('test', 'compact')
+        compact = scan.results(options={'compact_records': True})
+        expected = scan.results()
+
+        key_index = 2
+        compact = sorted((record.to_tuple() for record in compact),
+                         key=lambda record: record[0][key_index])
+        expected = sorted(expected, key=lambda record: record[0][key_index])
+        assert compact == expected
+
+        key, meta, bins = scan.results(options={'compact_records': True})[0]
+        assert key[0] == 'test'
+        assert set(bins) == {'name', 'age'}
+
+    def test_pos_query_foreach_compact_records(self):
+        records = []
+        query = self.as_connection.query('test', 'compact')
+        query.foreach(records.append, options={'compact_records': True})
+
+        assert len(records) == len(self.keys)
+        assert sorted(record.bins['age'] for record in records) == \
+            list(range(10))
+
+    def test_neg_compact_records_not_bool(self):
+        query = self.as_connection.query('test', 'compact')
+        with pytest.raises(e.ParamError):
+            query.results(options={'compact_records': 1})
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import pickle
+import sys
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+from aerospike import exception as e
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import expression_operations as expr_ops
+from .test_base_class import TestBaseClass
+
+
+class TestCompileExpression(TestBaseClass):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'compile_expression_%d' % i)
+                     for i in range(2)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'i': i})
+        self.compiled = exp.Eq(exp.IntBin('i'), 1).compile()
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_compile_expression_policy(self):
+        expr = self.as_connection.compile_expression(self.compiled)
+        assert isinstance(expr, aerospike.CompiledExpression)
+
+        _, _, bins = self.as_connection.get(self.keys[1],
+                                            {'expressions': expr})
+        assert bins == {'i': 1}
+        with pytest.raises(e.FilteredOut):
+            self.as_connection.get(self.keys[0], {'expressions': expr})
+
+    def test_pos_compile_expression_operation(self):
+        expr = self.as_connection.compile_expression(
+            exp.Add(exp.IntBin('i'), 10).compile())
+        _, _, bins = self.as_connection.operate(
+            self.keys[1], [expr_ops.expression_read('sum', expr)])
+        assert bins == {'sum': 11}
+
+    def test_pos_compile_expression_base64(self):
+        expr = self.as_connection.compile_expression(self.compiled)
+        base64 = self.as_connection.get_expression_base64(self.compiled)
+
+        assert expr.to_base64() == base64
+        assert self.as_connection.get_expression_base64(expr) == base64
+        assert aerospike.CompiledExpression.from_base64(base64) == expr
+
+    def test_pos_compile_expression_bytes_and_pickle(self):
+        expr = self.as_connection.compile_expression(self.compiled)
+
+        assert aerospike.CompiledExpression.from_bytes(expr.to_bytes()) == expr
+        unpickled = pickle.loads(pickle.dumps(expr))
+        assert unpickled == expr
+
+        _, _, bins = self.as_connection.get(self.keys[1],
+                                            {'expressions': unpickled})
+        assert bins == {'i': 1}
+
+    @pytest.mark.parametrize("expression", [[], None, 'a', [(1, 2)]])
+    def test_neg_compile_expression_invalid(self, expression):
+        with pytest.raises(e.ParamError):
+            self.as_connection.compile_expression(expression)
+
+    @pytest.mark.parametrize("method, value", [
+        ('from_bytes', b''),
+        ('from_bytes', 'not bytes'),
+        ('from_base64', b'bytes'),
+    ])
+    def test_neg_compiled_expression_from_invalid(self, method, value):
+        with pytest.raises(e.ParamError):
+            getattr(aerospike.CompiledExpression, method)(value)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+from aerospike import exception as e
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import operations
+from .test_base_class import TestBaseClass
+
+
+class TestCompilePolicy(TestBaseClass):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'compile_policy_%d' % i)
+                     for i in range(5)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'i': i})
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_compile_policy(self):
+        policy = self.as_connection.compile_policy('read',
+                                                   {'total_timeout': 1000})
+        assert isinstance(policy, aerospike.Policy)
+        assert policy.kind == 'read'
+
+        for i, key in enumerate(self.keys):
+            _, _, bins = self.as_connection.get(key, policy=policy)
+            assert bins == {'i': i}
+
+    def test_pos_compile_policy_defaults(self):
+        policy = self.as_connection.compile_policy('write')
+        self.as_connection.put(self.keys[0], {'i': 10}, policy=policy)
+
+        _, _, bins = self.as_connection.get(self.keys[0])
+        assert bins == {'i': 10}
+
+    def test_pos_compile_policy_expressions(self):
+        policy = self.as_connection.compile_policy(
+            'read', {'expressions': exp.GE(exp.IntBin('i'), 2).compile()})
+
+        # The filter expression is reused by every command.
+        for _ in range(2):
+            _, _, bins = self.as_connection.get(self.keys[2], policy=policy)
+            assert bins == {'i': 2}
+            with pytest.raises(e.FilteredOut):
+                self.as_connection.get(self.keys[1], policy=policy)
+
+    def test_pos_compile_policy_operate(self):
+        policy = self.as_connection.compile_policy(
+            'operate', {'key': aerospike.POLICY_KEY_SEND})
+        _, _, bins = self.as_connection.operate(
+            self.keys[0], [operations.increment('i', 1), operations.read('i')],
+            policy=policy)
+        assert bins == {'i': 1}
+
+    def test_pos_compile_policy_batch(self):
+        policy = self.as_connection.compile_policy('batch',
+                                                   {'max_keys_per_batch': 2})
+        records = self.as_connection.get_many(self.keys, policy)
+        assert [bins['i'] for _, _, bins in records] == list(range(5))
+
+    def test_pos_compile_policy_info(self):
+        policy = self.as_connection.compile_policy('info', {'timeout': 1000})
+        assert self.as_connection.info_all('namespaces', policy=policy)
+
+    def test_neg_compile_policy_wrong_kind(self):
+        policy = self.as_connection.compile_policy('write')
+        with pytest.raises(e.ParamError):
+            self.as_connection.get(self.keys[0], policy=policy)
+
+    @pytest.mark.parametrize("kind, policy", [
+        ('not a kind', {}),
+        (1, {}),
+        ('read', 'not a dict'),
+        ('read', {'total_timeout': 'a'}),
+    ])
+    def test_neg_compile_policy_invalid(self, kind, policy):
+        with pytest.raises(e.ParamError):
+            self.as_connection.compile_policy(kind, policy)
+
+    def test_neg_compile_policy_from_policy(self):
+        policy = self.as_connection.compile_policy('read')
+        with pytest.raises(e.ParamError):
+            self.as_connection.compile_policy('read', policy)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import time
+import asyncio
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.awaitable import AsyncClient
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+aerospike.init_async()
+
+
+def _new_client():
+    config = TestBaseClass.get_connection_config()
+    if config['user'] is None and config['password'] is None:
+        return aerospike.client(config).connect()
+    return aerospike.client(config).connect(config['user'], config['password'])
+
+
+class TestCompletionQueue():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request):
+        self.client = _new_client()
+        self.keys = [('test', 'demo', 'completion_queue_%d' % i)
+                     for i in range(10)]
+        for i, key in enumerate(self.keys):
+            self.client.put(key, {'i': i})
+
+        def teardown():
+            for key in self.keys:
+                self.client.remove(key)
+            self.client.close()
+
+        request.addfinalizer(teardown)
+
+    def _poll_until(self, results, count):
+        deadline = time.time() + 5
+        while len(results) < count and time.time() < deadline:
+            self.client.poll_completions()
+            time.sleep(0.01)
+
+    def test_pos_poll_completions(self):
+        self.client.enable_completion_queue(capacity=4)
+        results = []
+
+        def callback(key, record, err, exc):
+            results.append(record[2])
+
+        for key in self.keys:
+            self.client.get_async(callback, key)
+
+        # Nothing is delivered before polling, except on queue overflow.
+        self._poll_until(results, len(self.keys))
+        assert sorted(bins['i'] for bins in results) == list(range(10))
+
+    def test_pos_poll_completions_max(self):
+        self.client.enable_completion_queue()
+        results = []
+
+        def callback(key, err, exc):
+            results.append(err[0])
+
+        for key in self.keys[:3]:
+            self.client.put_async(callback, key, {'i': -1})
+
+        deadline = time.time() + 5
+        delivered = 0
+        while delivered < 3 and time.time() < deadline:
+            count = self.client.poll_completions(max=1)
+            assert count <= 1
+            delivered += count
+        assert results == [0, 0, 0]
+
+    def test_pos_client_released_with_commands_in_flight(self):
+        client = _new_client()
+        client.enable_completion_queue()
+        poll = client.poll_completions
+        results = []
+
+        def callback(key, record, err, exc):
+            results.append(record[2])
+
+        for key in self.keys:
+            client.get_async(callback, key)
+        # The commands in flight keep the client and its queue alive.
+        del client
+
+        deadline = time.time() + 5
+        while len(results) < len(self.keys) and time.time() < deadline:
+            poll()
+            time.sleep(0.01)
+        assert len(results) == len(self.keys)
+
+    def test_neg_poll_completions_not_enabled(self):
+        with pytest.raises(e.ParamError):
+            self.client.poll_completions()
+
+    def test_neg_enable_completion_queue_twice(self):
+        self.client.enable_completion_queue()
+        with pytest.raises(e.ParamError):
+            self.client.enable_completion_queue()
+
+    @pytest.mark.asyncio
+    async def test_pos_async_client_completion_queue(self):
+        async_client = AsyncClient(self.client, completion_queue=True,
+                                   loop=asyncio.get_event_loop())
+        records = await asyncio.gather(
+            *[async_client.get(key) for key in self.keys])
+        assert [bins for _, _, bins in records] == [{'i': i} for i in range(10)]
@@ -40,3 +40,19 @@ def test_error_codes(error, error_name, error_code, base):
     assert test_error.code == error_code
     assert type(test_error).__name__ == error_name
     assert issubclass(type(test_error), base)
+
+
+def test_error_details_on_instance():
+    error = e.RecordNotFound(AEROSPIKE_ERR_RECORD_NOT_FOUND, "not found",
+                             "src/main/client/get.c", 42, False)
+
+    assert error.code == AEROSPIKE_ERR_RECORD_NOT_FOUND
+    assert error.msg == "not found"
+    assert error.file == "src/main/client/get.c"
+    assert error.line == 42
+    assert error.in_doubt is False
+    assert error.args[1] == "not found"
+
+    # The class only carries the defaults.
+    assert e.RecordNotFound.msg is None
+    assert e.RecordNotFound.key is None
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+from aerospike import exception as e
+from aerospike_helpers import cdt_ctx
+from aerospike_helpers import expressions as exp
+from .test_base_class import TestBaseClass
+
+
+class TestExpressionCache(object):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.client = TestBaseClass.get_new_connection(
+            {'expression_cache_size': 2})
+        self.keys = [('test', 'demo', 'exp_cache_%d' % i) for i in range(3)]
+        for i, key in enumerate(self.keys):
+            self.client.put(key, {'i': i})
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    self.client.remove(key)
+                except e.RecordNotFound:
+                    pass
+            self.client.close()
+
+        request.addfinalizer(teardown)
+
+    def test_pos_cached_expression_reused(self):
+        expr = exp.Eq(exp.IntBin('i'), 1).compile()
+        policy = {'expressions': expr}
+
+        for _ in range(3):
+            _, _, bins = self.client.get(self.keys[1], policy)
+            assert bins == {'i': 1}
+            with pytest.raises(e.FilteredOut):
+                self.client.get(self.keys[0], policy)
+
+    def test_pos_cache_eviction(self):
+        exprs = [exp.Eq(exp.IntBin('i'), i).compile() for i in range(3)]
+
+        # More expressions than the cache holds, each keeps its own filter.
+        for _ in range(2):
+            for i, expr in enumerate(exprs):
+                _, _, bins = self.client.get(self.keys[i],
+                                             {'expressions': expr})
+                assert bins == {'i': i}
+
+    def test_pos_changed_list_converted_again(self):
+        expr = exp.Eq(exp.IntBin('i'), 0).compile()
+        self.client.get(self.keys[0], {'expressions': expr})
+
+        expr[:] = exp.Eq(exp.IntBin('i'), 2).compile()
+        _, _, bins = self.client.get(self.keys[2], {'expressions': expr})
+        assert bins == {'i': 2}
+        with pytest.raises(e.FilteredOut):
+            self.client.get(self.keys[0], {'expressions': expr})
+
+    def test_pos_changed_value_converted_again(self):
+        expr = exp.Eq(exp.IntBin('i'), 0).compile()
+        self.client.get(self.keys[0], {'expressions': expr})
+
+        expr[2][2]['val'] = 2
+        _, _, bins = self.client.get(self.keys[2], {'expressions': expr})
+        assert bins == {'i': 2}
+
+    def test_pos_changed_list_value_converted_again(self):
+        self.client.put(self.keys[1], {'l': [1]})
+        values = [0]
+        expr = exp.Eq(exp.ListBin('l'), values).compile()
+        with pytest.raises(e.FilteredOut):
+            self.client.get(self.keys[1], {'expressions': expr})
+
+        values[0] = 1
+        _, _, bins = self.client.get(self.keys[1], {'expressions': expr})
+        assert bins['l'] == [1]
+
+    def test_pos_changed_ctx_converted_again(self):
+        self.client.put(self.keys[1], {'l': [[1], [2]]})
+        ctx = [cdt_ctx.cdt_ctx_list_index(0)]
+        expr = exp.Eq(
+            exp.ListGetByIndex(ctx, aerospike.LIST_RETURN_VALUE,
+                               exp.ResultType.INTEGER, 0, exp.ListBin('l')),
+            1).compile()
+        self.client.get(self.keys[1], {'expressions': expr})
+
+        ctx[0].value = 1
+        with pytest.raises(e.FilteredOut):
+            self.client.get(self.keys[1], {'expressions': expr})
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.expressions.resources import _ExprOp
+
+
+class TestExpressionsCompile(object):
+
+    def test_pos_compile_order(self):
+        expr = exp.And(exp.GT(exp.IntBin('a'), 1), exp.Not(exp.BinExists('b')))
+        compiled = expr.compile()
+
+        assert [op[0] for op in compiled] == [
+            _ExprOp.AND, _ExprOp.GT, _ExprOp.BIN, _ExprOp.VAL, _ExprOp.NOT,
+            _ExprOp.BIN_EXISTS, _ExprOp._AS_EXP_CODE_END_OF_VA_ARGS]
+        assert [op[3] for op in compiled] == [3, 2, 0, 0, 1, 0, 0]
+
+    def test_pos_compile_shared_sub_expression(self):
+        shared = exp.Eq(exp.IntBin('a'), 1)
+        expr = exp.Or(shared, exp.Not(shared))
+        compiled = expr.compile()
+
+        shared_compiled = shared.compile()
+        assert compiled[1:4] == shared_compiled
+        assert compiled[5:8] == shared_compiled
+
+    def test_pos_compile_returns_new_list(self):
+        expr = exp.Eq(exp.IntBin('a'), 1)
+        compiled = expr.compile()
+        compiled.append(None)
+
+        assert expr.compile() == compiled[:-1]
+        assert expr.compile() is not expr.compile()
+
+    def test_pos_compile_uses_compiled_sub_expression(self):
+        sub = exp.Eq(exp.IntBin('a'), 1)
+        expected = exp.Not(exp.Eq(exp.IntBin('a'), 1)).compile()
+        sub.compile()
+
+        assert exp.Not(sub).compile() == expected
+
+    def test_pos_compile_reuses_cached_ops(self):
+        sub = exp.Eq(exp.IntBin('a'), 1)
+        sub_compiled = sub.compile()
+        compiled = exp.Not(sub).compile()
+
+        # Spliced from the cache of sub, not compiled again.
+        assert all(a is b for a, b in zip(compiled[1:], sub_compiled))
+
+    def test_pos_compile_deep_expression(self):
+        expr = exp.IntBin('a')
+        for _ in range(sys.getrecursionlimit() * 2):
+            expr = exp.Not(expr)
+
+        assert len(expr.compile()) == sys.getrecursionlimit() * 2 + 1
+
+    def test_pos_expressions_have_no_dict(self):
+        expr = exp.And(exp.GT(exp.IntBin('a') + 1, 2), exp.Eq(exp.ListSize(None, exp.ListBin('l')), 0))
+
+        for node in (expr, exp.IntBin('a'), exp.Eq(exp.IntBin('a'), 1), exp.Unknown()):
+            assert not hasattr(node, '__dict__')
+        with pytest.raises(AttributeError):
+            exp.IntBin('a').extra = 1
+        assert expr.compile() == expr.compile()
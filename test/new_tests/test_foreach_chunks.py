@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+from .test_base_class import TestBaseClass
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestForeachChunks(TestBaseClass):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'foreach_chunks', i) for i in range(100)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'age': i})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_scan_foreach_chunks(self):
+        chunks = []
+        scan = self.as_connection.scan('test', 'foreach_chunks')
+        scan.foreach(chunks.append, options={'chunk_size': 10})
+
+        assert all(isinstance(chunk, list) for chunk in chunks)
+        assert all(1 <= len(chunk) <= 10 for chunk in chunks)
+        ages = [bins['age'] for chunk in chunks for _, _, bins in chunk]
+        assert sorted(ages) == list(range(100))
+
+    def test_pos_query_foreach_chunks_small_queue(self):
+        ages = []
+
+        def callback(records):
+            ages.extend(bins['age'] for _, _, bins in records)
+
+        query = self.as_connection.query('test', 'foreach_chunks')
+        query.foreach(callback, options={'chunk_size': 4, 'queue_size': 2})
+
+        assert sorted(ages) == list(range(100))
+
+    def test_pos_foreach_chunks_stop(self):
+        chunks = []
+
+        def callback(records):
+            chunks.append(records)
+            return False
+
+        query = self.as_connection.query('test', 'foreach_chunks')
+        query.foreach(callback, options={'chunk_size': 10})
+
+        assert len(chunks) == 1
+
+    def test_pos_foreach_chunks_partition_filter(self):
+        records = []
+        scan = self.as_connection.scan('test', 'foreach_chunks')
+        scan.foreach(records.extend,
+                     policy={'partition_filter': {'begin': 0, 'count': 4096}},
+                     options={'chunk_size': 10})
+
+        assert len(records) == len(self.keys)
+        for part_id, (key, _, _) in records:
+            assert 0 <= part_id < 4096
+
+    @pytest.mark.parametrize("options", [
+        {'chunk_size': 0},
+        {'chunk_size': 'ten'},
+        {'chunk_size': 10, 'queue_size': -1},
+    ])
+    def test_neg_foreach_chunks_invalid_options(self, options):
+        query = self.as_connection.query('test', 'foreach_chunks')
+        with pytest.raises(e.ParamError):
+            query.foreach(lambda records: None, options=options)
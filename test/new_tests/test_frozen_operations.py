@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import pickle
+import sys
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.operations import operations
+    from aerospike_helpers.operations import list_operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestFrozenOperations(object):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.key = ('test', 'demo', 'frozen_operations')
+        as_connection.put(self.key, {'count': 1, 'l': [1]})
+
+        def teardown():
+            try:
+                as_connection.remove(self.key)
+            except e.RecordNotFound:
+                pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_operate_frozen_ops(self):
+        ops = [
+            operations.frozen(operations.increment('count', 2)),
+            operations.frozen(list_operations.list_append('l', 2)),
+            operations.frozen(operations.read('count')),
+        ]
+
+        for expected in (3, 5):
+            _, _, bins = self.as_connection.operate(self.key, ops)
+            assert bins == {'count': expected}
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins['l'] == [1, 2, 2]
+
+    def test_pos_frozen_op_copies(self):
+        op = operations.increment('count', 2)
+        frozen = operations.frozen(op)
+        op['val'] = 3
+
+        assert frozen == operations.increment('count', 2)
+        assert operations.frozen(frozen) is frozen
+        assert copy.deepcopy(frozen) is frozen
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+    @pytest.mark.parametrize("mutate", [
+        lambda op: op.__setitem__('val', 3),
+        lambda op: op.__delitem__('val'),
+        lambda op: op.update(val=3),
+        lambda op: op.pop('val'),
+        lambda op: op.setdefault('ttl', 3),
+        lambda op: op.clear(),
+    ])
+    def test_neg_frozen_op_mutation(self, mutate):
+        frozen = operations.frozen(operations.increment('count', 2))
+        with pytest.raises(TypeError):
+            mutate(frozen)
+        assert frozen == operations.increment('count', 2)
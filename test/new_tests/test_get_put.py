@@ -59,6 +59,22 @@ class TestGetPut():
         with pytest.raises(e.RecordNotFound):
             self.as_connection.get(key)
 
+    def test_neg_get_missing_records_exception_details(self):
+        """
+            Invoke get() for two missing records, each exception keeps its
+            own key.
+        """
+        keys = [('test', 'demo', 'non-existent-key-%d' % i) for i in range(2)]
+        errors = []
+        for key in keys:
+            with pytest.raises(e.RecordNotFound) as err_info:
+                self.as_connection.get(key)
+            errors.append(err_info.value)
+
+        assert [error.key for error in errors] == keys
+        assert all(error.msg for error in errors)
+        assert e.RecordNotFound.key is None
+
     @pytest.mark.skip(reason="byte key not currently handled")
     def test_get_information_using_bytes_key(self):
         record = {'bytes': 'are_cool'}
@@ -851,6 +867,21 @@ class TestGetPut():
         finally:
             self.as_connection.remove(key)
 
+    def test_pos_put_get_more_than_4096_bytes_values(self):
+        """
+            Invoke put() with more bytes values than the old fixed size
+            value pool could hold.
+        """
+        key = ('test', 'demo', 'many_bytes_values')
+        blobs = [bytearray(b'blob %d' % i) for i in range(5000)]
+
+        try:
+            assert 0 == self.as_connection.put(key, {'blobs': blobs})
+            _, _, bins = self.as_connection.get(key)
+            assert bins['blobs'] == [bytes(blob) for blob in blobs]
+        finally:
+            self.as_connection.remove(key)
+
     def test_null_bin_with_put_get(self):
         """
             Invoke put() with null bin and verify record is deleted.
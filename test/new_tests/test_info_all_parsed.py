@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestInfoAllParsed(object):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.key = ('test', 'demo', 'info_all_parsed')
+        as_connection.put(self.key, {'a': 1})
+
+        def teardown():
+            as_connection.remove(self.key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_info_all_parsed(self):
+        commands = ['statistics', 'namespace/test', 'sets', 'build']
+        response = self.as_connection.info_all_parsed(commands)
+
+        assert response
+        for node_response in response.values():
+            assert set(node_response) == set(commands)
+
+            assert isinstance(node_response['statistics']['cluster_size'], int)
+            assert isinstance(node_response['namespace/test']['objects'], int)
+            assert isinstance(node_response['build'], str)
+
+            sets = node_response['sets']
+            assert isinstance(sets, list)
+            assert any(s['ns'] == 'test' and s['set'] == 'demo' for s in sets)
+
+    def test_pos_info_all_parsed_matches_info_all(self):
+        response = self.as_connection.info_all_parsed(('build',), policy={'timeout': 1000})
+        expected = self.as_connection.info_all('build')
+
+        assert set(response) == set(expected)
+        for node, (_, build) in expected.items():
+            assert response[node]['build'] == build.strip()
+
+    @pytest.mark.parametrize("commands", [
+        [],
+        'statistics',
+        [1],
+        [''],
+        ['statistics\nbuild'],
+    ])
+    def test_neg_info_all_parsed_invalid_commands(self, commands):
+        with pytest.raises(e.ParamError):
+            self.as_connection.info_all_parsed(commands)
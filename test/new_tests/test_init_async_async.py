@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import asyncio
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.awaitable import io
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestInitAsync():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'init_async_%d' % i) for i in range(10)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'i': i})
+
+        def teardown():
+            for key in self.keys:
+                self.as_connection.remove(key)
+            aerospike.init_async()
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.asyncio
+    async def test_pos_init_async_multiple_loops(self):
+        aerospike.init_async(loops=4, max_commands_in_process=8,
+                             max_commands_in_queue=1000)
+        stats = aerospike.async_stats()
+        assert [loop['loop'] for loop in stats] == [0, 1, 2, 3]
+
+        records = await asyncio.gather(
+            *[io.get(self.as_connection, key) for key in self.keys])
+        assert [bins for _, _, bins in records] == [{'i': i} for i in range(10)]
+
+        for loop in aerospike.async_stats():
+            assert loop['in_queue'] >= 0
+
+    def test_neg_init_async_invalid_loops(self):
+        with pytest.raises(e.ParamError):
+            aerospike.init_async(loops=0)
+
+    def test_neg_init_async_negative_limits(self):
+        with pytest.raises(e.ParamError):
+            aerospike.init_async(max_commands_in_queue=-1)
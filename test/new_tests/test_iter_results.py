@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import threading
+from .test_base_class import TestBaseClass
+from aerospike import exception as e
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestIterResults(TestBaseClass):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'iter_results', i) for i in range(100)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'age': i})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_query_iter_results(self):
+        query = self.as_connection.query('test', 'iter_results')
+        records = list(query.iter_results())
+
+        assert sorted(bins['age'] for _, _, bins in records) == \
+            list(range(100))
+
+    def test_pos_scan_iter_results_small_buffer(self):
+        scan = self.as_connection.scan('test', 'iter_results')
+        ages = [bins['age'] for _, _, bins in scan.iter_results(buffer=1)]
+
+        assert sorted(ages) == list(range(100))
+
+    def test_pos_iter_results_compact_records(self):
+        scan = self.as_connection.scan('test', 'iter_results')
+        records = scan.iter_results(options={'compact_records': True})
+
+        for record in records:
+            assert isinstance(record, aerospike.Record)
+
+    def test_pos_iter_results_close(self):
+        query = self.as_connection.query('test', 'iter_results')
+        records = query.iter_results(buffer=2)
+
+        assert next(records) is not None
+        records.close()
+        assert list(records) == []
+
+    def test_pos_iter_results_close_from_other_thread(self):
+        scan = self.as_connection.scan('test', 'iter_results')
+        records = scan.iter_results(buffer=1)
+        consumed = []
+
+        # close() may come while the consumer waits on the queue.
+        consumer = threading.Thread(target=lambda: consumed.extend(records))
+        consumer.start()
+        records.close()
+        consumer.join(5)
+
+        assert not consumer.is_alive()
+        assert len(consumed) <= len(self.keys)
+        assert list(records) == []
+
+    def test_neg_iter_results_zero_buffer(self):
+        query = self.as_connection.query('test', 'iter_results')
+        with pytest.raises(e.ParamError):
+            query.iter_results(buffer=0)
+
+    def test_neg_iter_results_error_raised_by_iterator(self):
+        query = self.as_connection.query('fake_namespace', 'iter_results')
+        with pytest.raises(e.AerospikeError):
+            list(query.iter_results())
@@ -74,3 +74,52 @@ class TestLog(object):
         response = aerospike.set_log_level(9)
 
         assert response == 0
+
+    def test_log_buffer_drain(self):
+        """
+        Test buffering log records and draining them
+        """
+        aerospike.set_log_level(aerospike.LOG_LEVEL_DEBUG)
+        assert aerospike.set_log_buffer(1024) == 0
+        try:
+            # Forces events to be logged
+            client = TestBaseClass.get_new_connection()
+            client.close()
+
+            records, dropped = aerospike.drain_logs(max_records=1)
+            assert len(records) == 1
+            level, func, path, line, msg = records[0]
+            assert aerospike.LOG_LEVEL_ERROR <= level <= aerospike.LOG_LEVEL_TRACE
+            assert isinstance(func, str) and isinstance(path, str)
+            assert isinstance(line, int) and isinstance(msg, str)
+
+            records, dropped = aerospike.drain_logs()
+            assert isinstance(records, list)
+            assert dropped >= 0
+        finally:
+            aerospike.set_log_buffer(0)
+            aerospike.set_log_level(aerospike.LOG_LEVEL_ERROR)
+
+    def test_log_buffer_resize(self):
+        """
+        Test replacing the log buffer while the client logs
+        """
+        aerospike.set_log_level(aerospike.LOG_LEVEL_DEBUG)
+        try:
+            for buffer_size in (16, 1024, 1024, 2 ** 16, 16):
+                assert aerospike.set_log_buffer(buffer_size) == 0
+                client = TestBaseClass.get_new_connection()
+                client.close()
+                records, dropped = aerospike.drain_logs()
+                assert records or dropped
+        finally:
+            aerospike.set_log_buffer(0)
+            aerospike.set_log_level(aerospike.LOG_LEVEL_ERROR)
+
+    @pytest.mark.parametrize("buffer_size", [-1, 2 ** 16 + 1, 2 ** 25, 1.5, None, True])
+    def test_set_log_buffer_invalid_size(self, buffer_size):
+        """
+        Test set_log_buffer with an invalid buffer size
+        """
+        with pytest.raises(e.ParamError):
+            aerospike.set_log_buffer(buffer_size)
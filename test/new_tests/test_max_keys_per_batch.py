@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+from aerospike_helpers.batch import records as br
+from aerospike_helpers.operations import operations as op
+from aerospike import exception as e
+from .test_base_class import TestBaseClass
+from .as_status_codes import AerospikeStatus
+
+
+class TestMaxKeysPerBatch(TestBaseClass):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'max_keys_%d' % i) for i in range(10)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'i': i, 'name': 'name%d' % i})
+        self.missing_key = ('test', 'demo', 'max_keys_missing')
+        self.policy = {'max_keys_per_batch': 3}
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_get_many_split(self):
+        keys = self.keys + [self.missing_key]
+        records = self.as_connection.get_many(keys, self.policy)
+
+        assert len(records) == len(keys)
+        for i, (key, _, bins) in enumerate(records[:-1]):
+            assert key[2] == self.keys[i][2]
+            assert bins['i'] == i
+        assert records[-1][2] is None
+
+    def test_pos_get_many_split_tuple(self):
+        records = self.as_connection.get_many(tuple(self.keys), self.policy)
+        assert [bins['i'] for _, _, bins in records] == list(range(10))
+
+    def test_pos_exists_many_split(self):
+        records = self.as_connection.exists_many(self.keys, self.policy)
+        assert [key[2] for key, _ in records] == [k[2] for k in self.keys]
+        assert all(meta is not None for _, meta in records)
+
+    def test_pos_select_many_split(self):
+        records = self.as_connection.select_many(self.keys, ['name'],
+                                                 self.policy)
+        assert [bins for _, _, bins in records] == \
+            [{'name': 'name%d' % i} for i in range(10)]
+
+    def test_pos_batch_get_ops_split(self):
+        records = self.as_connection.batch_get_ops(
+            self.keys, [op.read('i')], policy=self.policy)
+        assert [bins['i'] for _, _, bins in records] == list(range(10))
+
+    def test_pos_batch_operate_split(self):
+        if self.server_version < [6, 0]:
+            pytest.skip("Servers older than 6.0 do not support batch operate.")
+
+        res = self.as_connection.batch_operate(
+            self.keys, [op.increment('i', 10), op.read('i')], self.policy)
+
+        assert isinstance(res, br.BatchRecords)
+        assert res.result == AerospikeStatus.AEROSPIKE_OK
+        assert [r.record[2]['i'] for r in res.batch_records] == \
+            list(range(10, 20))
+
+    def test_neg_batch_operate_split_returns_failed_records(self):
+        if self.server_version < [6, 0]:
+            pytest.skip("Servers older than 6.0 do not support batch operate.")
+
+        # The second sub-batch has an invalid key.
+        keys = self.keys[:4] + [('test', 'demo')] + self.keys[4:]
+        res = self.as_connection.batch_operate(
+            keys, [op.increment('i', 10), op.read('i')], self.policy)
+
+        assert res.result == AerospikeStatus.AEROSPIKE_ERR_PARAM
+        assert len(res.batch_records) == len(keys)
+        for r in res.batch_records[:3]:
+            assert r.result == AerospikeStatus.AEROSPIKE_OK
+        for r in res.batch_records[3:6]:
+            assert r.result == AerospikeStatus.AEROSPIKE_ERR_PARAM
+            assert r.in_doubt is False
+        # Later sub-batches either ran or are reported with the error.
+        for i, r in enumerate(res.batch_records[6:], 5):
+            _, _, bins = self.as_connection.get(self.keys[i])
+            if r.result == AerospikeStatus.AEROSPIKE_OK:
+                assert bins['i'] == i + 10
+            else:
+                assert r.result == AerospikeStatus.AEROSPIKE_ERR_PARAM
+                assert bins['i'] == i
+
+    def test_pos_max_keys_larger_than_batch(self):
+        records = self.as_connection.get_many(self.keys,
+                                              {'max_keys_per_batch': 100})
+        assert len(records) == len(self.keys)
+
+    @pytest.mark.parametrize("max_keys", [0, -1, 2 ** 32, 'a', 1.5])
+    def test_neg_invalid_max_keys_per_batch(self, max_keys):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(self.keys,
+                                        {'max_keys_per_batch': max_keys})
+
+    def test_neg_split_raises_first_error(self):
+        keys = self.keys + [('test', 'demo')]
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(keys, self.policy)
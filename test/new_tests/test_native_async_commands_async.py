@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import asyncio
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.awaitable import io
+    from aerospike_helpers.operations import operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+aerospike.init_async()
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestNativeAsyncCommands():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'native_async_%d' % i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {'i': i})
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    self.as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.asyncio
+    async def test_pos_exists_async(self):
+        _, meta = await io.exists(self.as_connection, self.keys[0])
+        assert meta['gen'] == 1
+
+    @pytest.mark.asyncio
+    async def test_pos_exists_async_missing_record(self):
+        key = ('test', 'demo', 'native_async_non_existent')
+        _, meta = await io.exists(self.as_connection, key)
+        assert meta is None
+
+    @pytest.mark.asyncio
+    async def test_pos_remove_async(self):
+        assert 0 == await io.remove(self.as_connection, self.keys[1])
+        _, meta = self.as_connection.exists(self.keys[1])
+        assert meta is None
+
+    @pytest.mark.asyncio
+    async def test_neg_remove_async_missing_record(self):
+        key = ('test', 'demo', 'native_async_non_existent')
+        with pytest.raises(e.RecordNotFound):
+            await io.remove(self.as_connection, key)
+
+    @pytest.mark.asyncio
+    async def test_pos_operate_async(self):
+        ops = [operations.increment('i', 10), operations.read('i')]
+        _, _, bins = await io.operate(self.as_connection, self.keys[2], ops)
+        assert bins == {'i': 12}
+
+    @pytest.mark.asyncio
+    async def test_pos_concurrent_operate_async(self):
+        ops = [operations.increment('i', 1)]
+        await asyncio.gather(
+            *[io.operate(self.as_connection, self.keys[3], ops)
+              for _ in range(20)])
+        _, _, bins = self.as_connection.get(self.keys[3])
+        assert bins == {'i': 23}
+
+    @pytest.mark.asyncio
+    async def test_pos_batch_operate_async(self):
+        ops = [operations.increment('i', 1), operations.read('i')]
+        res = await io.batch_operate(self.as_connection, self.keys, ops)
+        assert res.result == 0
+        assert [br.record[2] for br in res.batch_records] == \
+            [{'i': i + 1} for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_pos_batch_remove_async(self):
+        res = await io.batch_remove(self.as_connection, self.keys)
+        assert res.result == 0
+        assert all(br.result == 0 for br in res.batch_records)
+
+    def test_neg_operate_async_callback_not_callable(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate_async(
+                None, self.keys[0], [operations.read('i')])
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers import cdt_ctx
+    from aerospike_helpers.operations import operations
+    from aerospike_helpers.operations import list_operations
+    from aerospike_helpers.operations import map_operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestOperatePrepared(object):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [('test', 'demo', 'operate_prepared_%d' % i)
+                     for i in range(3)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {'count': i, 'name': 'name', 'l': [i]})
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    def test_pos_operate_prepared_values(self):
+        prepared = self.as_connection.prepare_operate([
+            operations.increment('count', 1),
+            operations.append('name', None),
+            operations.read('count'),
+            operations.read('name'),
+        ])
+        assert isinstance(prepared, aerospike.PreparedOps)
+        assert prepared.values_size == 2
+
+        for i, key in enumerate(self.keys):
+            _, _, bins = self.as_connection.operate_prepared(
+                key, prepared, [10, '_%d' % i])
+            assert bins == {'count': i + 10, 'name': 'name_%d' % i}
+
+    def test_pos_operate_prepared_default_values(self):
+        prepared = self.as_connection.prepare_operate(
+            [operations.increment('count', 5), operations.read('count')])
+
+        _, _, bins = self.as_connection.operate_prepared(self.keys[1],
+                                                         prepared)
+        assert bins == {'count': 6}
+
+    def test_pos_operate_prepared_cdt_and_meta(self):
+        prepared = self.as_connection.prepare_operate(
+            [list_operations.list_append('l', None),
+             operations.read('l')],
+            policy={'key': aerospike.POLICY_KEY_SEND})
+
+        _, meta, bins = self.as_connection.operate_prepared(
+            self.keys[2], prepared, values=(7,), meta={'ttl': 1000})
+        assert bins == {'l': [2, 7]}
+        assert meta['ttl'] <= 1000
+
+    def test_pos_operate_prepared_cdt_ctx(self):
+        list_ctx = [cdt_ctx.cdt_ctx_map_key('l'), cdt_ctx.cdt_ctx_list_index(0)]
+        map_ctx = [cdt_ctx.cdt_ctx_map_key('m')]
+        prepared = self.as_connection.prepare_operate([
+            list_operations.list_append('doc', None, ctx=list_ctx),
+            list_operations.list_size('doc', ctx=list_ctx),
+            map_operations.map_put('doc', 'k', None, ctx=map_ctx),
+            map_operations.map_increment('doc', 'n', None, ctx=map_ctx),
+            list_operations.list_get_by_value(
+                'doc', None, aerospike.LIST_RETURN_INDEX, ctx=list_ctx),
+        ])
+        assert prepared.values_size == 4
+
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(
+                key, {'doc': {'l': [[0]], 'm': {'n': 1}}})
+            self.as_connection.operate_prepared(key, prepared,
+                                                [i, 'v%d' % i, i, i])
+            _, _, bins = self.as_connection.get(key)
+            assert bins['doc'] == {'l': [[0, i]], 'm': {'n': 1 + i,
+                                                        'k': 'v%d' % i}}
+
+    def test_pos_prepared_ops_are_copied(self):
+        ops = [operations.write('name', 'a'), operations.read('name')]
+        prepared = self.as_connection.prepare_operate(ops)
+        ops[0]['bin'] = 'other'
+
+        _, _, bins = self.as_connection.operate_prepared(self.keys[0],
+                                                         prepared)
+        assert bins == {'name': 'a'}
+
+    @pytest.mark.parametrize("ops", [
+        [],
+        None,
+        ['not a dict'],
+        [{'op': aerospike.OPERATOR_INCR, 'bin': 'count'}],
+        [{'op': aerospike.OPERATOR_APPEND, 'bin': 'name'}],
+        [{'op': aerospike.OPERATOR_PREPEND, 'bin': 'name'}],
+        [{'op': aerospike.OPERATOR_WRITE, 'bin': 'name'}],
+    ])
+    def test_neg_prepare_operate_invalid_ops(self, ops):
+        with pytest.raises(e.ParamError):
+            self.as_connection.prepare_operate(ops)
+
+    @pytest.mark.parametrize("values", [[1], [1, 'a', 2], 'ab', {1: 1}])
+    def test_neg_operate_prepared_invalid_values(self, values):
+        prepared = self.as_connection.prepare_operate([
+            operations.increment('count', 1),
+            operations.append('name', 'a'),
+        ])
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate_prepared(self.keys[0], prepared,
+                                                values)
+
+    def test_neg_operate_prepared_not_prepared(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.operate_prepared(
+                self.keys[0], [operations.read('count')])
+
+    def test_neg_operate_prepared_other_client(self):
+        client = TestBaseClass.get_new_connection()
+        prepared = client.prepare_operate([operations.read('count')])
+        try:
+            with pytest.raises(e.ParamError):
+                self.as_connection.operate_prepared(self.keys[0], prepared)
+        finally:
+            client.close()
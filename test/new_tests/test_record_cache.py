@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+import random
+import sys
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.operations import operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestRecordCache(object):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.client = TestBaseClass.get_new_connection(
+            {'cache': {'max_entries': 16, 'sets': [('test', 'demo')]}})
+        self.key = ('test', 'demo', 'record_cache')
+        self.other_set_key = ('test', 'other', 'record_cache')
+        for key in (self.key, self.other_set_key):
+            as_connection.put(key, {'a': 1, 'b': 2})
+
+        def teardown():
+            for key in (self.key, self.other_set_key):
+                try:
+                    as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+            self.client.close()
+
+        request.addfinalizer(teardown)
+
+    def test_pos_get_is_cached(self):
+        _, meta, bins = self.client.get(self.key)
+        # Written by another client, so not seen until the record expires.
+        self.as_connection.put(self.key, {'a': 10})
+
+        _, cached_meta, cached_bins = self.client.get(self.key)
+        assert cached_bins == bins == {'a': 1, 'b': 2}
+        assert cached_meta['gen'] == meta['gen']
+
+    def test_pos_cached_bins_are_copied(self):
+        _, _, bins = self.client.get(self.key)
+        bins['a'] = 'changed'
+
+        _, _, bins = self.client.get(self.key)
+        assert bins == {'a': 1, 'b': 2}
+
+    def test_pos_cached_nested_values_are_copied(self):
+        record = {'l': [1, 2], 'm': {'k': [3]}, 'b': bytearray(b'ab')}
+        self.as_connection.put(self.key, record)
+
+        _, _, bins = self.client.get(self.key)
+        bins['l'].append(3)
+        bins['m']['k'].append(4)
+        bins['b'][0] = ord('z')
+
+        _, _, bins = self.client.get(self.key)
+        assert bins == record
+        _, _, bins = self.client.select(self.key, ['l'])
+        bins['l'].clear()
+        assert self.client.select(self.key, ['l'])[2] == {'l': [1, 2]}
+
+    def test_pos_local_writes_invalidate(self):
+        self.client.get(self.key)
+        self.client.put(self.key, {'a': 3})
+        assert self.client.get(self.key)[2] == {'a': 3, 'b': 2}
+
+        self.client.operate(self.key, [operations.increment('a', 1)])
+        assert self.client.get(self.key)[2] == {'a': 4, 'b': 2}
+
+        self.client.remove(self.key)
+        with pytest.raises(e.RecordNotFound):
+            self.client.get(self.key)
+
+    def test_pos_select_from_cached_record(self):
+        self.client.get(self.key)
+        self.as_connection.put(self.key, {'b': 20})
+
+        _, _, bins = self.client.select(self.key, ['b', 'missing'])
+        assert bins == {'b': 2}
+
+    def test_pos_select_outside_cached_bins(self):
+        self.client.operate(self.key, [operations.read('a')])
+        self.as_connection.put(self.key, {'a': 10, 'b': 20})
+
+        assert self.client.select(self.key, ('a',))[2] == {'a': 1}
+        assert self.client.select(self.key, ('a', 'b'))[2] == {'a': 10,
+                                                               'b': 20}
+
+    def test_pos_uncached_set(self):
+        self.client.get(self.other_set_key)
+        self.as_connection.put(self.other_set_key, {'a': 10})
+
+        assert self.client.get(self.other_set_key)[2] == {'a': 10, 'b': 2}
+
+    def test_pos_truncate_clears(self):
+        self.client.get(self.key)
+        self.client.truncate('test', 'other', 0)
+        self.as_connection.put(self.key, {'a': 10})
+
+        assert self.client.get(self.key)[2] == {'a': 10, 'b': 2}
+
+    @pytest.mark.parametrize("cache", [
+        {'max_entries': 0},
+        {'max_entries': -1},
+        {'max_bytes': 'a'},
+        {'policy': 5},
+        {'sets': [('test',)]},
+        {'sets': 'test'},
+        {'shm': {}},
+        {'max_ttl': 5, 'shm': {'max_records': 0}},
+        {'max_ttl': 5, 'shm': {'max_record_size': 2 ** 21}},
+        {'max_ttl': 5, 'shm': {'reset': 1}},
+        {'max_ttl': 5, 'shm': []},
+        [],
+    ])
+    def test_neg_invalid_cache_config(self, cache):
+        config = TestBaseClass.get_connection_config()
+        config['cache'] = cache
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
+
+    def test_pos_shm_shares_records(self):
+        shm_key = random.randint(1, 0xFFFF)
+        shm = {'shm_key': shm_key, 'max_records': 64, 'max_record_size': 512}
+        clients = [TestBaseClass.get_new_connection(
+            {'cache': {'max_ttl': 60, 'shm': shm}}) for _ in range(2)]
+        try:
+            clients[0].get(self.key)
+            self.as_connection.put(self.key, {'a': 10})
+            # Served from the record the first client read.
+            assert clients[1].get(self.key)[2] == {'a': 1, 'b': 2}
+
+            clients[1].put(self.key, {'b': 20})
+            assert clients[0].get(self.key)[2] == {'a': 10, 'b': 20}
+
+            mismatched = dict(shm, max_records=32)
+            config = TestBaseClass.get_connection_config()
+            config['cache'] = {'max_ttl': 60, 'shm': mismatched}
+            with pytest.raises(e.ParamError):
+                aerospike.client(config)
+        finally:
+            for client in clients:
+                client.close()
+            try:
+                os.remove('/dev/shm/aerospike_record_cache_%08x' % shm_key)
+            except OSError:
+                pass
+
+    def test_pos_shm_reset(self):
+        shm_key = random.randint(1, 0xFFFF)
+        path = '/dev/shm/aerospike_record_cache_%08x' % shm_key
+        cache = {'max_ttl': 60, 'shm': {'shm_key': shm_key}}
+        client = TestBaseClass.get_new_connection({'cache': cache})
+        try:
+            client.get(self.key)
+            self.as_connection.put(self.key, {'a': 10})
+            assert os.stat(path).st_mode & 0o077 == 0
+
+            cache = {'max_ttl': 60, 'shm': {'shm_key': shm_key, 'reset': True}}
+            other = TestBaseClass.get_new_connection({'cache': cache})
+            assert other.get(self.key)[2] == {'a': 10, 'b': 2}
+            other.close()
+        finally:
+            client.close()
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def test_neg_shm_accessible_to_others(self):
+        shm_key = random.randint(1, 0xFFFF)
+        path = '/dev/shm/aerospike_record_cache_%08x' % shm_key
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+        os.fchmod(fd, 0o666)
+        os.close(fd)
+        try:
+            config = TestBaseClass.get_connection_config()
+            config['cache'] = {'max_ttl': 60, 'shm': {'shm_key': shm_key}}
+            with pytest.raises(e.ParamError):
+                aerospike.client(config)
+        finally:
+            os.remove(path)
+
+    def test_cache_policy_constants(self):
+        assert aerospike.CACHE_POLICY_LRU != aerospike.CACHE_POLICY_LFU
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+    from aerospike_helpers.operations import operations
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestReturnNoneOnMiss():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request):
+        self.client = TestBaseClass.get_new_connection(
+            {'return_none_on_miss': True})
+        self.missing_key = ('test', 'demo', 'return_none_on_miss_missing')
+        self.key = ('test', 'demo', 'return_none_on_miss')
+        self.client.put(self.key, {'a': 1})
+
+        def teardown():
+            self.client.remove(self.key)
+            self.client.close()
+
+        request.addfinalizer(teardown)
+
+    def test_pos_get_miss(self):
+        assert self.client.get(self.missing_key) is None
+
+    def test_pos_get_hit(self):
+        _, _, bins = self.client.get(self.key)
+        assert bins == {'a': 1}
+
+    def test_pos_select_miss(self):
+        assert self.client.select(self.missing_key, ['a']) is None
+
+    def test_pos_exists_miss_unchanged(self):
+        key, meta = self.client.exists(self.missing_key)
+        assert key[:3] == self.missing_key
+        assert meta is None
+
+    def test_pos_operate_miss(self):
+        ops = [operations.read('a')]
+        assert self.client.operate(self.missing_key, ops) is None
+        assert self.client.operate_ordered(self.missing_key, ops) is None
+
+    def test_neg_touch_miss_still_raises(self):
+        with pytest.raises(e.RecordNotFound):
+            self.client.touch(self.missing_key)
+        with pytest.raises(e.RecordNotFound):
+            self.client.increment(self.missing_key, 'a', 1,
+                                  policy={'exists': aerospike.POLICY_EXISTS_UPDATE})
+
+    def test_neg_other_errors_still_raise(self):
+        with pytest.raises(e.NamespaceNotFound):
+            self.client.get(('fake_namespace', 'demo', 1))
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+import pytest
+
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+
+class TestRoundtrip(object):
+
+    def setup_class(cls):
+        # Conversions need no I/O, so the client is never connected.
+        cls.client = aerospike.client({'hosts': [('127.0.0.1', 3000)]})
+
+    def teardown_class(cls):
+        cls.client.close()
+
+    @pytest.mark.parametrize("value", [
+        1, -2 ** 63, 1.5, 'str', u'é', b'bytes', True, None,
+        [1, 'a', [2.5, {'b': b'c'}]],
+        {'a': 1, 2: [3, {'c': None}]},
+    ])
+    @pytest.mark.parametrize("msgpack", [False, True])
+    def test_pos_roundtrip_val(self, value, msgpack):
+        assert self.client._roundtrip_val(value, msgpack) == value
+
+    def test_pos_roundtrip_key_ordered_dict(self):
+        value = aerospike.KeyOrderedDict({'b': 1, 'a': 2})
+        assert self.client._roundtrip_val(value, True) == {'a': 2, 'b': 1}
+
+    def test_pos_roundtrip_record(self):
+        key = ('test', 'demo', 'roundtrip')
+        bins = {'i': 1, 's': 'str', 'l': [1, 2], 'm': {'a': 1}}
+
+        rec_key, meta, rec_bins = self.client._roundtrip_record(
+            key, bins, {'ttl': 100})
+        assert rec_key[:3] == key
+        assert rec_key[3] == aerospike.calc_digest(*key)
+        assert meta['ttl'] == 100
+        assert rec_bins == bins
+
+    def test_neg_roundtrip_record_invalid_key(self):
+        with pytest.raises(e.ParamError):
+            self.client._roundtrip_record(('test',), {'a': 1})
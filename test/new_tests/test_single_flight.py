@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import sys
+import threading
+
+from .test_base_class import TestBaseClass
+aerospike = pytest.importorskip("aerospike")
+try:
+    import aerospike
+    from aerospike import exception as e
+except:
+    print("Please install aerospike python client.")
+    sys.exit(1)
+
+aerospike.init_async()
+
+THREADS = 16
+
+
+def run_concurrently(func):
+    barrier = threading.Barrier(THREADS)
+    results = [None] * THREADS
+
+    def target(i):
+        barrier.wait()
+        try:
+            results[i] = func()
+        except Exception as exc:
+            results[i] = exc
+
+    threads = [threading.Thread(target=target, args=(i,))
+               for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestSingleFlight(object):
+
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.client = TestBaseClass.get_new_connection({'single_flight': True})
+        self.key = ('test', 'demo', 'single_flight')
+        self.missing_key = ('test', 'demo', 'single_flight_missing')
+        as_connection.put(self.key, {'a': 1, 'b': [1, 2]})
+
+        def teardown():
+            as_connection.remove(self.key)
+            self.client.close()
+
+        request.addfinalizer(teardown)
+
+    def test_pos_concurrent_gets(self):
+        results = run_concurrently(lambda: self.client.get(self.key))
+
+        for key, meta, bins in results:
+            assert key[:3] == ('test', 'demo', None)
+            assert meta['gen'] == results[0][1]['gen']
+            assert bins == {'a': 1, 'b': [1, 2]}
+
+        # Every reader gets its own bins.
+        assert len(set(id(bins) for _, _, bins in results)) == THREADS
+
+    def test_pos_concurrent_gets_mutating_nested_values(self):
+        def get_and_mutate():
+            bins = self.client.get(self.key)[2]
+            seen = list(bins['b'])
+            bins['b'].append(3)
+            return seen, bins['b']
+
+        results = run_concurrently(get_and_mutate)
+
+        # No reader sees the changes made by another.
+        assert all(seen == [1, 2] for seen, _ in results)
+        assert len(set(id(values) for _, values in results)) == THREADS
+
+    def test_pos_concurrent_selects(self):
+        policy = {'total_timeout': 2000}
+        results = run_concurrently(
+            lambda: self.client.select(self.key, ['a'], policy))
+        assert all(bins == {'a': 1} for _, _, bins in results)
+
+    def test_pos_concurrent_reads_of_different_bins(self):
+        results = run_concurrently(
+            lambda: (self.client.select(self.key, ['a'])[2],
+                     self.client.get(self.key)[2]))
+        assert all(result == ({'a': 1}, {'a': 1, 'b': [1, 2]})
+                   for result in results)
+
+    def test_neg_concurrent_gets_of_missing_record(self):
+        results = run_concurrently(lambda: self.client.get(self.missing_key))
+        assert all(isinstance(result, e.RecordNotFound)
+                   for result in results)
+
+    def test_pos_get_async(self):
+        done = threading.Semaphore(0)
+        results = []
+
+        def callback(key, record, err, exception):
+            results.append(record)
+            done.release()
+
+        for _ in range(THREADS):
+            self.client.get_async(callback, self.key)
+        for _ in range(THREADS):
+            assert done.acquire(timeout=5)
+
+        assert all(bins == {'a': 1, 'b': [1, 2]} for _, _, bins in results)